@@ -3,26 +3,44 @@
 Creates comprehensive backups of the book tracking database.
 """
 
-import gzip
-import hashlib
 import json
-import shutil
+import sqlite3
+from contextlib import closing
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterable, Iterator, Mapping, Optional
 
-from sqlalchemy import select
+from sqlalchemy import Table, create_engine, func, select
+from sqlalchemy.orm import Session
 
-from ..db.models import Book, ReadingLog
-from ..db.sqlite import Database, get_db
+from ..db.changes import changes_between, current_change_seq
+from ..db.models import Base, Book, ReadingLog
+from ..db.sqlite import IN_CLAUSE_SIZE, Database, get_db, register_models
+from ..search.fts import rebuild_fts_indexes
+from .stream import BackupWriter, data_checksum, iter_backup, read_backup_metadata
+
+# Rows fetched from SQLite at a time while writing a backup
+BACKUP_BATCH_SIZE = 500
+
+# Database pages copied per step of an online SQLite backup
+SQLITE_BACKUP_PAGES = 1024
+
+
+def _backup_progress(
+    callback: Optional[Callable[[int, int], None]],
+) -> Optional[Callable[[int, int, int], None]]:
+    """Adapt a (copied, total) callback to sqlite3's backup progress hook."""
+    if callback is None:
+        return None
+    return lambda status, remaining, total: callback(total - remaining, total)
 
 
 @dataclass
 class BackupMetadata:
     """Metadata about a backup."""
 
-    version: str = "1.0"
+    version: str = "2.0"
     created_at: str = ""
     database_path: str = ""
     book_count: int = 0
@@ -30,6 +48,12 @@ class BackupMetadata:
     checksum: str = ""
     compressed: bool = False
     app_version: str = ""
+    data_bytes: int = 0  # Length of the checksummed data section
+    table_counts: dict[str, int] = field(default_factory=dict)
+    kind: str = "full"  # full or incremental
+    change_seq: Optional[int] = None  # Change log position the backup is current to
+    parent_checksum: str = ""  # Checksum of the backup an incremental builds on
+    deleted_count: int = 0
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -42,6 +66,12 @@ class BackupMetadata:
             "checksum": self.checksum,
             "compressed": self.compressed,
             "app_version": self.app_version,
+            "data_bytes": self.data_bytes,
+            "table_counts": self.table_counts,
+            "kind": self.kind,
+            "change_seq": self.change_seq,
+            "parent_checksum": self.parent_checksum,
+            "deleted_count": self.deleted_count,
         }
 
     @classmethod
@@ -56,8 +86,19 @@ class BackupMetadata:
             checksum=data.get("checksum", ""),
             compressed=data.get("compressed", False),
             app_version=data.get("app_version", ""),
+            data_bytes=data.get("data_bytes", 0),
+            table_counts=data.get("table_counts", {}),
+            kind=data.get("kind", "full"),
+            change_seq=data.get("change_seq"),
+            parent_checksum=data.get("parent_checksum", ""),
+            deleted_count=data.get("deleted_count", 0),
         )
 
+    @property
+    def is_incremental(self) -> bool:
+        """Whether the backup only holds changes since its parent."""
+        return self.kind == "incremental"
+
 
 @dataclass
 class BackupResult:
@@ -102,6 +143,10 @@ class BackupManager:
     ) -> BackupResult:
         """Create a full backup of the database.
 
+        Every table is streamed into the file in batches inside one read
+        transaction, so the backup is a consistent snapshot and memory use
+        doesn't grow with the library.
+
         Args:
             output_path: Path to save backup file
             compress: Whether to compress the backup
@@ -113,56 +158,27 @@ class BackupManager:
         try:
             # Ensure output directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Get counts for metadata
-            with self.db.get_session() as session:
-                book_count = session.execute(
-                    select(Book.id)
-                ).all()
-                log_count = session.execute(
-                    select(ReadingLog.id)
-                ).all()
-
-            # Create backup data
-            backup_data = self._export_all_data()
-
-            # Calculate checksum
-            json_bytes = json.dumps(backup_data, indent=2).encode("utf-8")
-            checksum = hashlib.sha256(json_bytes).hexdigest()
-
-            # Create metadata
-            from .. import __version__
-            metadata = BackupMetadata(
-                created_at=datetime.now().isoformat(),
-                database_path=str(self.db.db_path),
-                book_count=len(book_count),
-                reading_log_count=len(log_count),
-                checksum=checksum,
-                compressed=compress,
-                app_version=__version__,
-            )
-
-            # Add metadata to backup
-            backup_data["_metadata"] = metadata.to_dict()
-
-            # Determine final path
-            if compress:
-                final_path = output_path.with_suffix(self.COMPRESSED_EXTENSION)
-                with gzip.open(final_path, "wt", encoding="utf-8") as f:
-                    json.dump(backup_data, f, indent=2)
-            else:
-                final_path = output_path.with_suffix(self.BACKUP_EXTENSION)
-                with open(final_path, "w", encoding="utf-8") as f:
-                    json.dump(backup_data, f, indent=2)
+            final_path = self._backup_path(output_path, compress)
+
+            register_models()
+            with BackupWriter(final_path, compress) as writer:
+                with self.db.get_session() as session:
+                    # Read in the same transaction as the rows it describes
+                    change_seq = current_change_seq(session)
+                    counts = {
+                        table.name: writer.write_table(table.name, self._table_rows(session, table))
+                        for table in Base.metadata.sorted_tables
+                    }
+                metadata = self._metadata(writer, counts, compress)
+                metadata.change_seq = change_seq
+                writer.write_metadata(metadata.to_dict())
 
             # Get file size
             size_bytes = final_path.stat().st_size
 
             # Save metadata file if requested
             if include_metadata:
-                meta_path = final_path.with_suffix(final_path.suffix + ".meta")
-                with open(meta_path, "w", encoding="utf-8") as f:
-                    json.dump(metadata.to_dict(), f, indent=2)
+                self._write_metadata_file(final_path, metadata)
 
             return BackupResult(
                 success=True,
@@ -180,64 +196,67 @@ class BackupManager:
     def create_incremental_backup(
         self,
         output_path: Path,
-        since: datetime,
+        parent: Path,
         compress: bool = True,
+        include_metadata: bool = True,
     ) -> BackupResult:
-        """Create incremental backup with changes since a date.
+        """Create a backup of the changes made since another backup.
+
+        Every row inserted or updated in any table since ``parent`` was
+        taken is included in full, and deleted rows are listed as
+        tombstones under ``_deleted``. The backup records the parent's
+        checksum, so a full backup and its incrementals form a chain that
+        restore replays in order.
 
         Args:
             output_path: Path to save backup
-            since: Only include changes after this datetime
+            parent: The full or incremental backup to build on
             compress: Whether to compress
+            include_metadata: Whether to include metadata file
 
         Returns:
             BackupResult
         """
         try:
-            since_str = since.date().isoformat()
-
-            with self.db.get_session() as session:
-                # Get books modified since date
-                stmt = select(Book).where(Book.date_added >= since_str)
-                books = list(session.execute(stmt).scalars().all())
-
-                # Get logs since date
-                stmt = select(ReadingLog).where(ReadingLog.date >= since_str)
-                logs = list(session.execute(stmt).scalars().all())
-
-                backup_data = {
-                    "incremental": True,
-                    "since": since.isoformat(),
-                    "books": [self._book_to_dict(b) for b in books],
-                    "reading_logs": [self._log_to_dict(l) for l in logs],
-                }
-
-            # Calculate checksum
-            json_bytes = json.dumps(backup_data, indent=2).encode("utf-8")
-            checksum = hashlib.sha256(json_bytes).hexdigest()
-
-            from .. import __version__
-            metadata = BackupMetadata(
-                created_at=datetime.now().isoformat(),
-                database_path=str(self.db.db_path),
-                book_count=len(books),
-                reading_log_count=len(logs),
-                checksum=checksum,
-                compressed=compress,
-                app_version=__version__,
-            )
+            parent_metadata = self._read_backup_metadata(parent)
+            if parent_metadata is None or parent_metadata.change_seq is None:
+                return BackupResult(
+                    success=False,
+                    error=f"{parent.name} has no change tracking position; "
+                    "create a new full backup to build on",
+                )
 
-            backup_data["_metadata"] = metadata.to_dict()
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            final_path = self._backup_path(output_path, compress)
+
+            register_models()
+            with BackupWriter(final_path, compress) as writer:
+                writer.write_value("incremental", True)
+                with self.db.get_session() as session:
+                    change_seq = current_change_seq(session)
+                    changes = changes_between(session, parent_metadata.change_seq, change_seq)
+                    counts = {}
+                    for table in Base.metadata.sorted_tables:
+                        if table.name in changes:
+                            rows = self._changed_rows(session, table, changes[table.name].changed)
+                            counts[table.name] = writer.write_table(table.name, rows)
+                    deleted = writer.write_table(
+                        "_deleted",
+                        (
+                            {"table": name, "id": row_id}
+                            for name, change_set in changes.items()
+                            for row_id in change_set.deleted
+                        ),
+                    )
+                metadata = self._metadata(writer, counts, compress)
+                metadata.kind = "incremental"
+                metadata.change_seq = change_seq
+                metadata.parent_checksum = parent_metadata.checksum
+                metadata.deleted_count = deleted
+                writer.write_metadata(metadata.to_dict())
 
-            # Write file
-            if compress:
-                final_path = output_path.with_suffix(self.COMPRESSED_EXTENSION)
-                with gzip.open(final_path, "wt", encoding="utf-8") as f:
-                    json.dump(backup_data, f, indent=2)
-            else:
-                final_path = output_path.with_suffix(self.BACKUP_EXTENSION)
-                with open(final_path, "w", encoding="utf-8") as f:
-                    json.dump(backup_data, f, indent=2)
+            if include_metadata:
+                self._write_metadata_file(final_path, metadata)
 
             return BackupResult(
                 success=True,
@@ -249,26 +268,102 @@ class BackupManager:
         except Exception as e:
             return BackupResult(success=False, error=str(e))
 
-    def create_sqlite_backup(self, output_path: Path) -> BackupResult:
+    def backup_chain(self, backup_path: Path) -> list[Path]:
+        """Find the backups an incremental backup builds on.
+
+        Parents are looked up by checksum among the backups in the same
+        directory.
+
+        Args:
+            backup_path: Full or incremental backup
+
+        Returns:
+            The full backup first, then each incremental up to ``backup_path``
+
+        Raises:
+            ValueError: If a backup in the chain is missing
+        """
+        metadata = self._read_backup_metadata(backup_path)
+        if metadata is None:
+            raise ValueError(f"Cannot read backup metadata: {backup_path.name}")
+
+        by_checksum = {
+            meta.checksum: path for path, meta in self.list_backups(backup_path.parent)
+        }
+        chain = [backup_path]
+        while metadata.is_incremental:
+            parent = by_checksum.get(metadata.parent_checksum)
+            if parent is None or parent in chain:
+                raise ValueError(
+                    f"Parent backup of {chain[-1].name} "
+                    f"({metadata.parent_checksum[:12]}) not found in {backup_path.parent}"
+                )
+            chain.append(parent)
+            metadata = self._read_backup_metadata(parent)
+
+        return list(reversed(chain))
+
+    def create_sqlite_backup(
+        self,
+        output_path: Path,
+        compact: bool = False,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> BackupResult:
         """Create a raw SQLite database backup.
 
+        Uses SQLite's online backup API, copying SQLITE_BACKUP_PAGES pages
+        per step, so other connections can keep writing while it runs
+        (changes they make mid-backup restart the copy). With ``compact``
+        the copy is made with ``VACUUM INTO`` instead, which also drops
+        free pages and defragments, in a single step; its full-text
+        indexes are then rebuilt, as vacuuming can renumber rowids.
+
         Args:
             output_path: Path to save the SQLite file
+            compact: Write a vacuumed copy
+            progress: Called with (pages copied, total pages) after each step
 
         Returns:
             BackupResult
         """
         try:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Copy the database file
             final_path = output_path.with_suffix(".db")
-            shutil.copy2(self.db.db_path, final_path)
+            final_path.unlink(missing_ok=True)
+
+            raw = self.db.engine.raw_connection()
+            try:
+                source = raw.driver_connection
+                if compact:
+                    source.execute("VACUUM INTO ?", (str(final_path),))
+                else:
+                    with closing(sqlite3.connect(final_path)) as target:
+                        source.backup(
+                            target,
+                            pages=SQLITE_BACKUP_PAGES,
+                            progress=_backup_progress(progress),
+                        )
+            finally:
+                raw.close()
+
+            if compact:
+                # VACUUM can renumber the rowids the FTS indexes are keyed on
+                copy = create_engine(f"sqlite:///{final_path}")
+                try:
+                    rebuild_fts_indexes(copy)
+                finally:
+                    copy.dispose()
+
+            # A standalone copy shouldn't need a WAL file next to it
+            with closing(sqlite3.connect(final_path)) as target:
+                target.execute("PRAGMA journal_mode=DELETE")
 
             # Get metadata
             with self.db.get_session() as session:
-                book_count = len(session.execute(select(Book.id)).all())
-                log_count = len(session.execute(select(ReadingLog.id)).all())
+                book_count = session.execute(select(func.count()).select_from(Book)).scalar_one()
+                log_count = session.execute(
+                    select(func.count()).select_from(ReadingLog)
+                ).scalar_one()
 
             from .. import __version__
             metadata = BackupMetadata(
@@ -333,99 +428,103 @@ class BackupManager:
             Tuple of (is_valid, error_message)
         """
         try:
-            data = self._load_backup_file(backup_path)
-
-            if "_metadata" not in data:
+            counts: dict[str, int] = {}
+            raw_metadata = None
+            for key, value in iter_backup(backup_path):
+                if key == "_metadata":
+                    raw_metadata = value
+                elif key in ("books", "reading_logs"):
+                    counts[key] = sum(1 for _ in value)
+
+            if raw_metadata is None:
                 return False, "Missing metadata in backup"
 
-            metadata = BackupMetadata.from_dict(data["_metadata"])
+            metadata = BackupMetadata.from_dict(raw_metadata)
 
-            # Verify checksum
-            data_copy = {k: v for k, v in data.items() if k != "_metadata"}
-            data_copy["_metadata"] = metadata.to_dict()
-            json_bytes = json.dumps(data_copy, indent=2).encode("utf-8")
-            actual_checksum = hashlib.sha256(json_bytes).hexdigest()
+            # Streamed backups record the extent of their checksummed bytes
+            if metadata.data_bytes:
+                if data_checksum(backup_path, metadata.data_bytes) != metadata.checksum:
+                    return False, "Checksum mismatch: backup data is corrupted"
 
-            # Note: Checksum verification is complex due to JSON formatting
-            # For now, verify structure
-            if "books" not in data:
-                return False, "Missing books in backup"
+            # Incrementals only hold the tables that changed
+            if not metadata.is_incremental:
+                if "books" not in counts:
+                    return False, "Missing books in backup"
 
-            if "reading_logs" not in data:
-                return False, "Missing reading_logs in backup"
+                if "reading_logs" not in counts:
+                    return False, "Missing reading_logs in backup"
 
             # Verify counts match
-            if len(data["books"]) != metadata.book_count:
-                return False, f"Book count mismatch: expected {metadata.book_count}, got {len(data['books'])}"
+            books = counts.get("books", 0)
+            if books != metadata.book_count:
+                return False, f"Book count mismatch: expected {metadata.book_count}, got {books}"
 
-            if len(data["reading_logs"]) != metadata.reading_log_count:
-                return False, f"Log count mismatch: expected {metadata.reading_log_count}, got {len(data['reading_logs'])}"
+            logs = counts.get("reading_logs", 0)
+            if logs != metadata.reading_log_count:
+                return False, (
+                    f"Log count mismatch: expected {metadata.reading_log_count}, got {logs}"
+                )
 
             return True, None
 
         except Exception as e:
             return False, str(e)
 
-    def _export_all_data(self) -> dict:
-        """Export all data from database."""
-        with self.db.get_session() as session:
-            # Export books
-            books = list(session.execute(select(Book)).scalars().all())
-            books_data = [self._book_to_dict(book) for book in books]
-
-            # Export reading logs
-            logs = list(session.execute(select(ReadingLog)).scalars().all())
-            logs_data = [self._log_to_dict(log) for log in logs]
-
-        return {
-            "books": books_data,
-            "reading_logs": logs_data,
-        }
-
-    def _book_to_dict(self, book: Book) -> dict:
-        """Convert book to dictionary."""
-        return {
-            "id": book.id,
-            "title": book.title,
-            "author": book.author,
-            "isbn": book.isbn,
-            "isbn13": book.isbn13,
-            "status": book.status,
-            "rating": book.rating,
-            "page_count": book.page_count,
-            "progress": book.progress,
-            "date_added": book.date_added,
-            "date_started": book.date_started,
-            "date_finished": book.date_finished,
-            "tags": book.get_tags(),
-            "comments": book.comments,
-            "publisher": book.publisher,
-            "publication_year": book.publication_year,
-            "series": book.series,
-            "series_index": book.series_index,
-            "cover": book.cover,
-            "description": book.description,
-            "goodreads_id": book.goodreads_id,
-            "goodreads_avg_rating": book.goodreads_avg_rating,
-            "read_next": book.read_next,
-            "notion_page_id": book.notion_page_id,
-            "notion_modified_at": book.notion_modified_at,
-        }
+    def _backup_path(self, output_path: Path, compress: bool) -> Path:
+        """Final backup file path for an output path."""
+        if compress:
+            return output_path.with_suffix(self.COMPRESSED_EXTENSION)
+        return output_path.with_suffix(self.BACKUP_EXTENSION)
+
+    def _table_rows(
+        self, session: Session, table: Table, stmt=None
+    ) -> Iterable[Mapping[str, Any]]:
+        """Stream a table's rows in batches of BACKUP_BATCH_SIZE."""
+        stmt = select(table) if stmt is None else stmt
+        rows = session.execute(stmt.execution_options(yield_per=BACKUP_BATCH_SIZE)).mappings()
+        if table.name == Book.__tablename__:
+            return (self._book_row(row) for row in rows)
+        return rows
+
+    def _changed_rows(
+        self, session: Session, table: Table, row_ids: list[Any]
+    ) -> Iterator[Mapping[str, Any]]:
+        """Stream the current rows for a list of primary keys."""
+        (pk,) = table.primary_key.columns
+        for start in range(0, len(row_ids), IN_CLAUSE_SIZE):
+            chunk = row_ids[start : start + IN_CLAUSE_SIZE]
+            yield from self._table_rows(session, table, select(table).where(pk.in_(chunk)))
+
+    @staticmethod
+    def _book_row(row: Mapping[str, Any]) -> dict:
+        """Book row with tags as a list, as in version 1 backups."""
+        book = dict(row)
+        book["tags"] = json.loads(book["tags"]) if book["tags"] else []
+        return book
+
+    def _metadata(
+        self, writer: BackupWriter, counts: dict[str, int], compress: bool
+    ) -> BackupMetadata:
+        """Metadata for a backup whose tables have all been written."""
+        from .. import __version__
+
+        return BackupMetadata(
+            created_at=datetime.now().isoformat(),
+            database_path=str(self.db.db_path),
+            book_count=counts.get("books", 0),
+            reading_log_count=counts.get("reading_logs", 0),
+            checksum=writer.seal(),
+            compressed=compress,
+            app_version=__version__,
+            data_bytes=writer.data_bytes,
+            table_counts=counts,
+        )
 
-    def _log_to_dict(self, log: ReadingLog) -> dict:
-        """Convert reading log to dictionary."""
-        return {
-            "id": log.id,
-            "book_id": log.book_id,
-            "date": log.date,
-            "pages_read": log.pages_read,
-            "start_page": log.start_page,
-            "end_page": log.end_page,
-            "duration_minutes": log.duration_minutes,
-            "notes": log.notes,
-            "location": log.location,
-            "notion_page_id": log.notion_page_id,
-        }
+    def _write_metadata_file(self, backup_path: Path, metadata: BackupMetadata) -> None:
+        """Save metadata next to a backup for quick listing."""
+        meta_path = backup_path.with_suffix(backup_path.suffix + ".meta")
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(metadata.to_dict(), f, indent=2)
 
     def _read_backup_metadata(self, backup_path: Path) -> Optional[BackupMetadata]:
         """Read metadata from backup file."""
@@ -440,19 +539,10 @@ class BackupManager:
 
         # Read from backup file itself
         try:
-            data = self._load_backup_file(backup_path)
-            if "_metadata" in data:
-                return BackupMetadata.from_dict(data["_metadata"])
+            metadata = read_backup_metadata(backup_path)
+            if metadata is not None:
+                return BackupMetadata.from_dict(metadata)
         except Exception:
             pass
 
         return None
-
-    def _load_backup_file(self, backup_path: Path) -> dict:
-        """Load backup file (compressed or not)."""
-        if backup_path.suffix == ".gz" or str(backup_path).endswith(".gz"):
-            with gzip.open(backup_path, "rt", encoding="utf-8") as f:
-                return json.load(f)
-        else:
-            with open(backup_path, "r", encoding="utf-8") as f:
-                return json.load(f)
@@ -1,22 +1,42 @@
 """Database restore functionality.
 
 Restores data from backups with various merge strategies.
+
+Backups are read with ``iter_backup``, so rows stream from the file
+(through gzip if compressed) without loading the whole document, and are
+written RESTORE_BATCH_SIZE at a time with the bulk helpers in
+``db/bulk.py``: one query finds which rows of a batch already exist, one
+executemany writes them.
 """
 
-import gzip
 import json
 import shutil
+import time
+from contextlib import ExitStack
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
+from itertools import groupby, islice
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional
+
+from sqlalchemy import Date, DateTime, Table, delete, func, select
+from sqlalchemy.orm import Session
+
+from ..db.bulk import existing_keys, row_key, write_rows
+from ..db.changes import bulk_rewrite
+from ..db.rollups import deferred_rollups
+from ..db.models import Base, Book, ReadingLog
+from ..db.sqlite import IN_CLAUSE_SIZE, Database, get_db, register_models
+from ..search.fts import deferred_fts_sync
+from ..search.suggest import invalidate_suggestion_index
+from .backup import BackupManager
+from .stream import iter_backup
 
-from sqlalchemy import select, delete
+# Rows read per batch, and per transaction in merge and update restores
+RESTORE_BATCH_SIZE = 500
 
-from ..db.models import Book, ReadingLog
-from ..db.schemas import BookCreate, BookStatus, ReadingLogCreate
-from ..db.sqlite import Database, get_db
+_MISSING_BOOKS = "Invalid backup: missing books data"
 
 
 class RestoreMode(str, Enum):
@@ -39,14 +59,29 @@ class RestoreResult:
     books_updated: int = 0
     logs_restored: int = 0
     logs_skipped: int = 0
+    records_deleted: int = 0
     error: Optional[str] = None
     warnings: list[str] = field(default_factory=list)
+    table_counts: dict[str, int] = field(default_factory=dict)  # Rows written per table
+    elapsed_seconds: float = 0.0
 
     @property
     def total_restored(self) -> int:
         """Total records restored."""
         return self.books_restored + self.logs_restored
 
+    @property
+    def rows_written(self) -> int:
+        """Rows written across all tables."""
+        return sum(self.table_counts.values())
+
+    @property
+    def rows_per_second(self) -> float:
+        """Restore throughput."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.rows_written / self.elapsed_seconds
+
 
 class RestoreManager:
     """Manages database restoration from backups."""
@@ -67,6 +102,10 @@ class RestoreManager:
     ) -> RestoreResult:
         """Restore database from backup.
 
+        Replace runs in a single transaction; merge and update commit
+        after every batch, so a large restore doesn't hold one huge
+        transaction open and an interrupted one keeps what it wrote.
+
         Args:
             backup_path: Path to backup file
             mode: Restore mode (replace, merge, update)
@@ -75,41 +114,69 @@ class RestoreManager:
         Returns:
             RestoreResult with status and counts
         """
+        started = time.perf_counter()
         try:
-            # Load backup data
-            data = self._load_backup_file(backup_path)
-
-            # Check for incremental backup
-            if data.get("incremental"):
-                if mode != RestoreMode.INCREMENTAL:
-                    mode = RestoreMode.INCREMENTAL
-
-            # Validate backup structure
-            if "books" not in data:
-                return RestoreResult(
-                    success=False,
-                    error="Invalid backup: missing books data",
-                )
-
-            if mode == RestoreMode.REPLACE:
-                return self._restore_replace(data, dry_run)
-            elif mode == RestoreMode.MERGE:
-                return self._restore_merge(data, dry_run)
-            elif mode == RestoreMode.UPDATE:
-                return self._restore_update(data, dry_run)
-            elif mode == RestoreMode.INCREMENTAL:
-                return self._restore_incremental(data, dry_run)
-            else:
+            if mode not in set(RestoreMode):
                 return RestoreResult(
                     success=False,
                     error=f"Unknown restore mode: {mode}",
                 )
-
+            result = self._restore(backup_path, RestoreMode(mode), dry_run)
         except Exception as e:
-            return RestoreResult(
+            result = RestoreResult(
                 success=False,
                 error=str(e),
             )
+        if not dry_run:
+            # Restored rows are upserted without the ORM events that keep
+            # search suggestions current; merge batches may have committed
+            # even if the restore then failed
+            invalidate_suggestion_index(self.db.engine)
+        result.elapsed_seconds = time.perf_counter() - started
+        return result
+
+    def _restore(self, backup_path: Path, mode: RestoreMode, dry_run: bool) -> RestoreResult:
+        """Dispatch on the first member of the backup."""
+        members = iter_backup(backup_path)
+        first = next(members, None)
+
+        # Incremental backups start with their flag
+        if first is not None and first[0] == "incremental" and first[1]:
+            members.close()
+            metadata = BackupManager(self.db)._read_backup_metadata(backup_path)
+            if metadata is not None and metadata.is_incremental:
+                return self._restore_incremental(backup_path, dry_run)
+            # Date-based incremental from an older version: no chain to replay
+            return self._restore_stream(iter_backup(backup_path), RestoreMode.UPDATE, dry_run)
+
+        if first is not None:
+            members = _prepend(first, members)
+        # A plain backup has no chain; apply it as an update
+        if mode == RestoreMode.INCREMENTAL:
+            mode = RestoreMode.UPDATE
+        return self._restore_stream(members, mode, dry_run)
+
+    def _restore_stream(
+        self,
+        members: Iterator[tuple[str, Any]],
+        mode: RestoreMode,
+        dry_run: bool,
+    ) -> RestoreResult:
+        """Restore a full backup's members in one replace, merge or update pass."""
+        result = RestoreResult(success=True, mode=mode)
+        register_models()
+        # A batch, so the trigger DDL and savepoints are in its transaction
+        with self.db.batch() as uow:
+            self._apply_members(
+                uow.session,
+                members,
+                result,
+                mode,
+                dry_run,
+                commit_batches=mode != RestoreMode.REPLACE,
+                require_books=True,
+            )
+        return result
 
     def restore_sqlite(
         self,
@@ -128,19 +195,31 @@ class RestoreManager:
         try:
             target = target_path or Path(self.db.db_path)
 
+            # Flush and close our connections so the file copies are complete
+            replacing_current = target == Path(self.db.db_path)
+            if replacing_current:
+                self.db.checkpoint()
+                self.db.engine.dispose()
+
             # Create backup of current database
             if target.exists():
                 backup = target.with_suffix(".db.bak")
                 shutil.copy2(target, backup)
 
-            # Copy backup to target
+            # Copy backup to target; a leftover WAL would be replayed onto it
             shutil.copy2(backup_path, target)
+            for suffix in ("-wal", "-shm"):
+                Path(f"{target}{suffix}").unlink(missing_ok=True)
+            if replacing_current:
+                invalidate_suggestion_index(self.db.engine)
 
             # Count records in restored database
             restored_db = Database(str(target))
             with restored_db.get_session() as session:
-                book_count = len(session.execute(select(Book.id)).all())
-                log_count = len(session.execute(select(ReadingLog.id)).all())
+                book_count = session.execute(select(func.count()).select_from(Book)).scalar_one()
+                log_count = session.execute(
+                    select(func.count()).select_from(ReadingLog)
+                ).scalar_one()
 
             return RestoreResult(
                 success=True,
@@ -165,311 +244,238 @@ class RestoreManager:
             Dictionary with preview information
         """
         try:
-            data = self._load_backup_file(backup_path)
-
-            metadata = data.get("_metadata", {})
-            books = data.get("books", [])
-            logs = data.get("reading_logs", [])
-
-            # Get current database counts
-            with self.db.get_session() as session:
-                current_books = len(session.execute(select(Book.id)).all())
-                current_logs = len(session.execute(select(ReadingLog.id)).all())
+            metadata: dict = {}
+            is_incremental = False
+            backup_books = backup_logs = overlap_count = 0
 
-            # Find overlaps
-            backup_book_ids = {b["id"] for b in books}
             with self.db.get_session() as session:
-                existing_ids = {
-                    row[0] for row in session.execute(select(Book.id)).all()
-                }
-
-            overlap_count = len(backup_book_ids & existing_ids)
-            new_count = len(backup_book_ids - existing_ids)
+                current_books = session.execute(select(func.count()).select_from(Book)).scalar_one()
+                current_logs = session.execute(
+                    select(func.count()).select_from(ReadingLog)
+                ).scalar_one()
+
+                for key, value in iter_backup(backup_path):
+                    if key == "books":
+                        # Overlap is checked a batch of IDs at a time
+                        for batch in _batches(value, IN_CLAUSE_SIZE):
+                            ids = [book["id"] for book in batch]
+                            backup_books += len(ids)
+                            overlap_count += session.execute(
+                                select(func.count()).select_from(Book).where(Book.id.in_(ids))
+                            ).scalar_one()
+                    elif key == "reading_logs":
+                        backup_logs += sum(1 for _ in value)
+                    elif key == "incremental":
+                        is_incremental = bool(value)
+                    elif key == "_metadata":
+                        metadata = value
 
             return {
                 "backup_created": metadata.get("created_at"),
                 "backup_version": metadata.get("version"),
-                "backup_books": len(books),
-                "backup_logs": len(logs),
+                "backup_books": backup_books,
+                "backup_logs": backup_logs,
                 "current_books": current_books,
                 "current_logs": current_logs,
                 "overlapping_books": overlap_count,
-                "new_books": new_count,
-                "is_incremental": data.get("incremental", False),
+                "new_books": backup_books - overlap_count,
+                "is_incremental": is_incremental,
             }
 
         except Exception as e:
             return {"error": str(e)}
 
-    def _restore_replace(self, data: dict, dry_run: bool) -> RestoreResult:
-        """Restore by replacing all data."""
-        result = RestoreResult(success=True, mode=RestoreMode.REPLACE)
-        warnings = []
-
-        books = data.get("books", [])
-        logs = data.get("reading_logs", [])
-
-        if dry_run:
-            result.books_restored = len(books)
-            result.logs_restored = len(logs)
-            return result
-
-        with self.db.get_session() as session:
-            # Clear existing data
-            session.execute(delete(ReadingLog))
-            session.execute(delete(Book))
-            session.commit()
-
-            # Restore books
-            for book_data in books:
-                try:
-                    book = self._create_book_from_dict(book_data)
-                    session.add(book)
-                    result.books_restored += 1
-                except Exception as e:
-                    warnings.append(f"Failed to restore book '{book_data.get('title')}': {e}")
-
-            session.commit()
-
-            # Restore reading logs
-            for log_data in logs:
-                try:
-                    log = self._create_log_from_dict(log_data)
-                    session.add(log)
-                    result.logs_restored += 1
-                except Exception as e:
-                    warnings.append(f"Failed to restore log: {e}")
-
-            session.commit()
-
-        result.warnings = warnings
-        return result
+    def _restore_incremental(self, backup_path: Path, dry_run: bool) -> RestoreResult:
+        """Replay an incremental backup's chain.
 
-    def _restore_merge(self, data: dict, dry_run: bool) -> RestoreResult:
-        """Restore by merging with existing data (skip existing)."""
-        result = RestoreResult(success=True, mode=RestoreMode.MERGE)
-        warnings = []
-
-        books = data.get("books", [])
-        logs = data.get("reading_logs", [])
-
-        with self.db.get_session() as session:
-            # Get existing IDs
-            existing_book_ids = {
-                row[0] for row in session.execute(select(Book.id)).all()
-            }
-            existing_log_ids = {
-                row[0] for row in session.execute(select(ReadingLog.id)).all()
-            }
+        The full backup at the root of the chain replaces the tables it
+        holds, then each incremental is applied in order: changed rows are
+        upserted and tombstoned rows deleted. The whole chain is applied
+        in one transaction.
+        """
+        chain = BackupManager(self.db).backup_chain(backup_path)
+        result = RestoreResult(success=True, mode=RestoreMode.INCREMENTAL)
+
+        register_models()
+        with self.db.batch() as uow:
+            for position, path in enumerate(chain):
+                self._apply_members(
+                    uow.session,
+                    iter_backup(path),
+                    result,
+                    RestoreMode.REPLACE if position == 0 else RestoreMode.UPDATE,
+                    dry_run,
+                    commit_batches=False,
+                    require_books=False,
+                )
 
-            if dry_run:
-                for book_data in books:
-                    if book_data["id"] in existing_book_ids:
-                        result.books_skipped += 1
-                    else:
-                        result.books_restored += 1
-
-                for log_data in logs:
-                    if log_data["id"] in existing_log_ids:
-                        result.logs_skipped += 1
-                    else:
-                        result.logs_restored += 1
-
-                return result
-
-            # Restore new books only
-            for book_data in books:
-                if book_data["id"] in existing_book_ids:
-                    result.books_skipped += 1
-                    continue
-
-                try:
-                    book = self._create_book_from_dict(book_data)
-                    session.add(book)
-                    result.books_restored += 1
-                except Exception as e:
-                    warnings.append(f"Failed to restore book '{book_data.get('title')}': {e}")
-
-            session.commit()
-
-            # Restore new logs only
-            for log_data in logs:
-                if log_data["id"] in existing_log_ids:
-                    result.logs_skipped += 1
-                    continue
-
-                try:
-                    log = self._create_log_from_dict(log_data)
-                    session.add(log)
-                    result.logs_restored += 1
-                except Exception as e:
-                    warnings.append(f"Failed to restore log: {e}")
-
-            session.commit()
-
-        result.warnings = warnings
         return result
 
-    def _restore_update(self, data: dict, dry_run: bool) -> RestoreResult:
-        """Restore by updating existing and adding new."""
-        result = RestoreResult(success=True, mode=RestoreMode.UPDATE)
-        warnings = []
+    def _apply_members(
+        self,
+        session: Session,
+        members: Iterable[tuple[str, Any]],
+        result: RestoreResult,
+        mode: RestoreMode,
+        dry_run: bool,
+        commit_batches: bool,
+        require_books: bool,
+    ) -> None:
+        """Write every table in a backup as it is read, then apply its tombstones.
 
-        books = data.get("books", [])
-        logs = data.get("reading_logs", [])
+        Args:
+            session: Session to write in
+            members: Members of the backup, from ``iter_backup``
+            result: RestoreResult to update
+            mode: REPLACE empties each table before writing it, MERGE only
+                adds new rows, UPDATE also overwrites existing ones
+            dry_run: Only count what would be written
+            commit_batches: Commit after every batch
+            require_books: Fail unless the backup's first table is books
+        """
+        tables = {table.name: table for table in Base.metadata.sorted_tables}
+        seen_books = False
+
+        for key, value in members:
+            if key == "_deleted":
+                self._apply_tombstones(session, value, result, dry_run)
+                continue
+            table = tables.get(key)
+            if table is None:
+                continue
+
+            # Books come first, so a backup without them fails before any write
+            if table.name == Book.__tablename__:
+                seen_books = True
+            elif require_books and not seen_books:
+                raise ValueError(_MISSING_BOOKS)
+
+            with ExitStack() as stack:
+                if mode == RestoreMode.REPLACE and not dry_run:
+                    # The table is rewritten whole: maintain the change log,
+                    # search index and rollups in bulk rather than per row
+                    stack.enter_context(bulk_rewrite(session, table))
+                    stack.enter_context(deferred_fts_sync(session, table.name))
+                    if table.name == ReadingLog.__tablename__:
+                        stack.enter_context(deferred_rollups(session))
+                    session.execute(delete(table))
+                result.table_counts.setdefault(table.name, 0)
+                for batch in _batches(value, RESTORE_BATCH_SIZE):
+                    self._restore_batch(session, table, batch, result, mode, dry_run)
+                    if commit_batches and not dry_run:
+                        session.commit()
+
+        if require_books and not seen_books:
+            raise ValueError(_MISSING_BOOKS)
+
+    def _restore_batch(
+        self,
+        session: Session,
+        table: Table,
+        rows: list[dict],
+        result: RestoreResult,
+        mode: RestoreMode,
+        dry_run: bool,
+    ) -> None:
+        """Write one batch of a table's rows and count them."""
+        pk_names = [column.name for column in table.primary_key.columns]
+        values = []
+        for row in rows:
+            try:
+                values.append(_column_values(table, row))
+            except (TypeError, ValueError) as e:
+                result.warnings.append(_row_warning(table, row, e))
+
+        existing = set() if mode == RestoreMode.REPLACE else existing_keys(session, table, values)
+        skipped = 0
+        if mode == RestoreMode.MERGE:
+            kept = [row for row in values if row_key(pk_names, row) not in existing]
+            skipped = len(values) - len(kept)
+            values = kept
+
+        if not dry_run:
+            values = write_rows(
+                session,
+                table,
+                values,
+                lambda row, error: result.warnings.append(_row_warning(table, row, error)),
+            )
 
-        with self.db.get_session() as session:
-            existing_book_ids = {
-                row[0] for row in session.execute(select(Book.id)).all()
+        updated = sum(1 for row in values if row_key(pk_names, row) in existing)
+        restored = len(values) - updated
+        result.table_counts[table.name] += len(values)
+        if table.name == Book.__tablename__:
+            result.books_restored += restored
+            result.books_updated += updated
+            result.books_skipped += skipped
+        elif table.name == ReadingLog.__tablename__:
+            result.logs_restored += len(values)
+            result.logs_skipped += skipped
+
+    def _apply_tombstones(
+        self,
+        session: Session,
+        tombstones: Iterable[dict],
+        result: RestoreResult,
+        dry_run: bool,
+    ) -> None:
+        """Delete the rows listed under an incremental backup's ``_deleted``."""
+        tombstones = list(tombstones)
+        if not dry_run:
+            by_table = {
+                name: [entry["id"] for entry in entries]
+                for name, entries in groupby(
+                    sorted(tombstones, key=lambda entry: entry["table"]),
+                    key=lambda entry: entry["table"],
+                )
             }
-
-            if dry_run:
-                for book_data in books:
-                    if book_data["id"] in existing_book_ids:
-                        result.books_updated += 1
-                    else:
-                        result.books_restored += 1
-                result.logs_restored = len(logs)
-                return result
-
-            # Process books
-            for book_data in books:
-                book_id = book_data["id"]
-
-                if book_id in existing_book_ids:
-                    # Update existing book
-                    try:
-                        existing = session.get(Book, book_id)
-                        if existing:
-                            self._update_book_from_dict(existing, book_data)
-                            result.books_updated += 1
-                    except Exception as e:
-                        warnings.append(f"Failed to update book '{book_data.get('title')}': {e}")
-                else:
-                    # Add new book
-                    try:
-                        book = self._create_book_from_dict(book_data)
-                        session.add(book)
-                        result.books_restored += 1
-                    except Exception as e:
-                        warnings.append(f"Failed to restore book '{book_data.get('title')}': {e}")
-
-            session.commit()
-
-            # Process logs (replace all for updated books)
-            for log_data in logs:
-                try:
-                    # Delete existing log if it exists
-                    existing_log = session.get(ReadingLog, log_data["id"])
-                    if existing_log:
-                        session.delete(existing_log)
-
-                    log = self._create_log_from_dict(log_data)
-                    session.add(log)
-                    result.logs_restored += 1
-                except Exception as e:
-                    warnings.append(f"Failed to restore log: {e}")
-
-            session.commit()
-
-        result.warnings = warnings
-        return result
-
-    def _restore_incremental(self, data: dict, dry_run: bool) -> RestoreResult:
-        """Apply incremental backup."""
-        # Incremental uses update mode logic
-        return self._restore_update(data, dry_run)
-
-    def _create_book_from_dict(self, data: dict) -> Book:
-        """Create Book model from dictionary."""
-        tags = data.get("tags", [])
-        if isinstance(tags, list):
-            tags_json = json.dumps(tags)
-        else:
-            tags_json = tags
-
-        book = Book(
-            id=data["id"],
-            title=data["title"],
-            author=data.get("author"),
-            isbn=data.get("isbn"),
-            isbn13=data.get("isbn13"),
-            status=data.get("status", BookStatus.WISHLIST.value),
-            rating=data.get("rating"),
-            page_count=data.get("page_count"),
-            progress=data.get("progress"),
-            date_added=data.get("date_added"),
-            date_started=data.get("date_started"),
-            date_finished=data.get("date_finished"),
-            tags=tags_json,
-            comments=data.get("comments"),
-            publisher=data.get("publisher"),
-            publication_year=data.get("publication_year"),
-            series=data.get("series"),
-            series_index=data.get("series_index"),
-            cover=data.get("cover"),
-            description=data.get("description"),
-            goodreads_id=data.get("goodreads_id"),
-            goodreads_avg_rating=data.get("goodreads_avg_rating"),
-            read_next=data.get("read_next", False),
-            notion_page_id=data.get("notion_page_id"),
-            notion_modified_at=data.get("notion_modified_at"),
-        )
-        return book
-
-    def _update_book_from_dict(self, book: Book, data: dict) -> None:
-        """Update existing book from dictionary."""
-        tags = data.get("tags", [])
-        if isinstance(tags, list):
-            tags_json = json.dumps(tags)
-        else:
-            tags_json = tags
-
-        book.title = data["title"]
-        book.author = data.get("author")
-        book.isbn = data.get("isbn")
-        book.isbn13 = data.get("isbn13")
-        book.status = data.get("status", BookStatus.WISHLIST.value)
-        book.rating = data.get("rating")
-        book.page_count = data.get("page_count")
-        book.progress = data.get("progress")
-        book.date_added = data.get("date_added")
-        book.date_started = data.get("date_started")
-        book.date_finished = data.get("date_finished")
-        book.tags = tags_json
-        book.comments = data.get("comments")
-        book.publisher = data.get("publisher")
-        book.publication_year = data.get("publication_year")
-        book.series = data.get("series")
-        book.series_index = data.get("series_index")
-        book.cover = data.get("cover")
-        book.description = data.get("description")
-        book.goodreads_id = data.get("goodreads_id")
-        book.goodreads_avg_rating = data.get("goodreads_avg_rating")
-        book.read_next = data.get("read_next", False)
-        book.notion_page_id = data.get("notion_page_id")
-        book.notion_modified_at = data.get("notion_modified_at")
-
-    def _create_log_from_dict(self, data: dict) -> ReadingLog:
-        """Create ReadingLog model from dictionary."""
-        return ReadingLog(
-            id=data["id"],
-            book_id=data["book_id"],
-            date=data.get("date"),
-            pages_read=data.get("pages_read"),
-            start_page=data.get("start_page"),
-            end_page=data.get("end_page"),
-            duration_minutes=data.get("duration_minutes"),
-            notes=data.get("notes"),
-            location=data.get("location"),
-            notion_page_id=data.get("notion_page_id"),
-        )
-
-    def _load_backup_file(self, backup_path: Path) -> dict:
-        """Load backup file (compressed or not)."""
-        if backup_path.suffix == ".gz" or str(backup_path).endswith(".gz"):
-            with gzip.open(backup_path, "rt", encoding="utf-8") as f:
-                return json.load(f)
-        else:
-            with open(backup_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            for table in reversed(Base.metadata.sorted_tables):
+                row_ids = by_table.get(table.name)
+                if row_ids:
+                    (pk,) = table.primary_key.columns
+                    for start in range(0, len(row_ids), IN_CLAUSE_SIZE):
+                        chunk = row_ids[start : start + IN_CLAUSE_SIZE]
+                        session.execute(delete(table).where(pk.in_(chunk)))
+        result.records_deleted += len(tombstones)
+
+
+def _prepend(first: Any, rest: Iterator[Any]) -> Iterator[Any]:
+    """An iterator yielding ``first`` then the rest."""
+    yield first
+    yield from rest
+
+
+def _batches(rows: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Split a stream of rows into lists of at most ``size``."""
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def _row_warning(table: Table, row: dict, error: Any) -> str:
+    """Warning for a row that couldn't be restored."""
+    if table.name == Book.__tablename__:
+        return f"Failed to restore book '{row.get('title')}': {error}"
+    label = ", ".join(str(row.get(column.name)) for column in table.primary_key.columns)
+    return f"Failed to restore {table.name} row {label}: {error}"
+
+
+def _column_values(table: Table, row: dict) -> dict[str, Any]:
+    """Backup row -> column values, dropping keys the table doesn't have.
+
+    Lists and dicts (e.g. book tags) go back to JSON text, and date and
+    datetime columns are parsed from their ISO strings.
+    """
+    values = {}
+    for name, value in row.items():
+        column = table.c.get(name)
+        if column is None:
+            continue
+        if isinstance(value, (list, dict)):
+            value = json.dumps(value)
+        elif isinstance(value, str) and isinstance(column.type, DateTime):
+            value = datetime.fromisoformat(value)
+        elif isinstance(value, str) and isinstance(column.type, Date):
+            value = date.fromisoformat(value)
+        values[name] = value
+    return values
@@ -0,0 +1,267 @@
+"""Streaming backup file I/O.
+
+A backup is one JSON object with a key per table holding its rows,
+followed by ``_metadata``. Rows are written one per line as they are read
+from the database, so memory use stays flat however large the library
+is, and the SHA-256 checksum is computed over the bytes as they pass
+through instead of over a second serialisation.
+
+Layout (uncompressed)::
+
+    {"books": [
+    {"id": "...", "title": "...", ...},
+    {"id": "...", "title": "...", ...}
+    ],
+    "reading_logs": [
+    ],
+    "_metadata": {...}}
+
+The checksum covers everything before ``"_metadata"``; its length is
+stored as ``data_bytes`` so the checksum can be verified without parsing.
+
+``iter_backup`` reads any backup - including the pretty-printed files of
+older versions - member by member, handing out table rows one at a time
+instead of loading the whole document.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator, Mapping, Optional, TextIO
+
+# Bytes read at a time when re-hashing a backup
+READ_CHUNK_SIZE = 1024 * 1024
+
+# Characters read at a time while parsing a backup
+PARSE_CHUNK_SIZE = 64 * 1024
+
+
+def is_compressed(path: Path) -> bool:
+    """Whether a backup file is gzip-compressed, judged by its name."""
+    return str(path).endswith(".gz")
+
+
+def open_backup(path: Path, mode: str = "rb") -> BinaryIO:
+    """Open a backup file in binary mode, through gzip if compressed."""
+    if is_compressed(path):
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+def _json_default(value: Any) -> Any:
+    """Encode column values json doesn't handle natively."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_row(row: Mapping[str, Any]) -> bytes:
+    """Serialise one row as a single line of JSON."""
+    return json.dumps(dict(row), default=_json_default, ensure_ascii=False).encode("utf-8")
+
+
+class BackupWriter:
+    """Writes a backup file table by table.
+
+    Use as a context manager: call ``write_table`` for each table, then
+    ``seal`` to get the checksum, then ``write_metadata``. If the block
+    raises, the partial file is removed.
+    """
+
+    def __init__(self, path: Path, compress: bool = True):
+        self.path = path
+        self.compress = compress
+        self.data_bytes = 0
+        self._hash = hashlib.sha256()
+        self._file: Optional[BinaryIO] = None
+        self._sections = 0
+        self._sealed = False
+
+    def __enter__(self) -> "BackupWriter":
+        self._file = gzip.open(self.path, "wb") if self.compress else open(self.path, "wb")
+        self._write(b"{")
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._file.close()
+        if exc_type is not None:
+            self.path.unlink(missing_ok=True)
+
+    def _write(self, data: bytes) -> None:
+        """Write bytes, hashing them while the data section is open."""
+        if not self._sealed:
+            self._hash.update(data)
+            self.data_bytes += len(data)
+        self._file.write(data)
+
+    def _start_section(self, key: str) -> None:
+        """Write the key of the next top-level member."""
+        separator = b",\n" if self._sections else b""
+        self._write(separator + json.dumps(key).encode("utf-8") + b": ")
+        self._sections += 1
+
+    def write_table(self, name: str, rows: Iterable[Mapping[str, Any]]) -> int:
+        """Write a table's rows as a JSON array, one row per line.
+
+        Args:
+            name: Key of the table in the backup
+            rows: Rows to write, consumed lazily
+
+        Returns:
+            Number of rows written
+        """
+        self._start_section(name)
+        self._write(b"[")
+        count = 0
+        for row in rows:
+            self._write((b",\n" if count else b"\n") + encode_row(row))
+            count += 1
+        self._write(b"\n]")
+        return count
+
+    def write_value(self, name: str, value: Any) -> None:
+        """Write a small top-level value (e.g. a flag) into the data section."""
+        self._start_section(name)
+        self._write(json.dumps(value, default=_json_default).encode("utf-8"))
+
+    def seal(self) -> str:
+        """End the checksummed data section.
+
+        Returns:
+            SHA-256 hex digest of the data section
+        """
+        self._sealed = True
+        return self._hash.hexdigest()
+
+    def write_metadata(self, metadata: dict) -> None:
+        """Write ``_metadata`` and close the top-level object."""
+        if not self._sealed:
+            self.seal()
+        self._start_section("_metadata")
+        self._file.write(json.dumps(metadata, indent=2).encode("utf-8") + b"}\n")
+
+
+def data_checksum(path: Path, data_bytes: int) -> str:
+    """SHA-256 of the first ``data_bytes`` uncompressed bytes of a backup."""
+    digest = hashlib.sha256()
+    remaining = data_bytes
+    with open_backup(path) as f:
+        while remaining > 0:
+            chunk = f.read(min(READ_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            digest.update(chunk)
+            remaining -= len(chunk)
+    return digest.hexdigest()
+
+
+class _Parser:
+    """Pull parser over a JSON text stream, refilling its buffer as needed."""
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read more text, dropping what has been parsed. False at EOF."""
+        if self._eof:
+            return False
+        chunk = self._stream.read(PARSE_CHUNK_SIZE)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Next non-whitespace character, without consuming it."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos].isspace():
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise ValueError("Invalid backup file: unexpected end of data")
+
+    def expect(self, *chars: str) -> str:
+        """Consume the next character, which must be one of ``chars``."""
+        char = self._peek()
+        if char not in chars:
+            raise ValueError(f"Invalid backup file: expected {' or '.join(chars)!r}, got {char!r}")
+        self._pos += 1
+        return char
+
+    def peek_is(self, char: str) -> bool:
+        """Whether the next character is ``char``."""
+        return self._peek() == char
+
+    def value(self) -> Any:
+        """Parse one complete JSON value."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise ValueError(f"Invalid backup file: {e}") from e
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def elements(self) -> Iterator[Any]:
+        """Yield the elements of an array whose '[' has been consumed."""
+        if self.peek_is("]"):
+            self.expect("]")
+            return
+        while True:
+            yield self.value()
+            if self.expect(",", "]") == "]":
+                return
+
+
+def iter_backup(path: Path) -> Iterator[tuple[str, Any]]:
+    """Yield the top-level members of a backup file in order.
+
+    Array members (tables) are yielded as lazy iterators over their rows;
+    anything the caller doesn't consume is skipped before the next member
+    is read. Other members are yielded parsed.
+
+    Raises:
+        ValueError: If the file isn't a JSON object
+    """
+    with open_backup(path) as raw:
+        parser = _Parser(io.TextIOWrapper(raw, encoding="utf-8"))
+        parser.expect("{")
+        if parser.peek_is("}"):
+            return
+        while True:
+            key = parser.value()
+            parser.expect(":")
+            if parser.peek_is("["):
+                parser.expect("[")
+                rows = parser.elements()
+                yield key, rows
+                for _ in rows:
+                    pass
+            else:
+                yield key, parser.value()
+            if parser.expect(",", "}") == "}":
+                return
+
+
+def read_backup_metadata(path: Path) -> Optional[dict]:
+    """The ``_metadata`` member of a backup, skipping over its rows."""
+    for key, value in iter_backup(path):
+        if key == "_metadata":
+            return value
+    return None
@@ -727,9 +727,15 @@ def history(
 def sync(
     status_only: bool = typer.Option(False, "--status", "-s", help="Show sync status only"),
     force_pull: bool = typer.Option(False, "--force-pull", help="Force full refresh from Notion"),
+    full: bool = typer.Option(
+        False, "--full", help="Pull every Notion page, not just changes since the last sync"
+    ),
     push_only: bool = typer.Option(False, "--push", help="Only push local changes"),
     pull_only: bool = typer.Option(False, "--pull", help="Only pull from Notion"),
     non_interactive: bool = typer.Option(False, "--yes", "-y", help="Auto-resolve conflicts (Notion wins)"),
+    workers: int = typer.Option(
+        4, "--workers", "-w", min=1, help="Concurrent Notion requests when pushing"
+    ),
 ) -> None:
     """Sync local database with Notion."""
     config = get_config()
@@ -760,7 +766,7 @@ def sync(
 
     if force_pull or pull_only:
         console.print("[bold]Pulling from Notion...[/bold]")
-        result = processor.pull_changes(interactive=interactive)
+        result = processor.pull_changes(interactive=interactive, full=full or force_pull)
         console.print(f"\n[green]Pulled: {result.pulled} books[/green]")
         if result.conflicts:
             console.print(f"[yellow]Conflicts resolved: {result.conflicts}[/yellow]")
@@ -776,7 +782,7 @@ def sync(
             console.print("[green]✓[/green] No pending changes to push.")
             return
         console.print(f"[bold]Pushing {pending} items to Notion...[/bold]")
-        result = processor.push_pending(interactive=interactive)
+        result = processor.push_pending(interactive=interactive, workers=workers)
         console.print(f"\n[green]Pushed: {result.pushed} items[/green]")
         if result.errors:
             print_error(f"{len(result.errors)} errors occurred")
@@ -787,7 +793,7 @@ def sync(
     if pending == 0:
         console.print("[dim]No pending local changes.[/dim]")
 
-    result = processor.sync(interactive=interactive)
+    result = processor.sync(interactive=interactive, workers=workers, full=full)
 
     console.print("\n" + "=" * 40)
     console.print("[bold]Sync Complete[/bold]")
@@ -816,6 +822,9 @@ def import_notion_cmd(
     dry_run: bool = typer.Option(False, "--dry-run", "-n", help="Preview without importing"),
     backup_first: bool = typer.Option(False, "--backup", "-b", help="Backup database first"),
     non_interactive: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompts"),
+    workers: int = typer.Option(
+        1, "--workers", "-w", min=1, help="Processes for duplicate detection"
+    ),
 ) -> None:
     """Import books from Notion CSV export."""
     if not file.exists():
@@ -824,13 +833,13 @@ def import_notion_cmd(
 
     if backup_first:
         from datetime import datetime
-        import shutil
+        from .backup import BackupManager
 
         config = get_config()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = config.db_path.parent / f"books_backup_{timestamp}.db"
         if config.db_path.exists():
-            shutil.copy2(config.db_path, backup_path)
+            BackupManager(get_db()).create_sqlite_backup(backup_path)
             console.print(f"[dim]Database backed up to: {backup_path}[/dim]")
 
     from .etl import import_notion
@@ -839,6 +848,7 @@ def import_notion_cmd(
         file_path=file,
         dry_run=dry_run,
         interactive=not non_interactive,
+        workers=workers,
     )
 
     if dry_run:
@@ -854,6 +864,9 @@ def import_calibre_cmd(
     dry_run: bool = typer.Option(False, "--dry-run", "-n", help="Preview without importing"),
     backup_first: bool = typer.Option(False, "--backup", "-b", help="Backup database first"),
     non_interactive: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompts"),
+    workers: int = typer.Option(
+        1, "--workers", "-w", min=1, help="Processes for duplicate detection"
+    ),
 ) -> None:
     """Import books from Calibre CSV export."""
     if not file.exists():
@@ -862,13 +875,13 @@ def import_calibre_cmd(
 
     if backup_first:
         from datetime import datetime
-        import shutil
+        from .backup import BackupManager
 
         config = get_config()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = config.db_path.parent / f"books_backup_{timestamp}.db"
         if config.db_path.exists():
-            shutil.copy2(config.db_path, backup_path)
+            BackupManager(get_db()).create_sqlite_backup(backup_path)
             console.print(f"[dim]Database backed up to: {backup_path}[/dim]")
 
     from .etl import import_calibre
@@ -877,6 +890,7 @@ def import_calibre_cmd(
         file_path=file,
         dry_run=dry_run,
         interactive=not non_interactive,
+        workers=workers,
     )
 
     if dry_run:
@@ -892,6 +906,9 @@ def import_goodreads_cmd(
     dry_run: bool = typer.Option(False, "--dry-run", "-n", help="Preview without importing"),
     backup_first: bool = typer.Option(False, "--backup", "-b", help="Backup database first"),
     non_interactive: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompts"),
+    workers: int = typer.Option(
+        1, "--workers", "-w", min=1, help="Processes for duplicate detection"
+    ),
 ) -> None:
     """Import books from Goodreads CSV export."""
     if not file.exists():
@@ -900,13 +917,13 @@ def import_goodreads_cmd(
 
     if backup_first:
         from datetime import datetime
-        import shutil
+        from .backup import BackupManager
 
         config = get_config()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = config.db_path.parent / f"books_backup_{timestamp}.db"
         if config.db_path.exists():
-            shutil.copy2(config.db_path, backup_path)
+            BackupManager(get_db()).create_sqlite_backup(backup_path)
             console.print(f"[dim]Database backed up to: {backup_path}[/dim]")
 
     from .etl import import_goodreads
@@ -915,6 +932,7 @@ def import_goodreads_cmd(
         file_path=file,
         dry_run=dry_run,
         interactive=not non_interactive,
+        workers=workers,
     )
 
     if dry_run:
@@ -932,6 +950,9 @@ def import_all_cmd(
     dry_run: bool = typer.Option(False, "--dry-run", "-n", help="Preview without importing"),
     backup_first: bool = typer.Option(False, "--backup", "-b", help="Backup database first"),
     non_interactive: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompts"),
+    workers: int = typer.Option(
+        1, "--workers", "-w", min=1, help="Processes for duplicate detection"
+    ),
 ) -> None:
     """Import books from all sources at once."""
     if not any([notion, calibre, goodreads]):
@@ -946,13 +967,13 @@ def import_all_cmd(
 
     if backup_first:
         from datetime import datetime
-        import shutil
+        from .backup import BackupManager
 
         config = get_config()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = config.db_path.parent / f"books_backup_{timestamp}.db"
         if config.db_path.exists():
-            shutil.copy2(config.db_path, backup_path)
+            BackupManager(get_db()).create_sqlite_backup(backup_path)
             console.print(f"[dim]Database backed up to: {backup_path}[/dim]")
 
     from .etl import import_from_csv
@@ -963,6 +984,7 @@ def import_all_cmd(
         goodreads_path=goodreads,
         dry_run=dry_run,
         interactive=not non_interactive,
+        workers=workers,
     )
 
     if dry_run:
@@ -1038,6 +1060,47 @@ def import_csv_generic(
             console.print(f"  [red]{error}[/red]")
 
 
+@import_app.command("columnar")
+def import_columnar(
+    path: Path = typer.Argument(..., help="Columnar export directory or .parquet/.arrow file"),
+    duplicates: str = typer.Option(
+        "skip", "--duplicates", "-d", help="Rows already in the library: skip, update, replace"
+    ),
+    dry_run: bool = typer.Option(False, "--dry-run", "-n", help="Preview without importing"),
+) -> None:
+    """Import a library from Parquet or Arrow files written by 'export columnar'."""
+    from .imports import ColumnarImporter
+    from .imports.base import DuplicateHandling
+
+    if not path.exists():
+        print_error(f"File not found: {path}")
+        raise typer.Exit(1)
+
+    dup_map = {
+        "skip": DuplicateHandling.SKIP,
+        "update": DuplicateHandling.UPDATE,
+        "replace": DuplicateHandling.REPLACE,
+    }
+    if duplicates not in dup_map:
+        print_error(f"Invalid duplicate handling: {duplicates}. Use: skip, update, replace")
+        raise typer.Exit(1)
+
+    importer = ColumnarImporter(get_db())
+    result = importer.import_file(path, duplicate_handling=dup_map[duplicates], dry_run=dry_run)
+
+    if result.success:
+        print_success(f"Import complete! {result.summary}")
+        for table, count in result.table_counts.items():
+            console.print(f"  {table}: {count}")
+        if dry_run:
+            console.print("\n[dim]Dry run - no changes made.[/dim]")
+    else:
+        print_error("Import failed")
+        for error in result.error_messages[:5]:
+            console.print(f"  [red]{error}[/red]")
+        raise typer.Exit(1)
+
+
 @import_app.command("preview")
 def import_preview(
     file: Path = typer.Argument(..., help="Path to file to preview"),
@@ -1246,7 +1309,7 @@ app.add_typer(export_app, name="export")
 @export_app.command("csv")
 def export_csv(
     output: Path = typer.Option(
-        Path("./books_export.csv"), "--output", "-o", help="Output file path"
+        Path("./books_export.csv"), "--output", "-o", help="Output file path ('-' for stdout)"
     ),
     format: str = typer.Option(
         "standard", "--format", "-f",
@@ -1263,6 +1326,8 @@ def export_csv(
     # Parse format
     try:
         export_format = ExportFormat(format.lower())
+        if export_format not in CSVExporter.FORMAT_FIELDS:
+            raise ValueError(format)
     except ValueError:
         print_error(f"Invalid format: {format}. Use: standard, goodreads, notion, calibre")
         raise typer.Exit(1)
@@ -1276,6 +1341,13 @@ def export_csv(
             print_error(f"Invalid status: {status}")
             raise typer.Exit(1)
 
+    if str(output) == "-":
+        # Rows go out as they are read, so this can feed a pipeline
+        import sys
+
+        exporter.write_books(sys.stdout, format=export_format, status_filter=status_filter)
+        return
+
     console.print(f"[dim]Exporting to {output}...[/dim]")
     result = exporter.export_books(output, format=export_format, status_filter=status_filter)
 
@@ -1289,7 +1361,7 @@ def export_csv(
 @export_app.command("json")
 def export_json(
     output: Path = typer.Option(
-        Path("./books_export.json"), "--output", "-o", help="Output file path"
+        Path("./books_export.json"), "--output", "-o", help="Output file path ('-' for stdout)"
     ),
     include_logs: bool = typer.Option(True, "--logs/--no-logs", help="Include reading logs"),
     compact: bool = typer.Option(False, "--compact", "-c", help="Compact JSON output"),
@@ -1300,6 +1372,13 @@ def export_json(
     db = get_db()
     exporter = JSONExporter(db)
 
+    if str(output) == "-":
+        import sys
+
+        exporter.write_all(sys.stdout, include_reading_logs=include_logs, pretty=not compact)
+        sys.stdout.write("\n")
+        return
+
     console.print(f"[dim]Exporting to {output}...[/dim]")
     result = exporter.export_all(output, include_reading_logs=include_logs, pretty=not compact)
 
@@ -1311,6 +1390,40 @@ def export_json(
         raise typer.Exit(1)
 
 
+@export_app.command("columnar")
+def export_columnar(
+    output: Path = typer.Option(
+        Path("./books_columnar"), "--output", "-o", help="Output directory"
+    ),
+    format: str = typer.Option("parquet", "--format", "-f", help="Format: parquet, arrow"),
+    compression: str = typer.Option(
+        "zstd", "--compression", "-c",
+        help="Codec: zstd, lz4, snappy (parquet), or none; uncompressed arrow can be memory-mapped",
+    ),
+) -> None:
+    """Export books, reading logs and daily readings to typed columnar files."""
+    from .export import ColumnarExporter, ExportFormat
+
+    if format.lower() not in ("parquet", "arrow"):
+        print_error(f"Invalid format: {format}. Use: parquet, arrow")
+        raise typer.Exit(1)
+
+    console.print(f"[dim]Exporting to {output}...[/dim]")
+    result = ColumnarExporter(get_db()).export_library(
+        output,
+        format=ExportFormat(format.lower()),
+        compression=None if compression.lower() == "none" else compression.lower(),
+    )
+
+    if result.success:
+        print_success(f"Exported {result.records_exported} rows to {result.file_path}")
+        for table, count in result.table_counts.items():
+            console.print(f"  {table}: {count}")
+    else:
+        print_error(f"Export failed: {result.error}")
+        raise typer.Exit(1)
+
+
 @export_app.command("logs")
 def export_logs(
     output: Path = typer.Option(
@@ -1645,12 +1758,17 @@ def report_heatmap(
 @report_app.command("dashboard")
 def report_dashboard(
     year: Optional[int] = typer.Option(None, "--year", "-y", help="Year (default: current)"),
+    in_memory: bool = typer.Option(
+        False, "--in-memory", help="Compute from an in-memory snapshot of the library"
+    ),
 ) -> None:
     """Show a reading dashboard with key stats."""
     from .reports import ReportManager
+    from .stats.snapshot import LibrarySnapshot
 
     db = get_db()
-    manager = ReportManager(db)
+    snapshot = LibrarySnapshot.load(db) if in_memory else None
+    manager = ReportManager(db, snapshot=snapshot)
 
     if year is None:
         year = date.today().year
@@ -1713,12 +1831,17 @@ def report_recap(
     year: Optional[int] = typer.Option(None, "--year", "-y", help="Year (default: current)"),
     export_format: Optional[str] = typer.Option(None, "--export", "-e", help="Export format: json, markdown, csv"),
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output file path"),
+    in_memory: bool = typer.Option(
+        False, "--in-memory", help="Compute from an in-memory snapshot of the library"
+    ),
 ) -> None:
     """Generate a detailed yearly recap with fun facts."""
     from .reports import ReportManager, ExportFormat
+    from .stats.snapshot import LibrarySnapshot
 
     db = get_db()
-    manager = ReportManager(db)
+    snapshot = LibrarySnapshot.load(db) if in_memory else None
+    manager = ReportManager(db, snapshot=snapshot)
 
     if year is None:
         year = date.today().year
@@ -1925,8 +2048,8 @@ def backup(
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Backup file path"),
 ) -> None:
     """Backup the SQLite database to a timestamped file."""
-    import shutil
     from datetime import datetime
+    from .backup import BackupManager
 
     config = get_config()
     db_path = config.db_path
@@ -1939,8 +2062,114 @@ def backup(
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output = db_path.parent / f"books_backup_{timestamp}.db"
 
-    shutil.copy2(db_path, output)
-    print_success(f"Database backed up to: {output}")
+    result = BackupManager(get_db()).create_sqlite_backup(output)
+    if not result.success:
+        print_error(f"Backup failed: {result.error}")
+        raise typer.Exit(1)
+    print_success(f"Database backed up to: {result.backup_path}")
+
+
+# ============================================================================
+# Database Commands
+# ============================================================================
+
+db_app = typer.Typer(help="Database maintenance and tuning.")
+app.add_typer(db_app, name="db")
+
+
+@db_app.command("tune")
+def db_tune(
+    profile: Optional[str] = typer.Option(
+        None, "--profile", "-p", help="Profile to compare or apply (performance, compatible)"
+    ),
+    apply: bool = typer.Option(False, "--apply", help="Apply the profile to the database"),
+) -> None:
+    """Inspect or apply the SQLite performance profile.
+
+    Unless BOOKTRACKER_DB_PROFILE is set, databases inside a cloud-synced
+    folder (OneDrive, Dropbox, ...) use the 'compatible' profile, since
+    syncing WAL's -wal/-shm files can corrupt the database; all others use
+    'performance' (WAL).
+    """
+    from .db.tuning import apply_pragmas, get_profile, read_pragmas
+
+    db = get_db()
+    name = profile or db.profile_name
+    try:
+        target = get_profile(name)
+    except ValueError as e:
+        print_error(str(e))
+        raise typer.Exit(1)
+
+    raw = db.engine.raw_connection()
+    try:
+        if apply:
+            # journal_mode is stored in the file; the rest last per connection
+            apply_pragmas(raw.driver_connection, target.pragmas(db.is_memory))
+            raw.driver_connection.execute("PRAGMA optimize")
+        current = read_pragmas(raw.driver_connection)
+    finally:
+        raw.close()
+
+    if apply:
+        # Reconnect so pooled connections start from the new journal mode
+        db.engine.dispose()
+        print_success(f"Applied '{name}' profile to {db.db_path}")
+        if name != db.profile_name:
+            print_warning(
+                f"New connections still apply '{db.profile_name}'; "
+                f"set BOOKTRACKER_DB_PROFILE={name} to keep this profile."
+            )
+
+    expected = target.pragmas()
+
+    table = Table(title=f"SQLite settings vs '{name}' profile")
+    table.add_column("PRAGMA", style="cyan")
+    table.add_column("Current", justify="right")
+    table.add_column("Profile", justify="right")
+    for pragma, value in expected.items():
+        matches = str(current.get(pragma)).lower() == str(value).lower()
+        style = "green" if matches else "yellow"
+        table.add_row(pragma, f"[{style}]{current.get(pragma)}[/{style}]", str(value))
+    console.print(table)
+
+
+@db_app.command("rebuild-rollups")
+def db_rebuild_rollups() -> None:
+    """Recompute the daily reading rollups from the reading logs."""
+    from sqlalchemy import func, select
+
+    from .db.rollups import DAILY_ACTIVITY, rebuild_rollups
+
+    db = get_db()
+    with db.get_session() as session:
+        rebuild_rollups(session)
+        days = session.execute(select(func.count()).select_from(DAILY_ACTIVITY)).scalar_one()
+    print_success(f"Rebuilt daily reading rollups ({days} reading days)")
+
+
+@db_app.command("rebuild-fts")
+def db_rebuild_fts() -> None:
+    """Rebuild the full-text search indexes from their tables."""
+    from .search.fts import fts_available, rebuild_fts_indexes
+
+    db = get_db()
+    if not fts_available(db.engine):
+        print_error("Full-text search indexes are not installed in this database")
+        raise typer.Exit(1)
+    rebuild_fts_indexes(db.engine)
+    print_success("Rebuilt full-text search indexes")
+
+
+@db_app.command("clear-cache")
+def db_clear_cache() -> None:
+    """Remove cached dashboards, insights and stats."""
+    from .db.cache import clear_result_cache
+
+    db = get_db()
+    with db.get_session() as session:
+        removed = clear_result_cache(session)
+    print_success(f"Cleared {removed} cached results")
 
 
 # ============================================================================
@@ -1955,21 +2184,25 @@ def stats(
 ) -> None:
     """Show reading statistics."""
     from datetime import timedelta
+    from .db.aggregates import book_totals, totals_by
+    from .db.models import Book
     from .reading import ProgressTracker
 
     db = get_db()
-    books = db.get_all_books()
+    with db.get_session() as session:
+        totals = book_totals(session)
+        by_status = {group.key: group.books for group in totals_by(session, Book.status)}
 
-    if not books:
+    if not totals.books:
         console.print("[dim]No books in library.[/dim]")
         return
 
     # Library stats
-    total = len(books)
-    completed = len([b for b in books if b.status == BookStatus.COMPLETED.value])
-    reading = len([b for b in books if b.status == BookStatus.READING.value])
-    wishlist = len([b for b in books if b.status == BookStatus.WISHLIST.value])
-    on_hold = len([b for b in books if b.status == BookStatus.ON_HOLD.value])
+    total = totals.books
+    completed = by_status.get(BookStatus.COMPLETED.value, 0)
+    reading = by_status.get(BookStatus.READING.value, 0)
+    wishlist = by_status.get(BookStatus.WISHLIST.value, 0)
+    on_hold = by_status.get(BookStatus.ON_HOLD.value, 0)
 
     table = Table(title="Library Overview", show_header=False)
     table.add_column("Metric", style="cyan")
@@ -1982,10 +2215,8 @@ def stats(
     table.add_row("Library holds", str(on_hold))
 
     # Average rating
-    rated_books = [b for b in books if b.rating]
-    if rated_books:
-        avg_rating = sum(b.rating for b in rated_books) / len(rated_books)
-        table.add_row("Average rating", f"{avg_rating:.1f} / 5")
+    if totals.avg_rating:
+        table.add_row("Average rating", f"{totals.avg_rating:.1f} / 5")
 
     console.print(table)
 
@@ -3438,6 +3669,12 @@ def backup_create(
     output: Path = typer.Argument(..., help="Output file path"),
     compress: bool = typer.Option(True, "--compress/--no-compress", help="Compress backup"),
     sqlite: bool = typer.Option(False, "--sqlite", help="Create SQLite file backup instead"),
+    compact: bool = typer.Option(
+        False, "--compact", help="With --sqlite, write a vacuumed (defragmented) copy"
+    ),
+    parent: Optional[Path] = typer.Option(
+        None, "--parent", help="Back up only changes since this backup (incremental)"
+    ),
 ) -> None:
     """Create a backup of your library."""
     from .backup import BackupManager
@@ -3446,7 +3683,9 @@ def backup_create(
     manager = BackupManager(db)
 
     if sqlite:
-        result = manager.create_sqlite_backup(output)
+        result = manager.create_sqlite_backup(output, compact=compact)
+    elif parent:
+        result = manager.create_incremental_backup(output, parent, compress=compress)
     else:
         result = manager.create_backup(output, compress=compress)
 
@@ -3528,6 +3767,10 @@ def backup_restore(
             console.print(f"  Books skipped: {result.books_skipped}")
         if result.books_updated:
             console.print(f"  Books updated: {result.books_updated}")
+        console.print(
+            f"[dim]  {result.rows_written} rows in {result.elapsed_seconds:.1f}s "
+            f"({result.rows_per_second:,.0f} rows/sec)[/dim]"
+        )
         if result.warnings:
             console.print(f"\n[yellow]Warnings ({len(result.warnings)}):[/yellow]")
             for warning in result.warnings[:5]:
@@ -6338,12 +6581,18 @@ Pages: {stats.best_day_pages}"""
 
 
 @streak_app.command("habits")
-def streak_habits() -> None:
+def streak_habits(
+    in_memory: bool = typer.Option(
+        False, "--in-memory", help="Compute from an in-memory snapshot of the library"
+    ),
+) -> None:
     """Analyze reading habits."""
+    from .stats.snapshot import LibrarySnapshot
     from .streaks import StreakManager
 
     db = get_db()
-    manager = StreakManager(db)
+    snapshot = LibrarySnapshot.load(db) if in_memory else None
+    manager = StreakManager(db, snapshot=snapshot)
 
     habits = manager.get_reading_habits()
 
@@ -9025,6 +9274,9 @@ def search_all(
     status: Optional[str] = typer.Option(None, "--status", help="Filter by book status"),
     genre: Optional[str] = typer.Option(None, "--genre", "-g", help="Filter by genre"),
     favorites: bool = typer.Option(False, "--favorites", "-f", help="Only favorites"),
+    cursor: Optional[str] = typer.Option(
+        None, "--cursor", help="Page token from a previous search"
+    ),
 ) -> None:
     """Search across all content."""
     from .search import SearchManager, SearchQuery, SearchScope
@@ -9048,9 +9300,14 @@ def search_all(
         book_status=status,
         genre=genre,
         favorites_only=favorites,
+        cursor=cursor,
     )
 
-    results = manager.search(search_query)
+    try:
+        results = manager.search(search_query)
+    except ValueError as e:
+        print_error(str(e))
+        raise typer.Exit(1)
 
     if results.total_count == 0:
         print_info(f"No results found for '{query}'")
@@ -9076,6 +9333,7 @@ def search_all(
 
     if results.has_more:
         console.print(f"\n[dim]Showing {len(results.results)} of {results.total_count} results[/dim]")
+        console.print(f"[dim]Next page: --cursor {results.next_cursor}[/dim]")
 
 
 @search_app.command("books")
@@ -9546,12 +9804,18 @@ def location_sessions(
 
 
 @location_app.command("stats")
-def location_stats() -> None:
+def location_stats(
+    in_memory: bool = typer.Option(
+        False, "--in-memory", help="Compute from an in-memory snapshot of the library"
+    ),
+) -> None:
     """Show location statistics."""
     from .locations import LocationManager
+    from .stats.snapshot import LibrarySnapshot
 
     db = get_db()
-    manager = LocationManager(db)
+    snapshot = LibrarySnapshot.load(db) if in_memory else None
+    manager = LocationManager(db, snapshot=snapshot)
 
     stats = manager.get_stats()
 
@@ -20,6 +20,7 @@ class Config:
 
     # Database
     db_path: Path
+    db_profile: Optional[str]  # None picks one from the path
 
     # Notion
     notion_api_key: Optional[str]
@@ -45,6 +46,7 @@ class Config:
 
         return cls(
             db_path=db_path,
+            db_profile=os.environ.get("BOOKTRACKER_DB_PROFILE") or None,
             notion_api_key=os.environ.get("NOTION_API_KEY"),
             notion_database_id=os.environ.get("NOTION_DATABASE_ID"),
             notion_reading_logs_db_id=os.environ.get("NOTION_READING_LOGS_DB_ID"),
@@ -1,17 +1,20 @@
 """Database module for local SQLite storage."""
 
-from .models import Book, ReadingLog, SyncQueueItem
+from .models import Book, ReadingLog, SyncPageVersion, SyncQueueItem, SyncState
 from .schemas import BookCreate, BookUpdate, BookResponse, ReadingLogCreate
-from .sqlite import Database, get_db
+from .sqlite import Database, UnitOfWork, get_db
 
 __all__ = [
     "Book",
     "ReadingLog",
     "SyncQueueItem",
+    "SyncState",
+    "SyncPageVersion",
     "BookCreate",
     "BookUpdate",
     "BookResponse",
     "ReadingLogCreate",
     "Database",
+    "UnitOfWork",
     "get_db",
 ]
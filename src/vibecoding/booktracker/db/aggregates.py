@@ -0,0 +1,220 @@
+"""Aggregate queries over books.
+
+Stats, reports and goals summarise sets of books: how many there are,
+the pages they add up to, their average rating, and the same per
+author, month, rating or tag. These helpers run the COUNT / SUM / AVG
+and GROUP BY in SQLite so only the totals are loaded, not every Book.
+
+The JSON array columns (``tags``, ``genres``) are grouped by their
+values with SQLite's ``json_each`` table-valued function, which yields
+one row per value of a book's array.
+
+Each helper takes the where-clauses choosing the books to summarise;
+``finished_between`` builds the usual ones. ``SelectedBooks`` bundles a
+connection with its where-clauses for reports that ask many questions
+of the same books.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+from sqlalchemy import Integer, cast, func, select, true
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ColumnElement
+
+from .models import Book
+from .schemas import BookStatus
+
+# Month (1-12) a book was finished in
+FINISHED_MONTH = cast(func.substr(Book.date_finished, 6, 2), Integer)
+
+
+@dataclass
+class BookTotals:
+    """Totals over a set of books, or over one group of them."""
+
+    books: int = 0
+    pages: int = 0
+    rated: int = 0  # Books with a rating
+    avg_rating: Optional[float] = None  # None when no book is rated
+    key: Any = None  # The group's value, for grouped totals
+
+
+def _totals_columns() -> tuple:
+    return (
+        func.count().label("books"),
+        func.coalesce(func.sum(Book.page_count), 0).label("pages"),
+        func.count(Book.rating).label("rated"),
+        func.avg(Book.rating).label("avg_rating"),
+    )
+
+
+def finished_between(start: str, end: str, completed: bool = True) -> list[ColumnElement]:
+    """Conditions for books finished between two ISO dates, inclusive.
+
+    Args:
+        start: First ISO date
+        end: Last ISO date
+        completed: Only count books whose status is completed
+    """
+    conditions = [Book.date_finished >= start, Book.date_finished <= end]
+    if completed:
+        conditions.append(Book.status == BookStatus.COMPLETED.value)
+    return conditions
+
+
+def count_books(conn: Union[Connection, Session], *where: ColumnElement) -> int:
+    """Number of books matching the conditions."""
+    stmt = select(func.count()).select_from(Book).where(*where)
+    return conn.execute(stmt).scalar_one()
+
+
+def book_totals(conn: Union[Connection, Session], *where: ColumnElement) -> BookTotals:
+    """Count, pages and ratings of the books matching the conditions."""
+    row = conn.execute(select(*_totals_columns()).where(*where)).one()
+    return BookTotals(**row._mapping)
+
+
+def _grouped(conn, key, stmt, limit: Optional[int]) -> list[BookTotals]:
+    stmt = stmt.group_by(key).order_by(func.count().desc(), key)
+    if limit:
+        stmt = stmt.limit(limit)
+    return [BookTotals(**row._mapping) for row in conn.execute(stmt)]
+
+
+def totals_by(
+    conn: Union[Connection, Session],
+    key: ColumnElement,
+    *where: ColumnElement,
+    limit: Optional[int] = None,
+) -> list[BookTotals]:
+    """Totals per value of ``key``, most books first.
+
+    Args:
+        conn: Connection or session
+        key: Column or expression to group by, e.g. ``Book.author``
+        where: Conditions choosing the books
+        limit: Only return the largest groups
+
+    Returns:
+        BookTotals per group, with the group's value as ``key``
+    """
+    stmt = select(key.label("key"), *_totals_columns()).where(*where)
+    return _grouped(conn, key, stmt, limit)
+
+
+def totals_by_value(
+    conn: Union[Connection, Session],
+    column: ColumnElement,
+    *where: ColumnElement,
+    limit: Optional[int] = None,
+) -> list[BookTotals]:
+    """Totals per value of a JSON array column, most books first.
+
+    A book is counted once for every value in its array; books with no
+    array are left out.
+
+    Args:
+        conn: Connection or session
+        column: JSON array column, ``Book.tags`` or ``Book.genres``
+        where: Conditions choosing the books
+        limit: Only return the largest groups
+
+    Returns:
+        BookTotals per value, with the value as ``key``
+    """
+    values = func.json_each(column).table_valued("value")
+    stmt = (
+        select(values.c.value.label("key"), *_totals_columns())
+        .select_from(Book)
+        .join(values, true())
+        .where(*where)
+    )
+    return _grouped(conn, values.c.value, stmt, limit)
+
+
+def rating_counts(conn: Union[Connection, Session], *where: ColumnElement) -> dict[int, int]:
+    """Number of rated books per rating, in rating order."""
+    stmt = (
+        select(Book.rating, func.count())
+        .where(Book.rating.isnot(None), *where)
+        .group_by(Book.rating)
+        .order_by(Book.rating)
+    )
+    return {rating: count for rating, count in conn.execute(stmt)}
+
+
+class SelectedBooks:
+    """The books matching some conditions, summarised in SQL.
+
+    Reports ask several questions of the same books; this keeps the
+    connection and conditions together. ``stats.snapshot.SnapshotBooks``
+    has the same methods, computed from an in-memory snapshot.
+    """
+
+    def __init__(self, conn: Union[Connection, Session], *where: ColumnElement):
+        """Initialize the selection.
+
+        Args:
+            conn: Connection or session
+            where: Conditions choosing the books
+        """
+        self.conn = conn
+        self.where = where
+
+    def totals(self) -> BookTotals:
+        """Count, pages and ratings of the books."""
+        return book_totals(self.conn, *self.where)
+
+    def by_month(self) -> list[BookTotals]:
+        """Totals per month (1-12) finished in."""
+        return totals_by(self.conn, FINISHED_MONTH, *self.where)
+
+    def by_finish_date(self) -> list[BookTotals]:
+        """Totals per ISO finish date."""
+        return totals_by(self.conn, Book.date_finished, *self.where)
+
+    def by_author(self, limit: Optional[int] = None, rated_only: bool = False) -> list[BookTotals]:
+        """Totals per named author, most books first.
+
+        Args:
+            limit: Only return the largest groups
+            rated_only: Only count books rated above 0
+        """
+        where = [*self.where, Book.author != ""]
+        if rated_only:
+            where.append(Book.rating > 0)
+        return totals_by(self.conn, Book.author, *where, limit=limit)
+
+    def by_genre(self, limit: Optional[int] = None) -> list[BookTotals]:
+        """Totals per genre, each book counted once per genre."""
+        return totals_by_value(self.conn, Book.genres, *self.where, limit=limit)
+
+    def rating_counts(self) -> dict[int, int]:
+        """Number of rated books per rating, in rating order."""
+        return rating_counts(self.conn, *self.where)
+
+    def top_rated(self, limit: int) -> list[Book]:
+        """Highest rated books, longer books first among equals."""
+        stmt = (
+            select(Book)
+            .where(*self.where, Book.rating > 0)
+            .order_by(Book.rating.desc(), func.coalesce(Book.page_count, 0).desc())
+            .limit(limit)
+        )
+        return list(self.conn.execute(stmt).scalars())
+
+    def extreme(self, kind: str) -> Optional[Book]:
+        """The longest, shortest, first or last finished book."""
+        orders = {
+            "longest": (Book.page_count > 0, Book.page_count.desc()),
+            "shortest": (Book.page_count > 0, Book.page_count),
+            "first": (Book.date_finished != "", Book.date_finished),
+            "last": (Book.date_finished != "", Book.date_finished.desc()),
+        }
+        if kind not in orders:
+            return None
+        condition, order = orders[kind]
+        stmt = select(Book).where(*self.where, condition).order_by(order).limit(1)
+        return self.conn.execute(stmt).scalars().first()
@@ -0,0 +1,117 @@
+"""Bulk row writes shared by restore and columnar import.
+
+Rows are plain dicts of column values keyed by primary key. A batch is
+checked against the table with one IN query and written with one
+``INSERT ... ON CONFLICT DO UPDATE`` executemany, instead of an ORM
+lookup and flush per row.
+"""
+
+from itertools import groupby
+from typing import Any, Callable, Iterable, Optional
+
+from sqlalchemy import Table, or_, select, tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from .sqlite import IN_CLAUSE_SIZE
+
+# Rows per INSERT ... ON CONFLICT executemany
+UPSERT_BATCH_SIZE = 500
+
+
+def row_key(pk_names: list[str], row: dict) -> Optional[tuple]:
+    """A row's primary key, or None if it doesn't have one."""
+    key = tuple(row.get(name) for name in pk_names)
+    return None if None in key else key
+
+
+def existing_keys(session: Session, table: Table, rows: list[dict]) -> set[tuple]:
+    """Primary keys of the rows that are already in the table.
+
+    Keys are looked up IN_CLAUSE_SIZE at a time.
+    """
+    pk_columns = list(table.primary_key.columns)
+    pk_names = [column.name for column in pk_columns]
+    keys = {row_key(pk_names, row) for row in rows}
+    keys.discard(None)
+
+    found: set[tuple] = set()
+    keys = list(keys)
+    for start in range(0, len(keys), IN_CLAUSE_SIZE):
+        chunk = keys[start : start + IN_CLAUSE_SIZE]
+        if len(pk_columns) == 1:
+            condition = pk_columns[0].in_([key[0] for key in chunk])
+        else:
+            condition = tuple_(*pk_columns).in_(chunk)
+        found.update(tuple(row) for row in session.execute(select(*pk_columns).where(condition)))
+    return found
+
+
+def upsert_rows(session: Session, table: Table, rows: Iterable[dict]) -> None:
+    """Insert rows, overwriting any with the same primary key.
+
+    Rows are sent in executemany batches of UPSERT_BATCH_SIZE;
+    consecutive rows with the same columns share a statement. A row
+    identical to the stored one is left alone, so it fires no
+    triggers and doesn't show up in the next incremental backup.
+    """
+    pk_names = [column.name for column in table.primary_key.columns]
+
+    for keys, group in groupby(rows, key=lambda row: tuple(row)):
+        stmt = sqlite_insert(table)
+        updates = {name: stmt.excluded[name] for name in keys if name not in pk_names}
+        stmt = (
+            stmt.on_conflict_do_update(
+                index_elements=pk_names,
+                set_=updates,
+                where=or_(
+                    *(table.c[name].is_distinct_from(value) for name, value in updates.items())
+                ),
+            )
+            if updates
+            else stmt.on_conflict_do_nothing(index_elements=pk_names)
+        )
+        batch: list[dict] = []
+        for row in group:
+            batch.append(row)
+            if len(batch) >= UPSERT_BATCH_SIZE:
+                session.execute(stmt, batch)
+                batch = []
+        if batch:
+            session.execute(stmt, batch)
+
+
+def write_rows(
+    session: Session,
+    table: Table,
+    rows: list[dict],
+    on_error: Callable[[dict, Any], None],
+) -> list[dict]:
+    """Upsert a batch, falling back to row by row if it fails.
+
+    The batch is written under a savepoint; if any row is rejected
+    (a constraint, a bad value) each row is retried under its own
+    savepoint and ``on_error(row, error)`` called for the ones that fail.
+
+    Returns:
+        The rows that were written
+    """
+    if not rows:
+        return rows
+    try:
+        with session.begin_nested():
+            upsert_rows(session, table, rows)
+        return rows
+    except SQLAlchemyError:
+        pass
+
+    written = []
+    for row in rows:
+        try:
+            with session.begin_nested():
+                upsert_rows(session, table, [row])
+            written.append(row)
+        except SQLAlchemyError as e:
+            on_error(row, getattr(e, "orig", None) or e)
+    return written
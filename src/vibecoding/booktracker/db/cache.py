@@ -0,0 +1,299 @@
+"""Cache of computed results.
+
+Dashboards, insights, goal summaries and reading stats are computed
+entirely from the books, reading logs and daily readings. Their results
+are stored in ``result_cache``, keyed by the function, its arguments and
+the day, along with the version of each table they were computed from.
+
+Triggers bump a table's version in ``data_versions`` on every insert,
+update and delete - ORM, bulk insert or raw SQL - so a cached result is
+reused until a table it depends on changes. Entries older than the
+``cache_ttl`` setting are recomputed regardless, and an entry that can't
+be read back (e.g. written by another version) is simply recomputed.
+
+Results are stored as JSON, not pickles: the database usually sits in a
+synced folder, and unpickling whatever is found there could run code.
+Dataclasses, pydantic models, enums and dates are written with a type
+tag and read back only if the type is one of this package's own.
+
+Like the rollups, the cache tables live outside ``Base.metadata``, so
+backups, exports and change tracking skip them.
+"""
+
+import dataclasses
+import importlib
+import json
+import time
+from datetime import date, datetime
+from enum import Enum
+from functools import wraps
+from typing import Any, Callable, Iterable, Optional, TypeVar, Union
+
+from pydantic import BaseModel
+from sqlalchemy import Column, Float, Integer, MetaData, String, Table, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from .. import __version__
+from ..config import get_config
+
+T = TypeVar("T")
+
+cache_metadata = MetaData()
+
+DATA_VERSIONS = Table(
+    "data_versions",
+    cache_metadata,
+    Column("table_name", String, primary_key=True),
+    Column("version", Integer, nullable=False),
+)
+
+RESULT_CACHE = Table(
+    "result_cache",
+    cache_metadata,
+    Column("key", String, primary_key=True),  # Function and arguments
+    Column("versions", String, nullable=False),  # Versions of the tables it depends on
+    Column("created_at", Float, nullable=False),  # Unix time
+    Column("value", String, nullable=False),  # Result encoded by _encode
+)
+
+# Tables whose writes invalidate cached results
+VERSIONED_TABLES = ("books", "reading_logs", "daily_readings")
+
+_TRIGGER_EVENTS = {"ai": "AFTER INSERT", "au": "AFTER UPDATE", "ad": "AFTER DELETE"}
+
+# Only classes from this package are read back from the cache
+_PACKAGE = __name__.rsplit(".", 2)[0]
+
+
+def _trigger_sql(table_name: str) -> list[str]:
+    """Triggers bumping a table's data version on every write."""
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {table_name}_version_{suffix} {event} ON {table_name} "
+        f"BEGIN UPDATE data_versions SET version = version + 1 "
+        f"WHERE table_name = '{table_name}'; END"
+        for suffix, event in _TRIGGER_EVENTS.items()
+    ]
+
+
+def install_result_cache(engine: Engine) -> None:
+    """Create the cache tables and the version triggers if they don't exist.
+
+    Args:
+        engine: SQLAlchemy engine for the database
+    """
+    with engine.begin() as conn:
+        cache_metadata.create_all(conn)
+        for table_name in VERSIONED_TABLES:
+            conn.execute(
+                sqlite_insert(DATA_VERSIONS)
+                .values(table_name=table_name, version=0)
+                .on_conflict_do_nothing()
+            )
+            for statement in _trigger_sql(table_name):
+                conn.execute(text(statement))
+
+
+def drop_result_cache(engine: Engine) -> None:
+    """Drop the cache tables and the version triggers."""
+    with engine.begin() as conn:
+        for table_name in VERSIONED_TABLES:
+            for suffix in _TRIGGER_EVENTS:
+                conn.execute(text(f"DROP TRIGGER IF EXISTS {table_name}_version_{suffix}"))
+        cache_metadata.drop_all(conn)
+
+
+def data_versions(conn: Union[Connection, Session], tables: Iterable[str]) -> dict[str, int]:
+    """Current version of each table, by name."""
+    stmt = select(DATA_VERSIONS).where(DATA_VERSIONS.c.table_name.in_(list(tables)))
+    return {row.table_name: row.version for row in conn.execute(stmt)}
+
+
+def clear_result_cache(conn: Union[Connection, Session]) -> int:
+    """Remove every cached result.
+
+    Returns:
+        Number of results removed
+    """
+    return conn.execute(RESULT_CACHE.delete()).rowcount
+
+
+def _class_path(cls: type) -> str:
+    if not (cls.__module__ == _PACKAGE or cls.__module__.startswith(_PACKAGE + ".")):
+        raise TypeError(f"Can't cache {cls.__qualname__} from outside {_PACKAGE}")
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def _load_class(path: str, kind: Callable[[type], bool]) -> type:
+    module, _, qualname = path.partition(":")
+    if not (module == _PACKAGE or module.startswith(_PACKAGE + ".")):
+        raise ValueError(f"Refusing to load {path} from the cache")
+    cls: Any = importlib.import_module(module)
+    for name in qualname.split("."):
+        cls = getattr(cls, name)
+    if not (isinstance(cls, type) and kind(cls)):
+        raise ValueError(f"Unexpected type in the cache: {path}")
+    return cls
+
+
+def _encode(value: Any) -> Any:
+    """A result as JSON-ready values, tagging anything JSON can't hold.
+
+    Raises:
+        TypeError: If the result holds a value that can't be stored
+    """
+    if isinstance(value, Enum):
+        return {"__enum__": _class_path(type(value)), "value": _encode(value.value)}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode(item) for item in value]}
+    # Keys needn't be strings, so dicts are stored as pairs
+    if isinstance(value, dict):
+        return {"__dict__": [[_encode(k), _encode(v)] for k, v in value.items()]}
+    if isinstance(value, BaseModel):
+        return {"__model__": _class_path(type(value)), "value": _encode(value.model_dump())}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        fields = {f.name: _encode(getattr(value, f.name)) for f in dataclasses.fields(value)}
+        return {"__dataclass__": _class_path(type(value)), "fields": fields}
+    raise TypeError(f"Can't cache a {type(value).__name__}")
+
+
+def _decode(value: Any) -> Any:
+    """Rebuild a result from ``_encode``'s output."""
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "__dict__" in value:
+        return {_decode(k): _decode(v) for k, v in value["__dict__"]}
+    if "__tuple__" in value:
+        return tuple(_decode(item) for item in value["__tuple__"])
+    if "__datetime__" in value:
+        return datetime.fromisoformat(value["__datetime__"])
+    if "__date__" in value:
+        return date.fromisoformat(value["__date__"])
+    if "__enum__" in value:
+        enum = _load_class(value["__enum__"], lambda c: issubclass(c, Enum))
+        return enum(_decode(value["value"]))
+    if "__model__" in value:
+        model = _load_class(value["__model__"], lambda c: issubclass(c, BaseModel))
+        return model.model_validate(_decode(value["value"]))
+    if "__dataclass__" in value:
+        cls = _load_class(value["__dataclass__"], dataclasses.is_dataclass)
+        # Restore the fields as stored, without rerunning __init__
+        obj = object.__new__(cls)
+        for name, field_value in value["fields"].items():
+            object.__setattr__(obj, name, _decode(field_value))
+        return obj
+    raise ValueError(f"Unknown cache entry tag: {sorted(value)}")
+
+
+class ResultCache:
+    """Computed results stored in the database."""
+
+    def __init__(self, db, ttl: Optional[int] = None):
+        """Initialize the cache.
+
+        Args:
+            db: Database instance
+            ttl: Seconds a result is kept at most (default: the
+                ``cache_ttl`` setting); 0 turns caching off
+        """
+        self.db = db
+        self.ttl = get_config().cache_ttl if ttl is None else ttl
+
+    def get_or_compute(
+        self,
+        name: str,
+        args: Any,
+        depends_on: Iterable[str],
+        compute: Callable[[], T],
+    ) -> T:
+        """Return the cached result for a call, computing it if stale.
+
+        Args:
+            name: Name of the computation
+            args: JSON-serialisable arguments it was called with
+            depends_on: Tables whose changes invalidate the result
+            compute: Computes the result when there's no fresh entry
+
+        Returns:
+            The cached or freshly computed result
+        """
+        if self.ttl <= 0:
+            return compute()
+
+        key = json.dumps([__version__, name, args], default=str)
+        now = time.time()
+        try:
+            with self.db.get_session() as session:
+                versions = json.dumps(data_versions(session, depends_on), sort_keys=True)
+                row = session.execute(
+                    select(RESULT_CACHE).where(RESULT_CACHE.c.key == key)
+                ).first()
+        except SQLAlchemyError:
+            # No cache tables, e.g. a database created before them
+            return compute()
+
+        if row and row.versions == versions and now - row.created_at < self.ttl:
+            try:
+                return _decode(json.loads(row.value))
+            except Exception:
+                pass  # Unreadable entry: recompute and overwrite it
+
+        result = compute()
+        try:
+            value = json.dumps(_encode(result))
+        except Exception:
+            return result  # Not something that can be stored
+
+        entry = {"versions": versions, "created_at": now, "value": value}
+        try:
+            with self.db.get_session() as session:
+                session.execute(
+                    RESULT_CACHE.delete().where(RESULT_CACHE.c.created_at < now - self.ttl)
+                )
+                session.execute(
+                    sqlite_insert(RESULT_CACHE)
+                    .values(key=key, **entry)
+                    .on_conflict_do_update(index_elements=[RESULT_CACHE.c.key], set_=entry)
+                )
+        except SQLAlchemyError:
+            pass  # Caching is best effort, e.g. on a read-only database
+        return result
+
+
+def cached(*depends_on: str, key: Optional[Callable[[Any], Any]] = None) -> Callable:
+    """Cache a method's results in its object's database.
+
+    The result is reused for calls with the same arguments on the same
+    day until one of the ``depends_on`` tables is written to.
+
+    Args:
+        depends_on: Tables the result is computed from
+        key: Extra cache key from the object, for state outside the
+            database (e.g. goals kept in a file)
+    """
+
+    def decorator(method: Callable[..., T]) -> Callable[..., T]:
+        name = method.__qualname__
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs) -> T:
+            call = [args, kwargs, date.today(), key(self) if key else None]
+            return ResultCache(self.db).get_or_compute(
+                name, call, depends_on, lambda: method(self, *args, **kwargs)
+            )
+
+        return wrapper
+
+    return decorator
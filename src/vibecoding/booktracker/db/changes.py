@@ -0,0 +1,184 @@
+"""Row change tracking for incremental backups.
+
+Triggers on every table record the primary key of each row that is
+inserted, updated or deleted in ``row_changes``. A row keeps a single
+entry, moved to the next sequence number on every change, so the log
+grows with the number of distinct rows touched rather than the number
+of writes. Deleted rows stay in the log as tombstones.
+
+Because the triggers fire for every write - ORM, bulk insert or raw
+SQL - an incremental backup only has to read the entries whose sequence
+number is above the one recorded by its parent backup.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Iterator, Union
+
+from sqlalchemy import Table, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+CHANGES_TABLE = "row_changes"
+
+_TRIGGERS = {
+    "ai": ("AFTER INSERT", "new", 0),
+    "au": ("AFTER UPDATE", "new", 0),
+    "ad": ("AFTER DELETE", "old", 1),
+}
+
+
+@dataclass
+class ChangeSet:
+    """Rows changed in one table between two sequence numbers."""
+
+    changed: list[Any] = field(default_factory=list)  # Primary keys of live rows
+    deleted: list[Any] = field(default_factory=list)  # Primary keys of deleted rows
+
+
+def _record(table: Table, key: str, deleted: int, condition: str = "") -> str:
+    """Trigger statements moving a row's log entry to the next sequence number.
+
+    DELETE + INSERT rather than INSERT OR REPLACE: inside a trigger the
+    firing statement's conflict policy (e.g. an upsert's) would override
+    the REPLACE.
+    """
+    where = f" AND {condition}" if condition else ""
+    return f"""
+                DELETE FROM {CHANGES_TABLE}
+                WHERE table_name = '{table.name}' AND row_id = {key}{where};
+                INSERT INTO {CHANGES_TABLE}(table_name, row_id, deleted)
+                SELECT '{table.name}', {key}, {deleted} WHERE 1{where};"""
+
+
+def _trigger_sql(table: Table) -> list[str]:
+    """Build the insert/update/delete triggers for a table."""
+    (pk,) = table.primary_key.columns
+    statements = []
+    for suffix, (event, ref, deleted) in _TRIGGERS.items():
+        body = _record(table, f"{ref}.{pk.name}", deleted)
+        if suffix == "au":
+            # An update that changes the key deletes the row under its old key
+            body = _record(table, f"old.{pk.name}", 1, f"old.{pk.name} IS NOT new.{pk.name}") + body
+        statements.append(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS {table.name}_changes_{suffix} {event} ON {table.name}
+            BEGIN{body}
+            END
+            """
+        )
+    return statements
+
+
+def _tracked(tables: Iterable[Table]) -> list[Table]:
+    """Tables that have a single-column primary key to record."""
+    return [table for table in tables if len(table.primary_key.columns) == 1]
+
+
+def install_change_tracking(engine: Engine, tables: Iterable[Table]) -> None:
+    """Create the change log and its triggers if they don't exist.
+
+    ``seq`` is AUTOINCREMENT, so replacing a row's entry always moves it
+    past every sequence number handed out before.
+
+    Args:
+        engine: SQLAlchemy engine for the database
+        tables: Tables to track
+    """
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {CHANGES_TABLE} ("
+                "seq INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "table_name TEXT NOT NULL, "
+                "row_id NOT NULL, "  # No type affinity: keeps integer and text keys as-is
+                "deleted INTEGER NOT NULL DEFAULT 0, "
+                "UNIQUE (table_name, row_id))"
+            )
+        )
+        for table in _tracked(tables):
+            for statement in _trigger_sql(table):
+                # Plain DDL: skip SQLAlchemy's statement compilation
+                conn.exec_driver_sql(statement)
+
+
+def drop_change_tracking(engine: Engine, tables: Iterable[Table]) -> None:
+    """Drop the change log and its triggers."""
+    with engine.begin() as conn:
+        for table in _tracked(tables):
+            for suffix in _TRIGGERS:
+                conn.execute(text(f"DROP TRIGGER IF EXISTS {table.name}_changes_{suffix}"))
+        conn.execute(text(f"DROP TABLE IF EXISTS {CHANGES_TABLE}"))
+
+
+def _record_all(conn: Union[Connection, Session], table: Table, deleted: int) -> None:
+    """Move the log entries of every row in a table to new sequence numbers."""
+    (pk,) = table.primary_key.columns
+    conn.execute(
+        text(
+            f"DELETE FROM {CHANGES_TABLE} WHERE table_name = :name "
+            f"AND row_id IN (SELECT {pk.name} FROM {table.name})"
+        ),
+        {"name": table.name},
+    )
+    conn.execute(
+        text(
+            f"INSERT INTO {CHANGES_TABLE}(table_name, row_id, deleted) "
+            f"SELECT :name, {pk.name}, {deleted} FROM {table.name}"
+        ),
+        {"name": table.name},
+    )
+
+
+@contextmanager
+def bulk_rewrite(conn: Union[Connection, Session], table: Table) -> Iterator[None]:
+    """Log a table being emptied and refilled in two statements.
+
+    Inside the block the table's triggers are dropped. Every row there
+    beforehand is tombstoned on entry and every row there afterwards
+    logged as changed on exit - the same log the per-row triggers would
+    leave, without a log write per row. Run it inside a transaction that
+    is rolled back if the block raises: DDL is transactional in SQLite,
+    so the rollback brings the triggers back.
+    """
+    if not _tracked([table]):
+        yield
+        return
+
+    for suffix in _TRIGGERS:
+        conn.execute(text(f"DROP TRIGGER IF EXISTS {table.name}_changes_{suffix}"))
+    _record_all(conn, table, 1)
+    yield
+    _record_all(conn, table, 0)
+    for statement in _trigger_sql(table):
+        conn.execute(text(statement))
+
+
+def current_change_seq(conn: Union[Connection, Session]) -> int:
+    """Sequence number of the latest recorded change (0 if none)."""
+    return conn.execute(text(f"SELECT IFNULL(MAX(seq), 0) FROM {CHANGES_TABLE}")).scalar_one()
+
+
+def changes_between(conn: Union[Connection, Session], after: int, upto: int) -> dict[str, ChangeSet]:
+    """Rows changed after sequence number ``after`` up to ``upto``.
+
+    Args:
+        conn: Connection or session, ideally in the transaction that read ``upto``
+        after: Sequence number recorded by the previous backup
+        upto: Sequence number recorded by this backup
+
+    Returns:
+        Table name -> ChangeSet, for tables with changes
+    """
+    rows = conn.execute(
+        text(
+            f"SELECT table_name, row_id, deleted FROM {CHANGES_TABLE} "
+            "WHERE seq > :after AND seq <= :upto ORDER BY seq"
+        ),
+        {"after": after, "upto": upto},
+    )
+    changes: dict[str, ChangeSet] = {}
+    for table_name, row_id, deleted in rows:
+        change_set = changes.setdefault(table_name, ChangeSet())
+        (change_set.deleted if deleted else change_set.changed).append(row_id)
+    return changes
@@ -4,6 +4,8 @@ Tables:
 - books: Main book records
 - reading_logs: Individual reading session entries
 - sync_queue: Pending sync operations to Notion
+- sync_state: Pull checkpoints, one row per synced stream
+- sync_page_versions: Last applied edit time of each pulled Notion page
 """
 
 import json
@@ -18,10 +20,12 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     create_engine,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -265,6 +269,10 @@ class SyncQueueItem(Base):
     retry_count: Mapped[int] = mapped_column(Integer, default=0)
     last_error: Mapped[Optional[str]] = mapped_column(Text)
 
+    # Lease held while a sync run is pushing the item (status in_progress)
+    lease_owner: Mapped[Optional[str]] = mapped_column(String(36))
+    lease_expires_at: Mapped[Optional[str]] = mapped_column(String(32))
+
     # Timestamps
     created_at: Mapped[str] = mapped_column(
         String(26), default=lambda: datetime.now(timezone.utc).isoformat()
@@ -275,6 +283,19 @@ class SyncQueueItem(Base):
         onupdate=lambda: datetime.now(timezone.utc).isoformat(),
     )
 
+    # At most one pending item per entity; later writes coalesce into it.
+    # Completed and failed items are history and may repeat.
+    __table_args__ = (
+        Index(
+            "uq_sync_queue_pending_entity",
+            "entity_type",
+            "entity_id",
+            "status",
+            unique=True,
+            sqlite_where=text(f"status = '{SyncStatus.PENDING.value}'"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<SyncQueueItem(id={self.id}, entity={self.entity_type}/{self.entity_id}, op={self.operation})>"
 
@@ -287,3 +308,45 @@ class SyncQueueItem(Base):
     def set_payload(self, payload: dict) -> None:
         """Set payload from dict."""
         self.payload = json.dumps(payload) if payload else None
+
+
+class SyncState(Base):
+    """Checkpoint of pulls from a remote stream (e.g. the Notion books database).
+
+    ``last_pulled_at`` is the high-water mark of the last complete pull.
+    While a pull is running, ``pull_since``, ``pull_started_at`` and
+    ``cursor`` record where it is, so an interrupted pull can resume.
+    """
+
+    __tablename__ = "sync_state"
+
+    stream: Mapped[str] = mapped_column(String(50), primary_key=True)
+    last_pulled_at: Mapped[Optional[str]] = mapped_column(String(32))
+    pull_since: Mapped[Optional[str]] = mapped_column(String(32))
+    pull_started_at: Mapped[Optional[str]] = mapped_column(String(32))
+    cursor: Mapped[Optional[str]] = mapped_column(String(100))
+    updated_at: Mapped[str] = mapped_column(
+        String(26),
+        default=lambda: datetime.now(timezone.utc).isoformat(),
+        onupdate=lambda: datetime.now(timezone.utc).isoformat(),
+    )
+
+    @property
+    def in_progress(self) -> bool:
+        """Whether a pull was started and hasn't completed."""
+        return self.pull_started_at is not None
+
+    def __repr__(self) -> str:
+        return f"<SyncState(stream={self.stream}, last_pulled_at={self.last_pulled_at})>"
+
+
+class SyncPageVersion(Base):
+    """Last edit time of a Notion page that has been applied locally."""
+
+    __tablename__ = "sync_page_versions"
+
+    page_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    last_edited_time: Mapped[str] = mapped_column(String(32), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<SyncPageVersion(page_id={self.page_id}, edited={self.last_edited_time})>"
@@ -0,0 +1,264 @@
+"""Daily reading activity rollups.
+
+``book_daily_activity`` holds one row per book per day with reading
+logs, and ``daily_activity`` one row per day: how many logs (sessions)
+there were and the pages and minutes they add up to. Triggers keep both
+up to date on every insert, update and delete of ``reading_logs`` -
+ORM, bulk insert or raw SQL - so stats, reports and goals read a row
+per day instead of loading every log.
+
+The logs triggers maintain ``book_daily_activity``; its own triggers
+fold each change into ``daily_activity``, which also counts the books
+read that day.
+
+The rollups are derived data, so their tables live outside
+``Base.metadata``: backups, exports and change tracking skip them, and
+``rebuild_rollups`` recomputes them from the logs.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional, Union
+
+from sqlalchemy import Column, Index, Integer, MetaData, String, Table, func, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+rollup_metadata = MetaData()
+
+DAILY_ACTIVITY = Table(
+    "daily_activity",
+    rollup_metadata,
+    Column("date", String(10), primary_key=True),  # ISO date
+    Column("sessions", Integer, nullable=False),
+    Column("pages", Integer, nullable=False),
+    Column("minutes", Integer, nullable=False),
+    Column("books", Integer, nullable=False),  # Distinct books logged
+)
+
+BOOK_DAILY_ACTIVITY = Table(
+    "book_daily_activity",
+    rollup_metadata,
+    Column("book_id", String(36), primary_key=True),
+    Column("date", String(10), primary_key=True),
+    Column("sessions", Integer, nullable=False),
+    Column("pages", Integer, nullable=False),
+    Column("minutes", Integer, nullable=False),
+    Index("ix_book_daily_activity_date", "date"),
+)
+
+_LOG_TRIGGERS = ("reading_logs_rollup_ai", "reading_logs_rollup_ad", "reading_logs_rollup_au")
+_BOOK_DAY_TRIGGERS = ("book_daily_rollup_ai", "book_daily_rollup_ad", "book_daily_rollup_au")
+
+
+@dataclass
+class DayActivity:
+    """Reading logged on one day."""
+
+    date: str
+    sessions: int = 0
+    pages: int = 0
+    minutes: int = 0
+    books: int = 0
+
+
+def _add_log(ref: str) -> str:
+    """Statement adding a log to its book's day."""
+    return f"""
+            INSERT INTO book_daily_activity(book_id, date, sessions, pages, minutes)
+            VALUES ({ref}.book_id, {ref}.date, 1,
+                    IFNULL({ref}.pages_read, 0), IFNULL({ref}.duration_minutes, 0))
+            ON CONFLICT(book_id, date) DO UPDATE SET
+                sessions = sessions + 1,
+                pages = pages + excluded.pages,
+                minutes = minutes + excluded.minutes;"""
+
+
+def _remove_log(ref: str) -> str:
+    """Statements taking a log off its book's day, dropping the day when empty."""
+    return f"""
+            UPDATE book_daily_activity SET
+                sessions = sessions - 1,
+                pages = pages - IFNULL({ref}.pages_read, 0),
+                minutes = minutes - IFNULL({ref}.duration_minutes, 0)
+            WHERE book_id = {ref}.book_id AND date = {ref}.date;
+            DELETE FROM book_daily_activity
+            WHERE book_id = {ref}.book_id AND date = {ref}.date AND sessions <= 0;"""
+
+
+def _add_book_day(ref: str) -> str:
+    """Statement adding a book's day to the day totals."""
+    return f"""
+            INSERT INTO daily_activity(date, sessions, pages, minutes, books)
+            VALUES ({ref}.date, {ref}.sessions, {ref}.pages, {ref}.minutes, 1)
+            ON CONFLICT(date) DO UPDATE SET
+                sessions = sessions + excluded.sessions,
+                pages = pages + excluded.pages,
+                minutes = minutes + excluded.minutes,
+                books = books + 1;"""
+
+
+def _remove_book_day(ref: str) -> str:
+    """Statements taking a book's day off the day totals."""
+    return f"""
+            UPDATE daily_activity SET
+                sessions = sessions - {ref}.sessions,
+                pages = pages - {ref}.pages,
+                minutes = minutes - {ref}.minutes,
+                books = books - 1
+            WHERE date = {ref}.date;
+            DELETE FROM daily_activity WHERE date = {ref}.date AND books <= 0;"""
+
+
+def _log_trigger_sql() -> list[str]:
+    """Triggers on reading_logs maintaining book_daily_activity."""
+    ai, ad, au = _LOG_TRIGGERS
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {ai} AFTER INSERT ON reading_logs "
+        f"BEGIN{_add_log('new')}\n        END",
+        f"CREATE TRIGGER IF NOT EXISTS {ad} AFTER DELETE ON reading_logs "
+        f"BEGIN{_remove_log('old')}\n        END",
+        f"CREATE TRIGGER IF NOT EXISTS {au} "
+        "AFTER UPDATE OF book_id, date, pages_read, duration_minutes ON reading_logs "
+        f"BEGIN{_remove_log('old')}{_add_log('new')}\n        END",
+    ]
+
+
+def _book_day_trigger_sql() -> list[str]:
+    """Triggers on book_daily_activity maintaining daily_activity."""
+    ai, ad, au = _BOOK_DAY_TRIGGERS
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {ai} AFTER INSERT ON book_daily_activity "
+        f"BEGIN{_add_book_day('new')}\n        END",
+        f"CREATE TRIGGER IF NOT EXISTS {ad} AFTER DELETE ON book_daily_activity "
+        f"BEGIN{_remove_book_day('old')}\n        END",
+        # A book's day only changes its counts; books stays as it is
+        f"""CREATE TRIGGER IF NOT EXISTS {au} AFTER UPDATE ON book_daily_activity BEGIN
+            UPDATE daily_activity SET
+                sessions = sessions + new.sessions - old.sessions,
+                pages = pages + new.pages - old.pages,
+                minutes = minutes + new.minutes - old.minutes
+            WHERE date = new.date;
+        END""",
+    ]
+
+
+def _drop_triggers(conn: Union[Connection, Session], names: tuple[str, ...]) -> None:
+    for name in names:
+        conn.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+
+
+def _create_triggers(conn: Union[Connection, Session], statements: list[str]) -> None:
+    for statement in statements:
+        conn.execute(text(statement))
+
+
+def _rollups_exist(conn: Connection) -> bool:
+    """Check whether the rollup tables have been created."""
+    row = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": DAILY_ACTIVITY.name},
+    ).first()
+    return row is not None
+
+
+def _recompute(conn: Union[Connection, Session]) -> None:
+    """Refill both rollup tables from reading_logs (triggers must be off)."""
+    conn.execute(BOOK_DAILY_ACTIVITY.delete())
+    conn.execute(DAILY_ACTIVITY.delete())
+    conn.execute(
+        text(
+            "INSERT INTO book_daily_activity(book_id, date, sessions, pages, minutes) "
+            "SELECT book_id, date, COUNT(*), SUM(IFNULL(pages_read, 0)), "
+            "SUM(IFNULL(duration_minutes, 0)) FROM reading_logs GROUP BY book_id, date"
+        )
+    )
+    conn.execute(
+        text(
+            "INSERT INTO daily_activity(date, sessions, pages, minutes, books) "
+            "SELECT date, SUM(sessions), SUM(pages), SUM(minutes), COUNT(*) "
+            "FROM book_daily_activity GROUP BY date"
+        )
+    )
+
+
+def install_rollups(engine: Engine) -> None:
+    """Create the rollup tables and their triggers if they don't exist.
+
+    Rollups created for an existing database are filled from its logs
+    straight away.
+
+    Args:
+        engine: SQLAlchemy engine for the database
+    """
+    with engine.begin() as conn:
+        is_new = not _rollups_exist(conn)
+        rollup_metadata.create_all(conn)
+        if is_new:
+            _recompute(conn)
+        _create_triggers(conn, _log_trigger_sql() + _book_day_trigger_sql())
+
+
+def drop_rollups(engine: Engine) -> None:
+    """Drop the rollup tables and their triggers."""
+    with engine.begin() as conn:
+        _drop_triggers(conn, _LOG_TRIGGERS + _BOOK_DAY_TRIGGERS)
+        rollup_metadata.drop_all(conn)
+
+
+def rebuild_rollups(conn: Union[Connection, Session]) -> None:
+    """Recompute the rollups from reading_logs.
+
+    Only needed if they were bypassed, e.g. logs written with the
+    triggers dropped; normal writes keep them current.
+    """
+    _drop_triggers(conn, _BOOK_DAY_TRIGGERS)
+    _recompute(conn)
+    _create_triggers(conn, _book_day_trigger_sql())
+
+
+@contextmanager
+def deferred_rollups(conn: Union[Connection, Session]) -> Iterator[None]:
+    """Rebuild the rollups once after a bulk rewrite of reading_logs.
+
+    The logs triggers are dropped for the block, then recreated and the
+    rollups rebuilt. Run it inside a transaction that is rolled back if
+    the block raises: DDL is transactional in SQLite, so the rollback
+    brings the triggers back.
+    """
+    _drop_triggers(conn, _LOG_TRIGGERS)
+    yield
+    rebuild_rollups(conn)
+    _create_triggers(conn, _log_trigger_sql())
+
+
+def daily_activity(
+    conn: Union[Connection, Session],
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+) -> dict[str, DayActivity]:
+    """Reading per day with logs, in date order.
+
+    Args:
+        conn: Connection or session
+        start: First ISO date to include
+        end: Last ISO date to include
+
+    Returns:
+        ISO date -> DayActivity
+    """
+    stmt = select(DAILY_ACTIVITY).order_by(DAILY_ACTIVITY.c.date)
+    if start:
+        stmt = stmt.where(DAILY_ACTIVITY.c.date >= start)
+    if end:
+        stmt = stmt.where(DAILY_ACTIVITY.c.date <= end)
+    return {row.date: DayActivity(**row._mapping) for row in conn.execute(stmt)}
+
+
+def books_logged(conn: Union[Connection, Session], start: str, end: str) -> int:
+    """Number of distinct books with logs between two ISO dates, inclusive."""
+    stmt = select(func.count(func.distinct(BOOK_DAILY_ACTIVITY.c.book_id))).where(
+        BOOK_DAILY_ACTIVITY.c.date >= start,
+        BOOK_DAILY_ACTIVITY.c.date <= end,
+    )
+    return conn.execute(stmt).scalar_one()
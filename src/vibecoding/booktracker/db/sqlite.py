@@ -3,18 +3,47 @@
 Handles database connection, session management, and CRUD operations.
 """
 
+import json
 import os
+import threading
 from contextlib import contextmanager
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Generator, Iterable, Iterator, Optional
 from uuid import UUID
 
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import (
+    and_,
+    case,
+    create_engine,
+    event,
+    exists,
+    func,
+    insert,
+    inspect,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, aliased, sessionmaker
 from sqlalchemy.pool import StaticPool
 
-from .models import Base, Book, ReadingLog, SyncQueueItem
+from ..config import get_config
+from .models import (
+    Base,
+    Book,
+    ReadingLog,
+    SyncPageVersion,
+    SyncQueueItem,
+    SyncState,
+    generate_uuid,
+)
+from .cache import drop_result_cache, install_result_cache
+from .changes import drop_change_tracking, install_change_tracking
+from .rollups import drop_rollups, install_rollups
+from .tuning import checkpoint, default_profile, get_profile, install_profile
 from .schemas import (
     BookCreate,
     BookResponse,
@@ -28,15 +57,210 @@ from .schemas import (
 )
 
 
+# Objects added through UnitOfWork.add between automatic flushes
+DEFAULT_FLUSH_SIZE = 500
+
+# How long a sync run holds the queue items it claimed
+DEFAULT_SYNC_LEASE = timedelta(minutes=15)
+
+# IDs per "IN (...)" clause, well below SQLite's bound-parameter limit
+IN_CLAUSE_SIZE = 500
+
+
+def _chunks(ids: list[str], size: int = IN_CLAUSE_SIZE) -> Iterator[list[str]]:
+    """Split IDs into lists small enough for one IN clause."""
+    for start in range(0, len(ids), size):
+        yield ids[start : start + size]
+
+
+def _upgrade_sync_queue(engine: Engine) -> None:
+    """Bring a sync_queue table created by an older version up to date.
+
+    Adds the lease columns and the unique pending-item index, first
+    collapsing any duplicate pending items the index would reject.
+    """
+    table = SyncQueueItem.__table__
+    inspector = inspect(engine)
+    columns = {c["name"] for c in inspector.get_columns(table.name)}
+    indexes = {i["name"] for i in inspector.get_indexes(table.name)}
+
+    with engine.begin() as conn:
+        for name in ("lease_owner", "lease_expires_at"):
+            if name not in columns:
+                column_type = table.c[name].type.compile(engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {name} {column_type}"))
+
+        for index in table.indexes:
+            if index.unique and index.name not in indexes:
+                conn.execute(
+                    text(
+                        "UPDATE sync_queue SET status = 'completed' "
+                        "WHERE status = 'pending' AND rowid NOT IN ("
+                        "SELECT MIN(rowid) FROM sync_queue WHERE status = 'pending' "
+                        "GROUP BY entity_type, entity_id)"
+                    )
+                )
+                index.create(conn)
+
+
+def _use_explicit_transactions(engine: Engine) -> None:
+    """Begin transactions explicitly on connections batch() takes over.
+
+    pysqlite only starts a transaction before DML, which breaks SAVEPOINT:
+    releasing the first savepoint of a session would commit it. batch()
+    turns off the driver's implicit handling on its own connection, and
+    this emits the BEGIN for it. The BEGIN is IMMEDIATE: a deferred one
+    takes a read lock that fails, rather than waits, when it has to be
+    upgraded for a write. Every other connection keeps pysqlite's default.
+    """
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn) -> None:
+        driver = conn.connection.driver_connection
+        # In-memory databases share one connection between sessions
+        if driver.isolation_level is None and not driver.in_transaction:
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def register_models() -> None:
+    """Import every feature's models so they are registered with Base."""
+    # Import collection models to register them with Base
+    from ..collections.models import Collection, CollectionBook  # noqa: F401
+    # Import challenge models to register them with Base
+    from ..challenges.models import Challenge, ChallengeBook  # noqa: F401
+    # Import lending models to register them with Base
+    from ..lending.models import Loan, Contact  # noqa: F401
+    # Import review models to register them with Base
+    from ..reviews.models import Review  # noqa: F401
+    # Import notes models to register them with Base
+    from ..notes.models import Note, Quote, QuoteCollection, CollectionQuote  # noqa: F401
+    # Import streak models to register them with Base
+    from ..streaks.models import ReadingStreak, DailyReading  # noqa: F401
+    # Import wishlist models to register them with Base
+    from ..wishlist.models import WishlistItem  # noqa: F401
+    # Import series models to register them with Base
+    from ..series.models import Series, SeriesBook  # noqa: F401
+    # Import lists models to register them with Base
+    from ..lists.models import ReadingList, ReadingListBook  # noqa: F401
+    # Import schedule models to register them with Base
+    from ..schedule.models import ReadingPlan, PlannedBook, ScheduleEntry, Reminder  # noqa: F401
+    # Import tags models to register them with Base
+    from ..tags.models import Tag, BookTag, CustomField, CustomFieldValue  # noqa: F401
+    # Import locations models to register them with Base
+    from ..locations.models import ReadingLocation, LocationSession  # noqa: F401
+    # Import settings models to register them with Base
+    from ..settings.models import Setting, SettingsBackup  # noqa: F401
+
+
+class _BatchSession(Session):
+    """The session of a batch.
+
+    Managers commit (or roll back) the session ``get_session()`` gives
+    them. Inside a batch operation that only ends the operation's
+    savepoint, so the batch transaction stays open.
+    """
+
+    uow: Optional["UnitOfWork"] = None
+
+    def commit(self) -> None:
+        if self.uow is not None and self.uow.in_operation:
+            self.uow.end_savepoint(commit=True)
+        else:
+            super().commit()
+
+    def rollback(self) -> None:
+        if self.uow is not None and self.uow.in_operation:
+            self.uow.end_savepoint(commit=False)
+        else:
+            super().rollback()
+
+
+class UnitOfWork:
+    """A batch of database operations sharing one session and transaction.
+
+    Created by ``Database.batch()``; not meant to be constructed directly.
+    """
+
+    def __init__(self, session: _BatchSession, flush_size: int = DEFAULT_FLUSH_SIZE):
+        self.session = session
+        self.flush_size = flush_size
+        self.operations = 0  # Completed get_session() operations
+        self._unflushed = 0
+        self._savepoints: list = []  # One per open operation, innermost last
+        session.uow = self
+
+    @property
+    def in_operation(self) -> bool:
+        """Whether a get_session() operation is open."""
+        return bool(self._savepoints)
+
+    def add(self, obj) -> None:
+        """Add a new object, flushing every ``flush_size`` additions."""
+        self.session.add(obj)
+        self._unflushed += 1
+        if self.flush_size and self._unflushed >= self.flush_size:
+            self.flush()
+
+    def add_all(self, objects) -> None:
+        """Add several objects, flushing as ``add`` does."""
+        for obj in objects:
+            self.add(obj)
+
+    def flush(self) -> None:
+        """Write pending changes to the transaction without committing."""
+        self.session.flush()
+        self._unflushed = 0
+
+    def commit(self) -> None:
+        """Commit what the batch has done so far and keep it open."""
+        Session.commit(self.session)
+        self._unflushed = 0
+
+    def end_savepoint(self, commit: bool) -> None:
+        """Release or roll back the innermost operation's savepoint.
+
+        The operation carries on in a new savepoint, so what it does next
+        is still rolled back alone if it raises.
+        """
+        savepoint = self._savepoints[-1]
+        if savepoint.is_active:
+            if commit:
+                savepoint.commit()
+            else:
+                savepoint.rollback()
+        self._savepoints[-1] = self.session.begin_nested()
+
+    @contextmanager
+    def operation(self) -> Generator[Session, None, None]:
+        """Run one operation in a savepoint of the batch transaction."""
+        self._savepoints.append(self.session.begin_nested())
+        try:
+            yield self.session
+        except Exception:
+            savepoint = self._savepoints.pop()
+            if savepoint.is_active:
+                savepoint.rollback()
+            raise
+        savepoint = self._savepoints.pop()
+        if savepoint.is_active:
+            savepoint.commit()
+        self.operations += 1
+        self._unflushed = 0
+
+
 class Database:
     """Database connection and operations manager."""
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(self, db_path: Optional[str] = None, profile: Optional[str] = None):
         """Initialize database connection.
 
         Args:
             db_path: Path to SQLite database file. If None, uses
                      BOOKTRACKER_DB_PATH env var or default location.
+            profile: Connection tuning profile name. If None, uses
+                     BOOKTRACKER_DB_PROFILE env var, else "compatible"
+                     inside a cloud-synced folder and "performance"
+                     elsewhere.
         """
         if db_path is None:
             db_path = os.environ.get(
@@ -65,50 +289,123 @@ class Database:
                 echo=False,
                 connect_args={"check_same_thread": False},
             )
+        # PRAGMAs (WAL, cache size, ...) applied to each new connection
+        self.profile_name = profile or get_config().db_profile or default_profile(db_path)
+        self.profile = get_profile(self.profile_name)
+        install_profile(self.engine, self.profile, in_memory=self._is_memory)
+
+        _use_explicit_transactions(self.engine)
+
         self.SessionLocal = sessionmaker(bind=self.engine, autocommit=False, autoflush=False)
 
+        # Unit of work opened by batch() on the current thread, if any
+        self._local = threading.local()
+
+    @property
+    def is_memory(self) -> bool:
+        """Whether this is an in-memory database."""
+        return self._is_memory
+
     def _ensure_directory(self) -> None:
         """Ensure the database directory exists."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
     def create_tables(self) -> None:
         """Create all database tables."""
-        # Import collection models to register them with Base
-        from ..collections.models import Collection, CollectionBook  # noqa: F401
-        # Import challenge models to register them with Base
-        from ..challenges.models import Challenge, ChallengeBook  # noqa: F401
-        # Import lending models to register them with Base
-        from ..lending.models import Loan, Contact  # noqa: F401
-        # Import review models to register them with Base
-        from ..reviews.models import Review  # noqa: F401
-        # Import notes models to register them with Base
-        from ..notes.models import Note, Quote, QuoteCollection, CollectionQuote  # noqa: F401
-        # Import streak models to register them with Base
-        from ..streaks.models import ReadingStreak, DailyReading  # noqa: F401
-        # Import wishlist models to register them with Base
-        from ..wishlist.models import WishlistItem  # noqa: F401
-        # Import series models to register them with Base
-        from ..series.models import Series, SeriesBook  # noqa: F401
-        # Import lists models to register them with Base
-        from ..lists.models import ReadingList, ReadingListBook  # noqa: F401
-        # Import schedule models to register them with Base
-        from ..schedule.models import ReadingPlan, PlannedBook, ScheduleEntry, Reminder  # noqa: F401
-        # Import tags models to register them with Base
-        from ..tags.models import Tag, BookTag, CustomField, CustomFieldValue  # noqa: F401
-        # Import locations models to register them with Base
-        from ..locations.models import ReadingLocation, LocationSession  # noqa: F401
-        # Import settings models to register them with Base
-        from ..settings.models import Setting, SettingsBackup  # noqa: F401
-
+        register_models()
         Base.metadata.create_all(self.engine)
+        _upgrade_sync_queue(self.engine)
+
+        # Change log read by incremental backups
+        install_change_tracking(self.engine, Base.metadata.sorted_tables)
+
+        # Per-day reading totals read by stats, reports and goals
+        install_rollups(self.engine)
+
+        # Table versions that invalidate cached dashboards and stats
+        install_result_cache(self.engine)
+
+        # Full-text search indexes and their sync triggers
+        from ..search.fts import install_fts_indexes
+
+        install_fts_indexes(self.engine)
 
     def drop_tables(self) -> None:
         """Drop all database tables. Use with caution!"""
+        from ..search.fts import drop_fts_indexes
+
+        drop_fts_indexes(self.engine)
+        drop_rollups(self.engine)
+        drop_result_cache(self.engine)
+        drop_change_tracking(self.engine, Base.metadata.sorted_tables)
         Base.metadata.drop_all(self.engine)
 
+    def checkpoint(self) -> None:
+        """Flush the WAL into the database file, e.g. before copying it."""
+        if not self._is_memory:
+            checkpoint(self.engine)
+
+    @contextmanager
+    def batch(self, flush_size: int = DEFAULT_FLUSH_SIZE) -> Generator["UnitOfWork", None, None]:
+        """Group database operations into one transaction.
+
+        While the batch is open, every ``get_session()`` on this thread -
+        and so every Database method and manager that uses it - shares the
+        batch session instead of committing on its own. Each of those
+        operations runs in a SAVEPOINT, so one that raises is rolled back
+        alone and the caller can carry on; a manager's own ``commit()`` or
+        ``rollback()`` only ends its savepoint. Everything commits together
+        when the block exits, or rolls back if it raises. Nested batches
+        join the outer one.
+
+        The batch holds SQLite's write lock from its first statement until
+        it ends, so keep batches to work that writes.
+
+        Args:
+            flush_size: Objects added through ``UnitOfWork.add`` between flushes
+
+        Yields:
+            The active UnitOfWork
+        """
+        current = getattr(self._local, "uow", None)
+        if current is not None:
+            yield current
+            return
+
+        # The batch's own connection begins its transactions explicitly
+        connection = self.engine.connect()
+        driver = connection.connection.driver_connection
+        isolation_level = driver.isolation_level
+        driver.isolation_level = None
+
+        session = _BatchSession(bind=connection, autoflush=True)
+        uow = UnitOfWork(session, flush_size)
+        self._local.uow = uow
+        try:
+            yield uow
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            self._local.uow = None
+            session.close()
+            driver.isolation_level = isolation_level
+            connection.close()
+
     @contextmanager
     def get_session(self) -> Generator[Session, None, None]:
-        """Get a database session context manager."""
+        """Get a database session context manager.
+
+        Inside ``batch()`` this is a savepoint on the batch session, and
+        nothing is committed until the batch ends.
+        """
+        uow = getattr(self._local, "uow", None)
+        if uow is not None:
+            with uow.operation() as session:
+                yield session
+            return
+
         session = self.SessionLocal()
         try:
             yield session
@@ -123,77 +420,83 @@ class Database:
     # Book Operations
     # ========================================================================
 
+    @staticmethod
+    def _book_values(book: BookCreate) -> dict:
+        """Column values for a new book row."""
+        return dict(
+            title=book.title,
+            title_sort=book.title_sort,
+            author=book.author,
+            author_sort=book.author_sort,
+            status=book.status.value,
+            rating=book.rating,
+            date_added=book.date_added.isoformat() if book.date_added else None,
+            date_started=book.date_started.isoformat() if book.date_started else None,
+            date_finished=book.date_finished.isoformat() if book.date_finished else None,
+            isbn=book.isbn,
+            isbn13=book.isbn13,
+            page_count=book.page_count,
+            description=book.description,
+            cover=book.cover,
+            cover_base64=book.cover_base64,
+            publisher=book.publisher,
+            series=book.series,
+            series_index=book.series_index,
+            publication_date=(
+                book.publication_date.isoformat() if book.publication_date else None
+            ),
+            publication_year=book.publication_year,
+            original_publication_year=book.original_publication_year,
+            language=book.language,
+            format=book.format,
+            file_size=book.file_size,
+            library_source=book.library_source,
+            amazon_url=book.amazon_url,
+            goodreads_url=book.goodreads_url,
+            library_url=book.library_url,
+            comments=book.comments,
+            progress=book.progress,
+            read_next=book.read_next,
+            recommended_by=book.recommended_by,
+            goodreads_id=book.goodreads_id,
+            additional_authors=book.additional_authors,
+            goodreads_avg_rating=book.goodreads_avg_rating,
+            goodreads_shelves=book.goodreads_shelves,
+            goodreads_shelf_positions=book.goodreads_shelf_positions,
+            review=book.review,
+            review_spoiler=book.review_spoiler,
+            notes=book.notes,
+            read_count=book.read_count,
+            owned_copies=book.owned_copies,
+            calibre_id=book.calibre_id,
+            calibre_uuid=book.calibre_uuid,
+            calibre_library=book.calibre_library,
+            custom_text=book.custom_text,
+            library_hold_date=(
+                book.library_hold_date.isoformat() if book.library_hold_date else None
+            ),
+            library_due_date=(
+                book.library_due_date.isoformat() if book.library_due_date else None
+            ),
+            pickup_location=book.pickup_location,
+            renewals=book.renewals,
+            import_date=datetime.now(timezone.utc).isoformat(),
+            # JSON fields
+            tags=json.dumps(book.tags) if book.tags else None,
+            file_formats=json.dumps(book.file_formats) if book.file_formats else None,
+            genres=json.dumps(book.genres) if book.genres else None,
+            sources=(
+                json.dumps([source.value for source in book.sources]) if book.sources else None
+            ),
+            source_ids=json.dumps(book.source_ids) if book.source_ids else None,
+            identifiers=json.dumps(book.identifiers) if book.identifiers else None,
+        )
+
     def create_book(self, book: BookCreate, session: Optional[Session] = None) -> Book:
         """Create a new book record."""
 
         def _create(s: Session) -> Book:
-            db_book = Book(
-                title=book.title,
-                title_sort=book.title_sort,
-                author=book.author,
-                author_sort=book.author_sort,
-                status=book.status.value,
-                rating=book.rating,
-                date_added=book.date_added.isoformat() if book.date_added else None,
-                date_started=book.date_started.isoformat() if book.date_started else None,
-                date_finished=book.date_finished.isoformat() if book.date_finished else None,
-                isbn=book.isbn,
-                isbn13=book.isbn13,
-                page_count=book.page_count,
-                description=book.description,
-                cover=book.cover,
-                cover_base64=book.cover_base64,
-                publisher=book.publisher,
-                series=book.series,
-                series_index=book.series_index,
-                publication_date=(
-                    book.publication_date.isoformat() if book.publication_date else None
-                ),
-                publication_year=book.publication_year,
-                original_publication_year=book.original_publication_year,
-                language=book.language,
-                format=book.format,
-                file_size=book.file_size,
-                library_source=book.library_source,
-                amazon_url=book.amazon_url,
-                goodreads_url=book.goodreads_url,
-                library_url=book.library_url,
-                comments=book.comments,
-                progress=book.progress,
-                read_next=book.read_next,
-                recommended_by=book.recommended_by,
-                goodreads_id=book.goodreads_id,
-                additional_authors=book.additional_authors,
-                goodreads_avg_rating=book.goodreads_avg_rating,
-                goodreads_shelves=book.goodreads_shelves,
-                goodreads_shelf_positions=book.goodreads_shelf_positions,
-                review=book.review,
-                review_spoiler=book.review_spoiler,
-                notes=book.notes,
-                read_count=book.read_count,
-                owned_copies=book.owned_copies,
-                calibre_id=book.calibre_id,
-                calibre_uuid=book.calibre_uuid,
-                calibre_library=book.calibre_library,
-                custom_text=book.custom_text,
-                library_hold_date=(
-                    book.library_hold_date.isoformat() if book.library_hold_date else None
-                ),
-                library_due_date=(
-                    book.library_due_date.isoformat() if book.library_due_date else None
-                ),
-                pickup_location=book.pickup_location,
-                renewals=book.renewals,
-                import_date=datetime.now(timezone.utc).isoformat(),
-            )
-            # Set JSON fields
-            db_book.set_tags(book.tags or [])
-            db_book.set_file_formats(book.file_formats or [])
-            db_book.set_genres(book.genres or [])
-            db_book.set_sources([s.value for s in book.sources])
-            db_book.set_source_ids(book.source_ids)
-            db_book.set_identifiers(book.identifiers or {})
-
+            db_book = Book(**self._book_values(book))
             s.add(db_book)
             s.flush()
 
@@ -210,6 +513,49 @@ class Database:
                 s.expunge(book)
                 return book
 
+    def bulk_create_books(
+        self, books: list[BookCreate], session: Optional[Session] = None
+    ) -> list[str]:
+        """Insert many new books and their sync queue items in one go.
+
+        Rows are written with executemany-style INSERTs instead of one
+        flush per book. Session events do not see these rows, so callers
+        should refresh anything cached from the ORM afterwards.
+
+        Args:
+            books: Books to insert
+            session: Optional session; otherwise one transaction is used
+
+        Returns:
+            IDs of the created books, in input order
+        """
+
+        def _create(s: Session) -> list[str]:
+            rows = [{"id": generate_uuid(), **self._book_values(book)} for book in books]
+            if not rows:
+                return []
+            s.execute(insert(Book), rows)
+            s.execute(
+                insert(SyncQueueItem),
+                [
+                    {
+                        "id": generate_uuid(),
+                        "entity_type": "book",
+                        "entity_id": row["id"],
+                        "operation": SyncOperation.CREATE.value,
+                        "status": SyncStatus.PENDING.value,
+                    }
+                    for row in rows
+                ],
+            )
+            return [row["id"] for row in rows]
+
+        if session:
+            return _create(session)
+        else:
+            with self.get_session() as s:
+                return _create(s)
+
     def get_book(self, book_id: str, session: Optional[Session] = None) -> Optional[Book]:
         """Get a book by ID."""
 
@@ -243,6 +589,24 @@ class Database:
                     s.expunge(book)
                 return book
 
+    def get_isbn_keys(self, session: Optional[Session] = None) -> set[str]:
+        """Get every ISBN and ISBN-13 stored, for bulk existence checks."""
+
+        def _get(s: Session) -> set[str]:
+            keys: set[str] = set()
+            for isbn, isbn13 in s.execute(select(Book.isbn, Book.isbn13)):
+                if isbn:
+                    keys.add(isbn)
+                if isbn13:
+                    keys.add(isbn13)
+            return keys
+
+        if session:
+            return _get(session)
+        else:
+            with self.get_session() as s:
+                return _get(s)
+
     def get_books_by_status(
         self, status: str, session: Optional[Session] = None
     ) -> list[Book]:
@@ -598,32 +962,37 @@ class Database:
 
     def _add_to_sync_queue(
         self, session: Session, entity_type: str, entity_id: str, operation: SyncOperation
-    ) -> SyncQueueItem:
-        """Add an item to the sync queue."""
-        # Check if there's already a pending item for this entity
-        stmt = select(SyncQueueItem).where(
-            SyncQueueItem.entity_type == entity_type,
-            SyncQueueItem.entity_id == entity_id,
-            SyncQueueItem.status == SyncStatus.PENDING.value,
-        )
-        existing = session.execute(stmt).scalar_one_or_none()
-
-        if existing:
-            # Update the existing item's operation if needed
-            if operation == SyncOperation.DELETE:
-                existing.operation = SyncOperation.DELETE.value
-            existing.updated_at = datetime.now(timezone.utc).isoformat()
-            return existing
+    ) -> None:
+        """Add an item to the sync queue.
 
-        # Create new queue item
-        queue_item = SyncQueueItem(
+        One upsert: a pending item for the entity absorbs the write instead
+        of getting a second row. A delete replaces the pending operation.
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        stmt = sqlite_insert(SyncQueueItem).values(
+            id=generate_uuid(),
             entity_type=entity_type,
             entity_id=entity_id,
             operation=operation.value,
             status=SyncStatus.PENDING.value,
+            created_at=now,
+            updated_at=now,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["entity_type", "entity_id", "status"],
+            index_where=SyncQueueItem.status == SyncStatus.PENDING.value,
+            set_={
+                "operation": case(
+                    (
+                        stmt.excluded.operation == SyncOperation.DELETE.value,
+                        stmt.excluded.operation,
+                    ),
+                    else_=SyncQueueItem.operation,
+                ),
+                "updated_at": now,
+            },
         )
-        session.add(queue_item)
-        return queue_item
+        session.execute(stmt)
 
     def get_pending_sync_items(
         self, session: Optional[Session] = None
@@ -651,10 +1020,8 @@ class Database:
         """Count pending sync queue items."""
 
         def _count(s: Session) -> int:
-            stmt = select(SyncQueueItem).where(
-                SyncQueueItem.status == SyncStatus.PENDING.value
-            )
-            return len(list(s.execute(stmt).scalars().all()))
+            stmt = select(func.count()).where(SyncQueueItem.status == SyncStatus.PENDING.value)
+            return s.execute(stmt).scalar_one()
 
         if session:
             return _count(session)
@@ -662,16 +1029,164 @@ class Database:
             with self.get_session() as s:
                 return _count(s)
 
+    def claim_sync_items(
+        self,
+        limit: Optional[int] = None,
+        lease: timedelta = DEFAULT_SYNC_LEASE,
+        session: Optional[Session] = None,
+    ) -> list[SyncQueueItem]:
+        """Lease pending sync queue items to the caller.
+
+        Claimed items move to in_progress, so a concurrent sync run skips
+        them. Leases that expired - their run crashed - are returned to the
+        queue first. Finish each claimed item with ``mark_sync_items_completed``
+        or ``mark_sync_item_failed``, and hand back the rest with
+        ``release_sync_items``.
+
+        Args:
+            limit: Maximum items to claim, oldest first
+            lease: How long the claim holds
+            session: Optional session
+
+        Returns:
+            Claimed items, oldest first
+        """
+        now = datetime.now(timezone.utc)
+        owner = generate_uuid()
+
+        def _claim(s: Session) -> list[SyncQueueItem]:
+            self._requeue(s, SyncQueueItem.lease_expires_at < now.isoformat())
+            oldest = (
+                select(SyncQueueItem.id)
+                .where(SyncQueueItem.status == SyncStatus.PENDING.value)
+                .order_by(SyncQueueItem.created_at)
+                .limit(limit)
+            )
+            s.execute(
+                update(SyncQueueItem)
+                .where(
+                    SyncQueueItem.id.in_(oldest.scalar_subquery()),
+                    SyncQueueItem.status == SyncStatus.PENDING.value,
+                )
+                .values(
+                    status=SyncStatus.IN_PROGRESS.value,
+                    lease_owner=owner,
+                    lease_expires_at=(now + lease).isoformat(),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            stmt = (
+                select(SyncQueueItem)
+                .where(SyncQueueItem.lease_owner == owner)
+                .order_by(SyncQueueItem.created_at)
+            )
+            return list(s.execute(stmt).scalars().all())
+
+        if session:
+            return _claim(session)
+        else:
+            with self.get_session() as s:
+                items = _claim(s)
+                for item in items:
+                    s.expunge(item)
+                return items
+
+    def release_sync_items(
+        self, item_ids: Iterable[str], session: Optional[Session] = None
+    ) -> None:
+        """Return claimed items that weren't finished to the pending queue."""
+        ids = list(item_ids)
+
+        def _release(s: Session) -> None:
+            for chunk in _chunks(ids):
+                self._requeue(s, SyncQueueItem.id.in_(chunk))
+
+        if session:
+            _release(session)
+        else:
+            with self.get_session() as s:
+                _release(s)
+
+    @staticmethod
+    def _requeue(s: Session, condition) -> None:
+        """Move in-progress items matching ``condition`` back to pending.
+
+        An item whose entity has been queued again meanwhile is completed
+        instead: the newer pending item pushes the entity's current state.
+        """
+        in_progress = and_(SyncQueueItem.status == SyncStatus.IN_PROGRESS.value, condition)
+        pending = aliased(SyncQueueItem)
+        requeued = exists().where(
+            pending.entity_type == SyncQueueItem.entity_type,
+            pending.entity_id == SyncQueueItem.entity_id,
+            pending.status == SyncStatus.PENDING.value,
+        )
+        released = {"lease_owner": None, "lease_expires_at": None}
+        s.execute(
+            update(SyncQueueItem)
+            .where(in_progress, requeued)
+            .values(status=SyncStatus.COMPLETED.value, **released)
+            .execution_options(synchronize_session=False)
+        )
+        s.execute(
+            update(SyncQueueItem)
+            .where(in_progress)
+            .values(status=SyncStatus.PENDING.value, **released)
+            .execution_options(synchronize_session=False)
+        )
+
+    def mark_sync_items_completed(
+        self, item_ids: Iterable[str], session: Optional[Session] = None
+    ) -> None:
+        """Mark sync queue items as completed with bulk UPDATEs."""
+        ids = list(item_ids)
+        now = datetime.now(timezone.utc).isoformat()
+
+        def _mark(s: Session) -> None:
+            for chunk in _chunks(ids):
+                s.execute(
+                    update(SyncQueueItem)
+                    .where(SyncQueueItem.id.in_(chunk))
+                    .values(
+                        status=SyncStatus.COMPLETED.value,
+                        lease_owner=None,
+                        lease_expires_at=None,
+                        updated_at=now,
+                    )
+                    .execution_options(synchronize_session=False)
+                )
+
+        if session:
+            _mark(session)
+        else:
+            with self.get_session() as s:
+                _mark(s)
+
     def mark_sync_item_completed(
         self, item_id: str, session: Optional[Session] = None
     ) -> None:
         """Mark a sync queue item as completed."""
+        self.mark_sync_items_completed([item_id], session)
+
+    def complete_pending_sync_items(
+        self, entity_type: str, entity_id: str, session: Optional[Session] = None
+    ) -> None:
+        """Complete the pending item of an entity, e.g. after pulling it."""
 
         def _mark(s: Session) -> None:
-            item = s.get(SyncQueueItem, item_id)
-            if item:
-                item.status = SyncStatus.COMPLETED.value
-                item.updated_at = datetime.now(timezone.utc).isoformat()
+            s.execute(
+                update(SyncQueueItem)
+                .where(
+                    SyncQueueItem.entity_type == entity_type,
+                    SyncQueueItem.entity_id == entity_id,
+                    SyncQueueItem.status == SyncStatus.PENDING.value,
+                )
+                .values(
+                    status=SyncStatus.COMPLETED.value,
+                    updated_at=datetime.now(timezone.utc).isoformat(),
+                )
+                .execution_options(synchronize_session=False)
+            )
 
         if session:
             _mark(session)
@@ -685,12 +1200,19 @@ class Database:
         """Mark a sync queue item as failed."""
 
         def _mark(s: Session) -> None:
-            item = s.get(SyncQueueItem, item_id)
-            if item:
-                item.status = SyncStatus.FAILED.value
-                item.last_error = error
-                item.retry_count += 1
-                item.updated_at = datetime.now(timezone.utc).isoformat()
+            s.execute(
+                update(SyncQueueItem)
+                .where(SyncQueueItem.id == item_id)
+                .values(
+                    status=SyncStatus.FAILED.value,
+                    last_error=error,
+                    retry_count=SyncQueueItem.retry_count + 1,
+                    lease_owner=None,
+                    lease_expires_at=None,
+                    updated_at=datetime.now(timezone.utc).isoformat(),
+                )
+                .execution_options(synchronize_session=False)
+            )
 
         if session:
             _mark(session)
@@ -698,6 +1220,77 @@ class Database:
             with self.get_session() as s:
                 _mark(s)
 
+    # ========================================================================
+    # Sync State Operations
+    # ========================================================================
+
+    def get_sync_state(self, stream: str, session: Optional[Session] = None) -> SyncState:
+        """Get the pull checkpoint for a stream (blank if never pulled)."""
+
+        def _get(s: Session) -> SyncState:
+            return s.get(SyncState, stream) or SyncState(stream=stream)
+
+        if session:
+            return _get(session)
+        else:
+            with self.get_session() as s:
+                state = _get(s)
+                if state in s:
+                    s.expunge(state)
+                return state
+
+    def save_sync_state(
+        self, stream: str, session: Optional[Session] = None, **fields
+    ) -> None:
+        """Create or update the pull checkpoint for a stream.
+
+        Args:
+            stream: Stream name
+            session: Optional session
+            **fields: SyncState columns to set
+        """
+
+        def _save(s: Session) -> None:
+            state = s.get(SyncState, stream)
+            if state is None:
+                state = SyncState(stream=stream)
+                s.add(state)
+            for name, value in fields.items():
+                setattr(state, name, value)
+
+        if session:
+            _save(session)
+        else:
+            with self.get_session() as s:
+                _save(s)
+
+    def get_page_versions(self, session: Optional[Session] = None) -> dict[str, str]:
+        """Get the last applied edit time of every pulled Notion page."""
+
+        def _get(s: Session) -> dict[str, str]:
+            rows = s.execute(select(SyncPageVersion.page_id, SyncPageVersion.last_edited_time))
+            return {page_id: edited for page_id, edited in rows}
+
+        if session:
+            return _get(session)
+        else:
+            with self.get_session() as s:
+                return _get(s)
+
+    def set_page_version(
+        self, page_id: str, last_edited_time: str, session: Optional[Session] = None
+    ) -> None:
+        """Record the edit time of a Notion page that was applied locally."""
+
+        def _set(s: Session) -> None:
+            s.merge(SyncPageVersion(page_id=page_id, last_edited_time=last_edited_time))
+
+        if session:
+            _set(session)
+        else:
+            with self.get_session() as s:
+                _set(s)
+
 
 # Global database instance
 _db: Optional[Database] = None
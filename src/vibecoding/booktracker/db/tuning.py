@@ -0,0 +1,153 @@
+"""SQLite connection tuning.
+
+A performance profile is a set of PRAGMAs applied to every new connection.
+The "performance" profile switches the database to WAL so readers don't
+block the writer, and relaxes fsyncs to ``synchronous=NORMAL``, which is
+still safe against application crashes in WAL mode.
+
+WAL keeps recent writes in ``-wal`` and ``-shm`` files next to the
+database. A sync client (OneDrive, Dropbox, ...) uploads those files
+separately from the database and can restore a mismatched set, which
+corrupts it. So unless a profile is chosen (``BOOKTRACKER_DB_PROFILE``),
+``default_profile`` picks "compatible" for databases under a synced
+folder - including the default ``~/OneDrive/booktracker/books.db`` - and
+"performance" everywhere else.
+
+Profiles:
+- performance: WAL, synchronous=NORMAL, 64 MiB cache, 256 MiB mmap,
+  in-memory temp tables, 5 s busy timeout
+- compatible: SQLite's rollback journal and synchronous=FULL defaults,
+  for databases kept on network or cloud-synced folders
+"""
+
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+
+@dataclass(frozen=True)
+class PerformanceProfile:
+    """PRAGMA values applied when a connection is opened."""
+
+    journal_mode: str = "wal"
+    synchronous: str = "normal"
+    cache_size: int = -65536  # Negative values are KiB
+    mmap_size: int = 268435456  # Bytes
+    temp_store: str = "memory"
+    busy_timeout: int = 5000  # Milliseconds
+
+    def pragmas(self, in_memory: bool = False) -> dict[str, Any]:
+        """PRAGMA name -> value, skipping those that don't apply in memory."""
+        values = asdict(self)
+        if in_memory:
+            values.pop("journal_mode")
+            values.pop("mmap_size")
+        return values
+
+
+PROFILES: dict[str, PerformanceProfile] = {
+    "performance": PerformanceProfile(),
+    "compatible": PerformanceProfile(
+        journal_mode="delete",
+        synchronous="full",
+        cache_size=-2000,
+        mmap_size=0,
+        temp_store="default",
+        busy_timeout=5000,
+    ),
+}
+
+DEFAULT_PROFILE = "performance"
+
+# Folder names cloud sync clients create; OneDrive for Business adds a
+# suffix ("OneDrive - Contoso"), and iCloud Drive is "Mobile Documents"
+SYNCED_FOLDERS = ("onedrive", "dropbox", "google drive", "icloud drive", "mobile documents")
+
+# PRAGMA results that come back as numbers, mapped to their names
+_PRAGMA_NAMES = {
+    "synchronous": {0: "off", 1: "normal", 2: "full", 3: "extra"},
+    "temp_store": {0: "default", 1: "file", 2: "memory"},
+}
+
+
+def get_profile(name: Optional[str] = None) -> PerformanceProfile:
+    """Look up a profile by name.
+
+    Args:
+        name: Profile name (default profile if None)
+
+    Returns:
+        The matching profile
+
+    Raises:
+        ValueError: If the profile name is unknown
+    """
+    name = (name or DEFAULT_PROFILE).lower()
+    if name not in PROFILES:
+        raise ValueError(
+            f"Unknown database profile: {name!r} (choose from {', '.join(PROFILES)})"
+        )
+    return PROFILES[name]
+
+
+def default_profile(db_path: Union[str, Path]) -> str:
+    """Profile name to use for a database when none is configured.
+
+    Args:
+        db_path: Path to the database file, or ":memory:"
+
+    Returns:
+        "compatible" if the file is inside a cloud-synced folder,
+        otherwise DEFAULT_PROFILE
+    """
+    for part in Path(db_path).expanduser().parts:
+        if part.lower().startswith(SYNCED_FOLDERS):
+            return "compatible"
+    return DEFAULT_PROFILE
+
+
+def apply_pragmas(dbapi_connection, pragmas: dict[str, Any]) -> None:
+    """Run PRAGMA statements on a raw DB-API connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def install_profile(
+    engine: Engine, profile: PerformanceProfile, in_memory: bool = False
+) -> None:
+    """Apply a profile to every connection the engine opens."""
+    pragmas = profile.pragmas(in_memory)
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record) -> None:
+        apply_pragmas(dbapi_connection, pragmas)
+
+
+def read_pragmas(dbapi_connection) -> dict[str, Any]:
+    """Current values of the profile PRAGMAs on a DB-API connection."""
+    values: dict[str, Any] = {}
+    cursor = dbapi_connection.cursor()
+    try:
+        for name in asdict(PerformanceProfile()):
+            value = cursor.execute(f"PRAGMA {name}").fetchone()[0]
+            values[name] = _PRAGMA_NAMES.get(name, {}).get(value, value)
+    finally:
+        cursor.close()
+    return values
+
+
+def checkpoint(engine: Engine) -> None:
+    """Fold the WAL into the main database file and truncate it.
+
+    Call before copying the database file, so the copy is complete.
+    A no-op for databases in rollback-journal mode.
+    """
+    with engine.connect() as conn:
+        conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
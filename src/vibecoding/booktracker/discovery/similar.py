@@ -1,11 +1,20 @@
 """Similar books finder.
 
 Finds books similar to a given book based on various criteria.
+
+Candidate scoring is vectorised: the fields that similarity depends on
+are loaded once with a narrow projection, encoded into NumPy arrays and
+incidence matrices, and scored for every (source, candidate) pair with
+batched array operations. Full ``Book`` rows are only loaded for the
+top-k results.
 """
 
+import json
+from itertools import chain
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Sequence
 
+import numpy as np
 from sqlalchemy import select, func, or_
 
 from ..db.models import Book
@@ -13,6 +22,34 @@ from ..db.schemas import BookStatus
 from ..db.sqlite import Database, get_db
 
 
+# Weight of each similarity component in the total score
+SCORE_WEIGHTS = {
+    "author": 0.30,
+    "genre": 0.25,
+    "series": 0.20,
+    "length": 0.10,
+    "era": 0.08,
+    "rating": 0.07,
+}
+
+# Candidates scoring at or below this are not considered similar
+MIN_SIMILARITY = 0.1
+
+# Upper bound on (sources x candidates) cells scored per batch
+_BATCH_CELLS = 4_000_000
+
+# Columns needed to score similarity, in _BookFeatures row order
+_FEATURE_COLUMNS = (
+    Book.id,
+    Book.author,
+    Book.series,
+    Book.tags,
+    Book.page_count,
+    Book.publication_year,
+    Book.rating,
+)
+
+
 @dataclass
 class SimilarityScore:
     """Similarity score breakdown for a book match."""
@@ -37,14 +74,7 @@ class SimilarityScore:
 
     def _calculate_total(self):
         """Calculate weighted total score."""
-        weights = {
-            "author": 0.30,
-            "genre": 0.25,
-            "series": 0.20,
-            "length": 0.10,
-            "era": 0.08,
-            "rating": 0.07,
-        }
+        weights = SCORE_WEIGHTS
 
         self.total_score = (
             self.author_score * weights["author"]
@@ -56,6 +86,254 @@ class SimilarityScore:
         )
 
 
+class _BookFeatures:
+    """Similarity inputs for a batch of books, parsed once.
+
+    Built from rows of ``_FEATURE_COLUMNS``. Text fields are lowercased
+    and tags are de-duplicated the same way ``_calculate_similarity`` does.
+    Missing numbers are stored as 0, which the scorer treats as unknown.
+    Arrays are float64, and the scorer uses the same expressions as
+    ``_calculate_similarity``, so totals on the MIN_SIMILARITY threshold
+    compare the same way.
+    """
+
+    def __init__(self, rows: Sequence[tuple]):
+        self.ids: list[str] = []
+        self.authors: list[Optional[str]] = []
+        self.series: list[Optional[str]] = []
+        self.tags: list[frozenset[str]] = []
+        pages, years, ratings = [], [], []
+
+        for book_id, author, series, tags, page_count, year, rating in rows:
+            self.ids.append(book_id)
+            self.authors.append(author.lower() if author else None)
+            self.series.append(series.lower() if series else None)
+            self.tags.append(frozenset(t.lower() for t in self._parse_tags(tags)))
+            pages.append(page_count or 0)
+            years.append(year or 0)
+            ratings.append(rating or 0)
+
+        self.pages = np.maximum(np.asarray(pages, dtype=np.float64), 0)
+        self.years = np.asarray(years, dtype=np.float64)
+        self.ratings = np.asarray(ratings, dtype=np.float64)
+        self.has_pages = (self.pages != 0).astype(np.float64)
+        self.has_year = (self.years != 0).astype(np.float64)
+        self.has_rating = (self.ratings != 0).astype(np.float64)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @staticmethod
+    def _parse_tags(tags: Optional[str]) -> list[str]:
+        """Decode the JSON tag column."""
+        if not tags:
+            return []
+        try:
+            return [t for t in json.loads(tags) if isinstance(t, str)]
+        except (ValueError, TypeError):
+            return []
+
+
+def _encode_keys(
+    left: list[Optional[str]], right: list[Optional[str]]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Map string keys on both sides to shared integer codes (-1 = missing)."""
+    codes: dict[str, int] = {}
+
+    def encode(keys: list[Optional[str]]) -> np.ndarray:
+        return np.asarray(
+            [codes.setdefault(k, len(codes)) if k else -1 for k in keys], dtype=np.int64
+        )
+
+    return encode(left), encode(right)
+
+
+def _incidence(
+    left: list[frozenset[str]], right: list[frozenset[str]]
+) -> tuple[np.ndarray, np.ndarray]:
+    """One-hot incidence matrices over the tokens both sides share.
+
+    Tokens that appear on only one side can never contribute to an
+    intersection, so they are left out of the vocabulary.
+    """
+    shared = set().union(*left) & set().union(*right)
+    vocab = {token: i for i, token in enumerate(sorted(shared))}
+
+    def encode(sets: list[frozenset[str]]) -> np.ndarray:
+        matrix = np.zeros((len(sets), len(vocab)), dtype=np.float64)
+        for row, tokens in enumerate(sets):
+            for token in tokens:
+                col = vocab.get(token)
+                if col is not None:
+                    matrix[row, col] = 1.0
+        return matrix
+
+    return encode(left), encode(right)
+
+
+def _similar_author_pairs(
+    left: list[Optional[str]], right: list[Optional[str]]
+) -> tuple[np.ndarray, np.ndarray]:
+    """(left row, right row) pairs of different authors with similar names.
+
+    Names are similar when their word overlap (Jaccard) is above one half.
+    Distinct names are compared through a prefix filter: with words ordered
+    rarest first, two names overlapping by more than half must share one
+    of the first ``ceil(len / 2)`` words of each, so only those are indexed
+    and common words like "john" never fan out to every other name.
+
+    Returns:
+        Left and right row indices, sorted by right row
+    """
+    left_rows: dict[str, list[int]] = {}
+    for row, author in enumerate(left):
+        if author:
+            left_rows.setdefault(author, []).append(row)
+    right_rows: dict[str, list[int]] = {}
+    for row, author in enumerate(right):
+        if author:
+            right_rows.setdefault(author, []).append(row)
+
+    words = {name: frozenset(name.split()) for name in chain(left_rows, right_rows)}
+    frequency: dict[str, int] = {}
+    for name_words in words.values():
+        for word in name_words:
+            frequency[word] = frequency.get(word, 0) + 1
+
+    def prefix(name: str) -> list[str]:
+        ordered = sorted(words[name], key=lambda w: (frequency[w], w))
+        return ordered[: (len(ordered) + 1) // 2]
+
+    by_word: dict[str, list[str]] = {}
+    for name in right_rows:
+        for word in prefix(name):
+            by_word.setdefault(word, []).append(name)
+
+    pairs_left: list[int] = []
+    pairs_right: list[int] = []
+    for name, rows in left_rows.items():
+        name_words = words[name]
+        for other in {o for word in prefix(name) for o in by_word.get(word, ())}:
+            if other == name:
+                continue
+            shared = len(name_words & words[other])
+            if shared / (len(name_words) + len(words[other]) - shared) > 0.5:
+                for right_row in right_rows[other]:
+                    pairs_left.extend(rows)
+                    pairs_right.extend([right_row] * len(rows))
+
+    pairs_left_arr = np.asarray(pairs_left, dtype=np.int64)
+    pairs_right_arr = np.asarray(pairs_right, dtype=np.int64)
+    order = np.argsort(pairs_right_arr, kind="stable")
+    return pairs_left_arr[order], pairs_right_arr[order]
+
+
+class _SimilarityMatrix:
+    """Vectorised equivalent of ``_calculate_similarity`` for many pairs."""
+
+    def __init__(self, sources: _BookFeatures, candidates: _BookFeatures):
+        self.sources = sources
+        self.candidates = candidates
+
+        self._src_author, self._cand_author = _encode_keys(sources.authors, candidates.authors)
+        self._similar_src, self._similar_cand = _similar_author_pairs(
+            sources.authors, candidates.authors
+        )
+        self._src_series, self._cand_series = _encode_keys(sources.series, candidates.series)
+        self._src_tags, self._cand_tags = _incidence(sources.tags, candidates.tags)
+
+        self._src_tag_counts = np.asarray([max(len(t), 1) for t in sources.tags], dtype=np.float64)
+        self._cand_tag_counts = np.asarray(
+            [max(len(t), 1) for t in candidates.tags], dtype=np.float64
+        )
+
+    def batches(self):
+        """Yield (candidate slice, sources x batch score matrix) pairs."""
+        n_sources = max(len(self.sources), 1)
+        step = max(_BATCH_CELLS // n_sources, 1)
+        for start in range(0, len(self.candidates), step):
+            batch = slice(start, min(start + step, len(self.candidates)))
+            yield batch, self.scores(batch)
+
+    def scores(self, batch: slice) -> np.ndarray:
+        """Weighted total similarity of every source to candidates[batch]."""
+        total = self._author_scores(batch)
+        total *= SCORE_WEIGHTS["author"]
+        total += SCORE_WEIGHTS["genre"] * self._genre_scores(batch)
+        total += SCORE_WEIGHTS["series"] * self._series_scores(batch)
+        total += SCORE_WEIGHTS["length"] * self._length_scores(batch)
+        total += SCORE_WEIGHTS["era"] * self._era_scores(batch)
+        total += SCORE_WEIGHTS["rating"] * self._rating_scores(batch)
+        return total
+
+    def _author_scores(self, batch: slice) -> np.ndarray:
+        src = self._src_author[:, None]
+        scores = ((src == self._cand_author[None, batch]) & (src >= 0)).astype(np.float64)
+
+        lo, hi = np.searchsorted(self._similar_cand, [batch.start, batch.stop])
+        scores[self._similar_src[lo:hi], self._similar_cand[lo:hi] - batch.start] = 0.5
+        return scores
+
+    def _series_scores(self, batch: slice) -> np.ndarray:
+        src = self._src_series[:, None]
+        return ((src == self._cand_series[None, batch]) & (src >= 0)).astype(np.float64)
+
+    def _genre_scores(self, batch: slice) -> np.ndarray:
+        common = self._src_tags @ self._cand_tags[batch].T
+        # Tag counts are floored at 1; untagged pairs share nothing and score 0
+        common /= np.maximum(self._src_tag_counts[:, None], self._cand_tag_counts[None, batch])
+        return common
+
+    def _length_scores(self, batch: slice) -> np.ndarray:
+        # 1 - |a - b| / max(a, b); unknown lengths are 0
+        src = self.sources.pages[:, None]
+        cand = self.candidates.pages[None, batch]
+        scores = np.abs(src - cand)
+        scores /= np.maximum(np.maximum(src, cand), 1)
+        np.subtract(1, scores, out=scores)
+        scores *= self.sources.has_pages[:, None]
+        scores *= self.candidates.has_pages[None, batch]
+        return scores
+
+    def _era_scores(self, batch: slice) -> np.ndarray:
+        scores = np.abs(self.sources.years[:, None] - self.candidates.years[None, batch])
+        scores /= 50
+        np.subtract(1, scores, out=scores)
+        np.maximum(scores, 0, out=scores)
+        scores *= self.sources.has_year[:, None]
+        scores *= self.candidates.has_year[None, batch]
+        return scores
+
+    def _rating_scores(self, batch: slice) -> np.ndarray:
+        scores = np.abs(self.sources.ratings[:, None] - self.candidates.ratings[None, batch])
+        scores /= 4
+        np.subtract(1, scores, out=scores)
+        scores *= self.sources.has_rating[:, None]
+        scores *= self.candidates.has_rating[None, batch]
+        return scores
+
+
+def _top_k(scores: np.ndarray, limit: int) -> list[int]:
+    """Indices of the best ``limit`` scores above MIN_SIMILARITY.
+
+    Ordered by score descending, then by index, which matches a stable
+    sort of the candidates in query order.
+    """
+    eligible = np.flatnonzero(scores > MIN_SIMILARITY)
+    if limit <= 0 or len(eligible) == 0:
+        return []
+
+    if len(eligible) > limit:
+        values = scores[eligible]
+        cutoff = np.partition(values, len(values) - limit)[len(values) - limit]
+        above = eligible[values > cutoff]
+        ties = eligible[values == cutoff][: limit - len(above)]
+        eligible = np.concatenate([above, ties])
+
+    order = np.lexsort((eligible, -scores[eligible]))
+    return eligible[order].tolist()
+
+
 class SimilarBooksFinder:
     """Finds books similar to a given book."""
 
@@ -89,8 +367,8 @@ class SimilarBooksFinder:
             if not source_book:
                 return []
 
-            # Get candidate books
-            stmt = select(Book).where(Book.id != book_id)
+            # Get candidate features
+            stmt = select(*_FEATURE_COLUMNS).where(Book.id != book_id)
 
             if not include_read:
                 stmt = stmt.where(
@@ -100,20 +378,20 @@ class SimilarBooksFinder:
                     ])
                 )
 
-            candidates = list(session.execute(stmt).scalars().all())
-
-            # Calculate similarity scores
-            scored = []
-            for candidate in candidates:
-                score = self._calculate_similarity(source_book, candidate)
-                if score.total_score > 0.1:  # Minimum threshold
-                    session.expunge(candidate)
-                    scored.append(score)
+            candidates = _BookFeatures(session.execute(stmt).all())
+            source = _BookFeatures(
+                session.execute(select(*_FEATURE_COLUMNS).where(Book.id == book_id)).all()
+            )
 
-            # Sort by total score
-            scored.sort(key=lambda s: s.total_score, reverse=True)
+            # Score every candidate at once, then pick the top results
+            scores = np.zeros(len(candidates))
+            for batch, batch_scores in _SimilarityMatrix(source, candidates).batches():
+                scores[batch] = batch_scores[0]
+            top = [candidates.ids[i] for i in _top_k(scores, limit)]
 
-            return scored[:limit]
+            # Full breakdown and reasons for the winners only
+            books = self._load_books(session, top)
+            return [self._calculate_similarity(source_book, books[i]) for i in top]
 
     def find_similar_to_favorites(
         self,
@@ -131,52 +409,56 @@ class SimilarBooksFinder:
         """
         with self.db.get_session() as session:
             # Get favorite books
-            stmt = select(Book).where(
+            stmt = select(*_FEATURE_COLUMNS).where(
                 Book.status == BookStatus.COMPLETED.value,
                 Book.rating >= min_rating,
             )
-            favorites = list(session.execute(stmt).scalars().all())
+            favorites = _BookFeatures(session.execute(stmt).all())
 
-            if not favorites:
+            if not len(favorites):
                 return []
 
             # Get unread candidates
-            stmt = select(Book).where(
+            stmt = select(*_FEATURE_COLUMNS).where(
                 Book.status.in_([
                     BookStatus.WISHLIST.value,
                     BookStatus.ON_HOLD.value,
                 ])
             )
-            candidates = list(session.execute(stmt).scalars().all())
-
-            # Calculate aggregate similarity to all favorites
-            candidate_scores = {}
-            for candidate in candidates:
-                total_similarity = 0.0
-                best_match_reasons = []
-
-                for favorite in favorites:
-                    score = self._calculate_similarity(favorite, candidate)
-                    if score.total_score > total_similarity:
-                        total_similarity = score.total_score
-                        best_match_reasons = score.match_reasons
-
-                if total_similarity > 0.1:
-                    session.expunge(candidate)
-                    candidate_scores[candidate.id] = SimilarityScore(
-                        book=candidate,
-                        total_score=total_similarity,
-                        match_reasons=best_match_reasons,
-                    )
+            candidates = _BookFeatures(session.execute(stmt).all())
 
-            # Sort and return top results
-            sorted_results = sorted(
-                candidate_scores.values(),
-                key=lambda s: s.total_score,
-                reverse=True,
+            # Best similarity to any favorite, and which favorite gave it
+            best_scores = np.zeros(len(candidates))
+            best_favorites = np.zeros(len(candidates), dtype=np.int64)
+            for batch, scores in _SimilarityMatrix(favorites, candidates).batches():
+                best_favorites[batch] = scores.argmax(axis=0)
+                best_scores[batch] = scores[best_favorites[batch], np.arange(scores.shape[1])]
+
+            top = _top_k(best_scores, limit)
+            if not top:
+                return []
+
+            # Load only the winners and their best-matching favorites
+            books = self._load_books(
+                session,
+                [candidates.ids[i] for i in top]
+                + [favorites.ids[best_favorites[i]] for i in top],
             )
 
-            return sorted_results[:limit]
+            results = []
+            for i in top:
+                candidate = books[candidates.ids[i]]
+                favorite = books[favorites.ids[best_favorites[i]]]
+                reasons = self._calculate_similarity(favorite, candidate).match_reasons
+                results.append(
+                    SimilarityScore(
+                        book=candidate,
+                        total_score=float(best_scores[i]),
+                        match_reasons=reasons,
+                    )
+                )
+
+            return results
 
     def find_by_author(
         self,
@@ -292,6 +574,15 @@ class SimilarBooksFinder:
 
             return books
 
+    def _load_books(self, session, book_ids: list[str]) -> dict[str, Book]:
+        """Load full, detached Book rows by id."""
+        if not book_ids:
+            return {}
+        books = session.execute(select(Book).where(Book.id.in_(set(book_ids)))).scalars().all()
+        for book in books:
+            session.expunge(book)
+        return {book.id: book for book in books}
+
     def _calculate_similarity(
         self,
         source: Book,
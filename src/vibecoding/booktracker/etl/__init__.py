@@ -20,8 +20,10 @@ from .transform import (
 )
 from .dedupe import (
     find_duplicates,
+    find_duplicates_with_report,
     merge_book_records,
     deduplicate_books,
+    BlockingReport,
     DuplicateMatch,
     DedupeResult,
     MatchType,
@@ -58,8 +60,10 @@ __all__ = [
     "TransformError",
     # Dedupe
     "find_duplicates",
+    "find_duplicates_with_report",
     "merge_book_records",
     "deduplicate_books",
+    "BlockingReport",
     "DuplicateMatch",
     "DedupeResult",
     "MatchType",
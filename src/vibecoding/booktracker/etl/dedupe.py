@@ -6,10 +6,19 @@ Identifies duplicate books using:
 
 Books are merged by combining data from all sources, with configurable
 priority for conflicting fields.
+
+Pairwise comparisons are restricted by a blocking stage: source IDs are
+matched through inverted indexes, and fuzzy matching only compares books
+that share a normalised-author block or sit within ``block_window`` of
+each other when sorted by title. Pass ``block_window=None`` to compare
+every pair. With ``workers > 1`` the candidate pairs are scored across a
+process pool.
 """
 
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from itertools import combinations
 from typing import Optional
 
 from thefuzz import fuzz
@@ -44,6 +53,32 @@ class DuplicateMatch:
         )
 
 
+@dataclass
+class BlockingReport:
+    """How many pairwise comparisons the blocking stage saved."""
+
+    books: int = 0
+    total_pairs: int = 0  # Every pair of books
+    isbn_pairs: int = 0  # Pairs resolved by the ISBN indexes
+    compared_pairs: int = 0  # Pairs passed to the source ID / fuzzy matchers
+
+    @property
+    def skipped_pairs(self) -> int:
+        """Pairs never compared."""
+        return self.total_pairs - self.isbn_pairs - self.compared_pairs
+
+    @property
+    def reduction(self) -> float:
+        """Fraction of all pairs that were skipped (0.0 - 1.0)."""
+        return self.skipped_pairs / self.total_pairs if self.total_pairs else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"compared {self.compared_pairs:,} of {self.total_pairs:,} pairs "
+            f"({self.skipped_pairs:,} skipped, {self.reduction:.1%} reduction)"
+        )
+
+
 @dataclass
 class DedupeResult:
     """Result of deduplication process."""
@@ -52,6 +87,7 @@ class DedupeResult:
     merged_books: list[BookCreate] = field(default_factory=list)
     duplicates: list[DuplicateMatch] = field(default_factory=list)
     conflicts: list[DuplicateMatch] = field(default_factory=list)  # Need manual resolution
+    blocking: Optional[BlockingReport] = None
 
 
 # Fuzzy matching thresholds
@@ -59,6 +95,13 @@ TITLE_MATCH_THRESHOLD = 90  # Minimum score for title match
 AUTHOR_MATCH_THRESHOLD = 85  # Minimum score for author match
 COMBINED_MATCH_THRESHOLD = 88  # Minimum combined score
 
+# Sorted-neighbourhood width for fuzzy candidate blocking. Larger windows
+# catch more typo'd duplicates at the cost of more fuzzy comparisons.
+BLOCK_WINDOW = 10
+
+# Below this many candidate pairs a process pool costs more than it saves
+MIN_PARALLEL_PAIRS = 5_000
+
 
 def normalize_string(s: str) -> str:
     """Normalize string for comparison."""
@@ -125,6 +168,13 @@ def match_isbn(book1: BookCreate, book2: BookCreate) -> Optional[DuplicateMatch]
     return None
 
 
+def _goodreads_ref(book: BookCreate) -> Optional[str]:
+    """Goodreads ID recorded in a book's source_ids or identifiers."""
+    return book.source_ids.get("goodreads") or (
+        book.identifiers.get("goodreads") if book.identifiers else None
+    )
+
+
 def match_source_ids(book1: BookCreate, book2: BookCreate) -> Optional[DuplicateMatch]:
     """Check if two books match by source IDs (Calibre ID, Goodreads ID)."""
     # Check Goodreads ID
@@ -150,12 +200,8 @@ def match_source_ids(book1: BookCreate, book2: BookCreate) -> Optional[Duplicate
             )
 
     # Check identifiers dict for goodreads ID
-    b1_gr = book1.source_ids.get("goodreads") or (
-        book1.identifiers.get("goodreads") if book1.identifiers else None
-    )
-    b2_gr = book2.source_ids.get("goodreads") or (
-        book2.identifiers.get("goodreads") if book2.identifiers else None
-    )
+    b1_gr = _goodreads_ref(book1)
+    b2_gr = _goodreads_ref(book2)
     if b1_gr and b2_gr and b1_gr == b2_gr:
         return DuplicateMatch(
             book1=book1,
@@ -201,21 +247,164 @@ def match_fuzzy(book1: BookCreate, book2: BookCreate) -> Optional[DuplicateMatch
     return None
 
 
+def _compare_pair(book1: BookCreate, book2: BookCreate) -> Optional[DuplicateMatch]:
+    """Match two books by source IDs, then fuzzily if neither has an ISBN."""
+    match = match_source_ids(book1, book2)
+    if match:
+        return match
+    if not book1.isbn and not book1.isbn13 and not book2.isbn and not book2.isbn13:
+        return match_fuzzy(book1, book2)
+    return None
+
+
+# Books shared with pool workers by _init_worker, so shards only carry indices
+_worker_books: list[BookCreate] = []
+
+
+def _init_worker(books: list[BookCreate]) -> None:
+    """Process pool initializer: receive the books once per worker."""
+    global _worker_books
+    _worker_books = books
+
+
+def _compare_shard(pairs: list[tuple[int, int]]) -> list[tuple[tuple[int, int], DuplicateMatch]]:
+    """Compare a shard of candidate pairs in a worker process."""
+    matches = []
+    for i, j in pairs:
+        match = _compare_pair(_worker_books[i], _worker_books[j])
+        if match:
+            matches.append(((i, j), match))
+    return matches
+
+
+def _compare_parallel(
+    books: list[BookCreate], pairs: list[tuple[int, int]], workers: int
+) -> list[tuple[tuple[int, int], DuplicateMatch]]:
+    """Compare candidate pairs across a process pool.
+
+    Shards are contiguous runs of ``pairs`` and results are collected in
+    shard order, so matches come back in the same order as a sequential
+    run. Matches are rebound to the caller's book objects, since the
+    workers only ever see copies.
+    """
+    shard_size = -(-len(pairs) // (workers * 4))
+    shards = [pairs[start : start + shard_size] for start in range(0, len(pairs), shard_size)]
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(books,)
+    ) as pool:
+        results = list(pool.map(_compare_shard, shards))
+
+    return [
+        ((i, j), replace(match, book1=books[i], book2=books[j]))
+        for shard in results
+        for (i, j), match in shard
+    ]
+
+
+def _source_id_pairs(books: list[BookCreate]) -> set[tuple[int, int]]:
+    """Pairs sharing a Goodreads ID or Calibre UUID, via inverted indexes."""
+    index: dict[tuple[str, str], list[int]] = {}
+    for i, book in enumerate(books):
+        keys = [
+            ("goodreads_id", book.goodreads_id),
+            ("calibre_uuid", book.calibre_uuid),
+            ("goodreads", _goodreads_ref(book)),
+        ]
+        for key in keys:
+            if key[1]:
+                index.setdefault(key, []).append(i)
+
+    pairs: set[tuple[int, int]] = set()
+    for indices in index.values():
+        pairs.update(combinations(indices, 2))
+    return pairs
+
+
+def _fuzzy_candidate_pairs(
+    books: list[BookCreate], block_window: Optional[int]
+) -> set[tuple[int, int]]:
+    """Pairs worth fuzzy matching: books without ISBNs that share a block.
+
+    Blocks are an exact normalised-author key (word order ignored, so
+    "King, Stephen" meets "Stephen King"), plus a sorted neighbourhood of
+    ``block_window`` books on the normalised title and on the reversed
+    title, which tolerates typos at either end of the title or in the
+    author's name.
+    """
+    eligible: list[int] = []
+    titles: dict[int, str] = {}
+    author_blocks: dict[str, list[int]] = {}
+    for i, book in enumerate(books):
+        if book.isbn or book.isbn13:
+            continue
+        title = normalize_string(book.title)
+        author = normalize_string(book.author)
+        if not title or not author:
+            continue
+        eligible.append(i)
+        titles[i] = title
+        author_blocks.setdefault(" ".join(sorted(author.split())), []).append(i)
+
+    if block_window is None:
+        return set(combinations(eligible, 2))
+
+    pairs: set[tuple[int, int]] = set()
+    for indices in author_blocks.values():
+        pairs.update(combinations(indices, 2))
+
+    for sort_key in (lambda i: titles[i], lambda i: titles[i][::-1]):
+        ordered = sorted(eligible, key=lambda i: (sort_key(i), i))
+        for pos, i in enumerate(ordered):
+            for j in ordered[pos + 1 : pos + 1 + block_window]:
+                pairs.add((min(i, j), max(i, j)))
+    return pairs
+
+
 def find_duplicates(
     books: list[BookCreate],
     existing_books: Optional[list[BookCreate]] = None,
+    block_window: Optional[int] = BLOCK_WINDOW,
+    workers: int = 1,
 ) -> list[DuplicateMatch]:
     """Find all duplicate pairs in a list of books.
 
     Args:
         books: List of books to check for duplicates
         existing_books: Optional list of existing books to check against
+        block_window: Sorted-neighbourhood width for fuzzy blocking, or
+                      None to compare every pair
+        workers: Number of processes for pair comparison (1 = in-process)
 
     Returns:
         List of DuplicateMatch objects for all potential duplicates
     """
+    duplicates, _ = find_duplicates_with_report(books, existing_books, block_window, workers)
+    return duplicates
+
+
+def find_duplicates_with_report(
+    books: list[BookCreate],
+    existing_books: Optional[list[BookCreate]] = None,
+    block_window: Optional[int] = BLOCK_WINDOW,
+    workers: int = 1,
+) -> tuple[list[DuplicateMatch], BlockingReport]:
+    """Find all duplicate pairs and report the comparisons blocking skipped.
+
+    Args:
+        books: List of books to check for duplicates
+        existing_books: Optional list of existing books to check against
+        block_window: Sorted-neighbourhood width for fuzzy blocking, or
+                      None to compare every pair
+        workers: Number of processes for pair comparison (1 = in-process)
+
+    Returns:
+        Tuple of (duplicate matches, blocking report)
+    """
     duplicates = []
     all_books = books + (existing_books or [])
+    n = len(all_books)
+    report = BlockingReport(books=n, total_pairs=n * (n - 1) // 2)
 
     # Build ISBN index for fast lookup
     isbn_index: dict[str, list[int]] = {}
@@ -266,28 +455,32 @@ def find_duplicates(
                             )
                         )
 
-    # Check source IDs for remaining books
-    for i in range(len(all_books)):
-        for j in range(i + 1, len(all_books)):
-            pair = (i, j)
-            if pair in seen_pairs:
-                continue
+    report.isbn_pairs = len(seen_pairs)
 
-            match = match_source_ids(all_books[i], all_books[j])
+    # Compare the remaining candidate pairs
+    if block_window is None:
+        candidates = combinations(range(n), 2)
+    else:
+        candidates = sorted(
+            _source_id_pairs(all_books) | _fuzzy_candidate_pairs(all_books, block_window)
+        )
+    pairs = [pair for pair in candidates if pair not in seen_pairs]
+    report.compared_pairs = len(pairs)
+
+    if workers > 1 and len(pairs) >= MIN_PARALLEL_PAIRS:
+        matches = _compare_parallel(all_books, pairs, workers)
+    else:
+        matches = []
+        for i, j in pairs:
+            match = _compare_pair(all_books[i], all_books[j])
             if match:
-                seen_pairs.add(pair)
-                duplicates.append(match)
-                continue
-
-            # Fuzzy match for books without ISBN
-            book1, book2 = all_books[i], all_books[j]
-            if not book1.isbn and not book1.isbn13 and not book2.isbn and not book2.isbn13:
-                match = match_fuzzy(book1, book2)
-                if match:
-                    seen_pairs.add(pair)
-                    duplicates.append(match)
+                matches.append(((i, j), match))
 
-    return duplicates
+    for pair, match in matches:
+        seen_pairs.add(pair)
+        duplicates.append(match)
+
+    return duplicates, report
 
 
 def merge_book_records(
@@ -432,6 +625,8 @@ def deduplicate_books(
     books: list[BookCreate],
     existing_books: Optional[list[BookCreate]] = None,
     auto_merge_threshold: float = 0.95,
+    block_window: Optional[int] = BLOCK_WINDOW,
+    workers: int = 1,
 ) -> DedupeResult:
     """Deduplicate a list of books, merging high-confidence duplicates.
 
@@ -439,6 +634,9 @@ def deduplicate_books(
         books: List of books to deduplicate
         existing_books: Optional existing books to check against
         auto_merge_threshold: Confidence threshold for automatic merging
+        block_window: Sorted-neighbourhood width for fuzzy blocking, or
+                      None to compare every pair
+        workers: Number of processes for pair comparison (1 = in-process)
 
     Returns:
         DedupeResult with unique, merged, and conflicting books
@@ -446,7 +644,9 @@ def deduplicate_books(
     result = DedupeResult()
 
     # Find all duplicates
-    duplicates = find_duplicates(books, existing_books)
+    duplicates, result.blocking = find_duplicates_with_report(
+        books, existing_books, block_window, workers
+    )
 
     # Group books by duplicate clusters
     # Build union-find structure
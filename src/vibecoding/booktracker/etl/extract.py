@@ -1,14 +1,14 @@
 """CSV extraction for Notion, Calibre, and Goodreads exports.
 
-Each extractor reads raw CSV data and yields dictionaries with original column names.
-Transformation to unified schema happens in transform.py.
+Each extractor streams raw CSV data and yields dictionaries with original column names,
+one row at a time. Transformation to unified schema happens in transform.py.
 """
 
+import codecs
 import csv
 from pathlib import Path
 from typing import Iterator, Optional
 
-import pandas as pd
 from tqdm import tqdm
 
 
@@ -18,59 +18,118 @@ class ExtractionError(Exception):
     pass
 
 
+# Strings pandas.read_csv treated as missing; kept so streamed rows match
+_NA_VALUES = frozenset(
+    {
+        "",
+        "#N/A",
+        "#N/A N/A",
+        "#NA",
+        "-1.#IND",
+        "-1.#QNAN",
+        "-NaN",
+        "-nan",
+        "1.#IND",
+        "1.#QNAN",
+        "<NA>",
+        "N/A",
+        "NA",
+        "NULL",
+        "NaN",
+        "None",
+        "n/a",
+        "nan",
+        "null",
+    }
+)
+
+# Bytes read when sniffing the encoding
+_SNIFF_BYTES = 64 * 1024
+
+
 def _detect_encoding(file_path: Path) -> str:
-    """Detect file encoding, defaulting to utf-8."""
-    encodings = ["utf-8", "utf-8-sig", "latin-1", "cp1252"]
+    """Detect file encoding from the start of the file, defaulting to utf-8."""
+    with open(file_path, "rb") as f:
+        sample = f.read(_SNIFF_BYTES)
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+
+    encodings = ["utf-8", "latin-1", "cp1252"]
     for encoding in encodings:
         try:
-            with open(file_path, "r", encoding=encoding) as f:
-                f.read(1024)
+            # Ignore a multi-byte character cut off at the end of the sample
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
             return encoding
         except UnicodeDecodeError:
             continue
     return "utf-8"
 
 
-def extract_notion_csv(
+def _stream_csv(
     file_path: Path | str,
-    show_progress: bool = True,
+    source: str,
+    title_column: str,
+    show_progress: bool,
 ) -> Iterator[dict]:
-    """Extract books from Notion CSV export.
+    """Yield rows of a CSV export one at a time.
 
-    Notion CSV has 31 fields including: Title, Author, Status, Rating,
-    Added, Date Started, Date Finished, ISBN, etc.
+    The file is parsed with the csv module as it is read, so memory use
+    does not grow with the export size. Cells are strings, with missing
+    values as "", and rows without a title are skipped.
 
     Args:
-        file_path: Path to Notion CSV file
+        file_path: Path to the CSV file
+        source: Source name, used in the yielded dicts and messages
+        title_column: Column that must be non-empty for a row to count
         show_progress: Show tqdm progress bar
 
     Yields:
-        Dictionary with raw Notion column values
+        Dictionary with the source name and raw column values
     """
     file_path = Path(file_path)
     if not file_path.exists():
         raise ExtractionError(f"File not found: {file_path}")
 
+    label = source.capitalize()
     encoding = _detect_encoding(file_path)
 
-    # Read CSV with pandas for better handling of complex fields
     try:
-        df = pd.read_csv(file_path, encoding=encoding, dtype=str, na_values=[""])
-        df = df.fillna("")
-    except Exception as e:
-        raise ExtractionError(f"Failed to read Notion CSV: {e}")
+        with open(file_path, "r", encoding=encoding, newline="") as f:
+            reader = csv.DictReader(f, restval="")
+            if reader.fieldnames is None:
+                raise ExtractionError(f"Failed to read {label} CSV: file is empty")
+
+            for row in tqdm(reader, desc=f"Reading {label} CSV", disable=not show_progress):
+                row.pop(None, None)  # Cells beyond the header
+                raw = {key: "" if value in _NA_VALUES else value for key, value in row.items()}
+                # Skip empty rows
+                if not raw.get(title_column, "").strip():
+                    continue
+                yield {
+                    "source": source,
+                    "raw": raw,
+                }
+    except (csv.Error, UnicodeDecodeError) as e:
+        raise ExtractionError(f"Failed to read {label} CSV: {e}")
 
-    rows = df.to_dict("records")
-    iterator = tqdm(rows, desc="Reading Notion CSV", disable=not show_progress)
 
-    for row in iterator:
-        # Skip empty rows
-        if not row.get("Title", "").strip():
-            continue
-        yield {
-            "source": "notion",
-            "raw": row,
-        }
+def extract_notion_csv(
+    file_path: Path | str,
+    show_progress: bool = True,
+) -> Iterator[dict]:
+    """Extract books from Notion CSV export.
+
+    Notion CSV has 31 fields including: Title, Author, Status, Rating,
+    Added, Date Started, Date Finished, ISBN, etc.
+
+    Args:
+        file_path: Path to Notion CSV file
+        show_progress: Show tqdm progress bar
+
+    Yields:
+        Dictionary with raw Notion column values
+    """
+    return _stream_csv(file_path, "notion", "Title", show_progress)
 
 
 def extract_calibre_csv(
@@ -89,29 +148,7 @@ def extract_calibre_csv(
     Yields:
         Dictionary with raw Calibre column values
     """
-    file_path = Path(file_path)
-    if not file_path.exists():
-        raise ExtractionError(f"File not found: {file_path}")
-
-    encoding = _detect_encoding(file_path)
-
-    try:
-        df = pd.read_csv(file_path, encoding=encoding, dtype=str, na_values=[""])
-        df = df.fillna("")
-    except Exception as e:
-        raise ExtractionError(f"Failed to read Calibre CSV: {e}")
-
-    rows = df.to_dict("records")
-    iterator = tqdm(rows, desc="Reading Calibre CSV", disable=not show_progress)
-
-    for row in iterator:
-        # Skip empty rows
-        if not row.get("title", "").strip():
-            continue
-        yield {
-            "source": "calibre",
-            "raw": row,
-        }
+    return _stream_csv(file_path, "calibre", "title", show_progress)
 
 
 def extract_goodreads_csv(
@@ -130,29 +167,7 @@ def extract_goodreads_csv(
     Yields:
         Dictionary with raw Goodreads column values
     """
-    file_path = Path(file_path)
-    if not file_path.exists():
-        raise ExtractionError(f"File not found: {file_path}")
-
-    encoding = _detect_encoding(file_path)
-
-    try:
-        df = pd.read_csv(file_path, encoding=encoding, dtype=str, na_values=[""])
-        df = df.fillna("")
-    except Exception as e:
-        raise ExtractionError(f"Failed to read Goodreads CSV: {e}")
-
-    rows = df.to_dict("records")
-    iterator = tqdm(rows, desc="Reading Goodreads CSV", disable=not show_progress)
-
-    for row in iterator:
-        # Skip empty rows
-        if not row.get("Title", "").strip():
-            continue
-        yield {
-            "source": "goodreads",
-            "raw": row,
-        }
+    return _stream_csv(file_path, "goodreads", "Title", show_progress)
 
 
 def extract_all(
@@ -183,11 +198,12 @@ def extract_all(
 
 
 def count_rows(file_path: Path | str) -> int:
-    """Count rows in a CSV file (excluding header)."""
+    """Count data rows in a CSV file (excluding header), streaming."""
     file_path = Path(file_path)
     if not file_path.exists():
         return 0
 
     encoding = _detect_encoding(file_path)
-    with open(file_path, "r", encoding=encoding) as f:
-        return sum(1 for _ in f) - 1  # Subtract header row
+    with open(file_path, "r", encoding=encoding, newline="") as f:
+        # Quoted fields can span lines, so count records rather than lines
+        return max(sum(1 for _ in csv.reader(f)) - 1, 0)
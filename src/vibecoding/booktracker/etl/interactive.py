@@ -291,6 +291,7 @@ def show_import_results(
     imported: int,
     skipped: int,
     errors: list[tuple[str, str]],
+    rows_per_second: Optional[float] = None,
 ) -> None:
     """Show results after import completes.
 
@@ -298,6 +299,7 @@ def show_import_results(
         imported: Number of books successfully imported
         skipped: Number of books skipped
         errors: List of (title, error_message) tuples
+        rows_per_second: Load throughput, if measured
     """
     console.print("\n" + "=" * 60)
     console.print("[bold]IMPORT COMPLETE[/bold]")
@@ -309,6 +311,9 @@ def show_import_results(
     if skipped > 0:
         console.print(f"[yellow]Skipped: {skipped} books[/yellow]")
 
+    if rows_per_second:
+        console.print(f"[dim]Throughput: {rows_per_second:,.0f} books/s[/dim]")
+
     if errors:
         console.print(f"\n[red]Errors: {len(errors)} books[/red]")
         error_table = Table(show_header=True, title="Import Errors")
@@ -3,15 +3,17 @@
 Handles bulk insertion with progress reporting and error handling.
 """
 
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Sized
 
 from tqdm import tqdm
 
 from ..db.schemas import BookCreate
 from ..db.sqlite import Database, get_db
-from .dedupe import DuplicateMatch, deduplicate_books, DedupeResult
+from ..search.suggest import invalidate_suggestion_index
+from .dedupe import BLOCK_WINDOW, DuplicateMatch, deduplicate_books, DedupeResult
 from .extract import extract_all
 from .interactive import (
     ConflictResolution,
@@ -23,6 +25,10 @@ from .interactive import (
 from .transform import transform_row
 
 
+# Books inserted per transaction by load_books
+LOAD_CHUNK_SIZE = 500
+
+
 @dataclass
 class ImportResult:
     """Result of an import operation."""
@@ -31,54 +37,83 @@ class ImportResult:
     skipped: int = 0
     merged: int = 0
     errors: list[tuple[str, str]] = field(default_factory=list)
+    elapsed_seconds: float = 0.0  # Time spent loading rows
 
     @property
     def total_processed(self) -> int:
         return self.imported + self.skipped + len(self.errors)
 
+    @property
+    def rows_per_second(self) -> float:
+        """Load throughput in processed books per second."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.total_processed / self.elapsed_seconds
+
 
 def load_books(
-    books: list[BookCreate],
+    books: Iterable[BookCreate],
     db: Optional[Database] = None,
     show_progress: bool = True,
+    chunk_size: int = LOAD_CHUNK_SIZE,
 ) -> ImportResult:
     """Load a list of books into the database.
 
+    Existing ISBN/ISBN-13 keys are fetched in one query up front, and new
+    books are inserted with their sync queue items in chunked bulk
+    transactions. A chunk that fails is retried book by book so errors
+    are reported against the offending book. ``books`` is consumed lazily,
+    so a generator keeps at most one chunk in memory.
+
     Args:
-        books: List of BookCreate objects to import
+        books: BookCreate objects to import (list or iterator)
         db: Database instance (uses global if not provided)
         show_progress: Show tqdm progress bar
+        chunk_size: Books inserted per transaction
 
     Returns:
-        ImportResult with counts and errors
+        ImportResult with counts, errors and throughput
     """
     if db is None:
         db = get_db()
 
     result = ImportResult()
-    iterator = tqdm(books, desc="Importing books", disable=not show_progress)
+    started = time.perf_counter()
+    known_isbns = db.get_isbn_keys()
 
-    for book in iterator:
+    def insert_chunk(chunk: list[BookCreate]) -> None:
         try:
-            # Check for existing book by ISBN
-            existing = None
-            if book.isbn:
-                existing = db.get_book_by_isbn(book.isbn)
-            if not existing and book.isbn13:
-                existing = db.get_book_by_isbn(book.isbn13)
-
-            if existing:
-                # Book already exists - skip
-                result.skipped += 1
-                continue
-
-            # Create new book
-            db.create_book(book)
-            result.imported += 1
+            result.imported += len(db.bulk_create_books(chunk))
+        except Exception:
+            for book in chunk:
+                try:
+                    db.create_book(book)
+                    result.imported += 1
+                except Exception as e:
+                    result.errors.append((book.title, str(e)))
+
+    total = len(books) if isinstance(books, Sized) else None
+    chunk: list[BookCreate] = []
+    for book in tqdm(books, total=total, desc="Importing books", disable=not show_progress):
+        # Skip books whose ISBN already exists, including earlier books in this load
+        if (book.isbn and book.isbn in known_isbns) or (
+            book.isbn13 and book.isbn13 in known_isbns
+        ):
+            result.skipped += 1
+            continue
+        known_isbns.update(key for key in (book.isbn, book.isbn13) if key)
 
-        except Exception as e:
-            result.errors.append((book.title, str(e)))
+        chunk.append(book)
+        if len(chunk) >= chunk_size:
+            insert_chunk(chunk)
+            chunk = []
+    if chunk:
+        insert_chunk(chunk)
 
+    # Bulk inserts bypass the ORM events that keep search suggestions current
+    invalidate_suggestion_index(db.engine)
+
+    result.elapsed_seconds = time.perf_counter() - started
     return result
 
 
@@ -91,6 +126,8 @@ def import_from_csv(
     interactive: bool = True,
     show_progress: bool = True,
     auto_merge_threshold: float = 0.95,
+    block_window: Optional[int] = BLOCK_WINDOW,
+    workers: int = 1,
 ) -> ImportResult:
     """Import books from CSV files with full ETL pipeline.
 
@@ -103,6 +140,8 @@ def import_from_csv(
         interactive: If True, prompt for conflict resolution
         show_progress: Show progress bars
         auto_merge_threshold: Confidence threshold for auto-merging duplicates
+        block_window: Fuzzy dedupe blocking width (None compares every pair)
+        workers: Processes used for duplicate detection
 
     Returns:
         ImportResult with counts and errors
@@ -155,7 +194,11 @@ def import_from_csv(
         transformed_books,
         existing_books=existing_books,
         auto_merge_threshold=auto_merge_threshold,
+        block_window=block_window,
+        workers=workers,
     )
+    if dedupe_result.blocking and show_progress:
+        print(f"  Dedupe {dedupe_result.blocking}")
 
     # Books to import
     books_to_import = dedupe_result.unique_books + dedupe_result.merged_books
@@ -213,10 +256,16 @@ def import_from_csv(
     result.imported = load_result.imported
     result.skipped += load_result.skipped
     result.errors.extend(load_result.errors)
+    result.elapsed_seconds = load_result.elapsed_seconds
 
     # Show results
     if interactive:
-        show_import_results(result.imported, result.skipped, result.errors)
+        show_import_results(
+            result.imported,
+            result.skipped,
+            result.errors,
+            rows_per_second=load_result.rows_per_second,
+        )
 
     return result
 
@@ -226,6 +275,7 @@ def import_notion(
     db: Optional[Database] = None,
     dry_run: bool = False,
     interactive: bool = True,
+    workers: int = 1,
 ) -> ImportResult:
     """Import books from Notion CSV export.
 
@@ -234,6 +284,7 @@ def import_notion(
         db: Database instance
         dry_run: Preview without importing
         interactive: Prompt for conflict resolution
+        workers: Processes used for duplicate detection
 
     Returns:
         ImportResult
@@ -243,6 +294,7 @@ def import_notion(
         db=db,
         dry_run=dry_run,
         interactive=interactive,
+        workers=workers,
     )
 
 
@@ -251,6 +303,7 @@ def import_calibre(
     db: Optional[Database] = None,
     dry_run: bool = False,
     interactive: bool = True,
+    workers: int = 1,
 ) -> ImportResult:
     """Import books from Calibre CSV export.
 
@@ -259,6 +312,7 @@ def import_calibre(
         db: Database instance
         dry_run: Preview without importing
         interactive: Prompt for conflict resolution
+        workers: Processes used for duplicate detection
 
     Returns:
         ImportResult
@@ -268,6 +322,7 @@ def import_calibre(
         db=db,
         dry_run=dry_run,
         interactive=interactive,
+        workers=workers,
     )
 
 
@@ -276,6 +331,7 @@ def import_goodreads(
     db: Optional[Database] = None,
     dry_run: bool = False,
     interactive: bool = True,
+    workers: int = 1,
 ) -> ImportResult:
     """Import books from Goodreads CSV export.
 
@@ -284,6 +340,7 @@ def import_goodreads(
         db: Database instance
         dry_run: Preview without importing
         interactive: Prompt for conflict resolution
+        workers: Processes used for duplicate detection
 
     Returns:
         ImportResult
@@ -293,4 +350,5 @@ def import_goodreads(
         db=db,
         dry_run=dry_run,
         interactive=interactive,
+        workers=workers,
     )
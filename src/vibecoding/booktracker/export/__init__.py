@@ -1,12 +1,15 @@
 """Export functionality for book data."""
 
-from .csv_export import CSVExporter, ExportFormat
+from .columnar import ColumnarExporter
+from .csv_export import CSVExporter, ExportFormat, ExportResult
 from .json_export import JSONExporter
 from .reports import ReportGenerator, YearInReview, MonthlyReport
 
 __all__ = [
+    "ColumnarExporter",
     "CSVExporter",
     "ExportFormat",
+    "ExportResult",
     "JSONExporter",
     "ReportGenerator",
     "YearInReview",
@@ -0,0 +1,233 @@
+"""Columnar export to Parquet and Arrow IPC files.
+
+Books, reading logs and daily readings are written one file per table
+with a typed schema: integers, floats and booleans keep their types, ISO
+date strings become ``date32`` and JSON list columns (tags, sources) a
+list of strings. Rows are read COLUMNAR_BATCH_SIZE at a time and written
+as record batches, so memory stays flat and each column is compressed on
+its own.
+
+Arrow IPC files written with ``compression=None`` can be memory-mapped
+and read without copying; ``read_batches`` does so, and
+``ColumnarImporter`` uses it to load the files back.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Sequence
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import Boolean, Float, Integer, Table, select
+
+from ..db.models import Base, Book, ReadingLog
+from ..db.sqlite import Database, get_db
+from ..streaks.models import DailyReading
+from .csv_export import ExportFormat, ExportResult
+
+# Tables written by a columnar export, parents before children
+COLUMNAR_TABLES = (Book.__tablename__, ReadingLog.__tablename__, DailyReading.__tablename__)
+
+# Rows fetched from SQLite and written per record batch
+COLUMNAR_BATCH_SIZE = 10_000
+
+FILE_EXTENSIONS = {
+    ExportFormat.PARQUET: ".parquet",
+    ExportFormat.ARROW: ".arrow",
+}
+
+# ISO date strings stored as date32
+DATE_COLUMNS = {
+    Book.__tablename__: {"date_added", "date_started", "date_finished"},
+    ReadingLog.__tablename__: {"date"},
+    DailyReading.__tablename__: {"reading_date"},
+}
+
+# JSON arrays stored as list<string>
+LIST_COLUMNS = {
+    Book.__tablename__: {"tags", "sources"},
+}
+
+
+def arrow_schema(table: Table) -> pa.Schema:
+    """Arrow schema for a table's columns."""
+    dates = DATE_COLUMNS.get(table.name, set())
+    lists = LIST_COLUMNS.get(table.name, set())
+    fields = []
+    for column in table.columns:
+        if column.name in dates:
+            type_ = pa.date32()
+        elif column.name in lists:
+            type_ = pa.list_(pa.string())
+        elif isinstance(column.type, Boolean):
+            type_ = pa.bool_()
+        elif isinstance(column.type, Integer):
+            type_ = pa.int64()
+        elif isinstance(column.type, Float):
+            type_ = pa.float64()
+        else:
+            type_ = pa.string()
+        fields.append(pa.field(column.name, type_, nullable=column.nullable))
+    return pa.schema(fields)
+
+
+def encode_batch(schema: pa.Schema, rows: Sequence[Sequence[Any]]) -> pa.RecordBatch:
+    """Turn rows selected in schema column order into a record batch.
+
+    Raises:
+        pyarrow.ArrowInvalid: If a date column holds something that isn't an ISO date
+    """
+    arrays = []
+    for field, values in zip(schema, zip(*rows)):
+        if pa.types.is_date32(field.type):
+            arrays.append(pa.array(values, pa.string()).cast(pa.date32()))
+        elif pa.types.is_list(field.type):
+            arrays.append(pa.array([json.loads(v) if v else None for v in values], field.type))
+        else:
+            arrays.append(pa.array(values, field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def decode_batch(table_name: str, batch: pa.RecordBatch) -> list[dict]:
+    """Turn a record batch back into rows of database column values."""
+    lists = LIST_COLUMNS.get(table_name, set())
+    columns = {}
+    for name, column in zip(batch.schema.names, batch.columns):
+        if pa.types.is_date32(column.type):
+            column = column.cast(pa.string())
+        values = column.to_pylist()
+        if name in lists:
+            values = [None if value is None else json.dumps(value) for value in values]
+        columns[name] = values
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+
+def table_files(path: Path) -> dict[str, Path]:
+    """Columnar files of a directory (or a single file), by table name.
+
+    Files are named ``<table>.parquet`` or ``<table>.arrow``; tables come
+    back in COLUMNAR_TABLES order so parents load before children.
+    """
+    candidates = sorted(path.iterdir()) if path.is_dir() else [path]
+    extensions = set(FILE_EXTENSIONS.values())
+    found = {
+        candidate.stem: candidate
+        for candidate in candidates
+        if candidate.suffix in extensions and candidate.stem in COLUMNAR_TABLES
+    }
+    return {name: found[name] for name in COLUMNAR_TABLES if name in found}
+
+
+def read_schema(path: Path) -> pa.Schema:
+    """Schema of a columnar file, without reading its rows."""
+    if path.suffix == FILE_EXTENSIONS[ExportFormat.PARQUET]:
+        return pq.read_schema(path)
+    with pa.memory_map(str(path)) as source:
+        return pa.ipc.open_file(source).schema
+
+
+def read_batches(path: Path) -> Iterator[pa.RecordBatch]:
+    """Record batches of a columnar file, one at a time.
+
+    Arrow files are memory-mapped, so uncompressed ones are read in
+    place rather than copied into memory.
+    """
+    if path.suffix == FILE_EXTENSIONS[ExportFormat.PARQUET]:
+        yield from pq.ParquetFile(path).iter_batches(batch_size=COLUMNAR_BATCH_SIZE)
+        return
+    with pa.memory_map(str(path)) as source:
+        reader = pa.ipc.open_file(source)
+        for i in range(reader.num_record_batches):
+            yield reader.get_batch(i)
+
+
+def _open_writer(path: Path, schema: pa.Schema, format: ExportFormat, compression: Optional[str]):
+    """Record batch writer for a format."""
+    if format == ExportFormat.PARQUET:
+        return pq.ParquetWriter(path, schema, compression=compression or "none")
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    return pa.ipc.new_file(str(path), schema, options=options)
+
+
+class ColumnarExporter:
+    """Exports the library to typed, compressed columnar files."""
+
+    def __init__(self, db: Optional[Database] = None):
+        """Initialize exporter.
+
+        Args:
+            db: Database instance
+        """
+        self.db = db or get_db()
+
+    def export_library(
+        self,
+        output_dir: Path,
+        format: ExportFormat = ExportFormat.PARQUET,
+        compression: Optional[str] = "zstd",
+        tables: Iterable[str] = COLUMNAR_TABLES,
+    ) -> ExportResult:
+        """Export tables to ``<output_dir>/<table>.<ext>``, one file each.
+
+        Args:
+            output_dir: Directory for the files, created if missing
+            format: PARQUET or ARROW
+            compression: Codec (e.g. "zstd", "lz4", "snappy"), or None;
+                uncompressed Arrow files can be memory-mapped
+            tables: Tables to export, from COLUMNAR_TABLES
+
+        Returns:
+            ExportResult with the row count of each table
+        """
+        if format not in FILE_EXTENSIONS:
+            return ExportResult(success=False, error=f"Not a columnar format: {format.value}")
+        tables = list(tables)
+        unknown = [name for name in tables if name not in COLUMNAR_TABLES]
+        if unknown:
+            return ExportResult(success=False, error=f"Unknown tables: {', '.join(unknown)}")
+
+        written: list[Path] = []
+        counts: dict[str, int] = {}
+        try:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            for name in tables:
+                path = output_dir / f"{name}{FILE_EXTENSIONS[format]}"
+                written.append(path)
+                counts[name] = self.write_table(name, path, format, compression)
+        except Exception as e:
+            # Leave no partial export behind
+            for path in written:
+                path.unlink(missing_ok=True)
+            return ExportResult(success=False, format=format, error=str(e))
+
+        return ExportResult(
+            success=True,
+            file_path=output_dir,
+            records_exported=sum(counts.values()),
+            format=format,
+            table_counts=counts,
+        )
+
+    def write_table(
+        self,
+        name: str,
+        path: Path,
+        format: ExportFormat = ExportFormat.PARQUET,
+        compression: Optional[str] = "zstd",
+    ) -> int:
+        """Write one table to a columnar file, a record batch at a time.
+
+        Returns:
+            Number of rows written
+        """
+        table = Base.metadata.tables[name]
+        schema = arrow_schema(table)
+        count = 0
+        with self.db.get_session() as session, _open_writer(
+            path, schema, format, compression
+        ) as writer:
+            stmt = select(*table.columns).execution_options(yield_per=COLUMNAR_BATCH_SIZE)
+            for rows in session.execute(stmt).partitions():
+                writer.write_batch(encode_batch(schema, rows))
+                count += len(rows)
+        return count
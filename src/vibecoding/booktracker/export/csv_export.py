@@ -1,15 +1,18 @@
 """CSV export functionality.
 
 Supports multiple export formats for compatibility with different applications.
+Books are streamed from the database and written as they arrive, so
+memory use doesn't grow with the library.
 """
 
 import csv
-from dataclasses import dataclass
-from datetime import date, datetime
+import json
+from dataclasses import dataclass, field
+from datetime import date
 from enum import Enum
 from io import StringIO
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional, TextIO
 
 from sqlalchemy import select
 
@@ -17,6 +20,9 @@ from ..db.models import Book, ReadingLog
 from ..db.schemas import BookStatus
 from ..db.sqlite import Database, get_db
 
+# Rows fetched from SQLite at a time while exporting
+EXPORT_BATCH_SIZE = 500
+
 
 class ExportFormat(str, Enum):
     """Export format options."""
@@ -25,6 +31,8 @@ class ExportFormat(str, Enum):
     GOODREADS = "goodreads"  # Goodreads-compatible
     NOTION = "notion"  # Notion-compatible
     CALIBRE = "calibre"  # Calibre-compatible
+    PARQUET = "parquet"  # Columnar, see ColumnarExporter
+    ARROW = "arrow"  # Columnar Arrow IPC, see ColumnarExporter
 
 
 @dataclass
@@ -36,6 +44,7 @@ class ExportResult:
     records_exported: int = 0
     format: Optional[ExportFormat] = None
     error: Optional[str] = None
+    table_counts: dict[str, int] = field(default_factory=dict)  # Columnar exports
 
 
 class CSVExporter:
@@ -104,6 +113,34 @@ class CSVExporter:
         "comments",
     ]
 
+    # Book columns each format reads; nothing else (e.g. cover_base64,
+    # description) is fetched
+    FORMAT_FIELDS = {
+        ExportFormat.STANDARD: (
+            "id", "title", "author", "isbn", "isbn13", "status", "rating",
+            "page_count", "progress", "date_added", "date_started",
+            "date_finished", "tags", "comments", "publisher",
+            "publication_year", "cover",
+        ),
+        ExportFormat.GOODREADS: (
+            "id", "title", "author", "isbn", "isbn13", "status", "rating",
+            "page_count", "date_added", "date_finished", "tags", "comments",
+        ),
+        ExportFormat.NOTION: (
+            "title", "author", "isbn", "isbn13", "status", "rating",
+            "page_count", "date_started", "date_finished", "tags", "comments",
+        ),
+        ExportFormat.CALIBRE: (
+            "title", "author", "isbn", "isbn13", "publisher",
+            "publication_year", "tags", "rating", "comments",
+        ),
+    }
+
+    LOG_COLUMNS = [
+        "id", "book_id", "book_title", "date", "pages_read",
+        "start_page", "end_page", "duration_minutes", "location", "notes",
+    ]
+
     def __init__(self, db: Optional[Database] = None):
         """Initialize exporter.
 
@@ -131,51 +168,15 @@ class CSVExporter:
             ExportResult with success status and details
         """
         try:
-            with self.db.get_session() as session:
-                stmt = select(Book)
-                if status_filter:
-                    stmt = stmt.where(Book.status == status_filter.value)
-                stmt = stmt.order_by(Book.date_added.desc())
-
-                books = list(session.execute(stmt).scalars().all())
-
-                if not books:
-                    return ExportResult(
-                        success=True,
-                        file_path=output_path,
-                        records_exported=0,
-                        format=format,
-                    )
-
-                # Convert to appropriate format
-                if format == ExportFormat.STANDARD:
-                    rows = self._to_standard_format(books, session)
-                    columns = self.STANDARD_COLUMNS
-                elif format == ExportFormat.GOODREADS:
-                    rows = self._to_goodreads_format(books)
-                    columns = self.GOODREADS_COLUMNS
-                elif format == ExportFormat.NOTION:
-                    rows = self._to_notion_format(books)
-                    columns = self.NOTION_COLUMNS
-                elif format == ExportFormat.CALIBRE:
-                    rows = self._to_calibre_format(books)
-                    columns = self.CALIBRE_COLUMNS
-                else:
-                    rows = self._to_standard_format(books, session)
-                    columns = self.STANDARD_COLUMNS
-
-                # Write to file
-                with open(output_path, "w", newline="", encoding="utf-8") as f:
-                    writer = csv.DictWriter(f, fieldnames=columns)
-                    writer.writeheader()
-                    writer.writerows(rows)
-
-                return ExportResult(
-                    success=True,
-                    file_path=output_path,
-                    records_exported=len(books),
-                    format=format,
-                )
+            with open(output_path, "w", newline="", encoding="utf-8") as f:
+                count = self.write_books(f, format=format, status_filter=status_filter)
+
+            return ExportResult(
+                success=True,
+                file_path=output_path,
+                records_exported=count,
+                format=format,
+            )
 
         except Exception as e:
             return ExportResult(
@@ -183,54 +184,66 @@ class CSVExporter:
                 error=str(e),
             )
 
-    def export_to_string(
+    def write_books(
         self,
+        stream: TextIO,
         format: ExportFormat = ExportFormat.STANDARD,
         status_filter: Optional[BookStatus] = None,
-    ) -> str:
-        """Export books to CSV string.
+    ) -> int:
+        """Write books as CSV to an open text stream, row by row.
+
+        Only the columns the format needs are selected, and rows are
+        fetched EXPORT_BATCH_SIZE at a time and written as they arrive;
+        the stream is flushed after the header and each batch, so output
+        piped to another program starts straight away.
 
         Args:
+            stream: Text stream to write to (opened with ``newline=""``)
             format: Export format to use
             status_filter: Only export books with this status
 
         Returns:
-            CSV content as string
+            Number of books written
         """
+        columns, to_row = self._format_writer(format)
+        writer = csv.DictWriter(stream, fieldnames=columns)
+        writer.writeheader()
+        stream.flush()
+
+        count = 0
         with self.db.get_session() as session:
-            stmt = select(Book)
+            stmt = select(*(getattr(Book, name) for name in self.FORMAT_FIELDS[format]))
             if status_filter:
                 stmt = stmt.where(Book.status == status_filter.value)
             stmt = stmt.order_by(Book.date_added.desc())
 
-            books = list(session.execute(stmt).scalars().all())
-
-            if not books:
-                return ""
-
-            # Convert to appropriate format
-            if format == ExportFormat.STANDARD:
-                rows = self._to_standard_format(books, session)
-                columns = self.STANDARD_COLUMNS
-            elif format == ExportFormat.GOODREADS:
-                rows = self._to_goodreads_format(books)
-                columns = self.GOODREADS_COLUMNS
-            elif format == ExportFormat.NOTION:
-                rows = self._to_notion_format(books)
-                columns = self.NOTION_COLUMNS
-            elif format == ExportFormat.CALIBRE:
-                rows = self._to_calibre_format(books)
-                columns = self.CALIBRE_COLUMNS
-            else:
-                rows = self._to_standard_format(books, session)
-                columns = self.STANDARD_COLUMNS
-
-            output = StringIO()
-            writer = csv.DictWriter(output, fieldnames=columns)
-            writer.writeheader()
-            writer.writerows(rows)
-
-            return output.getvalue()
+            for batch in session.execute(
+                stmt.execution_options(yield_per=EXPORT_BATCH_SIZE)
+            ).partitions():
+                writer.writerows(to_row(book) for book in batch)
+                stream.flush()
+                count += len(batch)
+
+        return count
+
+    def export_to_string(
+        self,
+        format: ExportFormat = ExportFormat.STANDARD,
+        status_filter: Optional[BookStatus] = None,
+    ) -> str:
+        """Export books to CSV string.
+
+        Args:
+            format: Export format to use
+            status_filter: Only export books with this status
+
+        Returns:
+            CSV content as string
+        """
+        output = StringIO()
+        if not self.write_books(output, format=format, status_filter=status_filter):
+            return ""
+        return output.getvalue()
 
     def export_reading_logs(
         self,
@@ -251,38 +264,70 @@ class CSVExporter:
             ExportResult with success status
         """
         try:
-            with self.db.get_session() as session:
-                stmt = select(ReadingLog)
-
-                if book_id:
-                    stmt = stmt.where(ReadingLog.book_id == book_id)
-                if start_date:
-                    stmt = stmt.where(ReadingLog.date >= start_date.isoformat())
-                if end_date:
-                    stmt = stmt.where(ReadingLog.date <= end_date.isoformat())
-
-                stmt = stmt.order_by(ReadingLog.date.desc())
-                logs = list(session.execute(stmt).scalars().all())
-
-                if not logs:
-                    return ExportResult(
-                        success=True,
-                        file_path=output_path,
-                        records_exported=0,
-                    )
-
-                # Get book titles for display
-                book_ids = {log.book_id for log in logs}
-                book_stmt = select(Book).where(Book.id.in_(book_ids))
-                books = {b.id: b for b in session.execute(book_stmt).scalars().all()}
-
-                rows = []
-                for log in logs:
-                    book = books.get(log.book_id)
-                    rows.append({
+            with open(output_path, "w", newline="", encoding="utf-8") as f:
+                count = self.write_reading_logs(f, book_id, start_date, end_date)
+
+            return ExportResult(
+                success=True,
+                file_path=output_path,
+                records_exported=count,
+            )
+
+        except Exception as e:
+            return ExportResult(
+                success=False,
+                error=str(e),
+            )
+
+    def write_reading_logs(
+        self,
+        stream: TextIO,
+        book_id: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> int:
+        """Write reading logs as CSV to an open text stream, row by row.
+
+        Book titles come from a join in the same query.
+
+        Returns:
+            Number of logs written
+        """
+        writer = csv.DictWriter(stream, fieldnames=self.LOG_COLUMNS)
+        writer.writeheader()
+        stream.flush()
+
+        count = 0
+        with self.db.get_session() as session:
+            stmt = select(
+                ReadingLog.id,
+                ReadingLog.book_id,
+                Book.title.label("book_title"),
+                ReadingLog.date,
+                ReadingLog.pages_read,
+                ReadingLog.start_page,
+                ReadingLog.end_page,
+                ReadingLog.duration_minutes,
+                ReadingLog.location,
+                ReadingLog.notes,
+            ).outerjoin(Book, Book.id == ReadingLog.book_id)
+
+            if book_id:
+                stmt = stmt.where(ReadingLog.book_id == book_id)
+            if start_date:
+                stmt = stmt.where(ReadingLog.date >= start_date.isoformat())
+            if end_date:
+                stmt = stmt.where(ReadingLog.date <= end_date.isoformat())
+
+            stmt = stmt.order_by(ReadingLog.date.desc())
+            for batch in session.execute(
+                stmt.execution_options(yield_per=EXPORT_BATCH_SIZE)
+            ).partitions():
+                writer.writerows(
+                    {
                         "id": log.id,
                         "book_id": log.book_id,
-                        "book_title": book.title if book else "",
+                        "book_title": log.book_title or "",
                         "date": log.date,
                         "pages_read": log.pages_read or "",
                         "start_page": log.start_page or "",
@@ -290,133 +335,123 @@ class CSVExporter:
                         "duration_minutes": log.duration_minutes or "",
                         "location": log.location or "",
                         "notes": log.notes or "",
-                    })
-
-                columns = [
-                    "id", "book_id", "book_title", "date", "pages_read",
-                    "start_page", "end_page", "duration_minutes", "location", "notes"
-                ]
-
-                with open(output_path, "w", newline="", encoding="utf-8") as f:
-                    writer = csv.DictWriter(f, fieldnames=columns)
-                    writer.writeheader()
-                    writer.writerows(rows)
-
-                return ExportResult(
-                    success=True,
-                    file_path=output_path,
-                    records_exported=len(logs),
+                    }
+                    for log in batch
                 )
-
-        except Exception as e:
-            return ExportResult(
-                success=False,
-                error=str(e),
-            )
-
-    def _to_standard_format(self, books: list[Book], session) -> list[dict]:
-        """Convert books to standard format."""
-        rows = []
-        for book in books:
-            session.expunge(book)
-            rows.append({
-                "id": book.id,
-                "title": book.title,
-                "author": book.author,
-                "isbn": book.isbn or "",
-                "isbn13": book.isbn13 or "",
-                "status": book.status,
-                "rating": book.rating or "",
-                "page_count": book.page_count or "",
-                "progress": book.progress or "",
-                "date_added": book.date_added or "",
-                "date_started": book.date_started or "",
-                "date_finished": book.date_finished or "",
-                "tags": ",".join(book.get_tags()) if book.tags else "",
-                "comments": book.comments or "",
-                "publisher": book.publisher or "",
-                "publication_year": book.publication_year or "",
-                "cover": book.cover or "",
-            })
-        return rows
-
-    def _to_goodreads_format(self, books: list[Book]) -> list[dict]:
-        """Convert books to Goodreads format."""
-        rows = []
-        for book in books:
-            # Map status to Goodreads shelves
-            shelf_map = {
-                BookStatus.COMPLETED.value: "read",
-                BookStatus.READING.value: "currently-reading",
-                BookStatus.WISHLIST.value: "to-read",
-                BookStatus.ON_HOLD.value: "to-read",
-                BookStatus.DNF.value: "did-not-finish",
-            }
-            exclusive_shelf = shelf_map.get(book.status, "to-read")
-
-            # Get additional bookshelves from tags
-            tags = book.get_tags()
-            bookshelves = ", ".join([exclusive_shelf] + tags)
-
-            rows.append({
-                "Book Id": book.id[:8],  # Shortened ID
-                "Title": book.title,
-                "Author": book.author,
-                "ISBN": book.isbn or "",
-                "ISBN13": book.isbn13 or "",
-                "My Rating": book.rating or 0,
-                "Number of Pages": book.page_count or "",
-                "Date Read": book.date_finished or "",
-                "Date Added": book.date_added or "",
-                "Bookshelves": bookshelves,
-                "Exclusive Shelf": exclusive_shelf,
-                "My Review": book.comments or "",
-            })
-        return rows
-
-    def _to_notion_format(self, books: list[Book]) -> list[dict]:
-        """Convert books to Notion format."""
-        rows = []
-        for book in books:
-            # Map status to Notion format
-            status_map = {
-                BookStatus.COMPLETED.value: "Completed",
-                BookStatus.READING.value: "Reading",
-                BookStatus.WISHLIST.value: "Want to Read",
-                BookStatus.ON_HOLD.value: "On Hold",
-                BookStatus.DNF.value: "Did Not Finish",
-            }
-            status = status_map.get(book.status, book.status)
-
-            rows.append({
-                "Name": book.title,
-                "Author": book.author,
-                "Status": status,
-                "Rating": book.rating or "",
-                "Pages": book.page_count or "",
-                "Started": book.date_started or "",
-                "Finished": book.date_finished or "",
-                "Tags": ",".join(book.get_tags()) if book.tags else "",
-                "Notes": book.comments or "",
-                "ISBN": book.isbn13 or book.isbn or "",
-            })
-        return rows
-
-    def _to_calibre_format(self, books: list[Book]) -> list[dict]:
-        """Convert books to Calibre format."""
-        rows = []
-        for book in books:
-            # Calibre uses rating out of 10, we use out of 5
-            calibre_rating = book.rating * 2 if book.rating else ""
-
-            rows.append({
-                "title": book.title,
-                "authors": book.author,
-                "isbn": book.isbn13 or book.isbn or "",
-                "publisher": book.publisher or "",
-                "pubdate": f"{book.publication_year}-01-01" if book.publication_year else "",
-                "tags": ",".join(book.get_tags()) if book.tags else "",
-                "rating": calibre_rating,
-                "comments": book.comments or "",
-            })
-        return rows
+                stream.flush()
+                count += len(batch)
+
+        return count
+
+    def _format_writer(self, format: ExportFormat) -> tuple[list[str], Callable[[Any], dict]]:
+        """Column headers and row converter for a format."""
+        if format not in self.FORMAT_FIELDS:
+            raise ValueError(f"Not a CSV format: {format.value}")
+        if format == ExportFormat.GOODREADS:
+            return self.GOODREADS_COLUMNS, self._goodreads_row
+        if format == ExportFormat.NOTION:
+            return self.NOTION_COLUMNS, self._notion_row
+        if format == ExportFormat.CALIBRE:
+            return self.CALIBRE_COLUMNS, self._calibre_row
+        return self.STANDARD_COLUMNS, self._standard_row
+
+    @staticmethod
+    def _standard_row(book) -> dict:
+        """Convert a book row to standard format."""
+        return {
+            "id": book.id,
+            "title": book.title,
+            "author": book.author,
+            "isbn": book.isbn or "",
+            "isbn13": book.isbn13 or "",
+            "status": book.status,
+            "rating": book.rating or "",
+            "page_count": book.page_count or "",
+            "progress": book.progress or "",
+            "date_added": book.date_added or "",
+            "date_started": book.date_started or "",
+            "date_finished": book.date_finished or "",
+            "tags": ",".join(_tags(book)),
+            "comments": book.comments or "",
+            "publisher": book.publisher or "",
+            "publication_year": book.publication_year or "",
+            "cover": book.cover or "",
+        }
+
+    @staticmethod
+    def _goodreads_row(book) -> dict:
+        """Convert a book row to Goodreads format."""
+        # Map status to Goodreads shelves
+        shelf_map = {
+            BookStatus.COMPLETED.value: "read",
+            BookStatus.READING.value: "currently-reading",
+            BookStatus.WISHLIST.value: "to-read",
+            BookStatus.ON_HOLD.value: "to-read",
+            BookStatus.DNF.value: "did-not-finish",
+        }
+        exclusive_shelf = shelf_map.get(book.status, "to-read")
+
+        # Get additional bookshelves from tags
+        bookshelves = ", ".join([exclusive_shelf] + _tags(book))
+
+        return {
+            "Book Id": book.id[:8],  # Shortened ID
+            "Title": book.title,
+            "Author": book.author,
+            "ISBN": book.isbn or "",
+            "ISBN13": book.isbn13 or "",
+            "My Rating": book.rating or 0,
+            "Number of Pages": book.page_count or "",
+            "Date Read": book.date_finished or "",
+            "Date Added": book.date_added or "",
+            "Bookshelves": bookshelves,
+            "Exclusive Shelf": exclusive_shelf,
+            "My Review": book.comments or "",
+        }
+
+    @staticmethod
+    def _notion_row(book) -> dict:
+        """Convert a book row to Notion format."""
+        # Map status to Notion format
+        status_map = {
+            BookStatus.COMPLETED.value: "Completed",
+            BookStatus.READING.value: "Reading",
+            BookStatus.WISHLIST.value: "Want to Read",
+            BookStatus.ON_HOLD.value: "On Hold",
+            BookStatus.DNF.value: "Did Not Finish",
+        }
+
+        return {
+            "Name": book.title,
+            "Author": book.author,
+            "Status": status_map.get(book.status, book.status),
+            "Rating": book.rating or "",
+            "Pages": book.page_count or "",
+            "Started": book.date_started or "",
+            "Finished": book.date_finished or "",
+            "Tags": ",".join(_tags(book)),
+            "Notes": book.comments or "",
+            "ISBN": book.isbn13 or book.isbn or "",
+        }
+
+    @staticmethod
+    def _calibre_row(book) -> dict:
+        """Convert a book row to Calibre format."""
+        # Calibre uses rating out of 10, we use out of 5
+        calibre_rating = book.rating * 2 if book.rating else ""
+
+        return {
+            "title": book.title,
+            "authors": book.author,
+            "isbn": book.isbn13 or book.isbn or "",
+            "publisher": book.publisher or "",
+            "pubdate": f"{book.publication_year}-01-01" if book.publication_year else "",
+            "tags": ",".join(_tags(book)),
+            "rating": calibre_rating,
+            "comments": book.comments or "",
+        }
+
+
+def _tags(book) -> list[str]:
+    """Tags of a book row, decoded from their JSON column."""
+    return json.loads(book.tags) if book.tags else []
@@ -1,19 +1,36 @@
 """JSON export functionality.
 
 Provides comprehensive data export for backup and portability.
+Rows are streamed from the database and written as they arrive, so
+memory use doesn't grow with the library.
 """
 
 import json
 from dataclasses import dataclass
 from datetime import date, datetime
+from io import StringIO
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional, TextIO
 
 from sqlalchemy import select
+from sqlalchemy.orm import Session
 
 from ..db.models import Book, ReadingLog
 from ..db.schemas import BookStatus
 from ..db.sqlite import Database, get_db
+from .csv_export import EXPORT_BATCH_SIZE
+
+# Columns written for each book and reading log
+BOOK_FIELDS = (
+    "id", "title", "author", "isbn", "status", "rating", "page_count",
+    "progress", "date_added", "date_started", "date_finished", "tags",
+    "comments", "publisher", "publication_year", "cover", "notion_page_id",
+    "series", "series_index",
+)
+LOG_FIELDS = (
+    "id", "book_id", "date", "pages_read", "start_page", "end_page",
+    "duration_minutes", "location", "notes",
+)
 
 
 @dataclass
@@ -55,49 +72,15 @@ class JSONExporter:
             JSONExportResult with success status
         """
         try:
-            with self.db.get_session() as session:
-                # Export books
-                stmt = select(Book).order_by(Book.date_added.desc())
-                books = list(session.execute(stmt).scalars().all())
-
-                book_data = []
-                for book in books:
-                    session.expunge(book)
-                    book_data.append(self._book_to_dict(book))
-
-                # Export reading logs
-                logs_data = []
-                if include_reading_logs:
-                    stmt = select(ReadingLog).order_by(ReadingLog.date.desc())
-                    logs = list(session.execute(stmt).scalars().all())
-
-                    for log in logs:
-                        session.expunge(log)
-                        logs_data.append(self._log_to_dict(log))
-
-                # Build export structure
-                export_data = {
-                    "version": "1.0",
-                    "exported_at": datetime.now().isoformat(),
-                    "books": book_data,
-                }
-
-                if include_reading_logs:
-                    export_data["reading_logs"] = logs_data
-
-                # Write to file
-                with open(output_path, "w", encoding="utf-8") as f:
-                    if pretty:
-                        json.dump(export_data, f, indent=2, ensure_ascii=False)
-                    else:
-                        json.dump(export_data, f, ensure_ascii=False)
-
-                return JSONExportResult(
-                    success=True,
-                    file_path=output_path,
-                    books_exported=len(book_data),
-                    logs_exported=len(logs_data),
-                )
+            with open(output_path, "w", encoding="utf-8") as f:
+                counts = self.write_all(f, include_reading_logs=include_reading_logs, pretty=pretty)
+
+            return JSONExportResult(
+                success=True,
+                file_path=output_path,
+                books_exported=counts["books"],
+                logs_exported=counts.get("reading_logs", 0),
+            )
 
         except Exception as e:
             return JSONExportResult(
@@ -105,6 +88,28 @@ class JSONExporter:
                 error=str(e),
             )
 
+    def write_all(
+        self,
+        stream: TextIO,
+        include_reading_logs: bool = True,
+        pretty: bool = True,
+    ) -> dict[str, int]:
+        """Write all data as JSON to an open text stream, row by row.
+
+        Args:
+            stream: Text stream to write to
+            include_reading_logs: Include reading log data
+            pretty: Pretty-print JSON output
+
+        Returns:
+            Number of items written per array
+        """
+        with self.db.get_session() as session:
+            arrays = {"books": self._book_dicts(session)}
+            if include_reading_logs:
+                arrays["reading_logs"] = self._log_dicts(session)
+            return _write_document(stream, arrays, pretty)
+
     def export_books(
         self,
         output_path: Path,
@@ -122,37 +127,17 @@ class JSONExporter:
             JSONExportResult with success status
         """
         try:
-            with self.db.get_session() as session:
-                stmt = select(Book)
-                if status_filter:
-                    stmt = stmt.where(Book.status == status_filter.value)
-                stmt = stmt.order_by(Book.date_added.desc())
-
-                books = list(session.execute(stmt).scalars().all())
-
-                book_data = []
-                for book in books:
-                    session.expunge(book)
-                    book_data.append(self._book_to_dict(book))
-
-                export_data = {
-                    "version": "1.0",
-                    "exported_at": datetime.now().isoformat(),
-                    "books": book_data,
-                }
-
-                with open(output_path, "w", encoding="utf-8") as f:
-                    if pretty:
-                        json.dump(export_data, f, indent=2, ensure_ascii=False)
-                    else:
-                        json.dump(export_data, f, ensure_ascii=False)
-
-                return JSONExportResult(
-                    success=True,
-                    file_path=output_path,
-                    books_exported=len(book_data),
+            with open(output_path, "w", encoding="utf-8") as f, self.db.get_session() as session:
+                counts = _write_document(
+                    f, {"books": self._book_dicts(session, status_filter)}, pretty
                 )
 
+            return JSONExportResult(
+                success=True,
+                file_path=output_path,
+                books_exported=counts["books"],
+            )
+
         except Exception as e:
             return JSONExportResult(
                 success=False,
@@ -173,39 +158,9 @@ class JSONExporter:
         Returns:
             JSON content as string
         """
-        with self.db.get_session() as session:
-            # Export books
-            stmt = select(Book).order_by(Book.date_added.desc())
-            books = list(session.execute(stmt).scalars().all())
-
-            book_data = []
-            for book in books:
-                session.expunge(book)
-                book_data.append(self._book_to_dict(book))
-
-            # Export reading logs
-            logs_data = []
-            if include_reading_logs:
-                stmt = select(ReadingLog).order_by(ReadingLog.date.desc())
-                logs = list(session.execute(stmt).scalars().all())
-
-                for log in logs:
-                    session.expunge(log)
-                    logs_data.append(self._log_to_dict(log))
-
-            # Build export structure
-            export_data = {
-                "version": "1.0",
-                "exported_at": datetime.now().isoformat(),
-                "books": book_data,
-            }
-
-            if include_reading_logs:
-                export_data["reading_logs"] = logs_data
-
-            if pretty:
-                return json.dumps(export_data, indent=2, ensure_ascii=False)
-            return json.dumps(export_data, ensure_ascii=False)
+        output = StringIO()
+        self.write_all(output, include_reading_logs=include_reading_logs, pretty=pretty)
+        return output.getvalue()
 
     def export_book(self, book_id: str, include_logs: bool = True) -> Optional[dict]:
         """Export a single book with its reading logs.
@@ -260,41 +215,15 @@ class JSONExporter:
             JSONExportResult with success status
         """
         try:
-            with self.db.get_session() as session:
-                stmt = select(ReadingLog)
-
-                if book_id:
-                    stmt = stmt.where(ReadingLog.book_id == book_id)
-                if start_date:
-                    stmt = stmt.where(ReadingLog.date >= start_date.isoformat())
-                if end_date:
-                    stmt = stmt.where(ReadingLog.date <= end_date.isoformat())
+            with open(output_path, "w", encoding="utf-8") as f, self.db.get_session() as session:
+                logs = self._log_dicts(session, book_id, start_date, end_date)
+                counts = _write_document(f, {"reading_logs": logs}, pretty)
 
-                stmt = stmt.order_by(ReadingLog.date.desc())
-                logs = list(session.execute(stmt).scalars().all())
-
-                logs_data = []
-                for log in logs:
-                    session.expunge(log)
-                    logs_data.append(self._log_to_dict(log))
-
-                export_data = {
-                    "version": "1.0",
-                    "exported_at": datetime.now().isoformat(),
-                    "reading_logs": logs_data,
-                }
-
-                with open(output_path, "w", encoding="utf-8") as f:
-                    if pretty:
-                        json.dump(export_data, f, indent=2, ensure_ascii=False)
-                    else:
-                        json.dump(export_data, f, ensure_ascii=False)
-
-                return JSONExportResult(
-                    success=True,
-                    file_path=output_path,
-                    logs_exported=len(logs_data),
-                )
+            return JSONExportResult(
+                success=True,
+                file_path=output_path,
+                logs_exported=counts["reading_logs"],
+            )
 
         except Exception as e:
             return JSONExportResult(
@@ -302,40 +231,83 @@ class JSONExporter:
                 error=str(e),
             )
 
-    def _book_to_dict(self, book: Book) -> dict[str, Any]:
-        """Convert a Book model to dictionary."""
-        return {
-            "id": book.id,
-            "title": book.title,
-            "author": book.author,
-            "isbn": book.isbn,
-            "status": book.status,
-            "rating": book.rating,
-            "page_count": book.page_count,
-            "progress": book.progress,
-            "date_added": book.date_added,
-            "date_started": book.date_started,
-            "date_finished": book.date_finished,
-            "tags": book.get_tags(),
-            "comments": book.comments,
-            "publisher": book.publisher,
-            "publication_year": book.publication_year,
-            "cover": book.cover,
-            "notion_page_id": book.notion_page_id,
-            "series": book.series,
-            "series_index": book.series_index,
-        }
-
-    def _log_to_dict(self, log: ReadingLog) -> dict[str, Any]:
-        """Convert a ReadingLog model to dictionary."""
-        return {
-            "id": log.id,
-            "book_id": log.book_id,
-            "date": log.date,
-            "pages_read": log.pages_read,
-            "start_page": log.start_page,
-            "end_page": log.end_page,
-            "duration_minutes": log.duration_minutes,
-            "location": log.location,
-            "notes": log.notes,
-        }
+    def _book_dicts(
+        self, session: Session, status_filter: Optional[BookStatus] = None
+    ) -> Iterator[dict[str, Any]]:
+        """Stream exported books, selecting only the exported columns."""
+        stmt = select(*(getattr(Book, name) for name in BOOK_FIELDS))
+        if status_filter:
+            stmt = stmt.where(Book.status == status_filter.value)
+        stmt = stmt.order_by(Book.date_added.desc())
+        for book in session.execute(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE)):
+            yield self._book_to_dict(book)
+
+    def _log_dicts(
+        self,
+        session: Session,
+        book_id: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Stream exported reading logs."""
+        stmt = select(*(getattr(ReadingLog, name) for name in LOG_FIELDS))
+        if book_id:
+            stmt = stmt.where(ReadingLog.book_id == book_id)
+        if start_date:
+            stmt = stmt.where(ReadingLog.date >= start_date.isoformat())
+        if end_date:
+            stmt = stmt.where(ReadingLog.date <= end_date.isoformat())
+        stmt = stmt.order_by(ReadingLog.date.desc())
+        for log in session.execute(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE)):
+            yield self._log_to_dict(log)
+
+    def _book_to_dict(self, book) -> dict[str, Any]:
+        """Convert a Book model or row to dictionary."""
+        data = {name: getattr(book, name) for name in BOOK_FIELDS}
+        data["tags"] = json.loads(book.tags) if book.tags else []
+        return data
+
+    def _log_to_dict(self, log) -> dict[str, Any]:
+        """Convert a ReadingLog model or row to dictionary."""
+        return {name: getattr(log, name) for name in LOG_FIELDS}
+
+
+def _write_document(
+    stream: TextIO, arrays: dict[str, Iterable[dict[str, Any]]], pretty: bool
+) -> dict[str, int]:
+    """Write an export document, streaming each array's items.
+
+    The layout matches ``json.dump`` (with ``indent=2`` when pretty), but
+    items are serialised one at a time and the stream is flushed after the
+    header and every EXPORT_BATCH_SIZE items.
+
+    Returns:
+        Number of items written per array
+    """
+    member_sep = ",\n  " if pretty else ", "
+    header = {"version": "1.0", "exported_at": datetime.now().isoformat()}
+    stream.write("{\n  " if pretty else "{")
+    stream.write(
+        member_sep.join(f"{json.dumps(key)}: {json.dumps(value)}" for key, value in header.items())
+    )
+    stream.flush()
+
+    counts = {}
+    for key, items in arrays.items():
+        stream.write(f"{member_sep}{json.dumps(key)}: [")
+        count = 0
+        for item in items:
+            if pretty:
+                text = json.dumps(item, indent=2, ensure_ascii=False).replace("\n", "\n    ")
+                stream.write(("\n    " if count == 0 else ",\n    ") + text)
+            else:
+                stream.write(("" if count == 0 else ", ") + json.dumps(item, ensure_ascii=False))
+            count += 1
+            if count % EXPORT_BATCH_SIZE == 0:
+                stream.flush()
+        stream.write("\n  ]" if pretty and count else "]")
+        counts[key] = count
+
+    stream.write("\n}" if pretty else "}")
+    stream.flush()
+    return counts
@@ -9,11 +9,13 @@ from dataclasses import dataclass, field
 from datetime import date, timedelta
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 from ..db.models import Book, ReadingLog
+from ..db.rollups import daily_activity
 from ..db.schemas import BookStatus
 from ..db.sqlite import Database, get_db
+from ..streaks.engine import StreakEngine
 
 
 @dataclass
@@ -136,23 +138,18 @@ class ReportGenerator:
             )
             started_books = list(session.execute(stmt).scalars().all())
 
-            # Get reading logs
-            stmt = select(ReadingLog).where(
-                ReadingLog.date >= year_start,
-                ReadingLog.date <= year_end,
-            )
-            logs = list(session.execute(stmt).scalars().all())
+            # Reading per day
+            daily = daily_activity(session, year_start, year_end)
 
             # Basic stats
             review.books_finished = len(finished_books)
             review.books_started = len(started_books)
             review.total_pages = sum(b.page_count or 0 for b in finished_books)
-            review.total_reading_time_minutes = sum(log.duration_minutes or 0 for log in logs)
-            review.total_reading_sessions = len(logs)
+            review.total_reading_time_minutes = sum(day.minutes for day in daily.values())
+            review.total_reading_sessions = sum(day.sessions for day in daily.values())
 
             # Active days
-            reading_dates = set(log.date for log in logs)
-            review.active_reading_days = len(reading_dates)
+            review.active_reading_days = len(daily)
 
             # Averages
             if finished_books:
@@ -228,9 +225,8 @@ class ReportGenerator:
 
             # Pages by month (from logs)
             pages_by_month = defaultdict(int)
-            for log in logs:
-                month = int(log.date[5:7])
-                pages_by_month[month] += log.pages_read or 0
+            for day in daily.values():
+                pages_by_month[int(day.date[5:7])] += day.pages
             review.pages_by_month = dict(pages_by_month)
 
             # Rating distribution
@@ -260,12 +256,22 @@ class ReportGenerator:
                 review.most_productive_month = calendar.month_name[best_month]
 
             # Favorite reading location
-            location_counts = Counter(log.location for log in logs if log.location)
-            if location_counts:
-                review.favorite_reading_location = location_counts.most_common(1)[0][0]
+            stmt = (
+                select(ReadingLog.location)
+                .where(
+                    ReadingLog.date >= year_start,
+                    ReadingLog.date <= year_end,
+                    ReadingLog.location.isnot(None),
+                    ReadingLog.location != "",
+                )
+                .group_by(ReadingLog.location)
+                .order_by(func.count().desc())
+                .limit(1)
+            )
+            review.favorite_reading_location = session.execute(stmt).scalar()
 
             # Reading streak
-            review.reading_streak_days = self._calculate_max_streak(reading_dates)
+            review.reading_streak_days = self._calculate_max_streak(set(daily))
 
             # Monthly summaries
             for month in range(1, 13):
@@ -317,22 +323,18 @@ class ReportGenerator:
             )
             finished_books = list(session.execute(stmt).scalars().all())
 
-            # Get reading logs
-            stmt = select(ReadingLog).where(
-                ReadingLog.date >= month_start,
-                ReadingLog.date < month_end,
-            )
-            logs = list(session.execute(stmt).scalars().all())
+            # Reading per day
+            last_day = calendar.monthrange(year, month)[1]
+            daily = daily_activity(session, month_start, f"{year}-{month:02d}-{last_day:02d}")
 
             # Stats
             report.books_finished = len(finished_books)
-            report.pages_read = sum(log.pages_read or 0 for log in logs)
-            report.reading_time_minutes = sum(log.duration_minutes or 0 for log in logs)
-            report.reading_sessions = len(logs)
+            report.pages_read = sum(day.pages for day in daily.values())
+            report.reading_time_minutes = sum(day.minutes for day in daily.values())
+            report.reading_sessions = sum(day.sessions for day in daily.values())
 
             # Active days
-            reading_dates = set(log.date for log in logs)
-            report.active_days = len(reading_dates)
+            report.active_days = len(daily)
 
             # Book summaries
             for book in finished_books:
@@ -457,20 +459,5 @@ class ReportGenerator:
 
     def _calculate_max_streak(self, reading_dates: set[str]) -> int:
         """Calculate the longest reading streak from dates."""
-        if not reading_dates:
-            return 0
-
-        # Convert to date objects and sort
-        dates = sorted(date.fromisoformat(d) for d in reading_dates)
-
-        max_streak = 1
-        current_streak = 1
-
-        for i in range(1, len(dates)):
-            if (dates[i] - dates[i-1]).days == 1:
-                current_streak += 1
-                max_streak = max(max_streak, current_streak)
-            elif (dates[i] - dates[i-1]).days > 1:
-                current_streak = 1
-
-        return max_streak
+        longest = StreakEngine(reading_dates).longest()
+        return longest.length if longest else 0
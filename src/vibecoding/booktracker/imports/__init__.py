@@ -8,6 +8,7 @@ from .base import (
 )
 from .goodreads import GoodreadsImporter
 from .calibre import CalibreImporter
+from .columnar import ColumnarImporter
 from .csv_import import GenericCSVImporter, FieldMapping
 
 __all__ = [
@@ -17,6 +18,7 @@ __all__ = [
     "BookImportError",
     "GoodreadsImporter",
     "CalibreImporter",
+    "ColumnarImporter",
     "GenericCSVImporter",
     "FieldMapping",
 ]
@@ -96,6 +96,7 @@ class ImportResult:
     errors: int = 0
     error_messages: list[str] = field(default_factory=list)
     imported_books: list[Book] = field(default_factory=list)
+    table_counts: dict[str, int] = field(default_factory=dict)  # Rows written per table
 
     @property
     def summary(self) -> str:
@@ -182,25 +183,26 @@ class BaseImporter(ABC):
 
         result.total_records = len(records)
 
-        # Import each record
-        for record in records:
-            try:
-                book, action = self._import_record(
-                    record, duplicate_handling, dry_run
-                )
-                if action == "imported":
-                    result.imported += 1
-                    if book:
-                        result.imported_books.append(book)
-                elif action == "skipped":
-                    result.skipped += 1
-                elif action == "updated":
-                    result.updated += 1
-            except Exception as e:
-                result.errors += 1
-                result.error_messages.append(
-                    f"Error importing '{record.title}': {e}"
-                )
+        # Import each record, committing once at the end
+        with self.db.batch():
+            for record in records:
+                try:
+                    book, action = self._import_record(
+                        record, duplicate_handling, dry_run
+                    )
+                    if action == "imported":
+                        result.imported += 1
+                        if book:
+                            result.imported_books.append(book)
+                    elif action == "skipped":
+                        result.skipped += 1
+                    elif action == "updated":
+                        result.updated += 1
+                except Exception as e:
+                    result.errors += 1
+                    result.error_messages.append(
+                        f"Error importing '{record.title}': {e}"
+                    )
 
         result.success = result.errors == 0 or result.imported > 0
         return result
@@ -0,0 +1,198 @@
+"""Columnar importer.
+
+Loads the Parquet or Arrow IPC files written by ``ColumnarExporter``
+back into the library. The files carry the library's own ids, so rows
+are matched by primary key rather than by ISBN or title, and written a
+record batch at a time with the bulk upserts of ``db/bulk.py``.
+"""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import Table
+from sqlalchemy.orm import Session
+
+from ..db.bulk import existing_keys, row_key, write_rows
+from ..db.models import Base, Book
+from ..db.schemas import BookStatus
+from ..export.columnar import decode_batch, read_batches, read_schema, table_files
+from ..search.suggest import invalidate_suggestion_index
+from .base import BaseImporter, DuplicateHandling, ImportRecord, ImportResult
+
+
+class ColumnarImporter(BaseImporter):
+    """Imports a library from Parquet or Arrow files.
+
+    ``file_path`` is either an export directory holding
+    ``<table>.parquet`` / ``<table>.arrow`` files or a single such file.
+    """
+
+    source_name = "columnar"
+
+    def validate_file(self, file_path: Path) -> tuple[bool, Optional[str]]:
+        """Validate a columnar file or export directory."""
+        if not file_path.exists():
+            return False, f"File not found: {file_path}"
+
+        files = table_files(file_path)
+        if not files:
+            return False, "No books, reading_logs or daily_readings .parquet/.arrow files found"
+
+        try:
+            for name, path in files.items():
+                table = Base.metadata.tables[name]
+                names = set(read_schema(path).names)
+                missing = {column.name for column in table.primary_key.columns} - names
+                if missing:
+                    return False, f"{path.name} is missing columns: {missing}"
+        except Exception as e:
+            return False, f"Error reading file: {e}"
+
+        return True, None
+
+    def parse_file(self, file_path: Path) -> list[ImportRecord]:
+        """Parse the books file into import records, for previews."""
+        path = table_files(file_path).get(Book.__tablename__)
+        if path is None:
+            return []
+
+        records = []
+        for batch in read_batches(path):
+            for row in decode_batch(Book.__tablename__, batch):
+                status = row.get("status")
+                records.append(
+                    ImportRecord(
+                        title=row.get("title") or "",
+                        author=row.get("author") or "",
+                        isbn=row.get("isbn"),
+                        isbn13=row.get("isbn13"),
+                        status=BookStatus(status) if status else None,
+                        rating=row.get("rating"),
+                        page_count=row.get("page_count"),
+                        date_added=row.get("date_added"),
+                        date_started=row.get("date_started"),
+                        date_finished=row.get("date_finished"),
+                        tags=json.loads(row["tags"]) if row.get("tags") else [],
+                        comments=row.get("comments"),
+                        publisher=row.get("publisher"),
+                        publication_year=row.get("publication_year"),
+                        series=row.get("series"),
+                        series_index=row.get("series_index"),
+                        cover_url=row.get("cover"),
+                        description=row.get("description"),
+                        source=self.source_name,
+                        source_id=row.get("id"),
+                    )
+                )
+        return records
+
+    def import_file(
+        self,
+        file_path: Path,
+        duplicate_handling: DuplicateHandling = DuplicateHandling.SKIP,
+        dry_run: bool = False,
+    ) -> ImportResult:
+        """Import every table file, a record batch at a time.
+
+        Each batch is committed as it is written. Rows whose id is
+        already in the library are skipped with SKIP; UPDATE and REPLACE
+        both overwrite them with the file's values. CREATE_NEW isn't
+        supported: the rows' ids are what tie logs to their books.
+
+        Args:
+            file_path: Export directory or single columnar file
+            duplicate_handling: How to handle rows that already exist
+            dry_run: If True, don't actually import
+
+        Returns:
+            ImportResult with counts over all tables, and per table in
+            ``table_counts``
+        """
+        result = ImportResult(
+            success=False,
+            source_file=file_path,
+            source_type=self.source_name,
+        )
+
+        is_valid, error = self.validate_file(file_path)
+        if not is_valid:
+            result.error_messages.append(f"Invalid file: {error}")
+            return result
+
+        if duplicate_handling == DuplicateHandling.CREATE_NEW:
+            result.error_messages.append(
+                "Columnar imports match rows by id: create_new is not supported"
+            )
+            return result
+
+        try:
+            # In a batch, so write_rows' savepoints nest in a real transaction
+            with self.db.batch() as uow:
+                session = uow.session
+                for name, path in table_files(file_path).items():
+                    table = Base.metadata.tables[name]
+                    result.table_counts.setdefault(name, 0)
+                    for batch in read_batches(path):
+                        self._import_batch(
+                            session, table, decode_batch(name, batch), result,
+                            duplicate_handling, dry_run,
+                        )
+                        if not dry_run:
+                            session.commit()
+        except Exception as e:
+            result.error_messages.append(f"Import failed: {e}")
+            return result
+        finally:
+            if not dry_run:
+                # Bulk upserts bypass the ORM events that keep search
+                # suggestions current, and earlier batches are committed
+                invalidate_suggestion_index(self.db.engine)
+
+        result.success = result.errors == 0 or result.imported > 0
+        return result
+
+    def _import_batch(
+        self,
+        session: Session,
+        table: Table,
+        rows: list[dict],
+        result: ImportResult,
+        duplicate_handling: DuplicateHandling,
+        dry_run: bool,
+    ) -> None:
+        """Write one batch of a table's rows and count them."""
+        pk_names = [column.name for column in table.primary_key.columns]
+        # Columns the file has but this schema doesn't are dropped
+        rows = [{k: v for k, v in row.items() if k in table.c} for row in rows]
+        result.total_records += len(rows)
+
+        existing = existing_keys(session, table, rows)
+        if duplicate_handling == DuplicateHandling.SKIP:
+            kept = [row for row in rows if row_key(pk_names, row) not in existing]
+            result.skipped += len(rows) - len(kept)
+            rows = kept
+
+        if not dry_run:
+
+            def on_error(row: dict, error) -> None:
+                result.errors += 1
+                label = row.get("title") or ", ".join(str(row.get(n)) for n in pk_names)
+                result.error_messages.append(f"Error importing {table.name} '{label}': {error}")
+
+            rows = write_rows(session, table, rows, on_error)
+
+        updated = sum(1 for row in rows if row_key(pk_names, row) in existing)
+        result.imported += len(rows) - updated
+        result.updated += updated
+        result.table_counts[table.name] += len(rows)
+
+    def _find_existing_book(self, record: ImportRecord) -> Optional[Book]:
+        """Find the library's book with the record's id."""
+        if not record.source_id:
+            return None
+        with self.db.get_session() as session:
+            existing = session.get(Book, record.source_id)
+            if existing:
+                session.expunge(existing)
+            return existing
@@ -2,9 +2,9 @@
 
 from collections import Counter
 from datetime import datetime, timezone
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import Integer, cast, func, select
 
 from ..db.models import Book
 from ..db.sqlite import Database, get_db
@@ -21,17 +21,83 @@ from .schemas import (
     LocationUpdate,
 )
 
+if TYPE_CHECKING:
+    from ..stats.snapshot import LibrarySnapshot
+
+
+def _location_stats(locations, usage: dict, total_pages: int, by_hour) -> LocationStats:
+    """Build location stats from per-location session totals.
+
+    Args:
+        locations: Rows with id, name, location_type, icon and is_favorite
+        usage: Location id -> (sessions, minutes)
+        total_pages: Pages read across all sessions
+        by_hour: (hour, minutes) pairs
+    """
+    favorite_location = next((loc.name for loc in locations if loc.is_favorite), None)
+    most_used_location = None
+    max_minutes = 0
+    minutes_by_type: dict[str, int] = {}
+    sessions_by_type: dict[str, int] = {}
+
+    for loc in locations:
+        loc_sessions, loc_minutes = usage.get(loc.id, (0, 0))
+        if loc_minutes > max_minutes:
+            max_minutes = loc_minutes
+            most_used_location = loc.name
+
+        # Aggregate by type
+        loc_type = loc.location_type
+        minutes_by_type[loc_type] = minutes_by_type.get(loc_type, 0) + loc_minutes
+        sessions_by_type[loc_type] = sessions_by_type.get(loc_type, 0) + loc_sessions
+
+    top_locations = sorted(locations, key=lambda loc: usage.get(loc.id, (0, 0))[1], reverse=True)
+
+    reading_by_hour: dict[int, int] = {h: 0 for h in range(24)}
+    for hour, minutes in by_hour:
+        if hour in reading_by_hour:
+            reading_by_hour[hour] += int(minutes or 0)
+
+    return LocationStats(
+        total_locations=len(locations),
+        total_sessions=sum(sessions for sessions, _ in usage.values()),
+        total_minutes=sum(minutes for _, minutes in usage.values()),
+        total_pages=total_pages,
+        favorite_location=favorite_location,
+        most_used_location=most_used_location,
+        minutes_by_type=minutes_by_type,
+        sessions_by_type=sessions_by_type,
+        top_locations=[
+            LocationSummary(
+                id=loc.id,
+                name=loc.name,
+                location_type=LocationType(loc.location_type),
+                icon=loc.icon,
+                total_sessions=usage.get(loc.id, (0, 0))[0],
+                total_minutes=usage.get(loc.id, (0, 0))[1],
+            )
+            for loc in top_locations[:5]
+        ],
+        reading_by_hour=reading_by_hour,
+    )
+
 
 class LocationManager:
     """Manages reading location operations."""
 
-    def __init__(self, db: Optional[Database] = None):
+    def __init__(
+        self,
+        db: Optional[Database] = None,
+        snapshot: Optional["LibrarySnapshot"] = None,
+    ):
         """Initialize location manager.
 
         Args:
             db: Database instance
+            snapshot: Compute location stats from this in-memory snapshot
         """
         self.db = db or get_db()
+        self.snapshot = snapshot
 
     # -------------------------------------------------------------------------
     # Location CRUD
@@ -346,97 +412,51 @@ class LocationManager:
         Returns:
             LocationStats with counts and breakdown
         """
-        with self.db.get_session() as session:
-            # Count locations
-            total_locations = session.execute(
-                select(func.count()).select_from(ReadingLocation)
-            ).scalar() or 0
-
-            # Count sessions
-            total_sessions = session.execute(
-                select(func.count()).select_from(LocationSession)
-            ).scalar() or 0
-
-            # Total reading
-            total_minutes = session.execute(
-                select(func.sum(LocationSession.minutes_read))
-            ).scalar() or 0
-
-            total_pages = session.execute(
-                select(func.sum(LocationSession.pages_read))
-            ).scalar() or 0
-
-            # Get all locations for breakdown
-            locations = session.execute(select(ReadingLocation)).scalars().all()
-
-            # Calculate favorites and most used
-            favorite_location = None
-            most_used_location = None
-            max_minutes = 0
-
-            minutes_by_type: dict[str, int] = {}
-            sessions_by_type: dict[str, int] = {}
-
-            for loc in locations:
-                # Load sessions
-                _ = loc.sessions
-
-                if loc.is_favorite and favorite_location is None:
-                    favorite_location = loc.name
-
-                loc_minutes = loc.total_minutes
-                if loc_minutes > max_minutes:
-                    max_minutes = loc_minutes
-                    most_used_location = loc.name
-
-                # Aggregate by type
-                loc_type = loc.location_type
-                minutes_by_type[loc_type] = minutes_by_type.get(loc_type, 0) + loc_minutes
-                sessions_by_type[loc_type] = (
-                    sessions_by_type.get(loc_type, 0) + loc.total_sessions
+        if self.snapshot is not None:
+            locations = list(self.snapshot.locations.itertuples(index=False))
+            sessions = self.snapshot.location_sessions
+            grouped = sessions.groupby("location_id", sort=False)
+            counts = grouped.size()
+            usage = {
+                location_id: (int(count), int(minutes))
+                for location_id, count, minutes in zip(
+                    counts.index, counts, grouped["minutes_read"].sum()
                 )
-
-            # Build top locations data before leaving session
-            top_locs_data = []
-            for loc in sorted(locations, key=lambda x: x.total_minutes, reverse=True)[:5]:
-                top_locs_data.append({
-                    "id": loc.id,
-                    "name": loc.name,
-                    "location_type": loc.location_type,
-                    "icon": loc.icon,
-                    "total_sessions": loc.total_sessions,
-                    "total_minutes": loc.total_minutes,
-                })
-
-            # Reading by hour
-            reading_by_hour: dict[int, int] = {h: 0 for h in range(24)}
-            all_sessions = session.execute(select(LocationSession)).scalars().all()
-            for s in all_sessions:
-                hour = s.session_hour
-                reading_by_hour[hour] += s.minutes_read
-
-        return LocationStats(
-            total_locations=total_locations,
-            total_sessions=total_sessions,
-            total_minutes=total_minutes,
-            total_pages=total_pages,
-            favorite_location=favorite_location,
-            most_used_location=most_used_location,
-            minutes_by_type=minutes_by_type,
-            sessions_by_type=sessions_by_type,
-            top_locations=[
-                LocationSummary(
-                    id=loc_data["id"],
-                    name=loc_data["name"],
-                    location_type=LocationType(loc_data["location_type"]),
-                    icon=loc_data["icon"],
-                    total_sessions=loc_data["total_sessions"],
-                    total_minutes=loc_data["total_minutes"],
-                )
-                for loc_data in top_locs_data
-            ],
-            reading_by_hour=reading_by_hour,
-        )
+            }
+            total_pages = int(sessions["pages_read"].sum())
+            by_hour = sessions.groupby("hour")["minutes_read"].sum().items()
+        else:
+            hour = cast(func.substr(LocationSession.session_date, 12, 2), Integer)
+            with self.db.get_session() as session:
+                locations = session.execute(
+                    select(
+                        ReadingLocation.id,
+                        ReadingLocation.name,
+                        ReadingLocation.location_type,
+                        ReadingLocation.icon,
+                        ReadingLocation.is_favorite,
+                    )
+                ).all()
+                usage = {
+                    row.location_id: (row.sessions, row.minutes)
+                    for row in session.execute(
+                        select(
+                            LocationSession.location_id,
+                            func.count().label("sessions"),
+                            func.coalesce(
+                                func.sum(LocationSession.minutes_read), 0
+                            ).label("minutes"),
+                        ).group_by(LocationSession.location_id)
+                    )
+                }
+                total_pages = session.execute(
+                    select(func.sum(LocationSession.pages_read))
+                ).scalar() or 0
+                by_hour = session.execute(
+                    select(hour, func.sum(LocationSession.minutes_read)).group_by(hour)
+                ).all()
+
+        return _location_stats(locations, usage, total_pages, by_hour)
 
     def get_location_breakdown(self, location_id: str) -> Optional[LocationBreakdown]:
         """Get detailed breakdown for a location.
@@ -10,9 +10,12 @@ from typing import Optional
 
 from sqlalchemy import select, func
 
+from ..db.cache import cached
 from ..db.models import Book, ReadingLog
+from ..db.rollups import books_logged, daily_activity
 from ..db.schemas import BookStatus
 from ..db.sqlite import Database, get_db
+from ..streaks.engine import StreakEngine
 
 
 @dataclass
@@ -165,6 +168,7 @@ class ProgressTracker:
 
             return history
 
+    @cached("books", "reading_logs")
     def get_stats(
         self,
         start_date: Optional[date] = None,
@@ -185,24 +189,21 @@ class ProgressTracker:
             end_date = date.today()
 
         with self.db.get_session() as session:
-            # Get logs in date range
-            stmt = select(ReadingLog).where(
-                ReadingLog.date >= start_date.isoformat(),
-                ReadingLog.date <= end_date.isoformat(),
-            )
-            logs = list(session.execute(stmt).scalars().all())
+            start, end = start_date.isoformat(), end_date.isoformat()
+
+            # Reading per day in the range
+            days = list(daily_activity(session, start, end).values())
 
-            if not logs:
+            if not days:
                 return ReadingStats()
 
             # Calculate totals
-            total_pages = sum(log.pages_read or 0 for log in logs)
-            total_minutes = sum(log.duration_minutes or 0 for log in logs)
-            total_sessions = len(logs)
+            total_pages = sum(day.pages for day in days)
+            total_minutes = sum(day.minutes for day in days)
+            total_sessions = sum(day.sessions for day in days)
 
             # Count unique books read
-            book_ids = set(log.book_id for log in logs)
-            total_books = len(book_ids)
+            total_books = books_logged(session, start, end)
 
             # Count books finished in period
             stmt = select(Book).where(
@@ -224,13 +225,16 @@ class ProgressTracker:
             avg_reading_speed = (total_pages / total_minutes * 60) if total_minutes > 0 else 0
 
             # Pages by location
-            pages_by_location = {}
-            for log in logs:
-                loc = log.location or "Unknown"
-                pages_by_location[loc] = pages_by_location.get(loc, 0) + (log.pages_read or 0)
+            location = func.coalesce(func.nullif(ReadingLog.location, ""), "Unknown")
+            stmt = (
+                select(location, func.coalesce(func.sum(ReadingLog.pages_read), 0))
+                .where(ReadingLog.date >= start, ReadingLog.date <= end)
+                .group_by(location)
+            )
+            pages_by_location = dict(session.execute(stmt).all())
 
             # Calculate streaks
-            current_streak, longest_streak = self._calculate_streaks(logs, end_date)
+            current_streak, longest_streak = self._calculate_streaks(days, end_date)
 
             return ReadingStats(
                 total_pages=total_pages,
@@ -247,55 +251,20 @@ class ProgressTracker:
                 pages_by_location=pages_by_location,
             )
 
-    def _calculate_streaks(self, logs: list[ReadingLog], end_date: date) -> tuple[int, int]:
+    def _calculate_streaks(self, logs: list, end_date: date) -> tuple[int, int]:
         """Calculate reading streaks from logs.
 
         Args:
-            logs: List of reading logs
+            logs: Reading logs or DayActivity rollups (anything with an ISO ``date``)
             end_date: End date of period
 
         Returns:
             Tuple of (current_streak, longest_streak)
         """
-        if not logs:
-            return 0, 0
-
-        # Get unique dates with reading activity
-        reading_dates = sorted(set(
-            date.fromisoformat(log.date) for log in logs
-        ), reverse=True)
-
-        if not reading_dates:
-            return 0, 0
-
-        # Calculate current streak (consecutive days ending today or yesterday)
-        current_streak = 0
-        check_date = end_date
-
-        # Allow for yesterday if not read today
-        if reading_dates[0] == check_date - timedelta(days=1):
-            check_date = check_date - timedelta(days=1)
-
-        for reading_date in reading_dates:
-            if reading_date == check_date:
-                current_streak += 1
-                check_date -= timedelta(days=1)
-            elif reading_date < check_date:
-                break
-
-        # Calculate longest streak
-        longest_streak = 1
-        current_run = 1
-        sorted_dates = sorted(reading_dates)
-
-        for i in range(1, len(sorted_dates)):
-            if sorted_dates[i] - sorted_dates[i - 1] == timedelta(days=1):
-                current_run += 1
-                longest_streak = max(longest_streak, current_run)
-            else:
-                current_run = 1
-
-        return current_streak, longest_streak
+        engine = StreakEngine(log.date for log in logs)
+        current = engine.current(end_date)
+        longest = engine.longest()
+        return (current.length if current else 0, longest.length if longest else 0)
 
     def get_currently_reading(self) -> list[dict]:
         """Get books currently being read with progress.
@@ -4,14 +4,18 @@ import calendar
 import json
 from collections import Counter, defaultdict
 from datetime import date, datetime, timedelta
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from sqlalchemy import func, extract
+from sqlalchemy import extract
 
 from ..db.sqlite import Database
-from ..db.models import Book, ReadingLog
+from ..db.cache import cached
+from ..db.aggregates import BookTotals, SelectedBooks
+from ..db.models import Book
+from ..db.rollups import DayActivity, daily_activity
 from ..db.schemas import BookStatus
+from ..streaks.engine import StreakEngine
 from .schemas import (
     TimeFrame,
     HeatmapDay,
@@ -36,17 +40,48 @@ from .schemas import (
     ReportExport,
 )
 
+if TYPE_CHECKING:
+    from ..stats.snapshot import LibrarySnapshot
+
 
 class ReportManager:
     """Manager for generating reports and visualization data."""
 
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, snapshot: Optional["LibrarySnapshot"] = None):
         """Initialize the report manager.
 
         Args:
             db: Database instance
+            snapshot: Compute reports from this in-memory snapshot
+                rather than querying the database for each figure
         """
         self.db = db
+        self.snapshot = snapshot
+
+    def _completed(
+        self, session, start: Optional[str] = None, end: Optional[str] = None
+    ):
+        """Completed books, optionally finished between two ISO dates.
+
+        Returns:
+            SnapshotBooks when reporting from a snapshot, else SelectedBooks
+        """
+        if self.snapshot is not None:
+            return self.snapshot.completed(start, end)
+        conditions = [Book.status == BookStatus.COMPLETED.value]
+        if start:
+            conditions.append(Book.date_finished >= start)
+        if end:
+            conditions.append(Book.date_finished <= end)
+        return SelectedBooks(session, *conditions)
+
+    def _activity(
+        self, session, start: Optional[str] = None, end: Optional[str] = None
+    ) -> dict[str, DayActivity]:
+        """Reading per day with logs, from the snapshot or the rollup."""
+        if self.snapshot is not None:
+            return self.snapshot.daily_activity(start, end)
+        return daily_activity(session, start, end)
 
     # ========================================================================
     # Heatmap Generation
@@ -62,33 +97,14 @@ class ReportManager:
             Year heatmap data
         """
         with self.db.get_session() as session:
-            # Get all reading logs for the year
+            # Reading per day for the year
             start_date = f"{year}-01-01"
             end_date = f"{year}-12-31"
 
-            logs = session.query(ReadingLog).filter(
-                ReadingLog.date >= start_date,
-                ReadingLog.date <= end_date,
-            ).all()
-
-            # Get completed books for the year
-            completed = session.query(Book).filter(
-                Book.status == BookStatus.COMPLETED.value,
-                Book.date_finished >= start_date,
-                Book.date_finished <= end_date,
-            ).all()
-
-            # Aggregate by date
-            daily_data = defaultdict(lambda: {"pages": 0, "minutes": 0})
-            for log in logs:
-                daily_data[log.date]["pages"] += log.pages_read or 0
-                daily_data[log.date]["minutes"] += log.duration_minutes or 0
+            daily_data = self._daily_data(session, start_date, end_date)
 
             # Count books finished per date
-            books_by_date = Counter()
-            for book in completed:
-                if book.date_finished:
-                    books_by_date[book.date_finished] += 1
+            books_by_date = self._books_by_date(session, start_date, end_date)
 
             # Build months
             months = []
@@ -114,7 +130,7 @@ class ReportManager:
                 total_reading_days=total_reading_days,
                 total_pages=total_pages,
                 total_minutes=total_minutes,
-                books_completed=len(completed),
+                books_completed=sum(books_by_date.values()),
                 longest_streak=longest_streak,
                 current_streak=current_streak,
             )
@@ -134,28 +150,25 @@ class ReportManager:
             _, last_day = calendar.monthrange(year, month)
             end_date = f"{year}-{month:02d}-{last_day:02d}"
 
-            logs = session.query(ReadingLog).filter(
-                ReadingLog.date >= start_date,
-                ReadingLog.date <= end_date,
-            ).all()
+            daily_data = self._daily_data(session, start_date, end_date)
 
-            completed = session.query(Book).filter(
-                Book.status == BookStatus.COMPLETED.value,
-                Book.date_finished >= start_date,
-                Book.date_finished <= end_date,
-            ).all()
+            books_by_date = self._books_by_date(session, start_date, end_date)
 
-            daily_data = defaultdict(lambda: {"pages": 0, "minutes": 0})
-            for log in logs:
-                daily_data[log.date]["pages"] += log.pages_read or 0
-                daily_data[log.date]["minutes"] += log.duration_minutes or 0
+            return self._build_month_heatmap(year, month, daily_data, books_by_date)
 
-            books_by_date = Counter()
-            for book in completed:
-                if book.date_finished:
-                    books_by_date[book.date_finished] += 1
+    def _daily_data(self, session, start_date: str, end_date: Optional[str] = None) -> dict:
+        """Pages and minutes per reading day."""
+        return {
+            day: {"pages": activity.pages, "minutes": activity.minutes}
+            for day, activity in self._activity(session, start_date, end_date).items()
+        }
 
-            return self._build_month_heatmap(year, month, daily_data, books_by_date)
+    def _books_by_date(self, session, start_date: str, end_date: str) -> Counter:
+        """Books completed per finish date."""
+        return Counter({
+            group.key: group.books
+            for group in self._completed(session, start_date, end_date).by_finish_date()
+        })
 
     def _build_month_heatmap(
         self,
@@ -243,33 +256,10 @@ class ReportManager:
 
     def _calculate_streaks(self, daily_data: dict, year: int) -> tuple[int, int]:
         """Calculate longest and current streak for a year."""
-        dates = sorted([
-            date.fromisoformat(d) for d in daily_data.keys()
-            if d.startswith(str(year))
-        ])
-
-        if not dates:
-            return 0, 0
-
-        longest = 1
-        current = 1
-        streak = 1
-
-        for i in range(1, len(dates)):
-            if (dates[i] - dates[i-1]).days == 1:
-                streak += 1
-                longest = max(longest, streak)
-            else:
-                streak = 1
-
-        # Check if current streak extends to today
-        today = date.today()
-        if dates and (today - dates[-1]).days <= 1:
-            current = streak
-        else:
-            current = 0
-
-        return longest, current
+        engine = StreakEngine(d for d in daily_data if d.startswith(str(year)))
+        longest = engine.longest()
+        current = engine.current()
+        return (longest.length if longest else 0, current.length if current else 0)
 
     # ========================================================================
     # Chart Data Generation
@@ -285,33 +275,22 @@ class ReportManager:
             Pie chart data for genres
         """
         with self.db.get_session() as session:
-            query = session.query(Book).filter(
-                Book.status == BookStatus.COMPLETED.value,
-                Book.genres.isnot(None),
-            )
-
             if year:
-                query = query.filter(
-                    Book.date_finished >= f"{year}-01-01",
-                    Book.date_finished <= f"{year}-12-31",
-                )
-
-            books = query.all()
+                books = self._completed(session, f"{year}-01-01", f"{year}-12-31")
+            else:
+                books = self._completed(session)
 
-            genre_counts = Counter()
-            for book in books:
-                for genre in book.get_genres():
-                    genre_counts[genre] += 1
+            genres = books.by_genre()
 
-            total = sum(genre_counts.values())
+            total = sum(group.books for group in genres)
             colors = ["#FF6384", "#36A2EB", "#FFCE56", "#4BC0C0", "#9966FF",
                       "#FF9F40", "#FF6384", "#C9CBCF"]
 
             data = []
-            for i, (genre, count) in enumerate(genre_counts.most_common(8)):
+            for i, group in enumerate(genres[:8]):
                 data.append(ChartDataPoint(
-                    label=genre,
-                    value=count,
+                    label=group.key,
+                    value=group.books,
                     color=colors[i % len(colors)],
                 ))
 
@@ -331,26 +310,18 @@ class ReportManager:
             Bar chart data for ratings
         """
         with self.db.get_session() as session:
-            query = session.query(Book).filter(
-                Book.status == BookStatus.COMPLETED.value,
-                Book.rating.isnot(None),
-            )
-
             if year:
-                query = query.filter(
-                    Book.date_finished >= f"{year}-01-01",
-                    Book.date_finished <= f"{year}-12-31",
-                )
-
-            books = query.all()
+                books = self._completed(session, f"{year}-01-01", f"{year}-12-31")
+            else:
+                books = self._completed(session)
 
-            rating_counts = Counter(book.rating for book in books)
+            counts = books.rating_counts()
 
             data = []
             for rating in range(1, 6):
                 data.append(ChartDataPoint(
                     label=f"{rating} star{'s' if rating > 1 else ''}",
-                    value=rating_counts.get(rating, 0),
+                    value=counts.get(rating, 0),
                 ))
 
             return BarChartData(
@@ -370,17 +341,12 @@ class ReportManager:
             Line chart data for monthly progress
         """
         with self.db.get_session() as session:
-            books = session.query(Book).filter(
-                Book.status == BookStatus.COMPLETED.value,
-                Book.date_finished >= f"{year}-01-01",
-                Book.date_finished <= f"{year}-12-31",
-            ).all()
-
-            monthly = defaultdict(int)
-            for book in books:
-                if book.date_finished:
-                    month = date.fromisoformat(book.date_finished).month
-                    monthly[month] += 1
+            monthly = {
+                group.key: group.books
+                for group in self._completed(
+                    session, f"{year}-01-01", f"{year}-12-31"
+                ).by_month()
+            }
 
             series = []
             for month in range(1, 13):
@@ -406,17 +372,12 @@ class ReportManager:
             Line chart data for cumulative pages
         """
         with self.db.get_session() as session:
-            logs = session.query(ReadingLog).filter(
-                ReadingLog.date >= f"{year}-01-01",
-                ReadingLog.date <= f"{year}-12-31",
-            ).order_by(ReadingLog.date).all()
+            days = self._activity(session, f"{year}-01-01", f"{year}-12-31")
 
             # Aggregate by month
             monthly_pages = defaultdict(int)
-            for log in logs:
-                if log.date:
-                    month = date.fromisoformat(log.date).month
-                    monthly_pages[month] += log.pages_read or 0
+            for day in days.values():
+                monthly_pages[int(day.date[5:7])] += day.pages
 
             # Create cumulative series
             cumulative = 0
@@ -449,31 +410,21 @@ class ReportManager:
             Complete yearly recap data
         """
         with self.db.get_session() as session:
-            # Get completed books
-            completed = session.query(Book).filter(
-                Book.status == BookStatus.COMPLETED.value,
-                Book.date_finished >= f"{year}-01-01",
-                Book.date_finished <= f"{year}-12-31",
-            ).all()
-
-            # Get reading logs
-            logs = session.query(ReadingLog).filter(
-                ReadingLog.date >= f"{year}-01-01",
-                ReadingLog.date <= f"{year}-12-31",
-            ).all()
+            # Completed books
+            completed = self._completed(session, f"{year}-01-01", f"{year}-12-31")
+            totals = completed.totals()
+
+            # Reading per day
+            daily_data = self._daily_data(session, f"{year}-01-01", f"{year}-12-31")
 
             # Basic stats
-            books_completed = len(completed)
-            total_pages = sum(book.page_count or 0 for book in completed)
-            total_minutes = sum(log.duration_minutes or 0 for log in logs)
-            reading_days = len(set(log.date for log in logs))
+            books_completed = totals.books
+            total_pages = totals.pages
+            total_minutes = sum(day["minutes"] for day in daily_data.values())
+            reading_days = len(daily_data)
 
             # Averages
-            rated_books = [b for b in completed if b.rating]
-            average_rating = (
-                sum(b.rating for b in rated_books) / len(rated_books)
-                if rated_books else None
-            )
+            average_rating = totals.avg_rating
             average_pages = total_pages / books_completed if books_completed else 0
             average_per_month = books_completed / 12
             pages_per_day = total_pages / 365
@@ -498,29 +449,23 @@ class ReportManager:
             rating_dist = self._get_rating_distribution(completed)
 
             # Streaks
-            daily_data = defaultdict(lambda: {"pages": 0, "minutes": 0})
-            for log in logs:
-                daily_data[log.date]["pages"] += log.pages_read or 0
             longest_streak, current_streak = self._calculate_streaks(daily_data, year)
 
             # Previous year comparison
             prev_year = year - 1
-            prev_completed = session.query(Book).filter(
-                Book.status == BookStatus.COMPLETED.value,
-                Book.date_finished >= f"{prev_year}-01-01",
-                Book.date_finished <= f"{prev_year}-12-31",
-            ).all()
+            prev_totals = self._completed(
+                session, f"{prev_year}-01-01", f"{prev_year}-12-31"
+            ).totals()
 
             books_vs_last = None
             pages_vs_last = None
-            if prev_completed:
-                books_vs_last = books_completed - len(prev_completed)
-                prev_pages = sum(b.page_count or 0 for b in prev_completed)
-                pages_vs_last = total_pages - prev_pages
+            if prev_totals.books:
+                books_vs_last = books_completed - prev_totals.books
+                pages_vs_last = total_pages - prev_totals.pages
 
             # Fun facts
             fun_facts = self._generate_fun_facts(
-                completed, books_completed, total_pages, reading_days,
+                books_completed, total_pages, reading_days,
                 longest_streak, top_genres, top_authors
             )
 
@@ -551,15 +496,9 @@ class ReportManager:
                 fun_facts=fun_facts,
             )
 
-    def _get_highest_rated_books(
-        self, books: list[Book], limit: int
-    ) -> list[BookHighlight]:
+    def _get_highest_rated_books(self, books, limit: int) -> list[BookHighlight]:
         """Get highest rated books."""
-        rated = sorted(
-            [b for b in books if b.rating],
-            key=lambda x: (x.rating, x.page_count or 0),
-            reverse=True,
-        )[:limit]
+        rated = books.top_rated(limit)
 
         return [
             BookHighlight(
@@ -574,47 +513,19 @@ class ReportManager:
             for b in rated
         ]
 
-    def _get_extreme_book(
-        self, books: list[Book], extreme: str
-    ) -> Optional[BookHighlight]:
+    def _get_extreme_book(self, books, extreme: str) -> Optional[BookHighlight]:
         """Get extreme book (longest, shortest, first, last)."""
-        if not books:
-            return None
-
-        if extreme == "longest":
-            book = max(
-                [b for b in books if b.page_count],
-                key=lambda x: x.page_count,
-                default=None,
-            )
-            reason = f"Longest at {book.page_count} pages" if book else ""
-        elif extreme == "shortest":
-            book = min(
-                [b for b in books if b.page_count],
-                key=lambda x: x.page_count,
-                default=None,
-            )
-            reason = f"Shortest at {book.page_count} pages" if book else ""
-        elif extreme == "first":
-            book = min(
-                [b for b in books if b.date_finished],
-                key=lambda x: x.date_finished,
-                default=None,
-            )
-            reason = "First book of the year"
-        elif extreme == "last":
-            book = max(
-                [b for b in books if b.date_finished],
-                key=lambda x: x.date_finished,
-                default=None,
-            )
-            reason = "Last book of the year"
-        else:
-            return None
-
+        book = books.extreme(extreme)
         if not book:
             return None
 
+        reasons = {
+            "longest": f"Longest at {book.page_count} pages",
+            "shortest": f"Shortest at {book.page_count} pages",
+            "first": "First book of the year",
+            "last": "Last book of the year",
+        }
+
         return BookHighlight(
             book_id=UUID(book.id),
             title=book.title,
@@ -622,108 +533,61 @@ class ReportManager:
             rating=book.rating,
             date_finished=date.fromisoformat(book.date_finished) if book.date_finished else None,
             pages=book.page_count,
-            highlight_reason=reason,
+            highlight_reason=reasons[extreme],
         )
 
-    def _get_monthly_breakdown(
-        self, books: list[Book], year: int
-    ) -> list[MonthlyProgress]:
+    def _get_monthly_breakdown(self, books, year: int) -> list[MonthlyProgress]:
         """Get monthly reading breakdown."""
-        monthly = defaultdict(lambda: {"count": 0, "pages": 0, "ratings": []})
-
-        for book in books:
-            if book.date_finished:
-                month = date.fromisoformat(book.date_finished).month
-                monthly[month]["count"] += 1
-                monthly[month]["pages"] += book.page_count or 0
-                if book.rating:
-                    monthly[month]["ratings"].append(book.rating)
+        monthly = {group.key: group for group in books.by_month()}
 
         result = []
         for month in range(1, 13):
-            data = monthly[month]
-            avg_rating = None
-            if data["ratings"]:
-                avg_rating = sum(data["ratings"]) / len(data["ratings"])
-
+            data = monthly.get(month, BookTotals())
             result.append(MonthlyProgress(
                 month=f"{year}-{month:02d}",
                 month_name=f"{calendar.month_name[month]} {year}",
-                books_completed=data["count"],
-                pages_read=data["pages"],
-                average_rating=avg_rating,
+                books_completed=data.books,
+                pages_read=data.pages,
+                average_rating=data.avg_rating,
             ))
 
         return result
 
-    def _get_genre_breakdown(self, books: list[Book]) -> list[GenreBreakdown]:
-        """Get genre breakdown from books."""
-        genre_data = defaultdict(lambda: {"count": 0, "pages": 0, "ratings": []})
-
-        for book in books:
-            if book.genres:
-                for genre in book.get_genres():
-                    genre_data[genre]["count"] += 1
-                    genre_data[genre]["pages"] += book.page_count or 0
-                    if book.rating:
-                        genre_data[genre]["ratings"].append(book.rating)
+    def _get_genre_breakdown(self, books) -> list[GenreBreakdown]:
+        """Get genre breakdown of the books."""
+        genres = books.by_genre()
 
-        total = sum(d["count"] for d in genre_data.values())
-
-        result = []
-        for genre, data in sorted(
-            genre_data.items(),
-            key=lambda x: x[1]["count"],
-            reverse=True,
-        )[:10]:
-            avg_rating = None
-            if data["ratings"]:
-                avg_rating = sum(data["ratings"]) / len(data["ratings"])
-
-            result.append(GenreBreakdown(
-                genre=genre,
-                count=data["count"],
-                percentage=data["count"] / total * 100 if total else 0,
-                average_rating=avg_rating,
-                pages_read=data["pages"],
-            ))
+        total = sum(group.books for group in genres)
 
-        return result
+        return [
+            GenreBreakdown(
+                genre=group.key,
+                count=group.books,
+                percentage=group.books / total * 100 if total else 0,
+                average_rating=group.avg_rating,
+                pages_read=group.pages,
+            )
+            for group in genres[:10]
+        ]
 
-    def _get_author_stats(self, books: list[Book]) -> list[AuthorStats]:
+    def _get_author_stats(self, books) -> list[AuthorStats]:
         """Get author statistics."""
-        author_data = defaultdict(lambda: {"count": 0, "pages": 0, "ratings": []})
-
-        for book in books:
-            if book.author:
-                author_data[book.author]["count"] += 1
-                author_data[book.author]["pages"] += book.page_count or 0
-                if book.rating:
-                    author_data[book.author]["ratings"].append(book.rating)
-
-        result = []
-        for author, data in sorted(
-            author_data.items(),
-            key=lambda x: x[1]["count"],
-            reverse=True,
-        )[:10]:
-            avg_rating = None
-            if data["ratings"]:
-                avg_rating = sum(data["ratings"]) / len(data["ratings"])
-
-            result.append(AuthorStats(
-                author=author,
-                books_read=data["count"],
-                total_pages=data["pages"],
-                average_rating=avg_rating,
-                favorite=avg_rating is not None and avg_rating >= 4,
-            ))
+        authors = books.by_author(limit=10)
 
-        return result
+        return [
+            AuthorStats(
+                author=group.key,
+                books_read=group.books,
+                total_pages=group.pages,
+                average_rating=group.avg_rating,
+                favorite=group.avg_rating is not None and group.avg_rating >= 4,
+            )
+            for group in authors
+        ]
 
-    def _get_rating_distribution(self, books: list[Book]) -> RatingDistribution:
+    def _get_rating_distribution(self, books) -> RatingDistribution:
         """Get rating distribution."""
-        ratings = Counter(book.rating for book in books if book.rating)
+        ratings = books.rating_counts()
 
         total = sum(ratings.values())
         average = 0.0
@@ -732,10 +596,10 @@ class ReportManager:
 
         mode = None
         if ratings:
-            mode = ratings.most_common(1)[0][0]
+            mode = max(ratings, key=ratings.get)
 
         return RatingDistribution(
-            ratings=dict(ratings),
+            ratings=ratings,
             average=average,
             total_rated=total,
             mode=mode,
@@ -743,7 +607,6 @@ class ReportManager:
 
     def _generate_fun_facts(
         self,
-        books: list[Book],
         total_books: int,
         total_pages: int,
         reading_days: int,
@@ -785,6 +648,7 @@ class ReportManager:
     # Dashboard Data
     # ========================================================================
 
+    @cached("books", "reading_logs")
     def get_dashboard(self, year: Optional[int] = None) -> DashboardData:
         """Generate dashboard data.
 
@@ -799,35 +663,25 @@ class ReportManager:
 
         with self.db.get_session() as session:
             # Currently reading
-            currently_reading = session.query(Book).filter(
-                Book.status == BookStatus.READING.value,
-            ).count()
-
-            # Books this year
-            books_this_year = session.query(Book).filter(
-                Book.status == BookStatus.COMPLETED.value,
-                Book.date_finished >= f"{year}-01-01",
-            ).count()
-
-            # Pages this year
-            completed = session.query(Book).filter(
-                Book.status == BookStatus.COMPLETED.value,
-                Book.date_finished >= f"{year}-01-01",
-            ).all()
-            pages_this_year = sum(b.page_count or 0 for b in completed)
+            if self.snapshot is not None:
+                currently_reading = self.snapshot.count_status(BookStatus.READING)
+            else:
+                currently_reading = session.query(Book).filter(
+                    Book.status == BookStatus.READING.value,
+                ).count()
+
+            # Books and pages this year
+            completed = self._completed(session, f"{year}-01-01")
+            totals = completed.totals()
+            books_this_year = totals.books
+            pages_this_year = totals.pages
 
             # Current streak
-            logs = session.query(ReadingLog).filter(
-                ReadingLog.date >= f"{year}-01-01",
-            ).all()
-            daily_data = defaultdict(lambda: {"pages": 0})
-            for log in logs:
-                daily_data[log.date]["pages"] += log.pages_read or 0
+            daily_data = self._daily_data(session, f"{year}-01-01")
             _, current_streak = self._calculate_streaks(daily_data, year)
 
             # Average rating
-            rated = [b for b in completed if b.rating]
-            avg_rating = sum(b.rating for b in rated) / len(rated) if rated else None
+            avg_rating = totals.avg_rating
 
             # Books per month
             today = date.today()
@@ -835,28 +689,21 @@ class ReportManager:
             books_per_month = books_this_year / months_elapsed if months_elapsed else 0
 
             # Favorite genre and author
-            genre_counts = Counter()
-            author_ratings = defaultdict(list)
-            for book in completed:
-                if book.genres:
-                    for g in book.get_genres():
-                        genre_counts[g] += 1
-                if book.author and book.rating:
-                    author_ratings[book.author].append(book.rating)
-
-            fav_genre = genre_counts.most_common(1)[0][0] if genre_counts else None
+            genres = completed.by_genre(limit=1)
+            fav_genre = genres[0].key if genres else None
+
+            rated_authors = completed.by_author(rated_only=True)
             fav_author = None
-            if author_ratings:
-                fav_author = max(
-                    author_ratings.keys(),
-                    key=lambda a: sum(author_ratings[a]) / len(author_ratings[a])
-                    if author_ratings[a] else 0
-                )
+            if rated_authors:
+                fav_author = max(rated_authors, key=lambda group: group.avg_rating).key
 
             # Recent activity (last 10)
-            recent = session.query(Book).filter(
-                Book.date_finished.isnot(None),
-            ).order_by(Book.date_finished.desc()).limit(10).all()
+            if self.snapshot is not None:
+                recent = self.snapshot.recently_finished(10)
+            else:
+                recent = session.query(Book).filter(
+                    Book.date_finished.isnot(None),
+                ).order_by(Book.date_finished.desc()).limit(10).all()
 
             recent_activity = [
                 RecentActivity(
@@ -0,0 +1,231 @@
+"""SQLite FTS5 full-text indexes for search.
+
+Each searchable table gets an external-content FTS5 table keyed on the
+source table's rowid. Triggers keep the index in sync with every write,
+whether it comes through the ORM, a bulk insert or raw SQL, so the search
+layer never has to fall back to ``LIKE '%term%'`` table scans.
+
+Indexes:
+- books_fts: title, author, description, genres, isbn, isbn13
+- notes_fts: title, content, tags
+- quotes_fts: text, speaker, context, tags
+- reviews_fts: title, content, tags
+"""
+
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional, Union
+
+from sqlalchemy import column, func, literal_column, table, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+
+@dataclass(frozen=True)
+class FTSIndex:
+    """Definition of an FTS5 index over a content table."""
+
+    name: str
+    content_table: str
+    columns: tuple[str, ...]
+    weights: tuple[float, ...]  # BM25 column weights, same order as columns
+
+    @property
+    def table(self):
+        """Lightweight table clause for joining against the index."""
+        return table(self.name, column("rowid"))
+
+    def rowid_join(self):
+        """ON clause joining the index to its content table."""
+        return self.table.c.rowid == literal_column(f"{self.content_table}.rowid")
+
+    def match(self, expression: str):
+        """WHERE clause for an FTS5 MATCH expression."""
+        return literal_column(self.name).op("MATCH")(expression)
+
+    def rank(self):
+        """BM25 rank expression (lower is better)."""
+        return func.bm25(literal_column(self.name), *self.weights)
+
+
+BOOKS_FTS = FTSIndex(
+    name="books_fts",
+    content_table="books",
+    columns=("title", "author", "description", "genres", "isbn", "isbn13"),
+    weights=(10.0, 6.0, 1.0, 3.0, 4.0, 4.0),
+)
+NOTES_FTS = FTSIndex(
+    name="notes_fts",
+    content_table="notes",
+    columns=("title", "content", "tags"),
+    weights=(5.0, 1.0, 3.0),
+)
+QUOTES_FTS = FTSIndex(
+    name="quotes_fts",
+    content_table="quotes",
+    columns=("text", "speaker", "context", "tags"),
+    weights=(5.0, 3.0, 1.0, 2.0),
+)
+REVIEWS_FTS = FTSIndex(
+    name="reviews_fts",
+    content_table="reviews",
+    columns=("title", "content", "tags"),
+    weights=(5.0, 1.0, 2.0),
+)
+
+FTS_INDEXES = (BOOKS_FTS, NOTES_FTS, QUOTES_FTS, REVIEWS_FTS)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """Convert free text into an FTS5 MATCH expression.
+
+    Every word becomes a quoted prefix term, and terms are ANDed together,
+    so "gats fitz" matches "The Great Gatsby" by F. Scott Fitzgerald.
+    Quoting keeps user input from being parsed as FTS5 query syntax.
+
+    Args:
+        query: Raw user query
+
+    Returns:
+        MATCH expression, or None if the query has no indexable words
+    """
+    tokens = _TOKEN_RE.findall(query.lower())
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def bm25_to_relevance(rank: Optional[float]) -> float:
+    """Map a BM25 rank (negative, lower is better) onto 0..1."""
+    if rank is None:
+        return 0.0
+    score = max(-rank, 0.0)
+    return score / (1.0 + score)
+
+
+def _trigger_sql(index: FTSIndex) -> list[str]:
+    """Build the insert/delete/update triggers for an index."""
+    cols = ", ".join(index.columns)
+    new_vals = ", ".join(f"new.{c}" for c in index.columns)
+    old_vals = ", ".join(f"old.{c}" for c in index.columns)
+    name, src = index.name, index.content_table
+
+    return [
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {name}_ai AFTER INSERT ON {src} BEGIN
+            INSERT INTO {name}(rowid, {cols}) VALUES (new.rowid, {new_vals});
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {name}_ad AFTER DELETE ON {src} BEGIN
+            INSERT INTO {name}({name}, rowid, {cols})
+            VALUES ('delete', old.rowid, {old_vals});
+        END
+        """,
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {name}_au AFTER UPDATE OF {cols} ON {src} BEGIN
+            INSERT INTO {name}({name}, rowid, {cols})
+            VALUES ('delete', old.rowid, {old_vals});
+            INSERT INTO {name}(rowid, {cols}) VALUES (new.rowid, {new_vals});
+        END
+        """,
+    ]
+
+
+def _index_exists(conn: Connection, index: FTSIndex) -> bool:
+    """Check whether an FTS table has been created."""
+    row = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": index.name},
+    ).first()
+    return row is not None
+
+
+def install_fts_indexes(engine: Engine) -> bool:
+    """Create FTS5 tables and sync triggers if they don't exist.
+
+    Indexes created for an existing database are populated from their
+    content tables straight away.
+
+    Args:
+        engine: SQLAlchemy engine for the database
+
+    Returns:
+        True if FTS5 is available and the indexes are installed
+    """
+    try:
+        with engine.begin() as conn:
+            for index in FTS_INDEXES:
+                is_new = not _index_exists(conn, index)
+                conn.execute(
+                    text(
+                        f"CREATE VIRTUAL TABLE IF NOT EXISTS {index.name} USING fts5("
+                        f"{', '.join(index.columns)}, "
+                        f"content='{index.content_table}', content_rowid='rowid', "
+                        f"tokenize='unicode61 remove_diacritics 2')"
+                    )
+                )
+                for statement in _trigger_sql(index):
+                    conn.execute(text(statement))
+                if is_new:
+                    conn.execute(
+                        text(f"INSERT INTO {index.name}({index.name}) VALUES ('rebuild')")
+                    )
+    except OperationalError:
+        # SQLite was built without FTS5; search falls back to LIKE scans
+        return False
+    return True
+
+
+def drop_fts_indexes(engine: Engine) -> None:
+    """Drop all FTS tables and their sync triggers."""
+    with engine.begin() as conn:
+        for index in FTS_INDEXES:
+            for suffix in ("ai", "ad", "au"):
+                conn.execute(text(f"DROP TRIGGER IF EXISTS {index.name}_{suffix}"))
+            conn.execute(text(f"DROP TABLE IF EXISTS {index.name}"))
+
+
+def rebuild_fts_indexes(engine: Engine) -> None:
+    """Rebuild every FTS index from its content table.
+
+    Needed after operations that can renumber rowids, such as VACUUM.
+    """
+    with engine.begin() as conn:
+        for index in FTS_INDEXES:
+            if _index_exists(conn, index):
+                conn.execute(text(f"INSERT INTO {index.name}({index.name}) VALUES ('rebuild')"))
+
+
+@contextmanager
+def deferred_fts_sync(conn: Union[Connection, Session], content_table: str) -> Iterator[None]:
+    """Rebuild a table's indexes once after a bulk rewrite instead of per row.
+
+    The sync triggers are dropped for the block, then recreated and the
+    indexes rebuilt from the content table. Run it inside a transaction
+    that is rolled back if the block raises: DDL is transactional in
+    SQLite, so the rollback brings the triggers back.
+    """
+    indexes = [
+        index
+        for index in FTS_INDEXES
+        if index.content_table == content_table and _index_exists(conn, index)
+    ]
+    for index in indexes:
+        for suffix in ("ai", "ad", "au"):
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {index.name}_{suffix}"))
+    yield
+    for index in indexes:
+        for statement in _trigger_sql(index):
+            conn.execute(text(statement))
+        conn.execute(text(f"INSERT INTO {index.name}({index.name}) VALUES ('rebuild')"))
+
+
+def fts_available(engine: Engine) -> bool:
+    """Check whether the FTS indexes are installed in this database."""
+    with engine.connect() as conn:
+        return all(_index_exists(conn, index) for index in FTS_INDEXES)
@@ -1,15 +1,31 @@
 """Manager for advanced search operations."""
 
+import base64
+import binascii
+import heapq
+import json
 import re
 import time
 from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional
+from itertools import islice
+from typing import Callable, Optional
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import and_, func, null, or_, select
 
 from ..db.models import Book
 from ..db.sqlite import Database, get_db
+from .fts import (
+    BOOKS_FTS,
+    NOTES_FTS,
+    QUOTES_FTS,
+    REVIEWS_FTS,
+    FTSIndex,
+    bm25_to_relevance,
+    build_match_query,
+    fts_available,
+)
 from .schemas import (
     AdvancedSearchQuery,
     BookSearchResult,
@@ -21,10 +37,20 @@ from .schemas import (
     SearchResult,
     SearchResults,
     SearchScope,
-    SearchSuggestion,
     SearchSuggestions,
     SortBy,
+    SortOrder,
 )
+from .suggest import get_suggestion_index
+
+
+@dataclass
+class _Hit:
+    """A unified search result positioned within its scope's ordering."""
+
+    key: tuple  # Merge key, comparable across scopes
+    cursor: list  # Keyset position within the scope, JSON-serialisable
+    result: SearchResult
 
 
 class SearchManager:
@@ -37,6 +63,7 @@ class SearchManager:
             db: Database instance
         """
         self.db = db or get_db()
+        self._fts_enabled: Optional[bool] = None
 
     # -------------------------------------------------------------------------
     # Unified Search
@@ -45,14 +72,22 @@ class SearchManager:
     def search(self, query: SearchQuery) -> SearchResults:
         """Perform a unified search across all specified scopes.
 
+        Each scope is queried already ordered by the requested sort key and
+        bounded by LIMIT, and the per-scope streams are merged lazily, so
+        only enough rows to fill the page are ever materialised. Pass the
+        returned ``next_cursor`` back as ``query.cursor`` to fetch the next
+        page by keyset instead of by offset.
+
         Args:
             query: Search query parameters
 
         Returns:
-            SearchResults with all matching items
+            SearchResults with the requested page of matching items
+
+        Raises:
+            ValueError: If the cursor is malformed or belongs to another query
         """
         start_time = time.time()
-        results: list[SearchResult] = []
         facets: dict[str, dict[str, int]] = {
             "type": {},
             "status": {},
@@ -61,67 +96,50 @@ class SearchManager:
 
         search_term = query.query.lower()
         scopes = query.scope
+        positions = self._decode_cursor(query) if query.cursor else {}
 
         # Determine which scopes to search
         search_all = SearchScope.ALL in scopes
+        scope_searches = [
+            (SearchScope.BOOKS, ResultType.BOOK, self._search_books),
+            (SearchScope.NOTES, ResultType.NOTE, self._search_notes),
+            (SearchScope.QUOTES, ResultType.QUOTE, self._search_quotes),
+            (SearchScope.REVIEWS, ResultType.REVIEW, self._search_reviews),
+            (SearchScope.COLLECTIONS, ResultType.COLLECTION, self._search_collections),
+            (SearchScope.LISTS, ResultType.LIST, self._search_lists),
+            (SearchScope.TAGS, ResultType.TAG, self._search_tags),
+            (SearchScope.AUTHORS, ResultType.AUTHOR, self._search_authors),
+        ]
+
+        # Every scope needs to supply at most this many rows for the page
+        window_size = query.offset + query.limit + 1
+        streams: list[list[_Hit]] = []
+        total_count = 0
+
+        for scope, result_type, search_scope in scope_searches:
+            if not (search_all or scope in scopes):
+                continue
+            hits, count = search_scope(
+                search_term, query, positions.get(result_type.value), window_size
+            )
+            streams.append(hits)
+            facets["type"][result_type.value] = count
+            total_count += count
 
-        # Search books
-        if search_all or SearchScope.BOOKS in scopes:
-            book_results = self._search_books(search_term, query)
-            results.extend(book_results)
-            facets["type"]["book"] = len(book_results)
-
-        # Search notes
-        if search_all or SearchScope.NOTES in scopes:
-            note_results = self._search_notes(search_term, query)
-            results.extend(note_results)
-            facets["type"]["note"] = len(note_results)
-
-        # Search quotes
-        if search_all or SearchScope.QUOTES in scopes:
-            quote_results = self._search_quotes(search_term, query)
-            results.extend(quote_results)
-            facets["type"]["quote"] = len(quote_results)
-
-        # Search reviews
-        if search_all or SearchScope.REVIEWS in scopes:
-            review_results = self._search_reviews(search_term, query)
-            results.extend(review_results)
-            facets["type"]["review"] = len(review_results)
-
-        # Search collections
-        if search_all or SearchScope.COLLECTIONS in scopes:
-            collection_results = self._search_collections(search_term, query)
-            results.extend(collection_results)
-            facets["type"]["collection"] = len(collection_results)
-
-        # Search lists
-        if search_all or SearchScope.LISTS in scopes:
-            list_results = self._search_lists(search_term, query)
-            results.extend(list_results)
-            facets["type"]["list"] = len(list_results)
-
-        # Search tags
-        if search_all or SearchScope.TAGS in scopes:
-            tag_results = self._search_tags(search_term, query)
-            results.extend(tag_results)
-            facets["type"]["tag"] = len(tag_results)
-
-        # Search authors
-        if search_all or SearchScope.AUTHORS in scopes:
-            author_results = self._search_authors(search_term, query)
-            results.extend(author_results)
-            facets["type"]["author"] = len(author_results)
-
-        # Sort results
-        results = self._sort_results(results, query.sort_by, query.sort_order)
-
-        # Calculate total before pagination
-        total_count = len(results)
+        # k-way merge of the ordered per-scope streams
+        merged = heapq.merge(
+            *streams, key=lambda hit: hit.key, reverse=self._is_descending(query)
+        )
+        window = list(islice(merged, window_size))
+        consumed = window[: query.offset + query.limit]
+        paginated = [hit.result for hit in consumed[query.offset :]]
+        has_more = len(window) > len(consumed)
 
-        # Apply pagination
-        paginated = results[query.offset : query.offset + query.limit]
-        has_more = query.offset + len(paginated) < total_count
+        next_cursor = None
+        if has_more:
+            for hit in consumed:
+                positions[hit.result.result_type.value] = hit.cursor
+            next_cursor = self._encode_cursor(query, positions)
 
         search_time = (time.time() - start_time) * 1000
 
@@ -132,6 +150,7 @@ class SearchManager:
             has_more=has_more,
             facets=facets,
             search_time_ms=search_time,
+            next_cursor=next_cursor,
         )
 
     def advanced_search(self, query: AdvancedSearchQuery) -> SearchResults:
@@ -235,14 +254,15 @@ class SearchManager:
         results = []
 
         with self.db.get_session() as session:
-            stmt = select(Book).where(
-                or_(
-                    func.lower(Book.title).like(f"%{search_term}%"),
-                    func.lower(Book.author).like(f"%{search_term}%"),
-                    func.lower(Book.description).like(f"%{search_term}%"),
-                    func.lower(Book.genres).like(f"%{search_term}%"),
-                    func.lower(Book.isbn).like(f"%{search_term}%"),
-                )
+            stmt, _ = self._match(
+                select(Book),
+                BOOKS_FTS,
+                search_term,
+                Book.title,
+                Book.author,
+                Book.description,
+                Book.genres,
+                Book.isbn,
             )
 
             if status:
@@ -253,15 +273,14 @@ class SearchManager:
                 stmt = stmt.where(Book.rating >= min_rating)
 
             stmt = stmt.limit(limit)
-            books = session.execute(stmt).scalars().all()
 
-            for book in books:
+            for book, rank in session.execute(stmt).all():
                 snippet = self._create_snippet(
                     f"{book.title} by {book.author or 'Unknown'}. {book.description or ''}",
                     search_term,
                 )
-                score = self._calculate_relevance(
-                    search_term, book.title, book.author, book.description
+                score = self._score(
+                    rank, search_term, book.title, book.author, book.description
                 )
 
                 results.append(
@@ -303,12 +322,8 @@ class SearchManager:
         results = []
 
         with self.db.get_session() as session:
-            stmt = select(Note).where(
-                or_(
-                    func.lower(Note.title).like(f"%{search_term}%"),
-                    func.lower(Note.content).like(f"%{search_term}%"),
-                    func.lower(Note.tags).like(f"%{search_term}%"),
-                )
+            stmt, _ = self._match(
+                select(Note), NOTES_FTS, search_term, Note.title, Note.content, Note.tags
             )
 
             if book_id:
@@ -317,9 +332,8 @@ class SearchManager:
                 stmt = stmt.where(Note.note_type == note_type)
 
             stmt = stmt.limit(limit)
-            notes = session.execute(stmt).scalars().all()
 
-            for note in notes:
+            for note, rank in session.execute(stmt).all():
                 book = session.execute(
                     select(Book).where(Book.id == note.book_id)
                 ).scalar_one_or_none()
@@ -327,9 +341,7 @@ class SearchManager:
                 snippet = self._create_snippet(
                     f"{note.title or ''} {note.content}", search_term
                 )
-                score = self._calculate_relevance(
-                    search_term, note.title, note.content
-                )
+                score = self._score(rank, search_term, note.title, note.content)
 
                 results.append(
                     NoteSearchResult(
@@ -369,13 +381,14 @@ class SearchManager:
         results = []
 
         with self.db.get_session() as session:
-            stmt = select(Quote).where(
-                or_(
-                    func.lower(Quote.text).like(f"%{search_term}%"),
-                    func.lower(Quote.speaker).like(f"%{search_term}%"),
-                    func.lower(Quote.context).like(f"%{search_term}%"),
-                    func.lower(Quote.tags).like(f"%{search_term}%"),
-                )
+            stmt, _ = self._match(
+                select(Quote),
+                QUOTES_FTS,
+                search_term,
+                Quote.text,
+                Quote.speaker,
+                Quote.context,
+                Quote.tags,
             )
 
             if book_id:
@@ -386,16 +399,15 @@ class SearchManager:
                 )
 
             stmt = stmt.limit(limit)
-            quotes = session.execute(stmt).scalars().all()
 
-            for quote in quotes:
+            for quote, rank in session.execute(stmt).all():
                 book = session.execute(
                     select(Book).where(Book.id == quote.book_id)
                 ).scalar_one_or_none()
 
                 snippet = self._create_snippet(quote.text, search_term)
-                score = self._calculate_relevance(
-                    search_term, quote.text, quote.speaker, quote.context
+                score = self._score(
+                    rank, search_term, quote.text, quote.speaker, quote.context
                 )
 
                 results.append(
@@ -435,13 +447,13 @@ class SearchManager:
         results = []
 
         with self.db.get_session() as session:
-            stmt = select(Review).where(
-                or_(
-                    func.lower(Review.title).like(f"%{search_term}%"),
-                    func.lower(Review.content).like(f"%{search_term}%"),
-                    func.lower(Review.pros).like(f"%{search_term}%"),
-                    func.lower(Review.cons).like(f"%{search_term}%"),
-                )
+            stmt, _ = self._match(
+                select(Review),
+                REVIEWS_FTS,
+                search_term,
+                Review.title,
+                Review.content,
+                Review.tags,
             )
 
             if book_id:
@@ -450,9 +462,8 @@ class SearchManager:
                 stmt = stmt.where(Review.rating >= min_rating)
 
             stmt = stmt.limit(limit)
-            reviews = session.execute(stmt).scalars().all()
 
-            for review in reviews:
+            for review, rank in session.execute(stmt).all():
                 book = session.execute(
                     select(Book).where(Book.id == review.book_id)
                 ).scalar_one_or_none()
@@ -460,9 +471,7 @@ class SearchManager:
                 snippet = self._create_snippet(
                     f"{review.title or ''} {review.content}", search_term
                 )
-                score = self._calculate_relevance(
-                    search_term, review.title, review.content
-                )
+                score = self._score(rank, search_term, review.title, review.content)
 
                 results.append(
                     ReviewSearchResult(
@@ -484,6 +493,10 @@ class SearchManager:
     def get_suggestions(self, query: str, limit: int = 10) -> SearchSuggestions:
         """Get search suggestions for autocomplete.
 
+        Served from the in-memory prefix index over titles, authors, series
+        and tags, which is built on first use and kept current as books and
+        notes change.
+
         Args:
             query: Partial query string
             limit: Maximum suggestions
@@ -491,73 +504,34 @@ class SearchManager:
         Returns:
             SearchSuggestions
         """
-        search_term = query.lower()
-        suggestions: list[SearchSuggestion] = []
+        index = get_suggestion_index(self.db.engine)
 
         with self.db.get_session() as session:
-            # Book title suggestions
-            books = (
-                session.execute(
-                    select(Book.title)
-                    .where(func.lower(Book.title).like(f"%{search_term}%"))
-                    .distinct()
-                    .limit(limit)
-                )
-                .scalars()
-                .all()
-            )
-            for title in books:
-                suggestions.append(
-                    SearchSuggestion(text=title, result_type=ResultType.BOOK, count=1)
-                )
-
-            # Author suggestions
-            authors = (
-                session.execute(
-                    select(Book.author, func.count(Book.id))
-                    .where(func.lower(Book.author).like(f"%{search_term}%"))
-                    .group_by(Book.author)
-                    .limit(limit)
-                )
-                .all()
-            )
-            for author, count in authors:
-                if author:
-                    suggestions.append(
-                        SearchSuggestion(
-                            text=author, result_type=ResultType.AUTHOR, count=count
-                        )
-                    )
-
-        # Sort by relevance (exact prefix match first)
-        suggestions.sort(
-            key=lambda x: (
-                not x.text.lower().startswith(search_term),
-                -x.count,
-                len(x.text),
-            )
-        )
+            suggestions = index.suggest(session, query, limit)
 
-        return SearchSuggestions(query=query, suggestions=suggestions[:limit])
+        return SearchSuggestions(query=query, suggestions=suggestions)
 
     # -------------------------------------------------------------------------
     # Internal Search Methods
     # -------------------------------------------------------------------------
 
     def _search_books(
-        self, search_term: str, query: SearchQuery
-    ) -> list[SearchResult]:
-        """Search books and return unified results."""
-        results = []
-
+        self,
+        search_term: str,
+        query: SearchQuery,
+        after: Optional[list],
+        limit: int,
+    ) -> tuple[list[_Hit], int]:
+        """Search books and return one ordered page of unified results."""
         with self.db.get_session() as session:
-            stmt = select(Book).where(
-                or_(
-                    func.lower(Book.title).like(f"%{search_term}%"),
-                    func.lower(Book.author).like(f"%{search_term}%"),
-                    func.lower(Book.description).like(f"%{search_term}%"),
-                    func.lower(Book.genres).like(f"%{search_term}%"),
-                )
+            stmt, rank = self._match(
+                select(Book),
+                BOOKS_FTS,
+                search_term,
+                Book.title,
+                Book.author,
+                Book.description,
+                Book.genres,
             )
 
             if query.book_status:
@@ -573,18 +547,15 @@ class SearchManager:
             if query.min_rating:
                 stmt = stmt.where(Book.rating >= query.min_rating)
 
-            books = session.execute(stmt).scalars().all()
-
-            for book in books:
+            def build(book: Book, book_rank: Optional[float]) -> SearchResult:
                 snippet = self._create_snippet(
                     f"{book.title}. {book.description or ''}", search_term
                 )
-                score = self._calculate_relevance(
-                    search_term, book.title, book.author, book.description
+                score = self._score(
+                    book_rank, search_term, book.title, book.author, book.description
                 )
 
-                results.append(
-                    SearchResult(
+                return SearchResult(
                         id=book.id,
                         result_type=ResultType.BOOK,
                         title=book.title,
@@ -602,44 +573,38 @@ class SearchManager:
                             "rating": book.rating,
                         },
                     )
-                )
 
-        return results
+            return self._page_scope(
+                session, stmt, rank, Book, Book.title, query, after, limit, build
+            )
 
     def _search_notes(
-        self, search_term: str, query: SearchQuery
-    ) -> list[SearchResult]:
-        """Search notes and return unified results."""
+        self,
+        search_term: str,
+        query: SearchQuery,
+        after: Optional[list],
+        limit: int,
+    ) -> tuple[list[_Hit], int]:
+        """Search notes and return one ordered page of unified results."""
         from ..notes.models import Note
 
-        results = []
-
         with self.db.get_session() as session:
-            stmt = select(Note).where(
-                or_(
-                    func.lower(Note.title).like(f"%{search_term}%"),
-                    func.lower(Note.content).like(f"%{search_term}%"),
-                    func.lower(Note.tags).like(f"%{search_term}%"),
-                )
+            stmt, rank = self._match(
+                select(Note), NOTES_FTS, search_term, Note.title, Note.content, Note.tags
             )
 
             if query.favorites_only:
                 stmt = stmt.where(Note.is_favorite == True)  # noqa: E712
 
-            notes = session.execute(stmt).scalars().all()
-
-            for note in notes:
+            def build(note: Note, note_rank: Optional[float]) -> SearchResult:
                 book = session.execute(
                     select(Book).where(Book.id == note.book_id)
                 ).scalar_one_or_none()
 
                 snippet = self._create_snippet(note.content, search_term)
-                score = self._calculate_relevance(
-                    search_term, note.title, note.content
-                )
+                score = self._score(note_rank, search_term, note.title, note.content)
 
-                results.append(
-                    SearchResult(
+                return SearchResult(
                         id=note.id,
                         result_type=ResultType.NOTE,
                         title=note.title or "Note",
@@ -653,44 +618,51 @@ class SearchManager:
                         ),
                         metadata={"note_type": note.note_type, "book_id": note.book_id},
                     )
-                )
 
-        return results
+            return self._page_scope(
+                session,
+                stmt,
+                rank,
+                Note,
+                func.coalesce(Note.title, "Note"),
+                query,
+                after,
+                limit,
+                build,
+            )
 
     def _search_quotes(
-        self, search_term: str, query: SearchQuery
-    ) -> list[SearchResult]:
-        """Search quotes and return unified results."""
+        self,
+        search_term: str,
+        query: SearchQuery,
+        after: Optional[list],
+        limit: int,
+    ) -> tuple[list[_Hit], int]:
+        """Search quotes and return one ordered page of unified results."""
         from ..notes.models import Quote
 
-        results = []
-
         with self.db.get_session() as session:
-            stmt = select(Quote).where(
-                or_(
-                    func.lower(Quote.text).like(f"%{search_term}%"),
-                    func.lower(Quote.speaker).like(f"%{search_term}%"),
-                    func.lower(Quote.context).like(f"%{search_term}%"),
-                )
+            stmt, rank = self._match(
+                select(Quote),
+                QUOTES_FTS,
+                search_term,
+                Quote.text,
+                Quote.speaker,
+                Quote.context,
             )
 
             if query.favorites_only:
                 stmt = stmt.where(Quote.is_favorite == True)  # noqa: E712
 
-            quotes = session.execute(stmt).scalars().all()
-
-            for quote in quotes:
+            def build(quote: Quote, quote_rank: Optional[float]) -> SearchResult:
                 book = session.execute(
                     select(Book).where(Book.id == quote.book_id)
                 ).scalar_one_or_none()
 
                 snippet = self._create_snippet(quote.text, search_term)
-                score = self._calculate_relevance(
-                    search_term, quote.text, quote.speaker
-                )
+                score = self._score(quote_rank, search_term, quote.text, quote.speaker)
 
-                results.append(
-                    SearchResult(
+                return SearchResult(
                         id=quote.id,
                         result_type=ResultType.QUOTE,
                         title=f'"{quote.text[:50]}..."' if len(quote.text) > 50 else f'"{quote.text}"',
@@ -704,43 +676,38 @@ class SearchManager:
                         ),
                         metadata={"speaker": quote.speaker, "book_id": quote.book_id},
                     )
-                )
 
-        return results
+            return self._page_scope(
+                session, stmt, rank, Quote, Quote.text, query, after, limit, build
+            )
 
     def _search_reviews(
-        self, search_term: str, query: SearchQuery
-    ) -> list[SearchResult]:
-        """Search reviews and return unified results."""
+        self,
+        search_term: str,
+        query: SearchQuery,
+        after: Optional[list],
+        limit: int,
+    ) -> tuple[list[_Hit], int]:
+        """Search reviews and return one ordered page of unified results."""
         from ..reviews.models import Review
 
-        results = []
-
         with self.db.get_session() as session:
-            stmt = select(Review).where(
-                or_(
-                    func.lower(Review.title).like(f"%{search_term}%"),
-                    func.lower(Review.content).like(f"%{search_term}%"),
-                )
+            stmt, rank = self._match(
+                select(Review), REVIEWS_FTS, search_term, Review.title, Review.content
             )
 
             if query.min_rating:
                 stmt = stmt.where(Review.rating >= query.min_rating)
 
-            reviews = session.execute(stmt).scalars().all()
-
-            for review in reviews:
+            def build(review: Review, review_rank: Optional[float]) -> SearchResult:
                 book = session.execute(
                     select(Book).where(Book.id == review.book_id)
                 ).scalar_one_or_none()
 
                 snippet = self._create_snippet(review.content, search_term)
-                score = self._calculate_relevance(
-                    search_term, review.title, review.content
-                )
+                score = self._score(review_rank, search_term, review.title, review.content)
 
-                results.append(
-                    SearchResult(
+                return SearchResult(
                         id=review.id,
                         result_type=ResultType.REVIEW,
                         title=review.title or "Review",
@@ -754,14 +721,27 @@ class SearchManager:
                         ),
                         metadata={"rating": review.rating, "book_id": review.book_id},
                     )
-                )
 
-        return results
+            return self._page_scope(
+                session,
+                stmt,
+                rank,
+                Review,
+                func.coalesce(Review.title, "Review"),
+                query,
+                after,
+                limit,
+                build,
+            )
 
     def _search_collections(
-        self, search_term: str, query: SearchQuery
-    ) -> list[SearchResult]:
-        """Search collections and return unified results."""
+        self,
+        search_term: str,
+        query: SearchQuery,
+        after: Optional[list],
+        limit: int,
+    ) -> tuple[list[_Hit], int]:
+        """Search collections and return one ordered page of unified results."""
         from ..collections.models import Collection
 
         results = []
@@ -801,12 +781,16 @@ class SearchManager:
                     )
                 )
 
-        return results
+        return self._rank_in_python(results, query, after, limit)
 
     def _search_lists(
-        self, search_term: str, query: SearchQuery
-    ) -> list[SearchResult]:
-        """Search reading lists and return unified results."""
+        self,
+        search_term: str,
+        query: SearchQuery,
+        after: Optional[list],
+        limit: int,
+    ) -> tuple[list[_Hit], int]:
+        """Search reading lists and return one ordered page of unified results."""
         from ..lists.models import ReadingList
 
         results = []
@@ -847,12 +831,16 @@ class SearchManager:
                     )
                 )
 
-        return results
+        return self._rank_in_python(results, query, after, limit)
 
     def _search_tags(
-        self, search_term: str, query: SearchQuery
-    ) -> list[SearchResult]:
-        """Search tags and return unified results."""
+        self,
+        search_term: str,
+        query: SearchQuery,
+        after: Optional[list],
+        limit: int,
+    ) -> tuple[list[_Hit], int]:
+        """Search tags and return one ordered page of unified results."""
         from ..tags.models import Tag
 
         results = []
@@ -890,12 +878,16 @@ class SearchManager:
                     )
                 )
 
-        return results
+        return self._rank_in_python(results, query, after, limit)
 
     def _search_authors(
-        self, search_term: str, query: SearchQuery
-    ) -> list[SearchResult]:
-        """Search authors and return unified results."""
+        self,
+        search_term: str,
+        query: SearchQuery,
+        after: Optional[list],
+        limit: int,
+    ) -> tuple[list[_Hit], int]:
+        """Search authors and return one ordered page of unified results."""
         results = []
 
         with self.db.get_session() as session:
@@ -928,7 +920,7 @@ class SearchManager:
                     )
                 )
 
-        return results
+        return self._rank_in_python(results, query, after, limit)
 
     def _advanced_search_books(
         self,
@@ -1103,6 +1095,181 @@ class SearchManager:
     # Helper Methods
     # -------------------------------------------------------------------------
 
+    def _use_fts(self) -> bool:
+        """Check (once) whether the FTS5 indexes are installed."""
+        if self._fts_enabled is None:
+            self._fts_enabled = fts_available(self.db.engine)
+        return self._fts_enabled
+
+    def _match(self, stmt, index: FTSIndex, search_term: str, *like_columns):
+        """Restrict a select to rows matching the search term.
+
+        Uses the FTS5 index, ordered by BM25, when it is available and the
+        term has indexable words. Otherwise falls back to a LIKE scan over
+        ``like_columns``. Either way a rank column is appended to each row;
+        it is None on the fallback path.
+
+        Returns:
+            Tuple of (statement, BM25 rank expression or None)
+        """
+        match = build_match_query(search_term) if self._use_fts() else None
+
+        if match is None:
+            stmt = stmt.add_columns(null()).where(
+                or_(*(func.lower(col).like(f"%{search_term}%") for col in like_columns))
+            )
+            return stmt, None
+
+        rank = index.rank()
+        stmt = (
+            stmt.add_columns(rank)
+            .join(index.table, index.rowid_join())
+            .where(index.match(match))
+            .order_by(rank)
+        )
+        return stmt, rank
+
+    def _page_scope(
+        self,
+        session,
+        stmt,
+        rank,
+        model,
+        title_column,
+        query: SearchQuery,
+        after: Optional[list],
+        limit: int,
+        build: Callable,
+    ) -> tuple[list[_Hit], int]:
+        """Count a scope's matches and fetch one ordered page of them.
+
+        The page is ordered in SQL by the requested sort key with the row id
+        as tie-breaker, starts after the keyset position ``after`` and holds
+        at most ``limit`` rows. Relevance ordering without an FTS rank has to
+        be scored in Python, so that case falls back to ``_rank_in_python``.
+        """
+        if query.sort_by == SortBy.TITLE:
+            sort_key = func.lower(title_column)
+        elif query.sort_by == SortBy.DATE:
+            sort_key = func.coalesce(model.created_at, "")
+        elif rank is not None:
+            sort_key = rank
+        else:
+            results = [build(obj, None) for obj, _ in session.execute(stmt).all()]
+            return self._rank_in_python(results, query, after, limit)
+
+        total = session.execute(
+            select(func.count()).select_from(stmt.order_by(None).subquery())
+        ).scalar_one()
+
+        # BM25 ranks ascend as relevance falls; other keys follow sort_order
+        descending = sort_key is not rank and self._is_descending(query)
+        stmt = stmt.add_columns(sort_key).order_by(None)
+
+        if after:
+            after_key, after_id = after
+            if descending:
+                stmt = stmt.where(
+                    or_(sort_key < after_key, and_(sort_key == after_key, model.id < after_id))
+                )
+            else:
+                stmt = stmt.where(
+                    or_(sort_key > after_key, and_(sort_key == after_key, model.id > after_id))
+                )
+
+        if descending:
+            stmt = stmt.order_by(sort_key.desc(), model.id.desc())
+        else:
+            stmt = stmt.order_by(sort_key.asc(), model.id.asc())
+
+        hits = []
+        for obj, obj_rank, key in session.execute(stmt.limit(limit)).all():
+            result = build(obj, obj_rank)
+            merge_key = -result.relevance_score if sort_key is rank else key
+            hits.append(
+                _Hit(
+                    key=(merge_key, result.result_type.value, result.id),
+                    cursor=[key, obj.id],
+                    result=result,
+                )
+            )
+
+        return hits, total
+
+    def _rank_in_python(
+        self,
+        results: list[SearchResult],
+        query: SearchQuery,
+        after: Optional[list],
+        limit: int,
+    ) -> tuple[list[_Hit], int]:
+        """Order already-fetched results and cut one page after ``after``."""
+        descending = self._is_descending(query)
+        hits = []
+
+        for result in results:
+            if query.sort_by == SortBy.TITLE:
+                merge_key = result.title.lower()
+            elif query.sort_by == SortBy.DATE:
+                merge_key = result.created_at.isoformat() if result.created_at else ""
+            else:
+                merge_key = -result.relevance_score
+            key = (merge_key, result.result_type.value, result.id)
+            hits.append(_Hit(key=key, cursor=list(key), result=result))
+
+        hits.sort(key=lambda hit: hit.key, reverse=descending)
+
+        if after:
+            after_key = tuple(after)
+            hits = [
+                hit
+                for hit in hits
+                if (hit.key < after_key if descending else hit.key > after_key)
+            ]
+
+        return hits[:limit], len(results)
+
+    def _is_descending(self, query: SearchQuery) -> bool:
+        """Whether merged results run from the largest sort key down.
+
+        Relevance is always best-first, which is an ascending merge key.
+        """
+        if query.sort_by in (SortBy.TITLE, SortBy.DATE):
+            return query.sort_order == SortOrder.DESC
+        return False
+
+    def _encode_cursor(self, query: SearchQuery, positions: dict[str, list]) -> str:
+        """Encode per-scope keyset positions into an opaque page token."""
+        payload = {
+            "q": query.query,
+            "sort": [query.sort_by.value, query.sort_order.value],
+            "after": positions,
+        }
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    def _decode_cursor(self, query: SearchQuery) -> dict[str, list]:
+        """Decode a page token produced by ``_encode_cursor``."""
+        try:
+            raw = base64.urlsafe_b64decode(query.cursor.encode("ascii"))
+            payload = json.loads(raw)
+            positions = payload["after"]
+            sort = payload["sort"]
+            text = payload["q"]
+        except (binascii.Error, ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Invalid search cursor: {e}") from e
+
+        if text != query.query or sort != [query.sort_by.value, query.sort_order.value]:
+            raise ValueError("Search cursor does not belong to this query")
+
+        return positions
+
+    def _score(self, rank: Optional[float], query: str, *texts: Optional[str]) -> float:
+        """Relevance from a BM25 rank, or from the text when there is none."""
+        if rank is not None:
+            return bm25_to_relevance(rank)
+        return self._calculate_relevance(query, *texts)
+
     def _calculate_relevance(
         self, query: str, *texts: Optional[str]
     ) -> float:
@@ -32,6 +32,7 @@ class ResultType(str, Enum):
     LIST = "list"
     TAG = "tag"
     AUTHOR = "author"
+    SERIES = "series"
 
 
 class SortBy(str, Enum):
@@ -60,6 +61,7 @@ class SearchQuery(BaseModel):
     scope: list[SearchScope] = Field(default=[SearchScope.ALL])
     limit: int = Field(default=50, ge=1, le=200)
     offset: int = Field(default=0, ge=0)
+    cursor: Optional[str] = None  # next_cursor from a previous page
     sort_by: SortBy = SortBy.RELEVANCE
     sort_order: SortOrder = SortOrder.DESC
 
@@ -120,6 +122,7 @@ class SearchResults(BaseModel):
     has_more: bool
     facets: dict[str, dict[str, int]] = Field(default_factory=dict)
     search_time_ms: float
+    next_cursor: Optional[str] = None  # Keyset token for the following page
 
 
 class BookSearchResult(BaseModel):
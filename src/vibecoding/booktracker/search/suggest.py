@@ -0,0 +1,295 @@
+"""In-memory prefix index for search autocomplete.
+
+Suggestion terms (book titles, authors, series, book tags and note tags)
+are kept in a sorted array keyed by every word start of the normalised
+term, so a type-ahead lookup is a bisect plus a short scan instead of a
+``LIKE '%q%'`` query.
+
+The index is built lazily, once per engine, on the first suggestion
+request. After that, committed ORM changes to books and notes are
+tracked through session events and re-read by id on the next lookup.
+Writers that bypass the ORM should call ``invalidate_suggestion_index``.
+"""
+
+import heapq
+import json
+import re
+import weakref
+from bisect import bisect_left, insort
+from itertools import chain
+from typing import Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from ..db.models import Book
+from .schemas import ResultType, SearchSuggestion
+
+# Session.info key holding (kind, id) pairs touched by flushes in this transaction
+_CHANGES_KEY = "suggestion_index_changes"
+
+# Entities that feed the index, by table name
+_TRACKED_TABLES = {"books": "book", "notes": "note"}
+
+_WORD_START_RE = re.compile(r"\b\w", re.UNICODE)
+
+# Max ids per IN (...) clause when refreshing
+_REFRESH_CHUNK = 500
+
+
+def _word_keys(text: str) -> set[str]:
+    """Lookup keys for a term: its normalised form from each word start."""
+    lowered = text.lower()
+    keys = {lowered}
+    for match in _WORD_START_RE.finditer(lowered):
+        keys.add(lowered[match.start() :])
+    return keys
+
+
+def _book_terms(title, author, series, tags) -> list[tuple[str, str]]:
+    """Suggestion terms contributed by one book row."""
+    terms = [
+        (ResultType.BOOK.value, title),
+        (ResultType.AUTHOR.value, author),
+        (ResultType.SERIES.value, series),
+    ]
+    if tags:
+        try:
+            terms.extend((ResultType.TAG.value, tag) for tag in json.loads(tags))
+        except (ValueError, TypeError):
+            pass
+    return [
+        (kind, text.strip()) for kind, text in terms if isinstance(text, str) and text.strip()
+    ]
+
+
+def _note_terms(tags) -> list[tuple[str, str]]:
+    """Suggestion terms contributed by one note row."""
+    if not tags:
+        return []
+    return [(ResultType.TAG.value, t.strip()) for t in tags.split(",") if t.strip()]
+
+
+class SuggestionIndex:
+    """Frequency-ranked prefix index over suggestion terms."""
+
+    def __init__(self):
+        """Initialize an empty, unbuilt index."""
+        self._built = False
+        # Sorted (key, result type, display text) triples
+        self._keys: list[tuple[str, str, str]] = []
+        # (result type, display text) -> number of rows using the term
+        self._counts: dict[tuple[str, str], int] = {}
+        # (kind, id) -> terms that row contributed
+        self._row_terms: dict[tuple[str, str], list[tuple[str, str]]] = {}
+        # (kind, id) pairs changed since the last refresh
+        self._pending: set[tuple[str, str]] = set()
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the index has been loaded from the database."""
+        return self._built
+
+    def invalidate(self) -> None:
+        """Drop the index so the next lookup rebuilds it."""
+        self._built = False
+        self._keys = []
+        self._counts = {}
+        self._row_terms = {}
+        self._pending = set()
+
+    def mark_changed(self, changes: set[tuple[str, str]]) -> None:
+        """Queue rows for re-reading on the next lookup."""
+        if self._built:
+            self._pending |= changes
+
+    def suggest(self, session: Session, prefix: str, limit: int = 10) -> list[SearchSuggestion]:
+        """Get suggestions whose words start with ``prefix``.
+
+        Terms that start with the prefix as a whole rank first, then more
+        frequent terms, then shorter ones.
+
+        Args:
+            session: Session used to build or refresh the index
+            prefix: Partial query string
+            limit: Maximum suggestions
+
+        Returns:
+            Ranked suggestions
+        """
+        self._sync(session)
+
+        prefix = prefix.lower().strip()
+        if not prefix:
+            return []
+
+        matches: set[tuple[str, str]] = set()
+        i = bisect_left(self._keys, (prefix,))
+        while i < len(self._keys) and self._keys[i][0].startswith(prefix):
+            _, kind, text = self._keys[i]
+            matches.add((kind, text))
+            i += 1
+
+        ranked = heapq.nsmallest(
+            limit,
+            matches,
+            key=lambda term: (
+                not term[1].lower().startswith(prefix),
+                -self._counts[term],
+                len(term[1]),
+                term[1],
+            ),
+        )
+
+        return [
+            SearchSuggestion(
+                text=text, result_type=ResultType(kind), count=self._counts[(kind, text)]
+            )
+            for kind, text in ranked
+        ]
+
+    # -------------------------------------------------------------------------
+    # Maintenance
+    # -------------------------------------------------------------------------
+
+    def _sync(self, session: Session) -> None:
+        """Build the index on first use, then apply pending row changes."""
+        if not self._built:
+            self._build(session)
+        elif self._pending:
+            self._refresh(session)
+
+    def _build(self, session: Session) -> None:
+        """Load every term with a narrow projection and sort once."""
+        from ..notes.models import Note
+
+        self.invalidate()
+
+        rows = session.execute(select(Book.id, Book.title, Book.author, Book.series, Book.tags))
+        for book_id, title, author, series, tags in rows:
+            terms = _book_terms(title, author, series, tags)
+            self._set_row_terms(("book", book_id), terms, False)
+
+        for note_id, tags in session.execute(select(Note.id, Note.tags)):
+            self._set_row_terms(("note", note_id), _note_terms(tags), False)
+
+        self._keys = sorted(
+            (key, kind, text) for kind, text in self._counts for key in _word_keys(text)
+        )
+        self._built = True
+
+    def _refresh(self, session: Session) -> None:
+        """Re-read changed rows by id and swap their terms."""
+        from ..notes.models import Note
+
+        pending, self._pending = self._pending, set()
+        book_ids = [row_id for kind, row_id in pending if kind == "book"]
+        note_ids = [row_id for kind, row_id in pending if kind == "note"]
+
+        for row_key in pending:
+            self._set_row_terms(row_key, [], True)
+
+        for start in range(0, len(book_ids), _REFRESH_CHUNK):
+            chunk = book_ids[start : start + _REFRESH_CHUNK]
+            rows = session.execute(
+                select(Book.id, Book.title, Book.author, Book.series, Book.tags).where(
+                    Book.id.in_(chunk)
+                )
+            )
+            for book_id, title, author, series, tags in rows:
+                terms = _book_terms(title, author, series, tags)
+                self._set_row_terms(("book", book_id), terms, True)
+
+        for start in range(0, len(note_ids), _REFRESH_CHUNK):
+            chunk = note_ids[start : start + _REFRESH_CHUNK]
+            rows = session.execute(select(Note.id, Note.tags).where(Note.id.in_(chunk)))
+            for note_id, tags in rows:
+                self._set_row_terms(("note", note_id), _note_terms(tags), True)
+
+    def _set_row_terms(
+        self, row_key: tuple[str, str], terms: list[tuple[str, str]], maintain_keys: bool
+    ) -> None:
+        """Replace the terms a row contributes, updating counts and keys."""
+        for term in self._row_terms.pop(row_key, []):
+            count = self._counts[term] - 1
+            if count:
+                self._counts[term] = count
+            else:
+                del self._counts[term]
+                if maintain_keys:
+                    self._remove_keys(term)
+
+        if terms:
+            self._row_terms[row_key] = terms
+        for term in terms:
+            count = self._counts.get(term, 0)
+            self._counts[term] = count + 1
+            if count == 0 and maintain_keys:
+                for key in _word_keys(term[1]):
+                    insort(self._keys, (key, term[0], term[1]))
+
+    def _remove_keys(self, term: tuple[str, str]) -> None:
+        """Remove every lookup key of a term that is no longer used."""
+        kind, text = term
+        for key in _word_keys(text):
+            entry = (key, kind, text)
+            i = bisect_left(self._keys, entry)
+            if i < len(self._keys) and self._keys[i] == entry:
+                del self._keys[i]
+
+
+# One index per engine; entries disappear with their engine
+_indexes: "weakref.WeakKeyDictionary[Engine, SuggestionIndex]" = weakref.WeakKeyDictionary()
+
+
+def get_suggestion_index(engine: Engine) -> SuggestionIndex:
+    """Get or create the suggestion index for a database engine."""
+    index = _indexes.get(engine)
+    if index is None:
+        index = SuggestionIndex()
+        _indexes[engine] = index
+    return index
+
+
+def invalidate_suggestion_index(engine: Engine) -> None:
+    """Force a rebuild after writes that bypass the ORM."""
+    index = _indexes.get(engine)
+    if index is not None:
+        index.invalidate()
+
+
+def _index_for(session: Session) -> Optional[SuggestionIndex]:
+    """The suggestion index for a session's engine, if one was created."""
+    bind = session.bind
+    engine = getattr(bind, "engine", bind)
+    return _indexes.get(engine) if engine is not None else None
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_rows(session: Session, flush_context) -> None:
+    """Remember which books and notes this transaction touched."""
+    if _index_for(session) is None:
+        return
+    changes = session.info.setdefault(_CHANGES_KEY, set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        kind = _TRACKED_TABLES.get(getattr(obj, "__tablename__", None))
+        if kind and obj.id:
+            changes.add((kind, obj.id))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed_rows(session: Session) -> None:
+    """Hand committed changes to the index for lazy refresh."""
+    index = _index_for(session)
+    if index is None:
+        return
+    changes = session.info.pop(_CHANGES_KEY, None)
+    if changes:
+        index.mark_changed(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_rows(session: Session) -> None:
+    """Forget changes that never reached the database."""
+    session.info.pop(_CHANGES_KEY, None)
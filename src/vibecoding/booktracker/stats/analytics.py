@@ -7,14 +7,25 @@ Provides detailed statistics about reading habits, including:
 - Reading pace analysis
 """
 
-from collections import Counter, defaultdict
+import calendar
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from typing import Optional
 
 from sqlalchemy import select, func
 
-from ..db.models import Book, ReadingLog
+from ..db.aggregates import (
+    FINISHED_MONTH,
+    book_totals,
+    count_books,
+    finished_between,
+    rating_counts,
+    totals_by,
+    totals_by_value,
+)
+from ..db.models import Book
+from ..db.rollups import daily_activity
 from ..db.schemas import BookStatus
 from ..db.sqlite import Database, get_db
 
@@ -101,94 +112,63 @@ class ReadingAnalytics:
             year_start = f"{year}-01-01"
             year_end = f"{year}-12-31"
 
-            stmt = select(Book).where(
-                Book.date_finished >= year_start,
-                Book.date_finished <= year_end,
-            )
-            finished_books = list(session.execute(stmt).scalars().all())
-
-            # Get books started this year
-            stmt = select(Book).where(
+            finished = finished_between(year_start, year_end, completed=False)
+            totals = book_totals(session, *finished)
+            books_started = count_books(
+                session,
                 Book.date_started >= year_start,
                 Book.date_started <= year_end,
             )
-            started_books = list(session.execute(stmt).scalars().all())
 
-            # Get reading logs for the year
-            stmt = select(ReadingLog).where(
-                ReadingLog.date >= year_start,
-                ReadingLog.date <= year_end,
-            )
-            logs = list(session.execute(stmt).scalars().all())
-
-            # Calculate basic stats
-            books_finished = len(finished_books)
-            books_started = len(started_books)
-
-            total_pages = sum(book.page_count or 0 for book in finished_books)
-            total_reading_time = sum(log.duration_minutes or 0 for log in logs)
-
-            # Average rating
-            rated_books = [b for b in finished_books if b.rating]
-            avg_rating = (
-                sum(b.rating for b in rated_books) / len(rated_books)
-                if rated_books else 0.0
-            )
+            # Reading per day for the year
+            daily = daily_activity(session, year_start, year_end)
+            total_reading_time = sum(day.minutes for day in daily.values())
 
             # Average pages per book
-            avg_pages = total_pages / books_finished if books_finished > 0 else 0.0
+            avg_pages = totals.pages / totals.books if totals.books > 0 else 0.0
 
             # Average days to finish
-            days_to_finish = []
-            for book in finished_books:
-                if book.date_started and book.date_finished:
-                    start = date.fromisoformat(book.date_started)
-                    end = date.fromisoformat(book.date_finished)
-                    days = (end - start).days
-                    if days >= 0:
-                        days_to_finish.append(days)
-            avg_days = sum(days_to_finish) / len(days_to_finish) if days_to_finish else 0.0
+            days_taken = func.julianday(Book.date_finished) - func.julianday(Book.date_started)
+            avg_days = session.execute(
+                select(func.avg(days_taken)).where(
+                    *finished, Book.date_started.isnot(None), days_taken >= 0
+                )
+            ).scalar_one() or 0.0
 
             # Books by month
-            books_by_month = defaultdict(int)
-            for book in finished_books:
-                month = int(book.date_finished[5:7])
-                books_by_month[month] += 1
+            books_by_month = {
+                group.key: group.books for group in totals_by(session, FINISHED_MONTH, *finished)
+            }
 
             # Pages by month (from reading logs)
             pages_by_month = defaultdict(int)
-            for log in logs:
-                month = int(log.date[5:7])
-                pages_by_month[month] += log.pages_read or 0
-
-            # Top authors
-            author_counts = Counter(book.author for book in finished_books)
-            top_authors = author_counts.most_common(10)
-
-            # Top genres (from tags)
-            genre_counts = Counter()
-            for book in finished_books:
-                tags = book.get_tags()
-                genre_counts.update(tags)
-            top_genres = genre_counts.most_common(10)
-
-            # Rating distribution
-            rating_dist = Counter(book.rating for book in finished_books if book.rating)
+            for day in daily.values():
+                pages_by_month[int(day.date[5:7])] += day.pages
+
+            # Top authors and genres (from tags)
+            top_authors = [
+                (group.key, group.books)
+                for group in totals_by(session, Book.author, *finished, limit=10)
+            ]
+            top_genres = [
+                (group.key, group.books)
+                for group in totals_by_value(session, Book.tags, *finished, limit=10)
+            ]
 
             return YearlyStats(
                 year=year,
-                books_finished=books_finished,
+                books_finished=totals.books,
                 books_started=books_started,
-                total_pages=total_pages,
+                total_pages=totals.pages,
                 total_reading_time=total_reading_time,
-                avg_rating=round(avg_rating, 2),
+                avg_rating=round(totals.avg_rating or 0.0, 2),
                 avg_pages_per_book=round(avg_pages, 1),
                 avg_days_to_finish=round(avg_days, 1),
-                books_by_month=dict(books_by_month),
+                books_by_month=books_by_month,
                 pages_by_month=dict(pages_by_month),
                 top_authors=top_authors,
                 top_genres=top_genres,
-                rating_distribution=dict(rating_dist),
+                rating_distribution=rating_counts(session, *finished),
             )
 
     def get_monthly_stats(self, year: int, month: int) -> MonthlyStats:
@@ -215,20 +195,13 @@ class ReadingAnalytics:
             )
             finished_books = list(session.execute(stmt).scalars().all())
 
-            # Get reading logs for the month
-            stmt = select(ReadingLog).where(
-                ReadingLog.date >= month_start,
-                ReadingLog.date < month_end,
-            )
-            logs = list(session.execute(stmt).scalars().all())
+            # Reading per day for the month
+            days_in_month = calendar.monthrange(year, month)[1]
+            daily = daily_activity(session, month_start, f"{year}-{month:02d}-{days_in_month:02d}")
 
             # Calculate stats
-            pages_read = sum(log.pages_read or 0 for log in logs)
-            reading_time = sum(log.duration_minutes or 0 for log in logs)
-
-            # Days in month
-            import calendar
-            days_in_month = calendar.monthrange(year, month)[1]
+            pages_read = sum(day.pages for day in daily.values())
+            reading_time = sum(day.minutes for day in daily.values())
             avg_pages_per_day = pages_read / days_in_month if days_in_month > 0 else 0
 
             # Book details
@@ -248,7 +221,7 @@ class ReadingAnalytics:
                 month=month,
                 books_finished=len(finished_books),
                 pages_read=pages_read,
-                reading_sessions=len(logs),
+                reading_sessions=sum(day.sessions for day in daily.values()),
                 reading_time=reading_time,
                 avg_pages_per_day=round(avg_pages_per_day, 1),
                 books=books,
@@ -264,40 +237,33 @@ class ReadingAnalytics:
             List of AuthorStats
         """
         with self.db.get_session() as session:
-            stmt = select(Book).where(Book.status == BookStatus.COMPLETED.value)
+            conditions = [Book.status == BookStatus.COMPLETED.value]
             if author:
-                stmt = stmt.where(Book.author.ilike(f"%{author}%"))
-
-            books = list(session.execute(stmt).scalars().all())
+                conditions.append(Book.author.ilike(f"%{author}%"))
 
-            # Group by author
+            # Each author's books, in the order the totals list the authors
+            stmt = select(
+                Book.author, Book.title, Book.rating, Book.page_count, Book.date_finished
+            ).where(*conditions)
             author_books = defaultdict(list)
-            for book in books:
-                session.expunge(book)
-                author_books[book.author].append(book)
-
-            stats = []
-            for auth, auth_books in author_books.items():
-                total_pages = sum(b.page_count or 0 for b in auth_books)
-                rated = [b for b in auth_books if b.rating]
-                avg_rating = sum(b.rating for b in rated) / len(rated) if rated else 0
-
-                stats.append(AuthorStats(
-                    author=auth,
-                    books_read=len(auth_books),
-                    total_pages=total_pages,
-                    avg_rating=round(avg_rating, 2),
-                    books=[{
-                        "title": b.title,
-                        "rating": b.rating,
-                        "pages": b.page_count,
-                        "date_finished": b.date_finished,
-                    } for b in auth_books],
-                ))
-
-            # Sort by books read
-            stats.sort(key=lambda x: x.books_read, reverse=True)
-            return stats
+            for row in session.execute(stmt):
+                author_books[row.author].append({
+                    "title": row.title,
+                    "rating": row.rating,
+                    "pages": row.page_count,
+                    "date_finished": row.date_finished,
+                })
+
+            return [
+                AuthorStats(
+                    author=group.key,
+                    books_read=group.books,
+                    total_pages=group.pages,
+                    avg_rating=round(group.avg_rating or 0, 2),
+                    books=author_books[group.key],
+                )
+                for group in totals_by(session, Book.author, *conditions)
+            ]
 
     def get_genre_stats(self) -> list[GenreStats]:
         """Get statistics by genre/tag.
@@ -306,35 +272,18 @@ class ReadingAnalytics:
             List of GenreStats sorted by count
         """
         with self.db.get_session() as session:
-            stmt = select(Book).where(Book.status == BookStatus.COMPLETED.value)
-            books = list(session.execute(stmt).scalars().all())
-
-            # Collect genre data
-            genre_data = defaultdict(lambda: {"count": 0, "ratings": [], "pages": 0})
-
-            for book in books:
-                tags = book.get_tags()
-                for tag in tags:
-                    genre_data[tag]["count"] += 1
-                    if book.rating:
-                        genre_data[tag]["ratings"].append(book.rating)
-                    genre_data[tag]["pages"] += book.page_count or 0
-
-            stats = []
-            for genre, data in genre_data.items():
-                avg_rating = (
-                    sum(data["ratings"]) / len(data["ratings"])
-                    if data["ratings"] else 0
+            groups = totals_by_value(
+                session, Book.tags, Book.status == BookStatus.COMPLETED.value
+            )
+            return [
+                GenreStats(
+                    genre=group.key,
+                    books_count=group.books,
+                    avg_rating=round(group.avg_rating or 0, 2),
+                    total_pages=group.pages,
                 )
-                stats.append(GenreStats(
-                    genre=genre,
-                    books_count=data["count"],
-                    avg_rating=round(avg_rating, 2),
-                    total_pages=data["pages"],
-                ))
-
-            stats.sort(key=lambda x: x.books_count, reverse=True)
-            return stats
+                for group in groups
+            ]
 
     def get_reading_pace(self, days: int = 30) -> dict:
         """Calculate recent reading pace.
@@ -348,27 +297,26 @@ class ReadingAnalytics:
         with self.db.get_session() as session:
             start_date = (date.today() - timedelta(days=days)).isoformat()
 
-            # Get reading logs
-            stmt = select(ReadingLog).where(ReadingLog.date >= start_date)
-            logs = list(session.execute(stmt).scalars().all())
+            # Reading per day
+            days_read = list(daily_activity(session, start_date).values())
 
-            # Get books finished
-            stmt = select(Book).where(
+            # Books finished
+            finished = count_books(
+                session,
                 Book.date_finished >= start_date,
                 Book.status == BookStatus.COMPLETED.value,
             )
-            finished = list(session.execute(stmt).scalars().all())
 
-            total_pages = sum(log.pages_read or 0 for log in logs)
-            total_time = sum(log.duration_minutes or 0 for log in logs)
-            sessions = len(logs)
+            total_pages = sum(day.pages for day in days_read)
+            total_time = sum(day.minutes for day in days_read)
+            sessions = sum(day.sessions for day in days_read)
 
             # Active reading days
-            reading_days = len(set(log.date for log in logs))
+            reading_days = len(days_read)
 
             return {
                 "period_days": days,
-                "books_finished": len(finished),
+                "books_finished": finished,
                 "total_pages": total_pages,
                 "total_time_minutes": total_time,
                 "reading_sessions": sessions,
@@ -386,66 +334,52 @@ class ReadingAnalytics:
             Dictionary with comprehensive all-time stats
         """
         with self.db.get_session() as session:
-            # All completed books
-            stmt = select(Book).where(Book.status == BookStatus.COMPLETED.value)
-            completed = list(session.execute(stmt).scalars().all())
-
-            # All books
-            stmt = select(Book)
-            all_books = list(session.execute(stmt).scalars().all())
+            completed = Book.status == BookStatus.COMPLETED.value
+            totals = book_totals(session, completed)
+            total_books = count_books(session)
 
-            # All reading logs
-            stmt = select(ReadingLog)
-            all_logs = list(session.execute(stmt).scalars().all())
-
-            # Basic counts
-            total_books = len(all_books)
-            completed_count = len(completed)
-            total_pages = sum(b.page_count or 0 for b in completed)
+            # Reading per day, all time
+            all_days = daily_activity(session).values()
 
             # Reading time
-            total_time = sum(log.duration_minutes or 0 for log in all_logs)
+            total_time = sum(day.minutes for day in all_days)
             hours = total_time // 60
             days_reading = total_time / (24 * 60) if total_time > 0 else 0
 
-            # Ratings
-            rated = [b for b in completed if b.rating]
-            avg_rating = sum(b.rating for b in rated) / len(rated) if rated else 0
-
-            # First and last book
-            finished_dates = [b.date_finished for b in completed if b.date_finished]
-            first_book_date = min(finished_dates) if finished_dates else None
-            last_book_date = max(finished_dates) if finished_dates else None
-
-            # Years active
-            years = set(d[:4] for d in finished_dates) if finished_dates else set()
+            # First and last book, and the years they span
+            first_book_date, last_book_date, years_active = session.execute(
+                select(
+                    func.min(Book.date_finished),
+                    func.max(Book.date_finished),
+                    func.count(func.distinct(func.substr(Book.date_finished, 1, 4))),
+                ).where(completed, Book.date_finished.isnot(None), Book.date_finished != "")
+            ).one()
 
             # Longest book
-            longest = max(completed, key=lambda b: b.page_count or 0) if completed else None
-
-            # Highest rated
-            if rated:
-                five_stars = [b for b in rated if b.rating == 5]
-            else:
-                five_stars = []
+            longest = session.execute(
+                select(Book.title, Book.page_count)
+                .where(completed, Book.page_count > 0)
+                .order_by(Book.page_count.desc())
+                .limit(1)
+            ).first()
 
             return {
                 "total_books": total_books,
-                "books_completed": completed_count,
-                "total_pages": total_pages,
+                "books_completed": totals.books,
+                "total_pages": totals.pages,
                 "total_reading_hours": hours,
                 "days_spent_reading": round(days_reading, 1),
-                "avg_rating": round(avg_rating, 2),
-                "books_rated": len(rated),
-                "five_star_books": len(five_stars),
-                "years_active": len(years),
+                "avg_rating": round(totals.avg_rating or 0, 2),
+                "books_rated": totals.rated,
+                "five_star_books": count_books(session, completed, Book.rating == 5),
+                "years_active": years_active,
                 "first_book_date": first_book_date,
                 "last_book_date": last_book_date,
                 "longest_book": {
                     "title": longest.title,
                     "pages": longest.page_count,
-                } if longest and longest.page_count else None,
-                "avg_book_length": round(total_pages / completed_count, 0) if completed_count > 0 else 0,
+                } if longest else None,
+                "avg_book_length": round(totals.pages / totals.books, 0) if totals.books > 0 else 0,
             }
 
     def get_rating_analysis(self) -> dict:
@@ -455,13 +389,9 @@ class ReadingAnalytics:
             Dictionary with rating analysis
         """
         with self.db.get_session() as session:
-            stmt = select(Book).where(
-                Book.status == BookStatus.COMPLETED.value,
-                Book.rating.isnot(None),
-            )
-            rated_books = list(session.execute(stmt).scalars().all())
+            distribution = rating_counts(session, Book.status == BookStatus.COMPLETED.value)
 
-            if not rated_books:
+            if not distribution:
                 return {
                     "total_rated": 0,
                     "distribution": {},
@@ -469,28 +399,25 @@ class ReadingAnalytics:
                     "mode_rating": None,
                 }
 
-            # Distribution
-            distribution = Counter(b.rating for b in rated_books)
-
             # Calculate percentages
-            total = len(rated_books)
+            total = sum(distribution.values())
             dist_pct = {
                 rating: round(count / total * 100, 1)
                 for rating, count in distribution.items()
             }
 
             # Average
-            avg = sum(b.rating for b in rated_books) / total
+            avg = sum(rating * count for rating, count in distribution.items()) / total
 
             # Mode (most common)
-            mode = distribution.most_common(1)[0][0] if distribution else None
+            mode = max(distribution, key=distribution.get)
 
             # Harshest and most generous periods
             # (could expand to track rating trends over time)
 
             return {
                 "total_rated": total,
-                "distribution": dict(distribution),
+                "distribution": distribution,
                 "distribution_percent": dist_pct,
                 "avg_rating": round(avg, 2),
                 "mode_rating": mode,
@@ -10,9 +10,12 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 
-from ..db.models import Book, ReadingLog
+from ..db.aggregates import count_books
+from ..db.cache import cached
+from ..db.models import Book
+from ..db.rollups import DAILY_ACTIVITY
 from ..db.schemas import BookStatus
 from ..db.sqlite import Database, get_db
 
@@ -258,32 +261,31 @@ class GoalTracker:
 
             if goal.goal_type == GoalType.BOOKS:
                 # Count books finished in period
-                stmt = select(Book).where(
+                goal.current = count_books(
+                    session,
                     Book.date_finished >= start_date,
                     Book.date_finished < end_date,
                     Book.status == BookStatus.COMPLETED.value,
                 )
-                books = list(session.execute(stmt).scalars().all())
-                goal.current = len(books)
-
-            elif goal.goal_type == GoalType.PAGES:
-                # Sum pages from reading logs
-                stmt = select(ReadingLog).where(
-                    ReadingLog.date >= start_date,
-                    ReadingLog.date < end_date,
+
+            elif goal.goal_type in (GoalType.PAGES, GoalType.MINUTES):
+                # Sum the daily reading rollup
+                column = (
+                    DAILY_ACTIVITY.c.pages
+                    if goal.goal_type == GoalType.PAGES
+                    else DAILY_ACTIVITY.c.minutes
                 )
-                logs = list(session.execute(stmt).scalars().all())
-                goal.current = sum(log.pages_read or 0 for log in logs)
-
-            elif goal.goal_type == GoalType.MINUTES:
-                # Sum reading time from logs
-                stmt = select(ReadingLog).where(
-                    ReadingLog.date >= start_date,
-                    ReadingLog.date < end_date,
+                stmt = select(func.coalesce(func.sum(column), 0)).where(
+                    DAILY_ACTIVITY.c.date >= start_date,
+                    DAILY_ACTIVITY.c.date < end_date,
                 )
-                logs = list(session.execute(stmt).scalars().all())
-                goal.current = sum(log.duration_minutes or 0 for log in logs)
+                goal.current = session.execute(stmt).scalar_one()
 
+    @cached(
+        "books",
+        "reading_logs",
+        key=lambda self: [(g.goal_type.value, g.target, g.year, g.month) for g in self._goals],
+    )
     def get_progress_summary(self) -> dict:
         """Get a summary of all current goal progress.
 
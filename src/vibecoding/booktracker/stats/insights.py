@@ -10,9 +10,12 @@ from typing import Optional
 
 from sqlalchemy import select
 
-from ..db.models import Book, ReadingLog
+from ..db.cache import cached
+from ..db.models import Book
+from ..db.rollups import daily_activity
 from ..db.schemas import BookStatus
 from ..db.sqlite import Database, get_db
+from ..streaks.engine import StreakEngine
 
 
 class InsightType(str, Enum):
@@ -53,6 +56,7 @@ class InsightGenerator:
         """
         self.db = db or get_db()
 
+    @cached("books", "reading_logs")
     def generate_all_insights(self) -> list[Insight]:
         """Generate all relevant insights.
 
@@ -79,12 +83,11 @@ class InsightGenerator:
         insights = []
 
         with self.db.get_session() as session:
-            # Get recent reading logs
+            # Get recent reading days
             thirty_days_ago = (date.today() - timedelta(days=30)).isoformat()
-            stmt = select(ReadingLog).where(ReadingLog.date >= thirty_days_ago)
-            logs = list(session.execute(stmt).scalars().all())
+            daily = daily_activity(session, thirty_days_ago)
 
-            if not logs:
+            if not daily:
                 insights.append(Insight(
                     insight_type=InsightType.RECOMMENDATION,
                     title="Start Reading",
@@ -93,23 +96,8 @@ class InsightGenerator:
                 ))
                 return insights
 
-            # Calculate current streak
-            reading_dates = sorted(set(log.date for log in logs), reverse=True)
-            current_streak = 0
-            expected_date = date.today()
-
-            for log_date in reading_dates:
-                log_date_obj = date.fromisoformat(log_date)
-                if log_date_obj == expected_date:
-                    current_streak += 1
-                    expected_date = expected_date - timedelta(days=1)
-                elif log_date_obj == expected_date - timedelta(days=1):
-                    # Allow one day gap
-                    expected_date = log_date_obj
-                    current_streak += 1
-                    expected_date = expected_date - timedelta(days=1)
-                else:
-                    break
+            current = StreakEngine(daily).current()
+            current_streak = current.length if current else 0
 
             if current_streak >= 7:
                 insights.append(Insight(
@@ -131,7 +119,7 @@ class InsightGenerator:
             # Check if streak is at risk
             if current_streak > 0:
                 today_str = date.today().isoformat()
-                read_today = any(log.date == today_str for log in logs)
+                read_today = today_str in daily
                 if not read_today:
                     insights.append(Insight(
                         insight_type=InsightType.RECOMMENDATION,
@@ -202,8 +190,7 @@ class InsightGenerator:
 
             # Get this month's activity
             month_start = date(today.year, today.month, 1).isoformat()
-            stmt = select(ReadingLog).where(ReadingLog.date >= month_start)
-            this_month_logs = list(session.execute(stmt).scalars().all())
+            this_month_days = daily_activity(session, month_start).values()
 
             # Get last month's activity
             if today.month == 1:
@@ -216,15 +203,13 @@ class InsightGenerator:
                 else:
                     last_month_end = date(today.year, today.month - 1, 30)
 
-            stmt = select(ReadingLog).where(
-                ReadingLog.date >= last_month_start.isoformat(),
-                ReadingLog.date <= last_month_end.isoformat(),
-            )
-            last_month_logs = list(session.execute(stmt).scalars().all())
+            last_month_days = daily_activity(
+                session, last_month_start.isoformat(), last_month_end.isoformat()
+            ).values()
 
-            if this_month_logs and last_month_logs:
-                this_month_pages = sum(log.pages_read or 0 for log in this_month_logs)
-                last_month_pages = sum(log.pages_read or 0 for log in last_month_logs)
+            if this_month_days and last_month_days:
+                this_month_pages = sum(day.pages for day in this_month_days)
+                last_month_pages = sum(day.pages for day in last_month_days)
 
                 # Normalize by days elapsed
                 days_this_month = today.day
@@ -0,0 +1,360 @@
+"""In-memory columnar snapshot of the library for vectorised analytics.
+
+The heavier reports - the yearly recap, the dashboard, reading habits
+and location stats - summarise the same few tables many different ways.
+Instead of a query per figure, ``LibrarySnapshot.load`` reads books,
+reading logs, daily readings and location sessions once, with narrow
+projections, into pandas frames:
+
+- ISO date strings are parsed to ``datetime64`` (NaT when missing);
+- authors, statuses and location types are categoricals;
+- ratings and page counts are float64, NaN when missing;
+- the JSON ``genres`` and ``tags`` arrays are exploded to one row per
+  (book, value), carrying the book's pages and rating.
+
+Group-bys and time bucketing then run vectorised on the frames.
+``SnapshotBooks`` answers the same questions as ``SelectedBooks`` in
+``db.aggregates`` and returns the same ``BookTotals``, so a report can
+take its figures from either. Pass a snapshot to ``ReportManager``,
+``StreakManager`` or ``LocationManager`` to use it; several reports can
+share one snapshot. It is a point-in-time copy: load a new one after
+writing.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..db.aggregates import BookTotals
+from ..db.models import Book, ReadingLog
+from ..db.rollups import DayActivity
+from ..db.schemas import BookStatus
+from ..db.sqlite import Database, get_db
+from ..locations.models import LocationSession, ReadingLocation
+from ..streaks.models import DailyReading
+
+
+class BookRow(NamedTuple):
+    """The fields of a book that reports show."""
+
+    id: str
+    title: str
+    author: str
+    rating: Optional[int]
+    date_finished: Optional[str]
+    page_count: Optional[int]
+
+
+def _read(session: Session, stmt, dtype=None) -> pd.DataFrame:
+    result = session.execute(stmt)
+    return pd.DataFrame(result.all(), columns=list(result.keys()), dtype=dtype)
+
+
+def _dates(values: pd.Series) -> pd.Series:
+    return pd.to_datetime(values, format="ISO8601", errors="coerce")
+
+
+def _json_list(value: Any) -> list:
+    if not isinstance(value, str) or not value:
+        return []
+    try:
+        values = json.loads(value)
+    except ValueError:
+        return []
+    return values if isinstance(values, list) else []
+
+
+def _exploded(books: pd.DataFrame, column: str) -> pd.DataFrame:
+    """One row per value of a JSON array column, indexed by book."""
+    values = books[column].map(_json_list).explode().dropna()
+    frame = books.loc[values.index, ["page_count", "rating"]]
+    frame.insert(0, "key", values.to_numpy())
+    return frame
+
+
+def _scalar(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _optional(value: Any, type_=float) -> Any:
+    return None if pd.isna(value) else type_(value)
+
+
+def _grouped(frame: pd.DataFrame, key, limit: Optional[int] = None) -> list[BookTotals]:
+    """Totals per group, most books first, then by key."""
+    grouped = frame.groupby(key, observed=True, sort=False)
+    totals = pd.DataFrame({
+        "books": grouped.size(),
+        "pages": grouped["page_count"].sum(),
+        "rated": grouped["rating"].count(),
+        "avg_rating": grouped["rating"].mean(),
+    })
+    totals.index.name = "key"
+    totals = totals.reset_index().sort_values(
+        ["books", "key"], ascending=[False, True], kind="stable"
+    )
+    if limit:
+        totals = totals.head(limit)
+    return [
+        BookTotals(
+            books=int(row.books),
+            pages=int(row.pages),
+            rated=int(row.rated),
+            avg_rating=_optional(row.avg_rating),
+            key=_scalar(row.key),
+        )
+        for row in totals.itertuples(index=False)
+    ]
+
+
+def _rows(frame: pd.DataFrame) -> list[BookRow]:
+    return [
+        BookRow(
+            id=id_,
+            title=title,
+            author=str(author),
+            rating=_optional(rating, int),
+            date_finished=None if pd.isna(finished) else finished,
+            page_count=_optional(pages, int),
+        )
+        for id_, title, author, rating, finished, pages in zip(
+            frame["id"], frame["title"], frame["author"], frame["rating"],
+            frame["date_finished"], frame["page_count"],
+        )
+    ]
+
+
+@dataclass
+class LibrarySnapshot:
+    """Books and reading activity as pandas frames."""
+
+    books: pd.DataFrame
+    genres: pd.DataFrame  # key (genre), page_count, rating; indexed by book
+    tags: pd.DataFrame  # key (tag), page_count, rating; indexed by book
+    logs: pd.DataFrame
+    daily: pd.DataFrame  # Daily readings, oldest first
+    locations: pd.DataFrame  # Python values; location_type categorical
+    location_sessions: pd.DataFrame
+
+    @classmethod
+    def load(cls, db: Optional[Database] = None) -> "LibrarySnapshot":
+        """Read the library into memory.
+
+        Args:
+            db: Database instance
+
+        Returns:
+            The snapshot
+        """
+        db = db or get_db()
+        with db.get_session() as session:
+            books = _read(session, select(
+                Book.id, Book.title, Book.author, Book.status, Book.rating,
+                Book.page_count, Book.date_finished, Book.genres, Book.tags,
+            ))
+            logs = _read(session, select(
+                ReadingLog.book_id, ReadingLog.date,
+                ReadingLog.pages_read, ReadingLog.duration_minutes,
+            ))
+            daily = _read(session, select(
+                DailyReading.reading_date, DailyReading.weekday, DailyReading.minutes_read,
+                DailyReading.pages_read, DailyReading.primary_hour,
+            ).order_by(DailyReading.reading_date))
+            locations = _read(session, select(
+                ReadingLocation.id, ReadingLocation.name, ReadingLocation.location_type,
+                ReadingLocation.icon, ReadingLocation.is_favorite,
+            ), dtype=object)  # A handful of rows, read back as Python values
+            location_sessions = _read(session, select(
+                LocationSession.location_id, LocationSession.minutes_read,
+                LocationSession.pages_read, LocationSession.session_date,
+            ))
+
+        books = books.astype({
+            "author": "category", "status": "category",
+            "rating": "float64", "page_count": "float64",
+        })
+        books["finished"] = _dates(books["date_finished"])
+        genres = _exploded(books, "genres")
+        tags = _exploded(books, "tags")
+        books = books.drop(columns=["genres", "tags"])
+
+        logs["day"] = _dates(logs["date"])
+        logs[["pages_read", "duration_minutes"]] = (
+            logs[["pages_read", "duration_minutes"]].fillna(0).astype("int64")
+        )
+
+        daily["day"] = _dates(daily["reading_date"])
+        daily[["weekday", "minutes_read", "pages_read"]] = (
+            daily[["weekday", "minutes_read", "pages_read"]].fillna(0).astype("int64")
+        )
+        daily["primary_hour"] = daily["primary_hour"].astype("float64")
+
+        locations["location_type"] = locations["location_type"].astype("category")
+        location_sessions[["minutes_read", "pages_read"]] = (
+            location_sessions[["minutes_read", "pages_read"]].fillna(0).astype("int64")
+        )
+        # Hour as written, like datetime.fromisoformat(session_date).hour
+        location_sessions["hour"] = (
+            pd.to_numeric(location_sessions["session_date"].str.slice(11, 13), errors="coerce")
+            .fillna(0)
+            .astype("int64")
+        )
+
+        return cls(
+            books=books,
+            genres=genres,
+            tags=tags,
+            logs=logs,
+            daily=daily,
+            locations=locations,
+            location_sessions=location_sessions,
+        )
+
+    # -------------------------------------------------------------------------
+    # Books
+    # -------------------------------------------------------------------------
+
+    def completed(self, start: Optional[str] = None, end: Optional[str] = None) -> "SnapshotBooks":
+        """Completed books, optionally finished between two ISO dates, inclusive."""
+        mask = self.books["status"] == BookStatus.COMPLETED.value
+        if start:
+            mask &= self.books["finished"] >= pd.Timestamp(start)
+        if end:
+            mask &= self.books["finished"] <= pd.Timestamp(end)
+        return SnapshotBooks(self, mask)
+
+    def count_status(self, status: BookStatus) -> int:
+        """Number of books with a status."""
+        return int((self.books["status"] == status.value).sum())
+
+    def recently_finished(self, limit: int) -> list[BookRow]:
+        """Books with a finish date, latest first."""
+        finished = self.books[self.books["date_finished"].notna()]
+        finished = finished.sort_values("date_finished", ascending=False, kind="stable")
+        return _rows(finished.head(limit))
+
+    # -------------------------------------------------------------------------
+    # Reading activity
+    # -------------------------------------------------------------------------
+
+    def daily_activity(
+        self, start: Optional[str] = None, end: Optional[str] = None
+    ) -> dict[str, DayActivity]:
+        """Reading per day with logs, in date order, like the rollup.
+
+        Args:
+            start: First ISO date to include
+            end: Last ISO date to include
+
+        Returns:
+            ISO date -> DayActivity
+        """
+        logs = self.logs
+        if start:
+            logs = logs[logs["day"] >= pd.Timestamp(start)]
+        if end:
+            logs = logs[logs["day"] <= pd.Timestamp(end)]
+
+        grouped = logs.groupby("date", sort=True)
+        days = pd.DataFrame({
+            "sessions": grouped.size(),
+            "pages": grouped["pages_read"].sum(),
+            "minutes": grouped["duration_minutes"].sum(),
+            "books": grouped["book_id"].nunique(),
+        })
+        return {
+            day: DayActivity(
+                date=day,
+                sessions=int(row.sessions),
+                pages=int(row.pages),
+                minutes=int(row.minutes),
+                books=int(row.books),
+            )
+            for day, row in zip(days.index, days.itertuples(index=False))
+        }
+
+
+class SnapshotBooks:
+    """A selection of a snapshot's books.
+
+    Has the same methods as ``db.aggregates.SelectedBooks``, computed
+    with pandas instead of SQL.
+    """
+
+    def __init__(self, snapshot: LibrarySnapshot, mask: pd.Series):
+        """Initialize the selection.
+
+        Args:
+            snapshot: Snapshot holding the books
+            mask: Boolean mask over ``snapshot.books``
+        """
+        self.snapshot = snapshot
+        self.frame = snapshot.books[mask]
+
+    def totals(self) -> BookTotals:
+        """Count, pages and ratings of the books."""
+        ratings = self.frame["rating"]
+        return BookTotals(
+            books=len(self.frame),
+            pages=int(self.frame["page_count"].sum()),
+            rated=int(ratings.count()),
+            avg_rating=_optional(ratings.mean()),
+        )
+
+    def by_month(self) -> list[BookTotals]:
+        """Totals per month (1-12) finished in."""
+        months = self.frame["finished"].dt.month.dropna().astype("int64")
+        return _grouped(self.frame, months.rename("key"))
+
+    def by_finish_date(self) -> list[BookTotals]:
+        """Totals per ISO finish date."""
+        return _grouped(self.frame, "date_finished")
+
+    def by_author(self, limit: Optional[int] = None, rated_only: bool = False) -> list[BookTotals]:
+        """Totals per named author, most books first.
+
+        Args:
+            limit: Only return the largest groups
+            rated_only: Only count books rated above 0
+        """
+        mask = self.frame["author"] != ""
+        if rated_only:
+            mask &= self.frame["rating"] > 0
+        return _grouped(self.frame[mask], "author", limit)
+
+    def by_genre(self, limit: Optional[int] = None) -> list[BookTotals]:
+        """Totals per genre, each book counted once per genre."""
+        genres = self.snapshot.genres
+        return _grouped(genres[genres.index.isin(self.frame.index)], "key", limit)
+
+    def rating_counts(self) -> dict[int, int]:
+        """Number of rated books per rating, in rating order."""
+        counts = self.frame["rating"].dropna().astype("int64").value_counts().sort_index()
+        return {int(rating): int(count) for rating, count in counts.items()}
+
+    def top_rated(self, limit: int) -> list[BookRow]:
+        """Highest rated books, longer books first among equals."""
+        rated = self.frame[self.frame["rating"] > 0]
+        order = rated.assign(_pages=rated["page_count"].fillna(0)).sort_values(
+            ["rating", "_pages"], ascending=False, kind="stable"
+        )
+        return _rows(order.head(limit))
+
+    def extreme(self, kind: str) -> Optional[BookRow]:
+        """The longest, shortest, first or last finished book."""
+        frame = self.frame
+        if kind in ("longest", "shortest"):
+            frame = frame[frame["page_count"] > 0]
+            frame = frame.sort_values("page_count", ascending=kind == "shortest", kind="stable")
+        elif kind in ("first", "last"):
+            frame = frame[frame["date_finished"].notna() & (frame["date_finished"] != "")]
+            frame = frame.sort_values("date_finished", ascending=kind == "first", kind="stable")
+        else:
+            return None
+        rows = _rows(frame.head(1))
+        return rows[0] if rows else None
@@ -0,0 +1,259 @@
+"""Streak engine over runs of consecutive reading days.
+
+Reading days are kept as sorted, non-overlapping runs of consecutive
+days rather than as the days themselves, with the runs also bucketed by
+length. That makes the usual updates and questions cheap:
+
+- adding the day after the latest run extends it, and a later day
+  starts a new run, both in O(1);
+- a backfilled past day is found by bisection and extends, starts or
+  merges the runs around it; removing a day splits its run;
+- the current streak is the run reaching today, found by bisection,
+  and the longest and top-N streaks are read off the length buckets,
+  without rescanning days.
+
+Every streak calculation - the streak manager, progress stats, report
+heatmaps and year-in-review - goes through ``StreakEngine`` so they all
+agree.
+"""
+
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Iterable, Optional, Union
+
+ONE_DAY = timedelta(days=1)
+
+Day = Union[date, str]
+
+
+def _as_date(day: Day) -> date:
+    return date.fromisoformat(day) if isinstance(day, str) else day
+
+
+@dataclass(frozen=True)
+class Run:
+    """A streak: consecutive reading days from start to end, inclusive."""
+
+    start: date
+    end: date
+
+    @property
+    def length(self) -> int:
+        """Number of days in the run."""
+        return (self.end - self.start).days + 1
+
+    def __contains__(self, day: Day) -> bool:
+        return self.start <= _as_date(day) <= self.end
+
+
+class StreakEngine:
+    """Reading days as runs of consecutive days.
+
+    Days are dates or ISO date strings. Adding a day that is already
+    present, or removing one that isn't, changes nothing.
+    """
+
+    def __init__(self, days: Iterable[Day] = ()):
+        """Initialize the engine.
+
+        Args:
+            days: Reading days to start with, in any order
+        """
+        self._starts: list[date] = []
+        self._ends: list[date] = []
+        self._by_length: dict[int, set[date]] = defaultdict(set)
+        self._longest = 0
+        self._days = 0
+        for day in sorted({_as_date(day) for day in days}):
+            self.add(day)
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def add(self, day: Day) -> tuple[Run, list[Run]]:
+        """Add a reading day.
+
+        Args:
+            day: The day read
+
+        Returns:
+            The run now holding the day, and the runs it replaced
+            (the runs it extended or merged; empty for a new run or a
+            day already present)
+        """
+        day = _as_date(day)
+
+        # The common case: today, or the day after the latest run
+        if not self._starts or day > self._ends[-1] + ONE_DAY:
+            return self._append_run(day, day), []
+        if day == self._ends[-1] + ONE_DAY:
+            old = self._run(len(self._starts) - 1)
+            return self._set_run(len(self._starts) - 1, old.start, day), [old]
+
+        # A backfilled past day
+        i = bisect_right(self._starts, day) - 1
+        if i >= 0 and day <= self._ends[i]:
+            return self._run(i), []
+
+        joins_prev = i >= 0 and self._ends[i] + ONE_DAY == day
+        joins_next = i + 1 < len(self._starts) and self._starts[i + 1] - ONE_DAY == day
+
+        if joins_prev and joins_next:
+            prev, nxt = self._run(i), self._run(i + 1)
+            merged = self._set_run(i, prev.start, nxt.end)
+            self._delete_run(i + 1)
+            return merged, [prev, nxt]
+        if joins_prev:
+            prev = self._run(i)
+            return self._set_run(i, prev.start, day), [prev]
+        if joins_next:
+            nxt = self._run(i + 1)
+            return self._set_run(i + 1, day, nxt.end), [nxt]
+        return self._insert_run(i + 1, day, day), []
+
+    def discard(self, day: Day) -> tuple[list[Run], Optional[Run]]:
+        """Remove a reading day, splitting its run.
+
+        Args:
+            day: The day no longer read
+
+        Returns:
+            The runs left where the day's run was (none, one or two),
+            and the run the day was removed from (None if it wasn't
+            a reading day)
+        """
+        day = _as_date(day)
+        i = bisect_right(self._starts, day) - 1
+        if i < 0 or day > self._ends[i]:
+            return [], None
+
+        old = self._run(i)
+        self._delete_run(i)
+        left = []
+        if old.start < day:
+            left.append(self._insert_run(i, old.start, day - ONE_DAY))
+            i += 1
+        if day < old.end:
+            left.append(self._insert_run(i, day + ONE_DAY, old.end))
+        return left, old
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Number of runs."""
+        return len(self._starts)
+
+    def __contains__(self, day: Day) -> bool:
+        return self.run_at(day) is not None
+
+    @property
+    def total_days(self) -> int:
+        """Number of reading days."""
+        return self._days
+
+    def runs(self) -> list[Run]:
+        """All runs, oldest first."""
+        return [Run(start, end) for start, end in zip(self._starts, self._ends)]
+
+    def last(self) -> Optional[Run]:
+        """The most recent run."""
+        return self._run(len(self._starts) - 1) if self._starts else None
+
+    def run_at(self, day: Day) -> Optional[Run]:
+        """The run a day belongs to, if it is a reading day."""
+        day = _as_date(day)
+        i = bisect_right(self._starts, day) - 1
+        if i >= 0 and day <= self._ends[i]:
+            return self._run(i)
+        return None
+
+    def current(self, as_of: Optional[Day] = None) -> Optional[Run]:
+        """The streak still going on a day.
+
+        A streak is current if it reaches the day, or the day before
+        (there's still time to read). Days after ``as_of`` aren't
+        counted.
+
+        Args:
+            as_of: Day to look from (default: today)
+
+        Returns:
+            The current run, cut off at ``as_of``, or None
+        """
+        as_of = _as_date(as_of) if as_of else date.today()
+        run = self.run_at(as_of) or self.run_at(as_of - ONE_DAY)
+        if run is None:
+            return None
+        return Run(run.start, min(run.end, as_of))
+
+    def longest(self) -> Optional[Run]:
+        """The longest run; the earliest of equally long ones."""
+        top = self.top(1)
+        return top[0] if top else None
+
+    def top(self, n: int) -> list[Run]:
+        """The n longest runs, longest first, then oldest first."""
+        # Removing runs can leave the longest length stale
+        while self._longest and self._longest not in self._by_length:
+            self._longest -= 1
+
+        result: list[Run] = []
+        length = self._longest
+        while length > 0 and len(result) < n:
+            for start in sorted(self._by_length.get(length, ())):
+                result.append(Run(start, start + timedelta(days=length - 1)))
+                if len(result) == n:
+                    break
+            length -= 1
+        return result
+
+    # -------------------------------------------------------------------------
+    # Run bookkeeping
+    # -------------------------------------------------------------------------
+
+    def _run(self, i: int) -> Run:
+        return Run(self._starts[i], self._ends[i])
+
+    def _index(self, start: date, end: date) -> None:
+        length = (end - start).days + 1
+        self._by_length[length].add(start)
+        self._longest = max(self._longest, length)
+        self._days += length
+
+    def _unindex(self, start: date, end: date) -> None:
+        length = (end - start).days + 1
+        bucket = self._by_length[length]
+        bucket.discard(start)
+        if not bucket:
+            del self._by_length[length]
+        self._days -= length
+
+    def _append_run(self, start: date, end: date) -> Run:
+        self._starts.append(start)
+        self._ends.append(end)
+        self._index(start, end)
+        return Run(start, end)
+
+    def _insert_run(self, i: int, start: date, end: date) -> Run:
+        self._starts.insert(i, start)
+        self._ends.insert(i, end)
+        self._index(start, end)
+        return Run(start, end)
+
+    def _set_run(self, i: int, start: date, end: date) -> Run:
+        old_start, old_end = self._starts[i], self._ends[i]
+        self._starts[i] = start
+        self._ends[i] = end
+        self._unindex(old_start, old_end)
+        self._index(start, end)
+        return Run(start, end)
+
+    def _delete_run(self, i: int) -> None:
+        self._unindex(self._starts[i], self._ends[i])
+        del self._starts[i]
+        del self._ends[i]
@@ -1,12 +1,13 @@
 """Streak manager for reading streaks and habits operations."""
 
-from collections import defaultdict
 from datetime import datetime, timezone, date, timedelta
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import delete, select, func, and_, or_
+from sqlalchemy.orm import Session
 
 from ..db.sqlite import Database, get_db
+from .engine import Run, StreakEngine
 from .models import ReadingStreak, DailyReading
 from .schemas import (
     StreakStatus,
@@ -19,6 +20,11 @@ from .schemas import (
     StreakCalendar,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from ..stats.snapshot import LibrarySnapshot
+
 
 # Milestone definitions
 MILESTONES = [
@@ -34,16 +40,147 @@ MILESTONES = [
 ]
 
 
+# Days with reading logged, as opposed to only a goal set
+IS_READING_DAY = or_(
+    DailyReading.sessions_count > 0,
+    DailyReading.minutes_read > 0,
+    DailyReading.pages_read > 0,
+)
+
+
+WEEKDAY_NAMES = ["Monday", "Tuesday", "Wednesday", "Thursday",
+                 "Friday", "Saturday", "Sunday"]
+
+
+def _trend(recent: float, older: float) -> str:
+    if recent > older * 1.1:
+        return "increasing"
+    if recent < older * 0.9:
+        return "decreasing"
+    return "stable"
+
+
+def _reading_habits(
+    days: "np.ndarray",
+    weekdays: "np.ndarray",
+    minutes: "np.ndarray",
+    pages: "np.ndarray",
+    hours: "np.ndarray",
+) -> ReadingHabits:
+    """Reading habits from daily readings given as parallel arrays.
+
+    Args:
+        days: Reading dates (datetime64[D])
+        weekdays: Weekday of each reading (0=Monday)
+        minutes: Minutes read
+        pages: Pages read
+        hours: Primary reading hour, NaN if unknown
+    """
+    import numpy as np
+
+    total = len(days)
+
+    # Weekday analysis
+    on_weekday = (weekdays >= 0) & (weekdays < 7)
+    wd = weekdays[on_weekday].astype(np.int64)
+    day_counts = np.bincount(wd, minlength=7)
+    minute_sums = np.bincount(wd, weights=minutes[on_weekday], minlength=7).astype(np.int64)
+    page_sums = np.bincount(wd, weights=pages[on_weekday], minlength=7).astype(np.int64)
+    read_on = day_counts > 0
+    avg_minutes = np.divide(minute_sums, day_counts, out=np.zeros(7), where=read_on)
+    avg_pages = np.divide(page_sums, day_counts, out=np.zeros(7), where=read_on)
+    frequency = day_counts / max(total / 7, 1) * 100
+
+    weekday_stats = [
+        WeekdayStats(
+            weekday=i,
+            weekday_name=WEEKDAY_NAMES[i],
+            total_days=int(day_counts[i]),
+            total_minutes=int(minute_sums[i]),
+            total_pages=int(page_sums[i]),
+            average_minutes=round(float(avg_minutes[i]), 1),
+            average_pages=round(float(avg_pages[i]), 1),
+            reading_frequency=round(float(frequency[i]), 1),
+        )
+        for i in range(7)
+    ]
+
+    best_weekday = None
+    worst_weekday = None
+    if read_on.any():
+        best = int(np.argmax(np.where(read_on, avg_minutes, -np.inf)))
+        if avg_minutes[best] > 0:
+            best_weekday = WEEKDAY_NAMES[best]
+        worst_weekday = WEEKDAY_NAMES[int(np.argmin(np.where(read_on, avg_minutes, np.inf)))]
+
+    # Hourly analysis
+    known_hours = hours[~np.isnan(hours)].astype(np.int64)
+    total_sessions = len(known_hours) or 1
+    hour_counts = np.bincount(
+        known_hours[(known_hours >= 0) & (known_hours < 24)], minlength=24
+    )
+    best_hour = int(np.argmax(hour_counts)) if hour_counts.any() else None
+    hourly_stats = [
+        HourlyStats(
+            hour=int(hour),
+            sessions_count=int(hour_counts[hour]),
+            percentage=round(float(hour_counts[hour] / total_sessions * 100), 1),
+        )
+        for hour in np.flatnonzero(hour_counts)
+    ]
+
+    # Consistency and trends (last week vs the week before)
+    today = np.datetime64(date.today(), "D")
+    week_ago = today - 7
+    this_week = days >= week_ago
+    this_month = days >= today - 30
+    last_week = (days < week_ago) & (days >= today - 14)
+    consistency = this_month.sum() / 30 * 100 if total else 0
+
+    recent_days = max(int(this_week.sum()), 1)
+    older_days = max(int(last_week.sum()), 1)
+
+    return ReadingHabits(
+        most_productive_weekday=best_weekday,
+        most_productive_hour=best_hour,
+        least_productive_weekday=worst_weekday,
+        weekday_stats=weekday_stats,
+        hourly_distribution=hourly_stats,
+        reading_days_this_week=int(this_week.sum()),
+        reading_days_this_month=int(this_month.sum()),
+        consistency_score=round(float(consistency), 1),
+        minutes_trend=_trend(
+            minutes[this_week].sum() / recent_days, minutes[last_week].sum() / older_days
+        ),
+        pages_trend=_trend(
+            pages[this_week].sum() / recent_days, pages[last_week].sum() / older_days
+        ),
+    )
+
+
 class StreakManager:
-    """Manages reading streaks and habit tracking."""
+    """Manages reading streaks and habit tracking.
+
+    Streaks come from a ``StreakEngine`` over the reading days, loaded
+    on first use and updated as reading is logged through the manager.
+    The ``reading_streaks`` rows mirror the engine's runs, with the
+    minutes, pages and books read during each.
+    """
 
-    def __init__(self, db: Optional[Database] = None):
+    def __init__(
+        self,
+        db: Optional[Database] = None,
+        snapshot: Optional["LibrarySnapshot"] = None,
+    ):
         """Initialize streak manager.
 
         Args:
             db: Database instance
+            snapshot: Analyze reading habits from this in-memory snapshot
         """
         self.db = db or get_db()
+        self.snapshot = snapshot
+        self._engine: Optional[StreakEngine] = None
 
     # -------------------------------------------------------------------------
     # Daily Reading Management
@@ -230,6 +367,43 @@ class StreakManager:
     # Streak Management
     # -------------------------------------------------------------------------
 
+    def _streak_engine(self, session: Session) -> StreakEngine:
+        """The streak engine, loaded from the reading days on first use.
+
+        Stored streaks that don't match the reading days - e.g. written
+        before backfilled days were merged - are rewritten.
+        """
+        if self._engine is None:
+            stmt = (
+                select(DailyReading.reading_date)
+                .where(IS_READING_DAY)
+                .order_by(DailyReading.reading_date)
+            )
+            self._engine = StreakEngine(session.execute(stmt).scalars())
+
+            stored = {
+                tuple(row)
+                for row in session.execute(select(ReadingStreak.start_date, ReadingStreak.length))
+            }
+            runs = self._engine.runs()
+            if stored != {(run.start.isoformat(), run.length) for run in runs}:
+                session.execute(delete(ReadingStreak))
+                self._save_runs(session, runs)
+        return self._engine
+
+    def rebuild_streaks(self) -> int:
+        """Recompute all streaks from the daily readings.
+
+        Needed after daily readings are written other than through
+        this manager, e.g. restored or imported.
+
+        Returns:
+            Number of streaks
+        """
+        self._engine = None
+        with self.db.get_session() as session:
+            return len(self._streak_engine(session))
+
     def _update_streak(self, reading_date: date) -> None:
         """Update streak after logging reading.
 
@@ -237,74 +411,82 @@ class StreakManager:
             reading_date: Date reading was logged
         """
         with self.db.get_session() as session:
-            # Get current active streak
-            stmt = select(ReadingStreak).where(ReadingStreak.is_current == True)  # noqa: E712
-            current = session.execute(stmt).scalar_one_or_none()
-
-            if current:
-                start = date.fromisoformat(current.start_date)
-                # Check if reading_date extends the streak
-                expected_next = start + timedelta(days=current.length)
-
-                if reading_date == expected_next:
-                    # Extends streak
-                    current.length += 1
-                    daily = self.get_daily_reading(reading_date)
-                    if daily:
-                        current.total_minutes += daily.minutes_read
-                        current.total_pages += daily.pages_read
-                        current.books_completed += daily.books_completed
-                elif reading_date > expected_next:
-                    # Gap - end current streak
-                    current.is_current = False
-                    current.end_date = (expected_next - timedelta(days=1)).isoformat()
-
-                    # Start new streak
-                    daily = self.get_daily_reading(reading_date)
-                    new_streak = ReadingStreak(
-                        start_date=reading_date.isoformat(),
-                        length=1,
-                        is_current=True,
-                        total_minutes=daily.minutes_read if daily else 0,
-                        total_pages=daily.pages_read if daily else 0,
-                        books_completed=daily.books_completed if daily else 0,
-                    )
-                    session.add(new_streak)
-                # If reading_date < expected_next, it's a past day being filled in
-                # Just update the totals if within streak range
-                elif reading_date >= start:
-                    daily = self.get_daily_reading(reading_date)
-                    if daily:
-                        current.total_minutes += daily.minutes_read
-                        current.total_pages += daily.pages_read
-                        current.books_completed += daily.books_completed
-            else:
-                # No current streak - start new one
-                daily = self.get_daily_reading(reading_date)
-                new_streak = ReadingStreak(
-                    start_date=reading_date.isoformat(),
-                    length=1,
-                    is_current=True,
-                    total_minutes=daily.minutes_read if daily else 0,
-                    total_pages=daily.pages_read if daily else 0,
-                    books_completed=daily.books_completed if daily else 0,
+            run, replaced = self._streak_engine(session).add(reading_date)
+            merged = [r.start.isoformat() for r in replaced if r.start != run.start]
+            if merged:
+                session.execute(
+                    delete(ReadingStreak).where(ReadingStreak.start_date.in_(merged))
                 )
-                session.add(new_streak)
+            self._save_runs(session, [run])
+
+    def _save_runs(self, session: Session, runs: list[Run]) -> None:
+        """Write runs to their streak rows, with the reading done during each."""
+        for run in runs:
+            minutes, pages, books = session.execute(
+                select(
+                    func.coalesce(func.sum(DailyReading.minutes_read), 0),
+                    func.coalesce(func.sum(DailyReading.pages_read), 0),
+                    func.coalesce(func.sum(DailyReading.books_completed), 0),
+                ).where(
+                    DailyReading.reading_date >= run.start.isoformat(),
+                    DailyReading.reading_date <= run.end.isoformat(),
+                )
+            ).one()
 
-            session.commit()
+            stmt = select(ReadingStreak).where(ReadingStreak.start_date == run.start.isoformat())
+            streak = session.execute(stmt).scalar_one_or_none()
+            if streak is None:
+                streak = ReadingStreak(start_date=run.start.isoformat())
+                session.add(streak)
+
+            streak.length = run.length
+            streak.total_minutes = minutes
+            streak.total_pages = pages
+            streak.books_completed = books
+            streak.is_current = True
+            streak.end_date = None
+
+        session.flush()
+        self._end_streaks(session)
+
+    def _end_streaks(self, session: Session) -> int:
+        """Mark every streak but the current one as ended."""
+        current = self._engine.current()
+        stmt = select(ReadingStreak).where(ReadingStreak.is_current == True)  # noqa: E712
+        if current:
+            stmt = stmt.where(ReadingStreak.start_date != current.start.isoformat())
+
+        ended = session.execute(stmt).scalars().all()
+        for streak in ended:
+            start = date.fromisoformat(streak.start_date)
+            streak.is_current = False
+            streak.end_date = (start + timedelta(days=streak.length - 1)).isoformat()
+        return len(ended)
+
+    def _streaks_for(self, session: Session, runs: list[Run]) -> list[ReadingStreak]:
+        """The stored streaks for runs, in the runs' order."""
+        starts = [run.start.isoformat() for run in runs]
+        stmt = select(ReadingStreak).where(ReadingStreak.start_date.in_(starts))
+        by_start = {streak.start_date: streak for streak in session.execute(stmt).scalars()}
+        streaks = [by_start[start] for start in starts if start in by_start]
+        for streak in streaks:
+            session.expunge(streak)
+        return streaks
 
     def get_current_streak(self) -> Optional[ReadingStreak]:
         """Get current active streak.
 
+        A streak is current while its last day is today or yesterday.
+
         Returns:
             Current ReadingStreak or None
         """
         with self.db.get_session() as session:
-            stmt = select(ReadingStreak).where(ReadingStreak.is_current == True)  # noqa: E712
-            streak = session.execute(stmt).scalar_one_or_none()
-            if streak:
-                session.expunge(streak)
-            return streak
+            current = self._streak_engine(session).current()
+            if current is None:
+                return None
+            streaks = self._streaks_for(session, [current])
+            return streaks[0] if streaks else None
 
     def get_longest_streak(self) -> Optional[ReadingStreak]:
         """Get longest streak ever.
@@ -312,12 +494,8 @@ class StreakManager:
         Returns:
             Longest ReadingStreak or None
         """
-        with self.db.get_session() as session:
-            stmt = select(ReadingStreak).order_by(ReadingStreak.length.desc()).limit(1)
-            streak = session.execute(stmt).scalar_one_or_none()
-            if streak:
-                session.expunge(streak)
-            return streak
+        streaks = self.get_all_streaks(limit=1)
+        return streaks[0] if streaks else None
 
     def get_all_streaks(self, limit: int = 10) -> list[ReadingStreak]:
         """Get all streaks, ordered by length.
@@ -329,15 +507,8 @@ class StreakManager:
             List of ReadingStreak
         """
         with self.db.get_session() as session:
-            stmt = (
-                select(ReadingStreak)
-                .order_by(ReadingStreak.length.desc())
-                .limit(limit)
-            )
-            streaks = session.execute(stmt).scalars().all()
-            for streak in streaks:
-                session.expunge(streak)
-            return list(streaks)
+            top = self._streak_engine(session).top(limit)
+            return self._streaks_for(session, top)
 
     def get_streak_status(self) -> StreakStatus:
         """Get current streak status.
@@ -345,25 +516,16 @@ class StreakManager:
         Returns:
             StreakStatus indicating current state
         """
-        current = self.get_current_streak()
-        if not current:
-            return StreakStatus.ENDED
+        with self.db.get_session() as session:
+            engine = self._streak_engine(session)
 
-        # Check if we've read today
-        today = date.today()
-        today_reading = self.get_daily_reading(today)
+        if engine.current() is None:
+            return StreakStatus.ENDED
 
-        if today_reading and today_reading.minutes_read > 0:
+        if date.today() in engine:
             return StreakStatus.ACTIVE
 
-        # Check if streak is still valid (read yesterday)
-        start = date.fromisoformat(current.start_date)
-        expected_days = (today - start).days + 1
-
-        if current.length >= expected_days - 1:
-            return StreakStatus.AT_RISK  # Haven't read today yet
-
-        return StreakStatus.ENDED
+        return StreakStatus.AT_RISK  # Read yesterday, not yet today
 
     def check_and_end_streak(self) -> bool:
         """Check if current streak should end and end it if needed.
@@ -371,32 +533,9 @@ class StreakManager:
         Returns:
             True if streak was ended
         """
-        current = self.get_current_streak()
-        if not current:
-            return False
-
-        today = date.today()
-        yesterday = today - timedelta(days=1)
-
-        # Check if we read yesterday
-        yesterday_reading = self.get_daily_reading(yesterday)
-
-        if not yesterday_reading or yesterday_reading.minutes_read == 0:
-            # Streak broken - check when last reading was
-            start = date.fromisoformat(current.start_date)
-            last_day = start + timedelta(days=current.length - 1)
-
-            if last_day < yesterday:
-                with self.db.get_session() as session:
-                    stmt = select(ReadingStreak).where(ReadingStreak.id == current.id)
-                    streak = session.execute(stmt).scalar_one_or_none()
-                    if streak:
-                        streak.is_current = False
-                        streak.end_date = last_day.isoformat()
-                        session.commit()
-                return True
-
-        return False
+        with self.db.get_session() as session:
+            self._streak_engine(session)
+            return self._end_streaks(session) > 0
 
     # -------------------------------------------------------------------------
     # Statistics
@@ -409,10 +548,7 @@ class StreakManager:
             StreakStats with all stats
         """
         with self.db.get_session() as session:
-            # Count streaks
-            total_streaks = session.execute(
-                select(func.count()).select_from(ReadingStreak)
-            ).scalar() or 0
+            engine = self._streak_engine(session)
 
             # Total reading days
             total_reading_days = session.execute(
@@ -420,9 +556,7 @@ class StreakManager:
             ).scalar() or 0
 
             # Average streak length
-            avg_streak = session.execute(
-                select(func.avg(ReadingStreak.length))
-            ).scalar() or 0
+            avg_streak = engine.total_days / len(engine) if len(engine) else 0
 
             # Average daily stats
             avg_minutes = session.execute(
@@ -454,7 +588,7 @@ class StreakManager:
         return StreakStats(
             current_streak=current.length if current else 0,
             longest_streak=longest.length if longest else 0,
-            total_streaks=total_streaks,
+            total_streaks=len(engine),
             total_reading_days=total_reading_days,
             streak_status=status,
             current_streak_start=(
@@ -476,139 +610,45 @@ class StreakManager:
     # -------------------------------------------------------------------------
 
     def get_reading_habits(self) -> ReadingHabits:
-        """Analyze reading habits.
+        """Analyze reading habits over the last 365 daily readings.
 
         Returns:
             ReadingHabits with analysis
         """
-        readings = self.get_reading_history(limit=365)
-
-        # Weekday analysis
-        weekday_data = defaultdict(lambda: {"days": 0, "minutes": 0, "pages": 0})
-        hourly_data = defaultdict(int)
-
-        for reading in readings:
-            wd = reading.weekday
-            weekday_data[wd]["days"] += 1
-            weekday_data[wd]["minutes"] += reading.minutes_read
-            weekday_data[wd]["pages"] += reading.pages_read
-
-            if reading.primary_hour is not None:
-                hourly_data[reading.primary_hour] += 1
-
-        # Build weekday stats
-        weekday_names = ["Monday", "Tuesday", "Wednesday", "Thursday",
-                         "Friday", "Saturday", "Sunday"]
-        weekday_stats = []
-        best_weekday = None
-        best_weekday_avg = 0
-        worst_weekday = None
-        worst_weekday_avg = float("inf")
-
-        for wd in range(7):
-            data = weekday_data[wd]
-            days = data["days"]
-            if days > 0:
-                avg_min = data["minutes"] / days
-                avg_pages = data["pages"] / days
-
-                if avg_min > best_weekday_avg:
-                    best_weekday_avg = avg_min
-                    best_weekday = weekday_names[wd]
-                if avg_min < worst_weekday_avg:
-                    worst_weekday_avg = avg_min
-                    worst_weekday = weekday_names[wd]
-
-                weekday_stats.append(WeekdayStats(
-                    weekday=wd,
-                    weekday_name=weekday_names[wd],
-                    total_days=days,
-                    total_minutes=data["minutes"],
-                    total_pages=data["pages"],
-                    average_minutes=round(avg_min, 1),
-                    average_pages=round(avg_pages, 1),
-                    reading_frequency=round(days / max(len(readings) / 7, 1) * 100, 1),
-                ))
-            else:
-                weekday_stats.append(WeekdayStats(
-                    weekday=wd,
-                    weekday_name=weekday_names[wd],
-                    total_days=0,
-                    total_minutes=0,
-                    total_pages=0,
-                    average_minutes=0,
-                    average_pages=0,
-                    reading_frequency=0,
-                ))
-
-        # Build hourly stats
-        total_sessions = sum(hourly_data.values()) or 1
-        hourly_stats = []
-        best_hour = None
-        best_hour_count = 0
-
-        for hour in range(24):
-            count = hourly_data[hour]
-            if count > best_hour_count:
-                best_hour_count = count
-                best_hour = hour
-            if count > 0:
-                hourly_stats.append(HourlyStats(
-                    hour=hour,
-                    sessions_count=count,
-                    percentage=round(count / total_sessions * 100, 1),
-                ))
-
-        # Calculate consistency
-        today = date.today()
-        week_ago = today - timedelta(days=7)
-        month_ago = today - timedelta(days=30)
-
-        week_readings = [r for r in readings
-                        if date.fromisoformat(r.reading_date) >= week_ago]
-        month_readings = [r for r in readings
-                         if date.fromisoformat(r.reading_date) >= month_ago]
-
-        # Consistency score (percentage of days with reading in last 30 days)
-        consistency = len(month_readings) / 30 * 100 if readings else 0
-
-        # Trends (compare last 2 weeks)
-        two_weeks_ago = today - timedelta(days=14)
-        recent = [r for r in readings if date.fromisoformat(r.reading_date) >= week_ago]
-        older = [r for r in readings
-                 if week_ago > date.fromisoformat(r.reading_date) >= two_weeks_ago]
-
-        recent_avg = sum(r.minutes_read for r in recent) / max(len(recent), 1)
-        older_avg = sum(r.minutes_read for r in older) / max(len(older), 1)
-
-        if recent_avg > older_avg * 1.1:
-            minutes_trend = "increasing"
-        elif recent_avg < older_avg * 0.9:
-            minutes_trend = "decreasing"
-        else:
-            minutes_trend = "stable"
-
-        recent_pages = sum(r.pages_read for r in recent) / max(len(recent), 1)
-        older_pages = sum(r.pages_read for r in older) / max(len(older), 1)
-
-        if recent_pages > older_pages * 1.1:
-            pages_trend = "increasing"
-        elif recent_pages < older_pages * 0.9:
-            pages_trend = "decreasing"
-        else:
-            pages_trend = "stable"
-
-        return ReadingHabits(
-            most_productive_weekday=best_weekday,
-            most_productive_hour=best_hour,
-            least_productive_weekday=worst_weekday,
-            weekday_stats=weekday_stats,
-            hourly_distribution=hourly_stats,
-            reading_days_this_week=len(week_readings),
-            reading_days_this_month=len(month_readings),
-            consistency_score=round(consistency, 1),
-            minutes_trend=minutes_trend,
-            pages_trend=pages_trend,
+        import numpy as np
+
+        if self.snapshot is not None:
+            daily = self.snapshot.daily.tail(365)
+            return _reading_habits(
+                daily["day"].to_numpy("datetime64[D]"),
+                daily["weekday"].to_numpy(),
+                daily["minutes_read"].to_numpy(),
+                daily["pages_read"].to_numpy(),
+                daily["primary_hour"].to_numpy(),
+            )
+
+        with self.db.get_session() as session:
+            rows = session.execute(
+                select(
+                    DailyReading.reading_date,
+                    DailyReading.weekday,
+                    DailyReading.minutes_read,
+                    DailyReading.pages_read,
+                    DailyReading.primary_hour,
+                )
+                .order_by(DailyReading.reading_date.desc())
+                .limit(365)
+            ).all()
+
+        return _reading_habits(
+            np.array([row.reading_date for row in rows], dtype="datetime64[D]"),
+            np.array([row.weekday or 0 for row in rows], dtype=np.int64),
+            np.array([row.minutes_read or 0 for row in rows], dtype=np.int64),
+            np.array([row.pages_read or 0 for row in rows], dtype=np.int64),
+            np.array(
+                [np.nan if row.primary_hour is None else row.primary_hour for row in rows],
+                dtype=np.float64,
+            ),
         )
 
     def get_milestones(self) -> list[StreakMilestone]:
@@ -674,6 +714,9 @@ class StreakManager:
             for r in readings
         }
 
+        with self.db.get_session() as session:
+            engine = self._streak_engine(session)
+
         days = {}
         streak_days = {}
         total_minutes = 0
@@ -688,20 +731,9 @@ class StreakManager:
                 total_minutes += reading.minutes_read
                 total_pages += reading.pages_read
 
-            # Calculate streak length at this day
-            if has_reading:
-                streak_count = 1
-                check_date = date(year, month, day) - timedelta(days=1)
-                while True:
-                    prev_reading = self.get_daily_reading(check_date)
-                    if prev_reading and prev_reading.minutes_read > 0:
-                        streak_count += 1
-                        check_date -= timedelta(days=1)
-                    else:
-                        break
-                streak_days[day] = streak_count
-            else:
-                streak_days[day] = 0
+            # Streak length at this day
+            run = engine.run_at(date(year, month, day)) if has_reading else None
+            streak_days[day] = (date(year, month, day) - run.start).days + 1 if run else 0
 
         return StreakCalendar(
             year=year,
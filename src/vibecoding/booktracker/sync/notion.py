@@ -4,6 +4,7 @@ Handles all Notion API interactions with proper error handling,
 rate limiting, and data mapping between local and Notion schemas.
 """
 
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -36,6 +37,46 @@ class NotionRateLimitError(NotionError):
         super().__init__(f"Rate limited. Retry after {retry_after}s")
 
 
+# Notion's documented average request budget per integration
+NOTION_REQUESTS_PER_SECOND = 3.0
+
+
+class RateLimiter:
+    """Thread-safe token bucket shared by every request a client makes.
+
+    Tokens refill at ``rate`` per second up to ``burst``; each request
+    takes one. ``defer`` stops all callers for a while, e.g. for the
+    Retry-After of a 429 response.
+    """
+
+    def __init__(self, rate: float = NOTION_REQUESTS_PER_SECOND, burst: int = 3):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if now >= self._blocked_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._blocked_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(wait)
+
+    def defer(self, seconds: float) -> None:
+        """Hold back every caller for ``seconds`` and drain the bucket."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+
 @dataclass
 class NotionPage:
     """Represents a Notion page (book record)."""
@@ -129,20 +170,19 @@ class NotionClient:
             raise NotionConfigError("NOTION_DATABASE_ID not set")
 
         self._client = Client(auth=self.api_key)
-        self._last_request_time = 0.0
-        self._min_request_interval = 0.35  # ~3 requests per second (Notion limit)
+        # Shared by all threads using this client, so concurrent pushes
+        # stay within Notion's budget together
+        self.rate_limiter = RateLimiter()
 
     def _rate_limit(self) -> None:
         """Enforce rate limiting between requests."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self._min_request_interval:
-            time.sleep(self._min_request_interval - elapsed)
-        self._last_request_time = time.time()
+        self.rate_limiter.acquire()
 
     def _handle_api_error(self, e: APIResponseError) -> None:
         """Handle Notion API errors."""
         if e.status == 429:
             retry_after = int(e.headers.get("Retry-After", 1))
+            self.rate_limiter.defer(retry_after)
             raise NotionRateLimitError(retry_after)
         # Message is stored in args[0], not as .message attribute
         error_msg = str(e.args[0]) if e.args else "Unknown error"
@@ -161,30 +201,59 @@ class NotionClient:
         Returns:
             List of NotionPage objects
         """
-        books = []
-        start_cursor = None
+        return self._query_books(None, page_size)
 
-        while True:
-            self._rate_limit()
-            try:
-                response = self._client.data_sources.query(
-                    data_source_id=self.database_id,
-                    page_size=page_size,
-                    start_cursor=start_cursor,
-                )
-            except APIResponseError as e:
-                self._handle_api_error(e)
-                raise
+    def query_books_page(
+        self,
+        since: Optional[datetime] = None,
+        start_cursor: Optional[str] = None,
+        page_size: int = 100,
+    ) -> tuple[list[NotionPage], Optional[str]]:
+        """Query one page of books from the Notion database.
+
+        Args:
+            since: Only return books modified after this time
+            start_cursor: Cursor returned by the previous call
+            page_size: Number of results per page (max 100)
 
-            for page in response.get("results", []):
-                books.append(NotionPage.from_api_response(page))
+        Returns:
+            (books, next_cursor); next_cursor is None after the last page
+        """
+        query: dict[str, Any] = {}
+        if since:
+            query["filter"] = {
+                "timestamp": "last_edited_time",
+                "last_edited_time": {
+                    "after": since.isoformat(),
+                },
+            }
 
-            if not response.get("has_more"):
-                break
+        self._rate_limit()
+        try:
+            response = self._client.data_sources.query(
+                data_source_id=self.database_id,
+                page_size=page_size,
+                start_cursor=start_cursor,
+                **query,
+            )
+        except APIResponseError as e:
+            self._handle_api_error(e)
+            raise
+
+        books = [NotionPage.from_api_response(page) for page in response.get("results", [])]
+        next_cursor = response.get("next_cursor") if response.get("has_more") else None
+        return books, next_cursor
 
-            start_cursor = response.get("next_cursor")
+    def _query_books(self, since: Optional[datetime], page_size: int) -> list[NotionPage]:
+        """Query every page of books, following cursors."""
+        books: list[NotionPage] = []
+        start_cursor = None
 
-        return books
+        while True:
+            batch, start_cursor = self.query_books_page(since, start_cursor, page_size)
+            books.extend(batch)
+            if start_cursor is None:
+                return books
 
     def get_page(self, page_id: str) -> NotionPage:
         """Get a single page by ID.
@@ -215,36 +284,7 @@ class NotionClient:
         Returns:
             List of NotionPage objects
         """
-        books = []
-        start_cursor = None
-
-        while True:
-            self._rate_limit()
-            try:
-                response = self._client.data_sources.query(
-                    data_source_id=self.database_id,
-                    page_size=page_size,
-                    start_cursor=start_cursor,
-                    filter={
-                        "timestamp": "last_edited_time",
-                        "last_edited_time": {
-                            "after": since.isoformat(),
-                        },
-                    },
-                )
-            except APIResponseError as e:
-                self._handle_api_error(e)
-                raise
-
-            for page in response.get("results", []):
-                books.append(NotionPage.from_api_response(page))
-
-            if not response.get("has_more"):
-                break
-
-            start_cursor = response.get("next_cursor")
-
-        return books
+        return self._query_books(since, page_size)
 
     # ========================================================================
     # Create Operations
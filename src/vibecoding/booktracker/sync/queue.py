@@ -5,12 +5,14 @@ and conflict handling.
 """
 
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
+from sqlalchemy import select
 from tqdm import tqdm
 
 from ..db.models import Book, SyncQueueItem
@@ -45,6 +47,75 @@ class SyncResult:
         return len(self.errors) == 0
 
 
+@dataclass
+class _PushJob:
+    """A queue item waiting on a Notion request.
+
+    ``request`` runs on a worker thread. ``on_done`` receives its response
+    back on the calling thread, does the local bookkeeping and may return
+    a follow-up job.
+    """
+
+    item: SyncQueueItem
+    title: str
+    request: Callable[[], Any]
+    on_done: Callable[[Any], Optional["_PushJob"]]
+
+
+class _PullIndex:
+    """Local book IDs by Notion page ID and by ISBN, built once per pull."""
+
+    def __init__(self):
+        self.by_page_id: dict[str, str] = {}
+        self.by_isbn: dict[str, str] = {}
+
+    @classmethod
+    def build(cls, db: Database) -> "_PullIndex":
+        """Load the lookup keys of every local book."""
+        index = cls()
+        with db.get_session() as session:
+            rows = session.execute(select(Book.id, Book.notion_page_id, Book.isbn, Book.isbn13))
+            for book_id, page_id, isbn, isbn13 in rows:
+                index.add(book_id, page_id, isbn, isbn13)
+        return index
+
+    def add(
+        self,
+        book_id: str,
+        page_id: Optional[str],
+        isbn: Optional[str] = None,
+        isbn13: Optional[str] = None,
+    ) -> None:
+        """Record a book's keys; an existing page ID mapping is replaced."""
+        if page_id:
+            self.by_page_id[page_id] = book_id
+        for key in (isbn, isbn13):
+            if key:
+                self.by_isbn.setdefault(key, book_id)
+
+    def find(
+        self, page_id: str, isbn: Optional[str], isbn13: Optional[str]
+    ) -> Optional[str]:
+        """Book ID for a page: by page ID first, then ISBN, then ISBN-13."""
+        book_id = self.by_page_id.get(page_id)
+        if book_id:
+            return book_id
+        for key in (isbn, isbn13):
+            if key and key in self.by_isbn:
+                return self.by_isbn[key]
+        return None
+
+
+# Sync state stream for pulls from the Notion books database
+NOTION_BOOKS_STREAM = "notion_books"
+
+# Incremental pulls look back this far past the last high-water mark, as
+# Notion rounds last_edited_time to the minute; page versions skip repeats
+PULL_OVERLAP = timedelta(minutes=2)
+
+# Notion requests in flight while pushing; the client's rate limiter sets the pace
+DEFAULT_PUSH_WORKERS = 4
+
 console = Console()
 
 
@@ -75,12 +146,16 @@ class SyncProcessor:
         self,
         interactive: bool = True,
         show_progress: bool = True,
+        workers: int = DEFAULT_PUSH_WORKERS,
+        full: bool = False,
     ) -> SyncResult:
         """Perform full sync: push local changes, pull Notion changes.
 
         Args:
             interactive: Prompt for conflict resolution
             show_progress: Show progress indicators
+            workers: Concurrent Notion requests when pushing
+            full: Pull every Notion page instead of changes since the last sync
 
         Returns:
             SyncResult with statistics
@@ -89,13 +164,17 @@ class SyncProcessor:
 
         # Step 1: Push pending local changes to Notion
         console.print("\n[bold]Pushing local changes to Notion...[/bold]")
-        push_result = self.push_pending(interactive=interactive, show_progress=show_progress)
+        push_result = self.push_pending(
+            interactive=interactive, show_progress=show_progress, workers=workers
+        )
         result.pushed = push_result.pushed
         result.errors.extend(push_result.errors)
 
         # Step 2: Pull changes from Notion
         console.print("\n[bold]Pulling changes from Notion...[/bold]")
-        pull_result = self.pull_changes(interactive=interactive, show_progress=show_progress)
+        pull_result = self.pull_changes(
+            interactive=interactive, show_progress=show_progress, full=full
+        )
         result.pulled = pull_result.pulled
         result.conflicts = pull_result.conflicts
         result.skipped = pull_result.skipped
@@ -107,83 +186,164 @@ class SyncProcessor:
         self,
         interactive: bool = True,
         show_progress: bool = True,
+        workers: int = DEFAULT_PUSH_WORKERS,
     ) -> SyncResult:
         """Push pending local changes to Notion.
 
-        Processes the sync queue and applies changes to Notion.
+        Claims the pending sync queue items, so a concurrent run leaves
+        them alone, and applies them to Notion. Up to
+        ``workers`` Notion requests are in flight at once while the next
+        queue items are read locally; the client's shared rate limiter
+        keeps them within Notion's request budget together. Database
+        writes and conflict prompts stay on the calling thread.
 
         Args:
             interactive: Prompt for conflict resolution
             show_progress: Show progress bar
+            workers: Concurrent Notion requests
 
         Returns:
             SyncResult with push statistics
         """
         result = SyncResult()
-        pending_items = self.db.get_pending_sync_items()
+        claimed = self.db.claim_sync_items()
 
-        if not pending_items:
+        if not claimed:
             console.print("[dim]No pending changes to push.[/dim]")
             return result
 
-        iterator = tqdm(pending_items, desc="Pushing", disable=not show_progress)
+        # Items that need no Notion request are finished in one UPDATE
+        local_only = {
+            item.id
+            for item in claimed
+            if item.entity_type != "book" or item.operation == SyncOperation.DELETE.value
+        }
+        self.db.mark_sync_items_completed(local_only)
+        pending_items = [item for item in claimed if item.id not in local_only]
 
-        for item in iterator:
-            try:
-                self._process_queue_item(item, result, interactive)
-            except Exception as e:
-                result.errors.append((item.entity_id, str(e)))
+        try:
+            self._push_items(pending_items, result, interactive, show_progress, workers)
+        finally:
+            # Hand back whatever wasn't completed or failed (skipped conflicts,
+            # local errors, an interrupted run)
+            self.db.release_sync_items(item.id for item in pending_items)
 
         return result
 
-    def _process_queue_item(
+    def _push_items(
         self,
-        item: SyncQueueItem,
+        pending_items: list[SyncQueueItem],
         result: SyncResult,
         interactive: bool,
+        show_progress: bool,
+        workers: int,
     ) -> None:
-        """Process a single sync queue item.
+        """Run claimed queue items through the concurrent push pipeline."""
+        if not pending_items:
+            return
+
+        items = iter(pending_items)
+        in_flight: dict[Future, _PushJob] = {}
+        progress = tqdm(total=len(pending_items), desc="Pushing", disable=not show_progress)
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+
+            def advance(item: SyncQueueItem, step: Callable[[], Optional[_PushJob]]) -> None:
+                """Run a local step for an item and send any request it needs."""
+                try:
+                    # One transaction per step: a Notion page ID and its queue
+                    # status are recorded together
+                    with self.db.batch():
+                        job = step()
+                except Exception as e:
+                    result.errors.append((item.entity_id, str(e)))
+                    job = None
+
+                if job is None:
+                    progress.update()
+                else:
+                    in_flight[pool.submit(self._with_retry, job.request)] = job
+
+            def fill() -> None:
+                """Prepare items ahead so local reads overlap network waits."""
+                while len(in_flight) < workers * 2:
+                    item = next(items, None)
+                    if item is None:
+                        return
+                    advance(item, lambda: self._prepare_push(item, result, interactive))
+
+            fill()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = in_flight.pop(future)
+                    try:
+                        response = future.result()
+                    except NotionError as e:
+                        failure = e
+                        advance(job.item, lambda: self._push_failed(job, failure, result))
+                        continue
+                    except Exception as e:
+                        result.errors.append((job.item.entity_id, str(e)))
+                        progress.update()
+                        continue
+                    advance(job.item, lambda: job.on_done(response))
+                fill()
+
+        progress.close()
+
+    def _prepare_push(
+        self,
+        item: SyncQueueItem,
+        result: SyncResult,
+        interactive: bool,
+    ) -> Optional[_PushJob]:
+        """Start processing a single sync queue item.
 
         Args:
             item: Queue item to process
             result: SyncResult to update
             interactive: Whether to prompt for conflicts
+
+        Returns:
+            The Notion request the item needs, or None if it is done
         """
         if item.entity_type != "book":
             # Only handle books for now
             self.db.mark_sync_item_completed(item.id)
-            return
+            return None
 
         book = self.db.get_book(item.entity_id)
 
         if item.operation == SyncOperation.CREATE.value:
-            self._push_create(item, book, result)
+            return self._push_create(item, book, result)
         elif item.operation == SyncOperation.UPDATE.value:
-            self._push_update(item, book, result, interactive)
+            return self._push_update(item, book, result, interactive)
         elif item.operation == SyncOperation.DELETE.value:
             self._push_delete(item, book, result)
+        return None
+
+    def _push_failed(self, job: _PushJob, error: NotionError, result: SyncResult) -> None:
+        """Record a Notion request that failed after retries."""
+        self.db.mark_sync_item_failed(job.item.id, str(error))
+        result.errors.append((job.title, str(error)))
 
     def _push_create(
         self,
         item: SyncQueueItem,
         book: Optional[Book],
         result: SyncResult,
-    ) -> None:
+    ) -> Optional[_PushJob]:
         """Push a new book to Notion."""
         if not book:
             # Book was deleted locally before sync
             self.db.mark_sync_item_completed(item.id)
-            return
-
-        try:
-            # Create BookCreate from Book model
-            book_data = self._book_to_create(book)
+            return None
 
-            # Create in Notion with retry
-            page_id = self._with_retry(
-                lambda: self.notion.create_book(book_data)
-            )
+        # Create BookCreate from Book model
+        book_data = self._book_to_create(book)
 
+        def on_created(page_id: str) -> None:
             # Update local book with Notion page ID
             with self.db.get_session() as session:
                 db_book = session.get(Book, book.id)
@@ -194,9 +354,12 @@ class SyncProcessor:
             self.db.mark_sync_item_completed(item.id)
             result.pushed += 1
 
-        except NotionError as e:
-            self.db.mark_sync_item_failed(item.id, str(e))
-            result.errors.append((book.title, str(e)))
+        return _PushJob(
+            item=item,
+            title=book.title,
+            request=lambda: self.notion.create_book(book_data),
+            on_done=on_created,
+        )
 
     def _push_update(
         self,
@@ -204,23 +367,20 @@ class SyncProcessor:
         book: Optional[Book],
         result: SyncResult,
         interactive: bool,
-    ) -> None:
+    ) -> Optional[_PushJob]:
         """Push a book update to Notion."""
         if not book:
             self.db.mark_sync_item_completed(item.id)
-            return
+            return None
 
         if not book.notion_page_id:
             # No Notion page yet, treat as create
-            self._push_create(item, book, result)
-            return
+            return self._push_create(item, book, result)
 
-        try:
-            # Check for conflicts
-            notion_page = self._with_retry(
-                lambda: self.notion.get_page(book.notion_page_id)
-            )
+        page_id = book.notion_page_id
 
+        def on_fetched(notion_page: NotionPage) -> Optional[_PushJob]:
+            # Check for conflicts
             last_sync = _parse_timestamp(book.notion_modified_at)
             conflict = detect_conflict(book, notion_page, last_sync)
 
@@ -235,18 +395,22 @@ class SyncProcessor:
                     self._apply_notion_to_local(notion_page, book)
                     self.db.mark_sync_item_completed(item.id)
                     result.conflicts += 1
-                    return
+                    return None
                 elif resolution == ConflictResolution.SKIP:
                     result.skipped += 1
-                    return
+                    return None
                 # KEEP_LOCAL falls through to push
 
             # Push update
             update = self._book_to_update(book)
-            self._with_retry(
-                lambda: self.notion.update_book(book.notion_page_id, update)
+            return _PushJob(
+                item=item,
+                title=book.title,
+                request=lambda: self.notion.update_book(page_id, update),
+                on_done=on_updated,
             )
 
+        def on_updated(_response) -> None:
             # Update sync timestamp
             with self.db.get_session() as session:
                 db_book = session.get(Book, book.id)
@@ -256,9 +420,12 @@ class SyncProcessor:
             self.db.mark_sync_item_completed(item.id)
             result.pushed += 1
 
-        except NotionError as e:
-            self.db.mark_sync_item_failed(item.id, str(e))
-            result.errors.append((book.title, str(e)))
+        return _PushJob(
+            item=item,
+            title=book.title,
+            request=lambda: self.notion.get_page(page_id),
+            on_done=on_fetched,
+        )
 
     def _push_delete(
         self,
@@ -278,43 +445,99 @@ class SyncProcessor:
         interactive: bool = True,
         show_progress: bool = True,
         since: Optional[datetime] = None,
+        full: bool = False,
     ) -> SyncResult:
         """Pull changes from Notion to local database.
 
+        Pulls are incremental: only pages edited since the last complete
+        pull are queried, and pages whose edit has already been applied are
+        skipped. The query cursor is checkpointed after every result page,
+        so an interrupted pull resumes where it stopped.
+
         Args:
             interactive: Prompt for conflict resolution
             show_progress: Show progress indicators
-            since: Only pull changes after this time
+            since: Only pull changes after this time (instead of the checkpoint)
+            full: Ignore the checkpoint and re-apply every Notion page
 
         Returns:
             SyncResult with pull statistics
         """
         result = SyncResult()
+        state = self.db.get_sync_state(NOTION_BOOKS_STREAM)
+        cursor = None
+        resuming = False
+
+        if not full and since is None and state.in_progress:
+            # Pick up an interrupted pull from its last cursor
+            since = _parse_timestamp(state.pull_since)
+            cursor = state.cursor
+            started_at = _parse_timestamp(state.pull_started_at)
+            resuming = cursor is not None
+        else:
+            started_at = datetime.now(timezone.utc)
+            if not full and since is None and state.last_pulled_at:
+                since = _parse_timestamp(state.last_pulled_at) - PULL_OVERLAP
+
+        self.db.save_sync_state(
+            NOTION_BOOKS_STREAM,
+            pull_since=since.isoformat() if since else None,
+            pull_started_at=started_at.isoformat(),
+            cursor=cursor,
+        )
 
-        try:
-            if since:
-                notion_books = self._with_retry(
-                    lambda: self.notion.query_books_modified_since(since)
-                )
-            else:
-                notion_books = self._with_retry(
-                    lambda: self.notion.query_all_books()
-                )
-        except NotionError as e:
-            result.errors.append(("Notion query", str(e)))
-            return result
+        # Match pages to local books through one narrow query, not a scan per page
+        index = _PullIndex.build(self.db)
+        versions = {} if full else self.db.get_page_versions()
+        seen = 0
+        progress = tqdm(desc="Pulling", unit="page", disable=not show_progress)
 
-        if not notion_books:
+        while True:
+            try:
+                notion_books, next_cursor = self._with_retry(
+                    lambda: self.notion.query_books_page(since=since, start_cursor=cursor),
+                    retries=1 if resuming else None,
+                )
+            except NotionError as e:
+                if resuming and not isinstance(e, NotionRateLimitError):
+                    # The saved cursor has expired; restart the query; pages
+                    # applied before the interruption are skipped by version
+                    resuming = False
+                    cursor = None
+                    continue
+                progress.close()
+                result.errors.append(("Notion query", str(e)))
+                return result
+            resuming = False
+
+            for notion_page in notion_books:
+                seen += 1
+                progress.update()
+                edited = notion_page.last_edited_time.isoformat()
+                if versions.get(notion_page.page_id) == edited:
+                    continue
+                try:
+                    with self.db.batch():
+                        self._process_notion_page(notion_page, result, interactive, index)
+                        self.db.set_page_version(notion_page.page_id, edited)
+                    versions[notion_page.page_id] = edited
+                except Exception as e:
+                    result.errors.append((notion_page.title, str(e)))
+
+            if next_cursor is None:
+                break
+            cursor = next_cursor
+            self.db.save_sync_state(NOTION_BOOKS_STREAM, cursor=cursor)
+
+        progress.close()
+        if not seen:
             console.print("[dim]No changes to pull from Notion.[/dim]")
-            return result
 
-        iterator = tqdm(notion_books, desc="Pulling", disable=not show_progress)
-
-        for notion_page in iterator:
-            try:
-                self._process_notion_page(notion_page, result, interactive)
-            except Exception as e:
-                result.errors.append((notion_page.title, str(e)))
+        completed = {"pull_since": None, "pull_started_at": None, "cursor": None}
+        if result.success:
+            # Pages that failed are re-queried next time from the old mark
+            completed["last_pulled_at"] = started_at.isoformat()
+        self.db.save_sync_state(NOTION_BOOKS_STREAM, **completed)
 
         return result
 
@@ -323,6 +546,7 @@ class SyncProcessor:
         notion_page: NotionPage,
         result: SyncResult,
         interactive: bool,
+        index: Optional["_PullIndex"] = None,
     ) -> None:
         """Process a single Notion page during pull.
 
@@ -330,10 +554,14 @@ class SyncProcessor:
             notion_page: Page from Notion
             result: SyncResult to update
             interactive: Whether to prompt for conflicts
+            index: Lookup of local books for this pull (built if not given)
         """
+        if index is None:
+            index = _PullIndex.build(self.db)
+
         # Find local book by Notion page ID or ISBN
-        local_book = self._find_local_book(notion_page)
         book_data = self.notion.notion_page_to_book(notion_page)
+        local_book = self._find_local_book(notion_page, book_data, index)
 
         if not local_book:
             # New book from Notion - create locally
@@ -347,10 +575,9 @@ class SyncProcessor:
                     db_book.notion_modified_at = notion_page.last_edited_time.isoformat()
 
             # Clear the create operation from queue
-            for item in self.db.get_pending_sync_items():
-                if item.entity_id == new_book.id:
-                    self.db.mark_sync_item_completed(item.id)
+            self.db.complete_pending_sync_items("book", new_book.id)
 
+            index.add(new_book.id, notion_page.page_id, book_data.isbn, book_data.isbn13)
             result.pulled += 1
             return
 
@@ -376,45 +603,41 @@ class SyncProcessor:
             result.conflicts += 1
 
         # Apply Notion data to local
-        self._apply_notion_to_local(notion_page, local_book)
+        self._apply_notion_to_local(notion_page, local_book, book_data)
+        index.add(local_book.id, notion_page.page_id)
         result.pulled += 1
 
-    def _find_local_book(self, notion_page: NotionPage) -> Optional[Book]:
+    def _find_local_book(
+        self, notion_page: NotionPage, book_data: BookCreate, index: "_PullIndex"
+    ) -> Optional[Book]:
         """Find local book matching a Notion page.
 
         Args:
             notion_page: Notion page to match
+            book_data: The page converted to local fields
+            index: Lookup of local books for this pull
 
         Returns:
             Local Book if found, None otherwise
         """
-        # First try by Notion page ID
-        all_books = self.db.get_all_books()
-        for book in all_books:
-            if book.notion_page_id == notion_page.page_id:
-                return book
+        book_id = index.find(notion_page.page_id, book_data.isbn, book_data.isbn13)
+        return self.db.get_book(book_id) if book_id else None
 
-        # Then try by ISBN
-        book_data = self.notion.notion_page_to_book(notion_page)
-        if book_data.isbn:
-            book = self.db.get_book_by_isbn(book_data.isbn)
-            if book:
-                return book
-        if book_data.isbn13:
-            book = self.db.get_book_by_isbn(book_data.isbn13)
-            if book:
-                return book
-
-        return None
-
-    def _apply_notion_to_local(self, notion_page: NotionPage, local_book: Book) -> None:
+    def _apply_notion_to_local(
+        self,
+        notion_page: NotionPage,
+        local_book: Book,
+        book_data: Optional[BookCreate] = None,
+    ) -> None:
         """Apply Notion page data to local book.
 
         Args:
             notion_page: Source Notion page
             local_book: Target local book
+            book_data: The page already converted to local fields, if available
         """
-        book_data = self.notion.notion_page_to_book(notion_page)
+        if book_data is None:
+            book_data = self.notion.notion_page_to_book(notion_page)
 
         update = BookUpdate(
             title=book_data.title,
@@ -436,9 +659,7 @@ class SyncProcessor:
                 db_book.notion_modified_at = notion_page.last_edited_time.isoformat()
 
         # Clear any pending sync for this book
-        for item in self.db.get_pending_sync_items():
-            if item.entity_id == local_book.id:
-                self.db.mark_sync_item_completed(item.id)
+        self.db.complete_pending_sync_items("book", local_book.id)
 
     def _with_retry(self, operation, retries: Optional[int] = None):
         """Execute operation with exponential backoff retry.
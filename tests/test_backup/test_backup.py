@@ -227,34 +227,131 @@ class TestBackupManager:
         assert "tags" in book
         assert isinstance(book["tags"], list)
 
-    def test_incremental_backup(self, db, tmp_path):
-        """Test incremental backup."""
-        from datetime import datetime
+    def test_incremental_backup(self, db, manager, sample_data, tmp_path):
+        """Incrementals hold edits to old rows, new rows and tombstones."""
+        from vibecoding.booktracker.db.schemas import BookUpdate
 
-        today = date.today()
+        full = manager.create_backup(tmp_path / "full")
+        assert full.metadata.change_seq is not None
+
+        db.update_book(sample_data[0].id, BookUpdate(rating=1))
+        db.delete_book(sample_data[1].id)
+        db.create_book(BookCreate(title="New Book", author="Author"))
+
+        result = manager.create_incremental_backup(tmp_path / "inc", full.backup_path)
+
+        assert result.success is True
+        assert result.metadata.kind == "incremental"
+        assert result.metadata.parent_checksum == full.metadata.checksum
+        assert result.metadata.book_count == 2
+        assert result.metadata.deleted_count >= 1
+        with gzip.open(result.backup_path, "rt") as f:
+            data = json.load(f)
+        titles = {book["title"] for book in data["books"]}
+        assert titles == {"Test Book 1", "New Book"}
+        assert {"table": "books", "id": sample_data[1].id} in data["_deleted"]
+        assert "reading_logs" not in data
+        assert manager.verify_backup(result.backup_path) == (True, None)
+
+    def test_incremental_without_changes_is_empty(self, manager, sample_data, tmp_path):
+        """Nothing changed, nothing written."""
+        full = manager.create_backup(tmp_path / "full")
+
+        result = manager.create_incremental_backup(tmp_path / "inc", full.backup_path)
+
+        assert result.metadata.table_counts == {}
+        assert result.metadata.deleted_count == 0
+
+    def test_incremental_needs_tracked_parent(self, manager, tmp_path):
+        """A parent without a change position can't be built on."""
+        parent = tmp_path / "old.booktracker-backup"
+        parent.write_text(json.dumps({"books": [], "reading_logs": [], "_metadata": {}}))
+
+        result = manager.create_incremental_backup(tmp_path / "inc", parent)
+
+        assert result.success is False
+        assert "full backup" in result.error
+
+    def test_backup_chain(self, db, manager, sample_data, tmp_path):
+        """The chain runs from the full backup to the requested incremental."""
+        full = manager.create_backup(tmp_path / "full")
+        db.create_book(BookCreate(title="Second", author="Author"))
+        inc1 = manager.create_incremental_backup(tmp_path / "inc1", full.backup_path)
+        db.create_book(BookCreate(title="Third", author="Author"))
+        inc2 = manager.create_incremental_backup(tmp_path / "inc2", inc1.backup_path)
+
+        chain = manager.backup_chain(inc2.backup_path)
+
+        assert chain == [full.backup_path, inc1.backup_path, inc2.backup_path]
+
+        inc1.backup_path.unlink()
+        inc1.backup_path.with_suffix(inc1.backup_path.suffix + ".meta").unlink()
+        with pytest.raises(ValueError):
+            manager.backup_chain(inc2.backup_path)
+
+    def test_backup_covers_every_table(self, manager, sample_data, tmp_path):
+        """Tables beyond books and logs are included."""
+        from vibecoding.booktracker.db.models import Base
+
+        result = manager.create_backup(tmp_path / "backup", compress=False)
+
+        with open(result.backup_path, "r") as f:
+            data = json.load(f)
+        assert set(Base.metadata.tables) <= set(data)
+        assert result.metadata.table_counts["books"] == 5
+        assert len(data["sync_queue"]) == result.metadata.table_counts["sync_queue"]
+
+    def test_checksum_matches_streamed_bytes(self, manager, sample_data, tmp_path):
+        """The checksum covers the data section and is verified."""
+        import hashlib
+
+        result = manager.create_backup(tmp_path / "backup", compress=True)
+
+        with gzip.open(result.backup_path, "rb") as f:
+            raw = f.read()
+        data_section = raw[: result.metadata.data_bytes]
+        assert hashlib.sha256(data_section).hexdigest() == result.metadata.checksum
+        assert raw[result.metadata.data_bytes :].lstrip(b",\n").startswith(b'"_metadata"')
+
+    def test_verify_backup_detects_tampering(self, manager, sample_data, tmp_path):
+        """Edited row data fails verification."""
+        result = manager.create_backup(tmp_path / "backup", compress=False)
+        path = result.backup_path
+        path.write_text(path.read_text().replace("Test Book 1", "Test Book X"))
+
+        is_valid, error = manager.verify_backup(path)
+
+        assert is_valid is False
+        assert "Checksum" in error
+
+    def test_sqlite_backup_includes_uncheckpointed_writes(self, db, manager, sample_data, tmp_path):
+        """Writes still in the WAL are part of the copy."""
+        import sqlite3
+
+        db.create_book(BookCreate(title="Fresh", author="Author"))
+        progress = []
+        result = manager.create_sqlite_backup(
+            tmp_path / "hot", progress=lambda copied, total: progress.append((copied, total))
+        )
+
+        assert result.success is True
+        assert result.metadata.book_count == 6
+        assert progress and progress[-1][0] == progress[-1][1]
+        conn = sqlite3.connect(result.backup_path)
+        assert conn.execute("SELECT COUNT(*) FROM books").fetchone()[0] == 6
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+        conn.close()
+
+    def test_compact_sqlite_backup(self, db, manager, sample_data, tmp_path):
+        """VACUUM INTO produces a complete copy without free pages."""
+        import sqlite3
 
-        # Create some old data
-        old_date = today - timedelta(days=30)
-        db.create_book(BookCreate(
-            title="Old Book",
-            author="Author",
-            status=BookStatus.COMPLETED,
-            date_added=old_date.isoformat(),
-        ))
-
-        # Create new data with explicit recent date
-        db.create_book(BookCreate(
-            title="New Book",
-            author="Author",
-            status=BookStatus.WISHLIST,
-            date_added=today.isoformat(),
-        ))
-
-        manager = BackupManager(db)
-        # Use yesterday as the cutoff so today's book is included
-        since = datetime.combine(today - timedelta(days=1), datetime.min.time())
-        result = manager.create_incremental_backup(tmp_path / "incremental", since)
+        result = manager.create_sqlite_backup(tmp_path / "compact", compact=True)
 
         assert result.success is True
-        # Should only include recent book (added today)
-        assert result.metadata.book_count == 1
+        conn = sqlite3.connect(result.backup_path)
+        assert conn.execute("SELECT COUNT(*) FROM books").fetchone()[0] == 5
+        assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+        # The search index was rebuilt against the copy's rowids
+        conn.execute("INSERT INTO books_fts(books_fts) VALUES ('integrity-check')")
+        conn.close()
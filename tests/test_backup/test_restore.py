@@ -1,11 +1,13 @@
 """Tests for restore functionality."""
 
+import gzip
 import json
 import pytest
 from datetime import date, timedelta
 from pathlib import Path
 
 from vibecoding.booktracker.backup.backup import BackupManager
+from vibecoding.booktracker.backup import stream
 from vibecoding.booktracker.backup.restore import (
     RestoreManager,
     RestoreResult,
@@ -44,6 +46,57 @@ class TestRestoreResult:
         assert result.books_skipped == 0
         assert result.books_updated == 0
         assert len(result.warnings) == 0
+        assert result.rows_per_second == 0.0
+
+    def test_rows_per_second(self):
+        """Throughput counts rows written in every table."""
+        result = RestoreResult(
+            success=True,
+            table_counts={"books": 300, "reading_logs": 700},
+            elapsed_seconds=2.0,
+        )
+        assert result.rows_written == 1000
+        assert result.rows_per_second == 500.0
+
+
+class TestIterBackup:
+    """Tests for the streaming backup reader."""
+
+    def test_streams_tables_across_buffer_refills(self, tmp_path, monkeypatch):
+        """Members parse the same however the text is split into chunks."""
+        monkeypatch.setattr(stream, "PARSE_CHUNK_SIZE", 7)
+        data = {
+            "incremental": True,
+            "books": [{"id": "a", "title": "x" * 40, "tags": ["t"]}, {"id": "b", "rating": 12345}],
+            "empty": [],
+            "_metadata": {"version": "1.0"},
+        }
+        path = tmp_path / "backup.booktracker-backup.gz"
+        # Pretty-printed, as version 1 backups were
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+        members = {
+            key: value if key in ("incremental", "_metadata") else list(value)
+            for key, value in stream.iter_backup(path)
+        }
+
+        assert members == data
+
+    def test_unread_rows_are_skipped(self, tmp_path):
+        """A table the caller doesn't consume doesn't derail the next member."""
+        path = tmp_path / "backup.booktracker-backup"
+        path.write_text(json.dumps({"books": [{"id": "a"}], "_metadata": {"book_count": 1}}))
+
+        assert stream.read_backup_metadata(path) == {"book_count": 1}
+
+    def test_invalid_json(self, tmp_path):
+        """Input that isn't a JSON object raises ValueError."""
+        path = tmp_path / "backup.booktracker-backup"
+        path.write_text('{"books": [{"id": "a"},')
+
+        with pytest.raises(ValueError):
+            list(stream.iter_backup(path))
 
 
 class TestRestoreManager:
@@ -274,6 +327,90 @@ class TestRestoreManager:
         assert result.success is True
         assert result.books_restored == 5
 
+    def test_failed_replace_keeps_library(self, db, restore_manager, sample_data, tmp_path):
+        """A replace that fails part way leaves the rows and their triggers as they were."""
+        from sqlalchemy import text
+
+        def triggers():
+            with db.engine.connect() as conn:
+                return conn.execute(
+                    text("SELECT name FROM sqlite_master WHERE type = 'trigger' ORDER BY name")
+                ).scalars().all()
+
+        before = triggers()
+        backup_path = tmp_path / "broken.booktracker-backup"
+        backup_path.write_text(json.dumps({
+            "books": [{"id": "book-1", "title": "Replacement", "author": "Author", "tags": []}],
+            "reading_logs": ["not a row"],
+        }))
+
+        result = restore_manager.restore(backup_path, mode=RestoreMode.REPLACE)
+
+        assert result.success is False
+        assert len(db.get_all_books()) == len(sample_data)
+        assert triggers() == before
+
+    def test_restore_refreshes_suggestions(self, db, restore_manager, tmp_path):
+        """Restored books show up in autocomplete suggestions."""
+        from vibecoding.booktracker.db.sqlite import Database
+        from vibecoding.booktracker.search.manager import SearchManager
+
+        source_db = Database(str(tmp_path / "source.db"))
+        source_db.create_tables()
+        source_db.create_book(BookCreate(title="Zebrafish Dreams", author="Author"))
+        backup = BackupManager(source_db).create_backup(tmp_path / "backup", compress=False)
+
+        search = SearchManager(db)
+        assert search.get_suggestions("zeb").suggestions == []
+
+        result = restore_manager.restore(backup.backup_path, mode=RestoreMode.MERGE)
+
+        assert result.books_restored == 1
+        titles = [s.text for s in search.get_suggestions("zeb").suggestions]
+        assert titles == ["Zebrafish Dreams"]
+
+    def test_restore_sqlite_refreshes_suggestions(
+        self, db, backup_manager, restore_manager, sample_data, tmp_path
+    ):
+        """Replacing the database file drops suggestions for its old contents."""
+        from vibecoding.booktracker.search.manager import SearchManager
+
+        backup = backup_manager.create_sqlite_backup(tmp_path / "backup")
+        db.create_book(BookCreate(title="Zebrafish Dreams", author="Author"))
+        search = SearchManager(db)
+        assert search.get_suggestions("zeb").suggestions
+
+        result = restore_manager.restore_sqlite(backup.backup_path)
+
+        assert result.success is True
+        assert search.get_suggestions("zeb").suggestions == []
+
+    def test_restore_incremental_chain(
+        self, db, backup_manager, restore_manager, sample_data, tmp_path
+    ):
+        """Replaying full + incrementals reproduces the library."""
+        from vibecoding.booktracker.db.schemas import BookUpdate
+
+        full = backup_manager.create_backup(tmp_path / "full")
+        db.update_book(sample_data[0].id, BookUpdate(title="Renamed"))
+        inc1 = backup_manager.create_incremental_backup(tmp_path / "inc1", full.backup_path)
+        db.delete_book(sample_data[1].id)
+        db.create_book(BookCreate(title="Added", author="Author"))
+        inc2 = backup_manager.create_incremental_backup(tmp_path / "inc2", inc1.backup_path)
+        expected = sorted(book.title for book in db.get_all_books())
+
+        # Drift away from the backed-up state
+        db.create_book(BookCreate(title="After backup", author="Author"))
+        db.delete_book(sample_data[2].id)
+
+        result = restore_manager.restore(inc2.backup_path)
+
+        assert result.success is True, result.error
+        assert result.mode == RestoreMode.INCREMENTAL
+        assert sorted(book.title for book in db.get_all_books()) == expected
+        assert len(db.get_reading_logs_for_book(sample_data[2].id)) == 2
+        assert db.get_book(sample_data[1].id) is None
+
     def test_restore_preserves_all_fields(self, tmp_path):
         """Test that restore preserves all book fields."""
         from vibecoding.booktracker.db.sqlite import Database
@@ -321,3 +458,157 @@ class TestRestoreManager:
             assert restored.comments == "Test notes"
             assert restored.series == "Test Series"
             assert restored.series_index == 1
+
+    def test_restore_compressed_in_batches(
+        self, db, restore_manager, backup_manager, sample_data, tmp_path, monkeypatch
+    ):
+        """Replace restores a gzip backup batch by batch and reports throughput."""
+        from vibecoding.booktracker.backup import restore as restore_module
+
+        monkeypatch.setattr(restore_module, "RESTORE_BATCH_SIZE", 3)
+        backup = backup_manager.create_backup(tmp_path / "backup", compress=True)
+        db.create_book(BookCreate(title="After backup", author="Author"))
+
+        result = restore_manager.restore(backup.backup_path, mode=RestoreMode.REPLACE)
+
+        assert result.success is True, result.error
+        assert result.books_restored == 5
+        assert result.logs_restored == 10
+        assert result.table_counts["books"] == 5
+        assert result.table_counts["reading_logs"] == 10
+        assert result.elapsed_seconds > 0
+        assert result.rows_per_second > 0
+        titles = sorted(b.title for b in db.get_all_books())
+        assert titles == [f"Test Book {i}" for i in range(1, 6)]
+
+    def test_restore_merge_counts_logs(self, db, restore_manager, backup_file, sample_data):
+        """Merge restores missing logs and skips the rest."""
+        from sqlalchemy import delete
+        from vibecoding.booktracker.db.models import ReadingLog
+
+        with db.get_session() as session:
+            session.execute(delete(ReadingLog).where(ReadingLog.book_id == sample_data[0].id))
+
+        result = restore_manager.restore(backup_file, mode=RestoreMode.MERGE)
+
+        assert result.success is True
+        assert result.books_skipped == 5
+        assert result.logs_restored == 2
+        assert result.logs_skipped == 8
+        assert len(db.get_reading_logs_for_book(sample_data[0].id)) == 2
+
+    def test_restore_update_adds_and_overwrites(
+        self, db, restore_manager, backup_file, sample_data
+    ):
+        """Update overwrites existing books and adds missing ones."""
+        from vibecoding.booktracker.db.schemas import BookUpdate
+
+        db.update_book(sample_data[0].id, BookUpdate(title="Changed"))
+        db.delete_book(sample_data[1].id)
+
+        result = restore_manager.restore(backup_file, mode=RestoreMode.UPDATE)
+
+        assert result.success is True
+        assert result.books_updated == 4
+        assert result.books_restored == 1
+        assert db.get_book(sample_data[0].id).title == "Test Book 1"
+        assert db.get_book(sample_data[1].id) is not None
+
+    def test_restore_bad_row_is_a_warning(self, db, restore_manager, tmp_path):
+        """A row that fails to insert is reported without losing its batch."""
+        fields = {"author": "A", "status": "wishlist", "tags": []}
+        backup_data = {
+            "books": [
+                {"id": "good-1", "title": "Good", **fields},
+                {"id": "bad", "title": None, **fields},
+                {"id": "good-2", "title": "Also good", **fields},
+            ],
+            "reading_logs": [],
+        }
+        backup_path = tmp_path / "bad_row.booktracker-backup"
+        backup_path.write_text(json.dumps(backup_data))
+
+        result = restore_manager.restore(backup_path, mode=RestoreMode.MERGE)
+
+        assert result.success is True
+        assert result.books_restored == 2
+        assert len(result.warnings) == 1
+        assert result.warnings[0].startswith("Failed to restore book 'None'")
+        assert sorted(b.title for b in db.get_all_books()) == ["Also good", "Good"]
+
+    def test_restore_books_must_come_first(self, db, restore_manager, tmp_path):
+        """A backup whose first table isn't books fails before writing."""
+        backup_path = tmp_path / "reordered.booktracker-backup"
+        backup_path.write_text(json.dumps({
+            "reading_logs": [{"id": 1, "book_id": "x", "date": "2024-01-01"}],
+            "books": [],
+        }))
+
+        result = restore_manager.restore(backup_path, mode=RestoreMode.MERGE)
+
+        assert result.success is False
+        assert "missing books" in result.error.lower()
+        assert db.get_reading_logs_for_book("x") == []
+
+    def test_replace_keeps_search_index_and_change_log(
+        self, db, restore_manager, backup_manager, backup_file, sample_data, tmp_path
+    ):
+        """Bulk replace leaves the same index, change log and rollups as per-row writes."""
+        from sqlalchemy import text
+
+        before = backup_manager.create_backup(tmp_path / "before")
+        extra = db.create_book(BookCreate(title="Zanzibar Chronicles", author="Author"))
+        with db.get_session() as session:
+            db.create_reading_log(
+                ReadingLogCreate(book_id=extra.id, date=date.today().isoformat(), pages_read=500),
+                session,
+            )
+
+        result = restore_manager.restore(backup_file, mode=RestoreMode.REPLACE)
+        assert result.success is True, result.error
+
+        # Daily rollups are rebuilt from the restored logs
+        from vibecoding.booktracker.db.rollups import daily_activity
+
+        with db.get_session() as session:
+            days = daily_activity(session).values()
+            assert sum(day.sessions for day in days) == 10
+            assert sum(day.pages for day in days) == 200
+
+        def matches(term):
+            with db.get_session() as session:
+                return session.execute(
+                    text("SELECT COUNT(*) FROM books_fts WHERE books_fts MATCH :term"),
+                    {"term": term},
+                ).scalar_one()
+
+        assert matches("Test") == 5
+        assert matches("Zanzibar") == 0
+        # Triggers are back in place for later writes
+        db.create_book(BookCreate(title="Xylophone Dreams", author="Author"))
+        assert matches("Xylophone") == 1
+
+        inc = backup_manager.create_incremental_backup(tmp_path / "inc", before.backup_path)
+        with gzip.open(inc.backup_path, "rt") as f:
+            data = json.load(f)
+        deleted = {entry["id"] for entry in data["_deleted"] if entry["table"] == "books"}
+        assert deleted == {extra.id}
+        assert len(data["books"]) == 6
+
+    def test_update_leaves_unchanged_rows_alone(
+        self, db, restore_manager, backup_manager, backup_file, sample_data, tmp_path
+    ):
+        """Rows identical to the stored ones aren't rewritten."""
+        from vibecoding.booktracker.db.schemas import BookUpdate
+
+        db.update_book(sample_data[0].id, BookUpdate(title="Changed"))
+        before = backup_manager.create_backup(tmp_path / "before")
+
+        result = restore_manager.restore(backup_file, mode=RestoreMode.UPDATE)
+        assert result.success is True
+
+        inc = backup_manager.create_incremental_backup(tmp_path / "inc", before.backup_path)
+        # Only the changed book (and its reverted sync queue entry) were written
+        assert inc.metadata.table_counts["books"] == 1
+        assert "reading_logs" not in inc.metadata.table_counts
+        assert db.get_book(sample_data[0].id).title == "Test Book 1"
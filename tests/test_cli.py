@@ -239,6 +239,41 @@ class TestBackupCommand:
         assert "Backup created" in result.stdout
 
 
+class TestDbTuneCommand:
+    """Tests for db tune command."""
+
+    def test_db_tune_shows_profile(self, runner: CliRunner):
+        """Test showing current settings against the profile."""
+        result = runner.invoke(app, ["db", "tune"])
+        assert result.exit_code == 0
+        assert "journal_mode" in result.stdout
+        assert "wal" in result.stdout
+
+    def test_db_tune_apply_other_profile(self, runner: CliRunner):
+        """Test applying a different profile warns that it is not persistent."""
+        result = runner.invoke(app, ["db", "tune", "--profile", "compatible", "--apply"])
+        assert result.exit_code == 0
+        assert "Applied 'compatible' profile" in result.stdout
+        assert "BOOKTRACKER_DB_PROFILE=compatible" in result.stdout
+
+    def test_db_tune_unknown_profile(self, runner: CliRunner):
+        """Test an unknown profile name fails."""
+        result = runner.invoke(app, ["db", "tune", "--profile", "turbo"])
+        assert result.exit_code == 1
+
+
+class TestDbRebuildFtsCommand:
+    """Tests for db rebuild-fts command."""
+
+    def test_db_rebuild_fts(self, runner: CliRunner):
+        """Test rebuilding the search indexes."""
+        runner.invoke(app, ["add-manual", "--title", "Dune", "--author", "Herbert"])
+
+        result = runner.invoke(app, ["db", "rebuild-fts"])
+        assert result.exit_code == 0
+        assert "Rebuilt full-text search indexes" in result.stdout
+
+
 class TestSyncCommand:
     """Tests for sync command."""
 
@@ -0,0 +1,95 @@
+"""Tests for the SQL aggregate queries over books."""
+
+import pytest
+
+from src.vibecoding.booktracker.db.aggregates import (
+    FINISHED_MONTH,
+    BookTotals,
+    book_totals,
+    count_books,
+    finished_between,
+    rating_counts,
+    totals_by,
+    totals_by_value,
+)
+from src.vibecoding.booktracker.db.models import Book
+from src.vibecoding.booktracker.db.schemas import BookCreate, BookStatus
+from src.vibecoding.booktracker.db.sqlite import Database
+
+
+@pytest.fixture
+def library(db: Database) -> Database:
+    """Completed books across two years, and one still being read."""
+    for title, author, finished, rating, pages, tags in [
+        ("A", "Le Guin", "2024-01-10", 5, 300, ["sf", "classic"]),
+        ("B", "Le Guin", "2024-01-20", 4, None, ["sf"]),
+        ("C", "Jemisin", "2024-03-05", None, 400, ["fantasy"]),
+        ("D", "Jemisin", "2023-12-31", 3, 250, None),
+    ]:
+        db.create_book(
+            BookCreate(
+                title=title,
+                author=author,
+                status=BookStatus.COMPLETED,
+                date_finished=finished,
+                rating=rating,
+                page_count=pages,
+                tags=tags or [],
+            )
+        )
+    db.create_book(
+        BookCreate(title="E", author="Le Guin", status=BookStatus.READING, page_count=99)
+    )
+    return db
+
+
+class TestAggregates:
+    """Tests for the aggregate helpers."""
+
+    def test_book_totals(self, library: Database):
+        """Counts, pages and ratings are totalled in SQL."""
+        with library.get_session() as session:
+            totals = book_totals(session, *finished_between("2024-01-01", "2024-12-31"))
+            assert totals == BookTotals(books=3, pages=700, rated=2, avg_rating=4.5)
+            assert count_books(session) == 5
+
+    def test_empty_totals(self, library: Database):
+        """No matching books gives zero totals and no average."""
+        with library.get_session() as session:
+            totals = book_totals(session, *finished_between("2020-01-01", "2020-12-31"))
+            assert totals == BookTotals()
+
+    def test_totals_by_author(self, library: Database):
+        """Groups come most books first, ties by key."""
+        with library.get_session() as session:
+            groups = totals_by(session, Book.author, Book.status == BookStatus.COMPLETED.value)
+            assert [(g.key, g.books, g.pages) for g in groups] == [
+                ("Jemisin", 2, 650),
+                ("Le Guin", 2, 300),
+            ]
+            assert totals_by(session, Book.author, limit=1)[0].key == "Le Guin"
+
+    def test_totals_by_month(self, library: Database):
+        """Books are grouped by the month they were finished in."""
+        with library.get_session() as session:
+            groups = totals_by(
+                session, FINISHED_MONTH, *finished_between("2024-01-01", "2024-12-31")
+            )
+            assert {g.key: g.books for g in groups} == {1: 2, 3: 1}
+
+    def test_totals_by_tag(self, library: Database):
+        """Each value of a book's JSON array counts the book once."""
+        with library.get_session() as session:
+            groups = totals_by_value(session, Book.tags)
+            assert [(g.key, g.books) for g in groups] == [
+                ("sf", 2),
+                ("classic", 1),
+                ("fantasy", 1),
+            ]
+            assert groups[0].avg_rating == 4.5
+
+    def test_rating_counts(self, library: Database):
+        """Unrated books are left out."""
+        with library.get_session() as session:
+            assert rating_counts(session) == {3: 1, 4: 1, 5: 1}
+            assert rating_counts(session, Book.author == "Le Guin") == {4: 1, 5: 1}
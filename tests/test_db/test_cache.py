@@ -0,0 +1,238 @@
+"""Tests for the computed-result cache."""
+
+import json
+import pickle
+from datetime import date
+
+from sqlalchemy import delete, select, update
+
+from src.vibecoding.booktracker.db.cache import (
+    RESULT_CACHE,
+    ResultCache,
+    cached,
+    clear_result_cache,
+    data_versions,
+)
+from src.vibecoding.booktracker.db.models import Book
+from src.vibecoding.booktracker.db.schemas import BookCreate, BookStatus, ReadingLogCreate
+from src.vibecoding.booktracker.db.sqlite import Database
+
+
+class Computation:
+    """A cached method that counts how often it runs."""
+
+    def __init__(self, db: Database):
+        self.db = db
+        self.calls = 0
+
+    @cached("books")
+    def total(self, offset: int = 0) -> int:
+        self.calls += 1
+        return self.calls * 100 + offset
+
+
+def _versions(db: Database) -> dict[str, int]:
+    with db.get_session() as session:
+        return data_versions(session, ["books", "reading_logs", "daily_readings"])
+
+
+class TestDataVersions:
+    """Tests for the per-table write versions."""
+
+    def test_writes_bump_their_table(self, db: Database):
+        """Inserts, updates and deletes each bump the table's version."""
+        before = _versions(db)
+        book = db.create_book(BookCreate(title="Dune", author="Herbert"))
+        after_insert = _versions(db)
+
+        with db.get_session() as session:
+            session.execute(update(Book).where(Book.id == book.id).values(rating=5))
+        after_update = _versions(db)
+        with db.get_session() as session:
+            session.execute(delete(Book).where(Book.id == book.id))
+        after_delete = _versions(db)
+
+        assert (
+            before["books"] < after_insert["books"] < after_update["books"] < after_delete["books"]
+        )
+        assert after_delete["reading_logs"] == before["reading_logs"]
+
+    def test_reading_logs_versioned(self, db: Database):
+        """Reading logs have their own version."""
+        book = db.create_book(BookCreate(title="Dune", author="Herbert"))
+        before = _versions(db)
+        with db.get_session() as session:
+            db.create_reading_log(
+                ReadingLogCreate(book_id=book.id, date="2024-01-01", pages_read=5), session
+            )
+
+        assert _versions(db)["reading_logs"] > before["reading_logs"]
+
+
+class TestResultCache:
+    """Tests for ResultCache and the cached decorator."""
+
+    def test_reused_until_dependency_changes(self, db: Database):
+        """A result is reused until a table it depends on is written."""
+        counter = Computation(db)
+
+        assert counter.total() == counter.total()
+        assert counter.calls == 1
+
+        book = db.create_book(BookCreate(title="Dune", author="Herbert"))
+        counter.total()
+        assert counter.calls == 2
+
+        with db.get_session() as session:
+            db.create_reading_log(ReadingLogCreate(book_id=book.id, date="2024-01-01"), session)
+        counter.total()
+        assert counter.calls == 2  # Doesn't depend on reading_logs
+
+    def test_keyed_by_arguments(self, db: Database):
+        """Different arguments are cached separately."""
+        counter = Computation(db)
+
+        assert counter.total(1) == counter.total(1)
+        counter.total(2)
+
+        assert counter.calls == 2
+
+    def test_shared_between_instances(self, db: Database):
+        """A new object, e.g. the next CLI run, reads the stored result."""
+        Computation(db).total()
+        other = Computation(db)
+        other.total()
+
+        assert other.calls == 0
+
+    def test_ttl(self, db: Database):
+        """Expired entries are recomputed; a zero TTL turns caching off."""
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        cache = ResultCache(db, ttl=3600)
+        assert cache.get_or_compute("f", [], ["books"], compute) == 1
+        assert cache.get_or_compute("f", [], ["books"], compute) == 1
+
+        assert ResultCache(db, ttl=0).get_or_compute("f", [], ["books"], compute) == 2
+        assert ResultCache(db, ttl=-1).get_or_compute("f", [], ["books"], compute) == 3
+
+    def test_clear(self, db: Database):
+        """Clearing the cache forces a recompute."""
+        counter = Computation(db)
+        counter.total()
+        with db.get_session() as session:
+            assert clear_result_cache(session) == 1
+        counter.total()
+
+        assert counter.calls == 2
+
+    def test_without_cache_tables(self, tmp_path):
+        """A database without the cache tables still computes results."""
+        from src.vibecoding.booktracker.db.models import Base
+
+        db = Database(str(tmp_path / "bare.db"))
+        Base.metadata.create_all(db.engine)
+        counter = Computation(db)
+
+        counter.total()
+        counter.total()
+        assert counter.calls == 2
+
+
+class TestStoredValues:
+    """Tests for how results are written to the cache."""
+
+    def test_round_trip(self, db: Database):
+        """Dataclasses, enums, dates and non-string keys come back as they were."""
+        from src.vibecoding.booktracker.stats.goals import GoalType, ReadingGoal
+
+        value = {
+            "goal": ReadingGoal(goal_type=GoalType.PAGES, target=5000, year=2024, current=120),
+            "by_rating": {5: 2, 4: 1},
+            "since": date(2024, 1, 1),
+            "pair": (1, "two"),
+        }
+        cache = ResultCache(db, ttl=3600)
+        cache.get_or_compute("f", [], ["books"], lambda: value)
+
+        stored = cache.get_or_compute("f", [], ["books"], lambda: None)
+
+        assert stored == value
+        assert stored["goal"].goal_type is GoalType.PAGES
+
+    def test_stored_as_json(self, db: Database):
+        """Results are written as JSON text, not pickles."""
+        ResultCache(db, ttl=3600).get_or_compute("f", [], ["books"], lambda: {"a": [1, 2.5]})
+
+        with db.get_session() as session:
+            value = session.execute(select(RESULT_CACHE.c.value)).scalar_one()
+        assert json.loads(value) == {"__dict__": [["a", [1, 2.5]]]}
+
+    def test_pickled_entry_is_not_loaded(self, db: Database):
+        """An entry that isn't our JSON is recomputed, never unpickled."""
+        cache = ResultCache(db, ttl=3600)
+        cache.get_or_compute("f", [], ["books"], lambda: 1)
+        with db.get_session() as session:
+            session.execute(update(RESULT_CACHE).values(value=pickle.dumps(2)))
+
+        assert cache.get_or_compute("f", [], ["books"], lambda: 3) == 3
+
+    def test_foreign_class_is_not_loaded(self, db: Database):
+        """Tagged types from outside the package are refused and recomputed."""
+        cache = ResultCache(db, ttl=3600)
+        cache.get_or_compute("f", [], ["books"], lambda: 1)
+        entry = {"__dataclass__": "subprocess:CompletedProcess", "fields": {}}
+        with db.get_session() as session:
+            session.execute(update(RESULT_CACHE).values(value=json.dumps(entry)))
+
+        assert cache.get_or_compute("f", [], ["books"], lambda: 3) == 3
+
+    def test_unstorable_result_is_returned(self, db: Database):
+        """A result that can't be encoded is returned but not cached."""
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {1, 2}
+
+        cache = ResultCache(db, ttl=3600)
+        assert cache.get_or_compute("f", [], ["books"], compute) == {1, 2}
+        assert cache.get_or_compute("f", [], ["books"], compute) == {1, 2}
+        assert len(calls) == 2
+
+
+class TestCachedReports:
+    """Tests for the cached dashboard and goal summary."""
+
+    def test_dashboard_follows_writes(self, db: Database):
+        """The cached dashboard changes when a book is finished."""
+        from src.vibecoding.booktracker.reports.manager import ReportManager
+
+        manager = ReportManager(db)
+        assert manager.get_dashboard().books_this_year == 0
+
+        db.create_book(
+            BookCreate(
+                title="Dune",
+                author="Herbert",
+                status=BookStatus.COMPLETED,
+                date_finished=date.today().isoformat(),
+            )
+        )
+
+        assert manager.get_dashboard().books_this_year == 1
+
+    def test_goal_summary_follows_goal_changes(self, db: Database, tmp_path):
+        """Goals live in a file, so changing them changes the cache key."""
+        from src.vibecoding.booktracker.stats.goals import GoalTracker, GoalType
+
+        tracker = GoalTracker(db, goals_file=tmp_path / "goals.json")
+        tracker.set_goal(GoalType.BOOKS, 10)
+        assert tracker.get_progress_summary()["goals"][0]["goal"].target == 10
+
+        tracker.set_goal(GoalType.BOOKS, 20)
+        assert tracker.get_progress_summary()["goals"][0]["goal"].target == 20
@@ -0,0 +1,148 @@
+"""Tests for the daily reading activity rollups."""
+
+from sqlalchemy import delete, select, text, update
+
+from src.vibecoding.booktracker.db.models import ReadingLog
+from src.vibecoding.booktracker.db.rollups import (
+    BOOK_DAILY_ACTIVITY,
+    DayActivity,
+    books_logged,
+    daily_activity,
+    deferred_rollups,
+    install_rollups,
+    rebuild_rollups,
+)
+from src.vibecoding.booktracker.db.schemas import BookCreate, ReadingLogCreate
+from src.vibecoding.booktracker.db.sqlite import Database
+
+
+def _log(db: Database, book_id: str, day: str, pages=None, minutes=None) -> str:
+    with db.get_session() as session:
+        log = db.create_reading_log(
+            ReadingLogCreate(book_id=book_id, date=day, pages_read=pages, duration_minutes=minutes),
+            session,
+        )
+        return log.id
+
+
+def _recomputed(db: Database) -> dict[str, DayActivity]:
+    """What the rollups should hold, computed from the logs."""
+    with db.get_session() as session:
+        rows = session.execute(
+            text(
+                "SELECT date, COUNT(*), SUM(IFNULL(pages_read, 0)), "
+                "SUM(IFNULL(duration_minutes, 0)), COUNT(DISTINCT book_id) "
+                "FROM reading_logs GROUP BY date ORDER BY date"
+            )
+        )
+        return {row[0]: DayActivity(*row) for row in rows}
+
+
+class TestRollups:
+    """Tests for trigger-maintained daily rollups."""
+
+    def _books(self, db: Database):
+        return [db.create_book(BookCreate(title=f"Book {i}", author="Author")) for i in range(2)]
+
+    def test_insert(self, db: Database):
+        """New logs are added to their day."""
+        a, b = self._books(db)
+        _log(db, a.id, "2024-03-01", pages=10, minutes=15)
+        _log(db, a.id, "2024-03-01", pages=5)
+        _log(db, b.id, "2024-03-01", pages=20, minutes=30)
+        _log(db, b.id, "2024-03-02", minutes=10)
+
+        with db.get_session() as session:
+            days = daily_activity(session)
+            assert days["2024-03-01"] == DayActivity("2024-03-01", 3, 35, 45, 2)
+            assert days["2024-03-02"] == DayActivity("2024-03-02", 1, 0, 10, 1)
+            assert books_logged(session, "2024-03-01", "2024-03-01") == 2
+            assert books_logged(session, "2024-03-02", "2024-03-31") == 1
+
+    def test_date_range(self, db: Database):
+        """Only days within the range are returned, in order."""
+        a, _ = self._books(db)
+        for day in ("2024-01-31", "2024-02-01", "2024-02-29", "2024-03-01"):
+            _log(db, a.id, day, pages=1)
+
+        with db.get_session() as session:
+            assert list(daily_activity(session, "2024-02-01", "2024-02-29")) == [
+                "2024-02-01",
+                "2024-02-29",
+            ]
+
+    def test_update_moves_log(self, db: Database):
+        """Changing a log's date, book or counts moves it between days."""
+        a, b = self._books(db)
+        log_id = _log(db, a.id, "2024-03-01", pages=10, minutes=15)
+        _log(db, b.id, "2024-03-01", pages=1)
+
+        with db.get_session() as session:
+            session.execute(
+                update(ReadingLog)
+                .where(ReadingLog.id == log_id)
+                .values(date="2024-03-05", book_id=b.id, pages_read=40)
+            )
+
+        with db.get_session() as session:
+            assert daily_activity(session) == _recomputed(db)
+            assert daily_activity(session)["2024-03-01"].books == 1
+
+    def test_delete_empties_day(self, db: Database):
+        """A day with no logs left disappears."""
+        a, _ = self._books(db)
+        log_id = _log(db, a.id, "2024-03-01", pages=10)
+
+        with db.get_session() as session:
+            session.execute(delete(ReadingLog).where(ReadingLog.id == log_id))
+
+        with db.get_session() as session:
+            assert daily_activity(session) == {}
+            assert session.execute(select(BOOK_DAILY_ACTIVITY)).all() == []
+
+    def test_deleting_book_cascades(self, db: Database):
+        """Logs removed with their book leave the rollups too."""
+        a, b = self._books(db)
+        _log(db, a.id, "2024-03-01", pages=10)
+        _log(db, b.id, "2024-03-01", pages=5)
+
+        db.delete_book(a.id)
+
+        with db.get_session() as session:
+            assert daily_activity(session) == {"2024-03-01": DayActivity("2024-03-01", 1, 5, 0, 1)}
+
+    def test_rebuild(self, db: Database):
+        """Rebuilding recomputes rollups bypassed by dropped triggers."""
+        a, _ = self._books(db)
+        _log(db, a.id, "2024-03-01", pages=10)
+        with db.get_session() as session:
+            with deferred_rollups(session):
+                session.execute(text("UPDATE reading_logs SET pages_read = 99"))
+                # The rollups are stale until the block ends
+                assert daily_activity(session)["2024-03-01"].pages == 10
+            assert daily_activity(session)["2024-03-01"].pages == 99
+
+        with db.get_session() as session:
+            session.execute(text("DELETE FROM daily_activity"))
+            rebuild_rollups(session)
+            assert daily_activity(session) == _recomputed(db)
+
+    def test_install_fills_existing_logs(self, db: Database):
+        """Rollups added to a database with logs start out filled."""
+        a, _ = self._books(db)
+        _log(db, a.id, "2024-03-01", pages=10)
+        with db.engine.begin() as conn:
+            conn.execute(text("DROP TABLE daily_activity"))
+            conn.execute(text("DROP TABLE book_daily_activity"))
+
+        install_rollups(db.engine)
+
+        with db.get_session() as session:
+            assert daily_activity(session) == _recomputed(db)
+
+    def test_kept_out_of_backups(self, db: Database):
+        """The rollups aren't part of the ORM metadata that backups walk."""
+        from src.vibecoding.booktracker.db.models import Base
+
+        assert "daily_activity" not in Base.metadata.tables
+        assert "book_daily_activity" not in Base.metadata.tables
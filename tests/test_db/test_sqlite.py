@@ -1,6 +1,8 @@
 """Tests for SQLite database operations."""
 
-from datetime import date
+import sqlite3
+from datetime import date, timedelta
+from pathlib import Path
 from uuid import UUID
 
 import pytest
@@ -279,6 +281,82 @@ class TestSyncQueue:
         pending = db.get_pending_sync_items()
         assert len(pending) == 1
 
+    def test_delete_replaces_pending_operation(self, db: Database, created_book: Book):
+        """A delete coalesces into the pending item and wins over its operation."""
+        with db.get_session() as session:
+            session.get(Book, created_book.id).notion_page_id = "test-notion-id"
+        db.update_book(created_book.id, BookUpdate(rating=3))
+        db.delete_book(created_book.id)
+
+        pending = db.get_pending_sync_items()
+        assert len(pending) == 1
+        assert pending[0].operation == "delete"
+
+    def test_mark_items_completed_in_bulk(self, db: Database, multiple_books: list[Book]):
+        """Several items are completed by one call."""
+        ids = [item.id for item in db.get_pending_sync_items()]
+
+        db.mark_sync_items_completed(ids[:3])
+
+        assert [item.id for item in db.get_pending_sync_items()] == ids[3:]
+
+    def test_claim_leases_items(self, db: Database, multiple_books: list[Book]):
+        """Claimed items leave the pending queue until released."""
+        claimed = db.claim_sync_items(limit=3)
+
+        assert len(claimed) == 3
+        assert all(item.status == SyncStatus.IN_PROGRESS.value for item in claimed)
+        assert db.count_pending_sync_items() == 1
+        assert len(db.claim_sync_items()) == 1
+
+        db.release_sync_items(item.id for item in claimed)
+        assert db.count_pending_sync_items() == 3
+
+    def test_write_during_claim_queues_new_item(self, db: Database, created_book: Book):
+        """A change to a claimed entity is queued again, superseding the claim."""
+        (claimed,) = db.claim_sync_items()
+        db.update_book(created_book.id, BookUpdate(rating=5))
+
+        pending = db.get_pending_sync_items()
+        assert len(pending) == 1
+        assert pending[0].id != claimed.id
+
+        # Releasing the stale claim doesn't create a second pending item
+        db.release_sync_items([claimed.id])
+        assert [item.id for item in db.get_pending_sync_items()] == [pending[0].id]
+
+    def test_expired_lease_is_reclaimed(self, db: Database, created_book: Book):
+        """Items from a run that died are claimed again once the lease runs out."""
+        (claimed,) = db.claim_sync_items(lease=timedelta(seconds=-1))
+
+        (reclaimed,) = db.claim_sync_items()
+        assert reclaimed.id == claimed.id
+        assert reclaimed.lease_owner != claimed.lease_owner
+
+    def test_upgrades_legacy_sync_queue(self, temp_db_path: Path):
+        """An old sync_queue table gets lease columns and duplicates collapsed."""
+        conn = sqlite3.connect(temp_db_path)
+        conn.execute(
+            "CREATE TABLE sync_queue (id VARCHAR(36) PRIMARY KEY, entity_type VARCHAR(20) "
+            "NOT NULL, entity_id VARCHAR(36) NOT NULL, operation VARCHAR(10) NOT NULL, "
+            "status VARCHAR(20), payload TEXT, retry_count INTEGER, last_error TEXT, "
+            "created_at VARCHAR(26), updated_at VARCHAR(26))"
+        )
+        conn.executemany(
+            "INSERT INTO sync_queue (id, entity_type, entity_id, operation, status, "
+            "retry_count, created_at) VALUES (?, 'book', 'b1', 'update', 'pending', 0, ?)",
+            [("q1", "2026-01-01"), ("q2", "2026-01-02")],
+        )
+        conn.commit()
+        conn.close()
+
+        db = Database(str(temp_db_path))
+        db.create_tables()
+
+        assert [item.id for item in db.get_pending_sync_items()] == ["q1"]
+        (claimed,) = db.claim_sync_items()
+        assert claimed.lease_expires_at is not None
+
 
 class TestJSONFields:
     """Tests for JSON field serialization."""
@@ -309,3 +387,206 @@ class TestJSONFields:
         identifiers = retrieved.get_identifiers()
         assert identifiers["goodreads"] == "234225"
         assert identifiers["mobi-asin"] == "B00B7NPRY8"
+
+
+class TestConnectionProfile:
+    """Tests for the SQLite performance profile."""
+
+    def test_performance_profile_applied_on_connect(self, db: Database):
+        """New connections use WAL and the profile's PRAGMAs."""
+        from src.vibecoding.booktracker.db.tuning import read_pragmas
+
+        raw = db.engine.raw_connection()
+        try:
+            pragmas = read_pragmas(raw.driver_connection)
+        finally:
+            raw.close()
+
+        assert db.profile_name == "performance"
+        assert pragmas["journal_mode"] == "wal"
+        assert pragmas["synchronous"] == "normal"
+        assert pragmas["temp_store"] == "memory"
+        assert pragmas["busy_timeout"] == 5000
+
+    def test_compatible_profile(self, tmp_path):
+        """The compatible profile keeps the rollback journal."""
+        db = Database(str(tmp_path / "compat.db"), profile="compatible")
+        db.create_tables()
+
+        with db.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "delete"
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 2
+
+    def test_synced_folder_defaults_to_compatible(self, tmp_path):
+        """Databases under a cloud-synced folder don't default to WAL."""
+        db = Database(str(tmp_path / "OneDrive - Contoso" / "booktracker" / "books.db"))
+        db.create_tables()
+
+        assert db.profile_name == "compatible"
+        with db.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "delete"
+        assert not list(db.db_path.parent.glob("*-wal"))
+
+    def test_configured_profile_overrides_path(self, tmp_path, monkeypatch):
+        """BOOKTRACKER_DB_PROFILE wins over the synced-folder default."""
+        from src.vibecoding.booktracker.config import reset_config
+
+        monkeypatch.setenv("BOOKTRACKER_DB_PROFILE", "performance")
+        reset_config()
+        try:
+            db = Database(str(tmp_path / "Dropbox" / "books.db"))
+        finally:
+            monkeypatch.delenv("BOOKTRACKER_DB_PROFILE")
+            reset_config()
+
+        assert db.profile_name == "performance"
+
+    def test_default_profile(self):
+        """Only paths inside a synced folder pick the compatible profile."""
+        from src.vibecoding.booktracker.db.tuning import default_profile
+
+        assert default_profile("~/OneDrive/booktracker/books.db") == "compatible"
+        assert default_profile("/Users/me/Library/Mobile Documents/books.db") == "compatible"
+        assert default_profile("/home/me/books.db") == "performance"
+        assert default_profile(":memory:") == "performance"
+
+    def test_is_memory(self, tmp_path):
+        """is_memory tells in-memory databases from files."""
+        assert Database(":memory:").is_memory
+        assert not Database(str(tmp_path / "x.db")).is_memory
+
+    def test_unknown_profile(self, tmp_path):
+        """Unknown profile names are rejected."""
+        with pytest.raises(ValueError, match="Unknown database profile"):
+            Database(str(tmp_path / "x.db"), profile="turbo")
+
+    def test_checkpoint_makes_file_copy_complete(self, db: Database, tmp_path):
+        """After a checkpoint, copying just the main file keeps committed rows."""
+        import shutil
+
+        db.create_book(BookCreate(title="In the WAL", author="Author"))
+        db.checkpoint()
+
+        copy_path = tmp_path / "copy.db"
+        shutil.copy2(db.db_path, copy_path)
+
+        copy = Database(str(copy_path))
+        assert [b.title for b in copy.get_all_books()] == ["In the WAL"]
+
+
+class TestBatch:
+    """Tests for Database.batch() unit-of-work batching."""
+
+    def test_batch_commits_once(self, db: Database, sample_book_data: BookCreate):
+        """Writes inside a batch are invisible to other sessions until it exits."""
+        other = Database(str(db.db_path))
+
+        with db.batch() as uow:
+            book = db.create_book(sample_book_data)
+            db.update_book(book.id, BookUpdate(rating=5))
+            assert other.get_book(book.id) is None
+            assert uow.operations >= 2
+
+        stored = other.get_book(book.id)
+        assert stored.rating == 5
+
+    def test_batch_rolls_back_on_error(self, db: Database, sample_book_data: BookCreate):
+        """An exception escaping the batch discards all of its writes."""
+        with pytest.raises(RuntimeError):
+            with db.batch():
+                db.create_book(sample_book_data)
+                raise RuntimeError("abort")
+
+        assert db.get_all_books() == []
+
+    def test_failed_operation_rolled_back_alone(
+        self, db: Database, sample_book_data: BookCreate
+    ):
+        """An operation that raises inside a batch doesn't undo the others."""
+        with db.batch():
+            kept = db.create_book(sample_book_data)
+            with pytest.raises(ValueError):
+                with db.get_session() as session:
+                    session.add(Book(title="Ghost", author="Nobody"))
+                    session.flush()
+                    raise ValueError("bad row")
+
+        titles = [b.title for b in db.get_all_books()]
+        assert titles == [kept.title]
+
+    def test_manager_commit_stays_in_batch(
+        self, db: Database, sample_book_data: BookCreate
+    ):
+        """A manager that commits its session doesn't commit the batch."""
+        from src.vibecoding.booktracker.notes.manager import NotesManager
+        from src.vibecoding.booktracker.notes.schemas import NoteCreate
+
+        book = db.create_book(sample_book_data)
+        notes = NotesManager(db)
+
+        with pytest.raises(RuntimeError):
+            with db.batch():
+                db.create_book(BookCreate(title="Rolled back", author="Author"))
+                notes.create_note(NoteCreate(book_id=book.id, content="Rolled back too"))
+                raise RuntimeError("abort")
+
+        assert [b.title for b in db.get_all_books()] == [book.title]
+        assert notes.get_stats().total_notes == 0
+
+    def test_manager_commit_then_failure(self, db: Database, sample_book_data: BookCreate):
+        """Work after a manager's commit is still rolled back with its operation."""
+        with db.batch():
+            with pytest.raises(ValueError):
+                with db.get_session() as session:
+                    session.add(Book(title="Committed", author="A"))
+                    session.commit()
+                    session.add(Book(title="Ghost", author="B"))
+                    session.flush()
+                    raise ValueError("bad row")
+
+        assert [b.title for b in db.get_all_books()] == ["Committed"]
+
+    def test_nested_batches_join(self, db: Database):
+        """A nested batch reuses the outer unit of work."""
+        with db.batch() as outer:
+            with db.batch() as inner:
+                assert inner is outer
+
+    def test_add_flushes_every_flush_size(self, db: Database):
+        """UnitOfWork.add flushes pending objects in groups."""
+        with db.batch(flush_size=2) as uow:
+            uow.add(Book(title="One", author="A"))
+            assert uow.session.new
+            uow.add(Book(title="Two", author="B"))
+            assert not uow.session.new
+
+        assert len(db.get_all_books()) == 2
+
+class TestConcurrentSessions:
+    """Tests for sessions on several threads."""
+
+    def test_read_then_write(self, db: Database, sample_book_data: BookCreate):
+        """Sessions that read a row, then update it, wait for each other's locks."""
+        import threading
+
+        from sqlalchemy.exc import OperationalError
+
+        book_id = db.create_book(sample_book_data).id
+        errors = []
+
+        def edit(worker: int) -> None:
+            for i in range(25):
+                try:
+                    with db.get_session() as session:
+                        book = session.get(Book, book_id)
+                        book.comments = f"{worker}-{i}"
+                except OperationalError as e:
+                    errors.append(e)
+
+        threads = [threading.Thread(target=edit, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
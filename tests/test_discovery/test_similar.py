@@ -311,3 +311,100 @@ class TestSimilarBooksFinder:
         similar = finder.find_similar(source_id, limit=2)
 
         assert len(similar) <= 2
+
+
+class TestVectorisedScoring:
+    """Tests that batched scoring matches the pairwise reference."""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        """Create a test database."""
+        from vibecoding.booktracker.db.sqlite import Database
+
+        db = Database(str(tmp_path / "test.db"))
+        db.create_tables()
+        return db
+
+    @pytest.fixture
+    def library(self, db):
+        """Create a varied library of favorites and candidates."""
+        import random
+
+        rng = random.Random(7)
+        authors = ["Ann Leckie", "Ursula K. Le Guin", "Ursula Le Guin", "Iain M. Banks", None]
+        series = ["Imperial Radch", "Earthsea", "Culture", None, None]
+        tags = ["sci-fi", "Fantasy", "space", "AI", "classic", "politics"]
+
+        for i in range(60):
+            db.create_book(BookCreate(
+                title=f"Book {i}",
+                author=rng.choice(authors) or "Unknown",
+                status=BookStatus.COMPLETED if i % 3 == 0 else BookStatus.WISHLIST,
+                rating=rng.choice([None, 3, 4, 5]),
+                page_count=rng.choice([None, 200, 320, 480, 640]),
+                publication_year=rng.choice([None, 1968, 1987, 2013, 2015]),
+                series=rng.choice(series),
+                tags=rng.sample(tags, rng.randint(0, 3)),
+            ))
+
+    def _reference(self, finder, db):
+        """Score candidates with the pairwise _calculate_similarity loop."""
+        books = db.get_all_books()
+        candidates = [b for b in books if b.status == BookStatus.WISHLIST.value]
+        favorites = [
+            b for b in books
+            if b.status == BookStatus.COMPLETED.value and (b.rating or 0) >= 4
+        ]
+        best = {}
+        for candidate in candidates:
+            best[candidate.id] = max(
+                finder._calculate_similarity(f, candidate).total_score for f in favorites
+            )
+        return favorites, best
+
+    def test_favorites_scores_match_reference(self, db, library):
+        """Test aggregate favorite scores against the pairwise loop."""
+        finder = SimilarBooksFinder(db)
+        _, expected = self._reference(finder, db)
+
+        results = finder.find_similar_to_favorites(limit=100)
+
+        assert len(results) == sum(1 for v in expected.values() if v > 0.1)
+        for result in results:
+            assert result.total_score == expected[result.book.id]
+        scores = [r.total_score for r in results]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_find_similar_matches_reference(self, db, library):
+        """Test single-source scores and breakdowns against the pairwise loop."""
+        finder = SimilarBooksFinder(db)
+        favorites, _ = self._reference(finder, db)
+        source = favorites[0]
+
+        results = finder.find_similar(source.id, limit=5)
+
+        expected = sorted(
+            (
+                finder._calculate_similarity(source, b).total_score
+                for b in db.get_all_books()
+                if b.status == BookStatus.WISHLIST.value
+            ),
+            reverse=True,
+        )
+        expected = [s for s in expected if s > 0.1][:5]
+        assert [r.total_score for r in results] == expected
+
+    def test_score_on_threshold_is_excluded(self, db):
+        """A total of exactly MIN_SIMILARITY is not similar, as in the pairwise loop."""
+        source = db.create_book(BookCreate(
+            title="Source", author="One", status=BookStatus.COMPLETED, rating=5, page_count=300,
+        ))
+        # Only the length matches: 1.0 * 0.10
+        candidate = db.create_book(BookCreate(
+            title="Candidate", author="Two", status=BookStatus.WISHLIST, page_count=300,
+        ))
+        finder = SimilarBooksFinder(db)
+        assert finder._calculate_similarity(source, candidate).total_score == 0.1
+
+        assert finder.find_similar(source.id) == []
+        assert finder.find_similar_to_favorites() == []
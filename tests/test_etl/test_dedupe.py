@@ -1,13 +1,17 @@
 """Tests for deduplication logic."""
 
+import hashlib
+
 import pytest
 
 from src.vibecoding.booktracker.db.schemas import BookCreate, BookSource, BookStatus
+from src.vibecoding.booktracker.etl import dedupe
 from src.vibecoding.booktracker.etl.dedupe import (
     DuplicateMatch,
     MatchType,
     deduplicate_books,
     find_duplicates,
+    find_duplicates_with_report,
     match_fuzzy,
     match_isbn,
     match_source_ids,
@@ -164,6 +168,117 @@ class TestFindDuplicates:
         assert len(duplicates) == 2
 
 
+class TestBlocking:
+    """Tests for candidate blocking in duplicate detection."""
+
+    @staticmethod
+    def _library(n: int) -> list[BookCreate]:
+        """Unrelated books with no ISBNs."""
+        digests = [hashlib.sha1(str(i).encode()).hexdigest() for i in range(n)]
+        return [BookCreate(title=d[:12], author=d[20:32]) for d in digests]
+
+    def test_fuzzy_match_within_author_block(self):
+        """Books by the same author are compared however far apart their titles sort."""
+        books = self._library(50) + [
+            BookCreate(title="Aardvark Stories", author="Stephen King"),
+            BookCreate(title="Stories: Aardvark", author="Stephen King"),
+        ]
+
+        duplicates, report = find_duplicates_with_report(books, block_window=1)
+        assert [d.match_type for d in duplicates] == [MatchType.FUZZY]
+        assert report.skipped_pairs > 0
+
+    def test_fuzzy_match_with_author_typo(self):
+        """Neighbouring titles are compared even when the author keys differ."""
+        books = self._library(50) + [
+            BookCreate(title="The Left Hand of Darkness", author="Ursula K Le Guin"),
+            BookCreate(title="Left Hand of Darkness", author="Ursula K LeGuin"),
+        ]
+
+        duplicates = find_duplicates(books)
+        assert len(duplicates) == 1
+        assert duplicates[0].match_type == MatchType.FUZZY
+
+    def test_source_ids_matched_without_blocking_loss(self):
+        """Source ID matches are found through the index regardless of titles."""
+        books = self._library(30) + [
+            BookCreate(title="Alpha", author="One", isbn="1", goodreads_id="42"),
+            BookCreate(title="Zulu", author="Two", isbn="2", goodreads_id="42"),
+        ]
+
+        duplicates = find_duplicates(books, block_window=0)
+        assert [d.match_type for d in duplicates] == [MatchType.GOODREADS_ID]
+
+    def test_matches_exhaustive_comparison(self):
+        """Blocking finds the same duplicates as comparing every pair."""
+        books = self._library(40) + [
+            BookCreate(title="Dune", author="Frank Herbert"),
+            BookCreate(title="Dune.", author="Frank Herbert"),
+            BookCreate(title="Foundation", author="Isaac Asimov", calibre_uuid="u-1"),
+            BookCreate(title="Foundation", author="Asimov", calibre_uuid="u-1"),
+        ]
+
+        blocked, report = find_duplicates_with_report(books)
+        exhaustive, full_report = find_duplicates_with_report(books, block_window=None)
+
+        def key(d):
+            return (d.book1.title, d.book2.title, d.match_type)
+
+        assert sorted(map(key, blocked)) == sorted(map(key, exhaustive))
+        assert full_report.skipped_pairs == 0
+        assert report.compared_pairs < full_report.compared_pairs
+
+    def test_report_counts(self):
+        """Report accounts for every pair."""
+        books = [
+            BookCreate(title="Book A", author="Author", isbn="1111111111"),
+            BookCreate(title="Book A Copy", author="Author", isbn="1111111111"),
+            BookCreate(title="Book B", author="Someone"),
+        ]
+
+        result = deduplicate_books(books)
+        report = result.blocking
+        assert report.books == 3
+        assert report.total_pairs == 3
+        assert report.isbn_pairs == 1
+        assert report.isbn_pairs + report.compared_pairs + report.skipped_pairs == 3
+
+
+class TestParallelMatching:
+    """Tests for process-pool pair comparison."""
+
+    def test_parallel_matches_sequential(self, monkeypatch):
+        """Workers find the same matches, in the same order, bound to the input books."""
+        monkeypatch.setattr(dedupe, "MIN_PARALLEL_PAIRS", 0)
+        books = TestBlocking._library(60) + [
+            BookCreate(title="Dune", author="Frank Herbert"),
+            BookCreate(title="Dune.", author="Frank Herbert"),
+            BookCreate(title="Emma", author="Jane Austen", goodreads_id="7"),
+            BookCreate(title="Emma", author="Austen", isbn="1", goodreads_id="7"),
+        ]
+
+        sequential = find_duplicates(books, block_window=None)
+        parallel = find_duplicates(books, block_window=None, workers=2)
+
+        assert [(d.book1.title, d.book2.title, d.match_type) for d in parallel] == [
+            (d.book1.title, d.book2.title, d.match_type) for d in sequential
+        ]
+        assert all(any(d.book1 is b for b in books) for d in parallel)
+
+    def test_deduplicate_with_workers(self, monkeypatch):
+        """deduplicate_books can map parallel matches back to its clusters."""
+        monkeypatch.setattr(dedupe, "MIN_PARALLEL_PAIRS", 0)
+        books = [
+            BookCreate(title="Dune", author="Frank Herbert", goodreads_id="1"),
+            BookCreate(title="Dune", author="Frank Herbert", goodreads_id="1"),
+            BookCreate(title="Emma", author="Jane Austen"),
+        ]
+
+        result = deduplicate_books(books, workers=2)
+        assert len(result.merged_books) == 1
+        assert len(result.unique_books) == 1
+
+
 class TestMergeBookRecords:
     """Tests for merging duplicate books."""
 
@@ -11,6 +11,7 @@ from src.vibecoding.booktracker.etl.extract import (
     extract_goodreads_csv,
     extract_notion_csv,
     extract_all,
+    count_rows,
 )
 
 
@@ -41,6 +42,47 @@ class TestExtractNotion:
         assert rows[0]["raw"]["Title"] == "Book One"
 
 
+class TestStreamingExtraction:
+    """Tests for row-by-row CSV parsing."""
+
+    def test_rows_are_yielded_lazily(self, tmp_path):
+        """The first row is available before the rest of the file is parsed."""
+        csv_file = tmp_path / "notion.csv"
+        csv_file.write_text('Title,Author\nFirst,A\nSecond,"unterminated\n')
+
+        rows = extract_notion_csv(csv_file, show_progress=False)
+        assert next(rows)["raw"]["Title"] == "First"
+
+    def test_missing_values_are_empty_strings(self, tmp_path):
+        """Short rows and pandas-style NA markers come through as ""."""
+        csv_file = tmp_path / "goodreads.csv"
+        csv_file.write_text("Title,Author,ISBN\nBook,NA\nOther,Someone,N/A\n")
+
+        rows = list(extract_goodreads_csv(csv_file, show_progress=False))
+        assert rows[0]["raw"] == {"Title": "Book", "Author": "", "ISBN": ""}
+        assert rows[1]["raw"]["ISBN"] == ""
+
+    def test_utf8_bom_and_multiline_fields(self, tmp_path):
+        """A BOM does not leak into the header and quoted newlines stay in one row."""
+        csv_file = tmp_path / "calibre.csv"
+        csv_file.write_bytes(
+            b'\xef\xbb\xbftitle,comments\nDune,"Line one\nLine two"\nEmma,\n'
+        )
+
+        rows = list(extract_calibre_csv(csv_file, show_progress=False))
+        assert [r["raw"]["title"] for r in rows] == ["Dune", "Emma"]
+        assert rows[0]["raw"]["comments"] == "Line one\nLine two"
+        assert count_rows(csv_file) == 2
+
+    def test_latin1_file(self, tmp_path):
+        """Non-UTF-8 exports are decoded with a fallback encoding."""
+        csv_file = tmp_path / "notion.csv"
+        csv_file.write_bytes("Title,Author\nCaf\u00e9,Zo\u00eb\n".encode("latin-1"))
+
+        rows = list(extract_notion_csv(csv_file, show_progress=False))
+        assert rows[0]["raw"]["Title"] == "Caf\u00e9"
+
+
 class TestExtractCalibre:
     """Tests for Calibre CSV extraction."""
 
@@ -0,0 +1,65 @@
+"""Tests for loading books into the database."""
+
+from src.vibecoding.booktracker.db.schemas import BookCreate, BookSource
+from src.vibecoding.booktracker.db.sqlite import Database
+from src.vibecoding.booktracker.etl.load import load_books
+
+
+class TestLoadBooks:
+    """Tests for the bulk book loader."""
+
+    def test_loads_books_with_sync_items(self, db: Database):
+        """Every new book is inserted and queued for sync."""
+        books = [
+            BookCreate(
+                title=f"Book {i}",
+                author="Author",
+                isbn=f"00000000{i:02d}",
+                tags=["fiction"],
+                sources=[BookSource.CALIBRE],
+            )
+            for i in range(12)
+        ]
+
+        result = load_books(books, db=db, show_progress=False, chunk_size=5)
+
+        assert result.imported == 12
+        assert result.errors == []
+        assert result.rows_per_second > 0
+        assert len(db.get_all_books()) == 12
+        assert db.count_pending_sync_items() == 12
+
+        stored = db.get_book_by_isbn("0000000003")
+        assert stored.get_tags() == ["fiction"]
+        assert stored.get_sources() == ["calibre"]
+
+    def test_skips_existing_and_repeated_isbns(self, db: Database):
+        """Books matching a stored ISBN, or an earlier book in the load, are skipped."""
+        db.create_book(BookCreate(title="Stored", author="A", isbn13="9780000000001"))
+
+        books = [
+            BookCreate(title="Same as stored", author="A", isbn="9780000000001"),
+            BookCreate(title="New", author="B", isbn="1111111111"),
+            BookCreate(title="Repeat of new", author="B", isbn13="1111111111"),
+            BookCreate(title="No ISBN", author="C"),
+        ]
+
+        result = load_books(books, db=db, show_progress=False)
+
+        assert result.imported == 2
+        assert result.skipped == 2
+        assert {b.title for b in db.get_all_books()} == {"Stored", "New", "No ISBN"}
+
+    def test_failed_chunk_reports_per_book(self, db: Database, monkeypatch):
+        """A failing bulk insert falls back to per-book inserts for error reporting."""
+
+        def fail(*args, **kwargs):
+            raise RuntimeError("bulk insert failed")
+
+        monkeypatch.setattr(db, "bulk_create_books", fail)
+        books = [BookCreate(title="One", author="A"), BookCreate(title="Two", author="B")]
+
+        result = load_books(books, db=db, show_progress=False)
+
+        assert result.imported == 2
+        assert len(db.get_all_books()) == 2
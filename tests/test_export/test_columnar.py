@@ -0,0 +1,180 @@
+"""Tests for columnar (Parquet / Arrow) export."""
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from datetime import date, timedelta
+
+from vibecoding.booktracker.db.models import Base
+from vibecoding.booktracker.db.schemas import BookCreate, BookStatus, ReadingLogCreate
+from vibecoding.booktracker.export.columnar import (
+    COLUMNAR_TABLES,
+    ColumnarExporter,
+    arrow_schema,
+    decode_batch,
+    read_batches,
+)
+from vibecoding.booktracker.export.csv_export import ExportFormat
+from vibecoding.booktracker.streaks.models import DailyReading
+
+
+class TestArrowSchema:
+    """Tests for the typed schema of each table."""
+
+    def test_book_types(self):
+        """Columns keep their types; dates and tags are typed."""
+        schema = arrow_schema(Base.metadata.tables["books"])
+        assert schema.field("title").type == pa.string()
+        assert schema.field("rating").type == pa.int64()
+        assert schema.field("series_index").type == pa.float64()
+        assert schema.field("read_next").type == pa.bool_()
+        assert schema.field("date_finished").type == pa.date32()
+        assert schema.field("tags").type == pa.list_(pa.string())
+        assert not schema.field("id").nullable
+
+    def test_daily_reading_date(self):
+        """Daily readings are keyed by a date32 column."""
+        schema = arrow_schema(Base.metadata.tables["daily_readings"])
+        assert schema.field("reading_date").type == pa.date32()
+        assert schema.field("goal_met").type == pa.bool_()
+
+
+class TestColumnarExporter:
+    """Tests for ColumnarExporter."""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        """Create a test database."""
+        from vibecoding.booktracker.db.sqlite import Database
+
+        db = Database(str(tmp_path / "test.db"))
+        db.create_tables()
+        return db
+
+    @pytest.fixture
+    def exporter(self, db):
+        """Create exporter instance."""
+        return ColumnarExporter(db)
+
+    @pytest.fixture
+    def library(self, db):
+        """Books, reading logs and daily readings."""
+        today = date.today()
+        books = [
+            db.create_book(
+                BookCreate(
+                    title=f"Book {i}",
+                    author="Author",
+                    status=BookStatus.COMPLETED,
+                    rating=4,
+                    page_count=200 + i,
+                    date_finished=(today - timedelta(days=i)).isoformat(),
+                    tags=["fiction", f"tag{i}"],
+                )
+            )
+            for i in range(3)
+        ]
+        with db.get_session() as session:
+            for i in range(4):
+                db.create_reading_log(
+                    ReadingLogCreate(
+                        book_id=books[0].id,
+                        date=(today - timedelta(days=i)).isoformat(),
+                        pages_read=20,
+                    ),
+                    session,
+                )
+            session.add(
+                DailyReading(
+                    reading_date=today.isoformat(),
+                    minutes_read=30,
+                    pages_read=20,
+                    goal_met=True,
+                    weekday=today.weekday(),
+                )
+            )
+        return books
+
+    @pytest.mark.parametrize(
+        "format,compression",
+        [
+            (ExportFormat.PARQUET, "zstd"),
+            (ExportFormat.PARQUET, None),
+            (ExportFormat.ARROW, "lz4"),
+            (ExportFormat.ARROW, None),
+        ],
+    )
+    def test_export_library(self, exporter, library, tmp_path, format, compression):
+        """Each table is written to its own typed file."""
+        result = exporter.export_library(tmp_path / "out", format=format, compression=compression)
+
+        assert result.success is True
+        assert result.table_counts == {"books": 3, "reading_logs": 4, "daily_readings": 1}
+        assert result.records_exported == 8
+        suffix = ".parquet" if format == ExportFormat.PARQUET else ".arrow"
+        assert sorted(p.name for p in (tmp_path / "out").iterdir()) == sorted(
+            f"{name}{suffix}" for name in COLUMNAR_TABLES
+        )
+
+        batches = list(read_batches(tmp_path / "out" / f"books{suffix}"))
+        table = pa.Table.from_batches(batches)
+        assert table.schema.field("date_finished").type == pa.date32()
+        assert sorted(table.column("page_count").to_pylist()) == [200, 201, 202]
+        assert ["fiction", "tag0"] in table.column("tags").to_pylist()
+
+    def test_parquet_compression(self, exporter, library, tmp_path):
+        """Parquet column chunks use the requested codec."""
+        exporter.export_library(tmp_path, compression="zstd", tables=["books"])
+
+        metadata = pq.ParquetFile(tmp_path / "books.parquet").metadata
+        assert metadata.row_group(0).column(0).compression == "ZSTD"
+
+    def test_uncompressed_arrow_is_memory_mapped(self, exporter, library, tmp_path):
+        """Uncompressed Arrow files are read in place, without copying."""
+        exporter.export_library(tmp_path, format=ExportFormat.ARROW, compression=None)
+
+        pool = pa.default_memory_pool()
+        before = pool.bytes_allocated()
+        batches = list(read_batches(tmp_path / "reading_logs.arrow"))
+        assert sum(batch.num_rows for batch in batches) == 4
+        assert pool.bytes_allocated() == before
+
+    def test_decode_restores_column_values(self, exporter, db, library, tmp_path):
+        """Decoded rows match what is stored in the database."""
+        exporter.export_library(tmp_path, tables=["books"])
+
+        (batch,) = read_batches(tmp_path / "books.parquet")
+        rows = {row["id"]: row for row in decode_batch("books", batch)}
+        for book in library:
+            stored = db.get_book(book.id)
+            assert rows[book.id]["date_finished"] == stored.date_finished
+            assert rows[book.id]["tags"] == stored.tags
+            assert rows[book.id]["read_next"] is False
+
+    def test_empty_library(self, exporter, tmp_path):
+        """An empty library exports empty files with the full schema."""
+        result = exporter.export_library(tmp_path)
+
+        assert result.success is True
+        assert result.records_exported == 0
+        schema = pq.read_schema(tmp_path / "books.parquet")
+        assert schema.field("date_added").type == pa.date32()
+
+    def test_rejects_non_columnar_format(self, exporter, tmp_path):
+        """CSV formats aren't columnar."""
+        result = exporter.export_library(tmp_path, format=ExportFormat.STANDARD)
+
+        assert result.success is False
+        assert "columnar" in result.error
+
+    def test_bad_date_removes_partial_files(self, exporter, db, library, tmp_path):
+        """A failed export leaves no files behind."""
+        from sqlalchemy import text
+
+        with db.get_session() as session:
+            session.execute(text("UPDATE reading_logs SET date = 'yesterday'"))
+
+        result = exporter.export_library(tmp_path / "out")
+
+        assert result.success is False
+        assert list((tmp_path / "out").iterdir()) == []
@@ -327,3 +327,60 @@ class TestCSVExporter:
 
         # Calibre uses 10-star rating
         assert row["rating"] == "10"
+
+    def test_write_books_streams_in_batches(self, exporter, sample_books, monkeypatch):
+        """The header is flushed before any rows, then each batch as it's read."""
+        from io import StringIO
+        from vibecoding.booktracker.export import csv_export
+
+        monkeypatch.setattr(csv_export, "EXPORT_BATCH_SIZE", 2)
+
+        class Recorder(StringIO):
+            def __init__(self):
+                super().__init__()
+                self.flushed = []
+
+            def flush(self):
+                self.flushed.append(self.getvalue().count("\n"))
+
+        stream = Recorder()
+        count = exporter.write_books(stream, format=ExportFormat.GOODREADS)
+
+        assert count == 5
+        # Header, then batches of 2, 2 and 1 rows
+        assert stream.flushed == [1, 3, 5, 6]
+
+    @pytest.mark.parametrize("format", list(CSVExporter.FORMAT_FIELDS))
+    def test_export_selects_only_format_columns(self, db, exporter, sample_books, tmp_path, format):
+        """Large columns the format doesn't use are never read."""
+        from sqlalchemy import event
+
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", capture)
+        try:
+            result = exporter.export_books(tmp_path / "out.csv", format=format)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", capture)
+
+        assert result.records_exported == 5
+        book_queries = [s for s in statements if "FROM books" in s]
+        assert book_queries
+        for statement in book_queries:
+            assert "cover_base64" not in statement
+            assert "description" not in statement
+
+    def test_export_reading_logs_includes_titles(
+        self, exporter, sample_books, sample_logs, tmp_path
+    ):
+        """Log rows carry their book's title from the joined query."""
+        output = tmp_path / "logs.csv"
+        exporter.export_reading_logs(output)
+
+        with open(output, "r", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+
+        assert {row["book_title"] for row in rows} == {"Test Book 1"}
@@ -317,3 +317,31 @@ class TestJSONExporter:
 
         assert data["books"][0]["title"] == "日本語の本"
         assert data["books"][0]["author"] == "作家名"
+
+    @pytest.mark.parametrize("pretty", [True, False])
+    def test_streamed_layout_matches_json_dump(self, exporter, sample_books, sample_logs, pretty):
+        """Streaming writes the same text json.dump would."""
+        json_str = exporter.export_to_string(pretty=pretty)
+
+        data = json.loads(json_str)
+        assert len(data["books"]) == 5
+        assert json_str == json.dumps(data, indent=2 if pretty else None, ensure_ascii=False)
+
+    def test_write_all_flushes_header_first(self, exporter, sample_books):
+        """The document header reaches the stream before any book is read."""
+        from io import StringIO
+
+        class Recorder(StringIO):
+            def __init__(self):
+                super().__init__()
+                self.flushed = []
+
+            def flush(self):
+                self.flushed.append(self.getvalue())
+
+        stream = Recorder()
+        counts = exporter.write_all(stream, include_reading_logs=False)
+
+        assert counts == {"books": 5}
+        assert "exported_at" in stream.flushed[0]
+        assert "Test Book" not in stream.flushed[0]
@@ -0,0 +1,195 @@
+"""Tests for the columnar (Parquet / Arrow) importer."""
+
+import pytest
+from datetime import date, timedelta
+
+from sqlalchemy import func, select
+
+from vibecoding.booktracker.db.models import Book, ReadingLog
+from vibecoding.booktracker.db.schemas import BookCreate, BookStatus, BookUpdate, ReadingLogCreate
+from vibecoding.booktracker.export.columnar import ColumnarExporter
+from vibecoding.booktracker.export.csv_export import ExportFormat
+from vibecoding.booktracker.imports.base import DuplicateHandling
+from vibecoding.booktracker.imports.columnar import ColumnarImporter
+from vibecoding.booktracker.streaks.models import DailyReading
+
+
+def _make_db(path):
+    from vibecoding.booktracker.db.sqlite import Database
+
+    db = Database(str(path))
+    db.create_tables()
+    return db
+
+
+def _count(db, model):
+    with db.get_session() as session:
+        return session.execute(select(func.count()).select_from(model)).scalar_one()
+
+
+class TestColumnarImporter:
+    """Tests for ColumnarImporter."""
+
+    @pytest.fixture
+    def source_db(self, tmp_path):
+        """A library to export."""
+        db = _make_db(tmp_path / "source.db")
+        today = date.today()
+        books = [
+            db.create_book(
+                BookCreate(
+                    title=f"Book {i}",
+                    author="Author",
+                    status=BookStatus.COMPLETED,
+                    rating=3 + i % 3,
+                    page_count=300,
+                    date_finished=(today - timedelta(days=i)).isoformat(),
+                    tags=["fiction"],
+                )
+            )
+            for i in range(5)
+        ]
+        with db.get_session() as session:
+            for i, book in enumerate(books):
+                db.create_reading_log(
+                    ReadingLogCreate(book_id=book.id, date=today.isoformat(), pages_read=10 + i),
+                    session,
+                )
+            session.add(
+                DailyReading(
+                    reading_date=today.isoformat(), minutes_read=45, weekday=today.weekday()
+                )
+            )
+        return db
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        """An empty library to import into."""
+        return _make_db(tmp_path / "target.db")
+
+    @pytest.fixture
+    def importer(self, db):
+        """Create importer instance."""
+        return ColumnarImporter(db)
+
+    @pytest.fixture(params=[ExportFormat.PARQUET, ExportFormat.ARROW])
+    def export_dir(self, source_db, tmp_path, request):
+        """The source library exported in each columnar format."""
+        out = tmp_path / "export"
+        result = ColumnarExporter(source_db).export_library(out, format=request.param)
+        assert result.success
+        return out
+
+    def test_round_trip(self, importer, db, source_db, export_dir):
+        """Every table comes back with the same values."""
+        result = importer.import_file(export_dir)
+
+        assert result.success is True
+        assert result.table_counts == {"books": 5, "reading_logs": 5, "daily_readings": 1}
+        assert result.imported == 11
+        for book in source_db.get_all_books():
+            imported = db.get_book(book.id)
+            assert imported.title == book.title
+            assert imported.rating == book.rating
+            assert imported.date_finished == book.date_finished
+            assert imported.get_tags() == ["fiction"]
+        with db.get_session() as session:
+            daily = session.execute(select(DailyReading)).scalar_one()
+            assert daily.reading_date == date.today().isoformat()
+            assert daily.minutes_read == 45
+
+    def test_books_are_searchable(self, importer, db, export_dir):
+        """Imported books are indexed like any other write."""
+        importer.import_file(export_dir)
+
+        assert len(db.search_books("Book 3")) >= 1
+
+    def test_books_are_suggested(self, importer, db, export_dir):
+        """Imported books show up in autocomplete suggestions."""
+        from vibecoding.booktracker.search.manager import SearchManager
+
+        search = SearchManager(db)
+        assert search.get_suggestions("book").suggestions == []
+
+        importer.import_file(export_dir)
+
+        titles = {s.text for s in search.get_suggestions("book").suggestions}
+        assert "Book 3" in titles
+
+    def test_single_file(self, importer, db, export_dir):
+        """A single table's file can be imported on its own."""
+        (books_file,) = export_dir.glob("books.*")
+        result = importer.import_file(books_file)
+
+        assert result.table_counts == {"books": 5}
+        assert _count(db, ReadingLog) == 0
+
+    def test_skip_existing(self, importer, db, export_dir):
+        """With SKIP, rows already in the library are left alone."""
+        importer.import_file(export_dir)
+        book = db.get_all_books()[0]
+        db.update_book(book.id, BookUpdate(rating=1))
+
+        result = importer.import_file(export_dir)
+
+        assert result.imported == 0
+        assert result.skipped == 11
+        assert db.get_book(book.id).rating == 1
+
+    def test_update_existing(self, importer, db, export_dir):
+        """With UPDATE, existing rows take the file's values."""
+        importer.import_file(export_dir)
+        book = db.get_all_books()[0]
+        original = book.rating
+        db.update_book(book.id, BookUpdate(rating=1))
+
+        result = importer.import_file(export_dir, duplicate_handling=DuplicateHandling.UPDATE)
+
+        assert result.updated == 11
+        assert result.imported == 0
+        assert db.get_book(book.id).rating == original
+        assert _count(db, Book) == 5
+
+    def test_create_new_unsupported(self, importer, db, export_dir):
+        """Rows are matched by id, so CREATE_NEW is refused."""
+        result = importer.import_file(export_dir, duplicate_handling=DuplicateHandling.CREATE_NEW)
+
+        assert result.success is False
+        assert _count(db, Book) == 0
+
+    def test_dry_run(self, importer, db, export_dir):
+        """A dry run counts rows without writing them."""
+        result = importer.import_file(export_dir, dry_run=True)
+
+        assert result.imported == 11
+        assert _count(db, Book) == 0
+
+    def test_conflicting_row_is_an_error(self, importer, db, export_dir):
+        """A row the database rejects is reported; the rest are imported."""
+        with db.get_session() as session:
+            session.add(DailyReading(reading_date=date.today().isoformat(), weekday=0))
+
+        result = importer.import_file(export_dir)
+
+        assert result.errors == 1
+        assert result.table_counts["books"] == 5
+        assert result.table_counts["daily_readings"] == 0
+        assert "daily_readings" in result.error_messages[0]
+
+    def test_preview_matches_by_id(self, importer, export_dir):
+        """The preview counts books by id."""
+        importer.import_file(export_dir, duplicate_handling=DuplicateHandling.SKIP)
+
+        preview = importer.preview_import(export_dir)
+
+        assert preview["valid"] is True
+        assert preview["total_records"] == 5
+        assert preview["existing_books"] == 5
+
+    def test_validate_missing(self, importer, tmp_path):
+        """A path with no columnar files is rejected."""
+        assert importer.validate_file(tmp_path / "nope")[0] is False
+        (tmp_path / "empty").mkdir()
+        is_valid, error = importer.validate_file(tmp_path / "empty")
+        assert is_valid is False
+        assert "parquet" in error
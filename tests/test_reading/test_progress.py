@@ -171,33 +171,28 @@ class TestProgressTracker:
         assert stats.total_pages == 0
         assert stats.total_sessions == 0
 
-    def test_get_stats_with_logs(self, tracker, mock_db):
+    def test_get_stats_with_logs(self, tmp_path):
         """Test get_stats with reading logs."""
-        mock_log1 = MagicMock()
-        mock_log1.book_id = "book-1"
-        mock_log1.pages_read = 50
-        mock_log1.duration_minutes = 60
-        mock_log1.location = "home"
-        mock_log1.date = (date.today() - timedelta(days=1)).isoformat()
-
-        mock_log2 = MagicMock()
-        mock_log2.book_id = "book-1"
-        mock_log2.pages_read = 30
-        mock_log2.duration_minutes = 45
-        mock_log2.location = "commute"
-        mock_log2.date = date.today().isoformat()
-
-        mock_session = MagicMock()
-        # First call for reading logs, second for finished books
-        mock_session.execute.return_value.scalars.return_value.all.side_effect = [
-            [mock_log1, mock_log2],  # Reading logs
-            [],  # Finished books
-        ]
-
-        mock_db.get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
-        mock_db.get_session.return_value.__exit__ = MagicMock(return_value=False)
-
-        stats = tracker.get_stats()
+        from src.vibecoding.booktracker.db.schemas import BookCreate, ReadingLogCreate
+        from src.vibecoding.booktracker.db.sqlite import Database
+
+        db = Database(str(tmp_path / "test.db"))
+        db.create_tables()
+        book = db.create_book(BookCreate(title="Book", author="Author"))
+        with db.get_session() as session:
+            for days_ago, pages, minutes, location in [(1, 50, 60, "home"), (0, 30, 45, "commute")]:
+                db.create_reading_log(
+                    ReadingLogCreate(
+                        book_id=book.id,
+                        date=(date.today() - timedelta(days=days_ago)).isoformat(),
+                        pages_read=pages,
+                        duration_minutes=minutes,
+                        location=location,
+                    ),
+                    session,
+                )
+
+        stats = ProgressTracker(db).get_stats()
 
         assert stats.total_pages == 80  # 50 + 30
         assert stats.total_minutes == 105  # 60 + 45
@@ -206,6 +201,7 @@ class TestProgressTracker:
         assert stats.avg_pages_per_session == 40.0  # 80 / 2
         assert stats.pages_by_location["home"] == 50
         assert stats.pages_by_location["commute"] == 30
+        assert stats.current_streak_days == 2
 
     def test_get_currently_reading(self, tracker, mock_db):
         """Test getting currently reading books."""
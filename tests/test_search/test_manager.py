@@ -425,6 +425,65 @@ class TestSearchSuggestions:
         authors = [s.text for s in suggestions.suggestions if s.result_type == ResultType.AUTHOR]
         # May or may not find matches depending on data
 
+    def test_suggestions_match_word_prefix(self, manager, sample_books):
+        """Test that any word of a term can be completed."""
+        suggestions = manager.get_suggestions("mock")
+
+        assert [s.text for s in suggestions.suggestions] == ["To Kill a Mockingbird"]
+
+    def test_suggestions_ranked_by_frequency(self, manager, db, sample_books):
+        """Test that more frequent terms rank first."""
+        with db.get_session() as session:
+            session.add(Book(title="Animal Farm", author="George Orwell", status="read"))
+
+        suggestions = manager.get_suggestions("george")
+
+        first = suggestions.suggestions[0]
+        assert first.text == "George Orwell"
+        assert first.result_type == ResultType.AUTHOR
+        assert first.count == 2
+
+    def test_suggestions_include_series_and_tags(self, manager, db, sample_books, sample_notes):
+        """Test series, book tag and note tag suggestions."""
+        with db.get_session() as session:
+            book = Book(
+                title="Dune", author="Frank Herbert", status="read", series="Dune Chronicles"
+            )
+            book.set_tags(["space-opera"])
+            session.add(book)
+
+        series = manager.get_suggestions("chron").suggestions
+        tags = manager.get_suggestions("space").suggestions
+        note_tags = manager.get_suggestions("symbol").suggestions
+
+        assert [(s.text, s.result_type) for s in series] == [("Dune Chronicles", ResultType.SERIES)]
+        assert [(s.text, s.result_type) for s in tags] == [("space-opera", ResultType.TAG)]
+        assert [(s.text, s.result_type) for s in note_tags] == [("symbolism", ResultType.TAG)]
+
+    def test_index_refreshes_after_changes(self, manager, db, sample_books):
+        """Test that a built index picks up committed edits and deletes."""
+        assert manager.get_suggestions("gatsby").suggestions
+
+        with db.get_session() as session:
+            session.get(Book, sample_books[0]).title = "Trimalchio"
+            session.delete(session.get(Book, sample_books[1]))
+
+        assert manager.get_suggestions("gatsby").suggestions == []
+        assert [s.text for s in manager.get_suggestions("trim").suggestions] == ["Trimalchio"]
+        assert manager.get_suggestions("orwell").suggestions == []
+
+    def test_index_ignores_rolled_back_changes(self, manager, db, sample_books):
+        """Test that rolled-back writes never reach the index."""
+        assert manager.get_suggestions("gatsby").suggestions
+
+        with pytest.raises(RuntimeError):
+            with db.get_session() as session:
+                session.add(Book(title="Phantom Book", author="Nobody", status="read"))
+                session.flush()
+                raise RuntimeError("abort")
+
+        assert manager.get_suggestions("phantom").suggestions == []
+
 
 class TestRelevanceScoring:
     """Tests for relevance scoring."""
@@ -489,3 +548,136 @@ class TestSorting:
             titles = [r.title.lower() for r in results.results]
             # Should be sorted (ascending or descending)
             assert titles == sorted(titles) or titles == sorted(titles, reverse=True)
+
+
+class TestFullTextIndex:
+    """Tests for the FTS5-backed search path."""
+
+    def test_fts_enabled(self, manager):
+        """Test that create_tables installs the FTS indexes."""
+        assert manager._use_fts() is True
+
+    def test_prefix_match(self, manager, sample_books):
+        """Test that partial words match by prefix."""
+        results = manager.search_books("gats fitz")
+
+        assert [r.title for r in results] == ["The Great Gatsby"]
+
+    def test_index_follows_updates(self, manager, db, sample_books):
+        """Test that the index tracks edits and deletes."""
+        with db.get_session() as session:
+            book = session.get(Book, sample_books[0])
+            book.title = "Trimalchio in West Egg"
+
+        assert manager.search_books("gatsby") == []
+        assert len(manager.search_books("trimalchio")) == 1
+
+        with db.get_session() as session:
+            session.delete(session.get(Book, sample_books[0]))
+
+        assert manager.search_books("trimalchio") == []
+
+    def test_title_ranks_above_description(self, manager, db, sample_books):
+        """Test BM25 column weighting favours title matches."""
+        with db.get_session() as session:
+            session.add(
+                Book(
+                    title="Unrelated",
+                    author="Someone",
+                    status="read",
+                    description="Mentions a mockingbird in passing.",
+                )
+            )
+
+        results = manager.search_books("mockingbird")
+
+        assert results[0].title == "To Kill a Mockingbird"
+        assert results[0].relevance_score > results[1].relevance_score
+
+    def test_query_syntax_is_escaped(self, manager, sample_books):
+        """Test that FTS5 operators in user input are treated as text."""
+        results = manager.search_books('gatsby" OR "1984')
+
+        assert results == []
+
+    def test_search_reviews(self, manager, db, sample_books):
+        """Test review search through the index."""
+        from vibecoding.booktracker.reviews.models import Review
+
+        with db.get_session() as session:
+            session.add(
+                Review(
+                    book_id=sample_books[1],
+                    title="Chilling",
+                    content="Surveillance everywhere.",
+                    rating=5,
+                )
+            )
+
+        results = manager.search_reviews("surveil")
+
+        assert len(results) == 1
+        assert results[0].book_title == "1984"
+
+
+class TestPagination:
+    """Tests for merged, keyset-paginated unified search."""
+
+    def _collect(self, manager, **kwargs):
+        """Walk every page of a query via next_cursor."""
+        query = SearchQuery(**kwargs)
+        pages = []
+        while True:
+            results = manager.search(query)
+            pages.append(results)
+            if not results.next_cursor:
+                return pages
+            query = query.model_copy(update={"cursor": results.next_cursor})
+
+    def test_cursor_walks_all_results(self, manager, sample_books, sample_notes, sample_quotes):
+        """Test that cursor pages cover every match exactly once."""
+        full = manager.search(SearchQuery(query="the", limit=200))
+        pages = self._collect(manager, query="the", limit=2)
+
+        ids = [(r.result_type, r.id) for page in pages for r in page.results]
+        assert len(ids) == len(set(ids)) == full.total_count
+        assert ids == [(r.result_type, r.id) for r in full.results]
+        assert all(page.total_count == full.total_count for page in pages)
+
+    def test_cursor_pages_sorted_by_title(self, manager, sample_books, sample_notes):
+        """Test keyset pagination with a title sort across scopes."""
+        pages = self._collect(
+            manager, query="the", limit=2, sort_by=SortBy.TITLE, sort_order="asc"
+        )
+
+        titles = [r.title.lower() for page in pages for r in page.results]
+        assert titles == sorted(titles)
+
+    def test_offset_matches_cursor(self, manager, sample_books, sample_notes):
+        """Test that offset and cursor paging return the same second page."""
+        first = manager.search(SearchQuery(query="the", limit=2))
+        by_cursor = manager.search(
+            SearchQuery(query="the", limit=2, cursor=first.next_cursor)
+        )
+        by_offset = manager.search(SearchQuery(query="the", limit=2, offset=2))
+
+        assert [r.id for r in by_cursor.results] == [r.id for r in by_offset.results]
+
+    def test_last_page_has_no_cursor(self, manager, sample_books):
+        """Test that the final page reports no more results."""
+        results = manager.search(SearchQuery(query="gatsby", limit=50))
+
+        assert results.has_more is False
+        assert results.next_cursor is None
+
+    def test_cursor_from_other_query_rejected(self, manager, sample_books):
+        """Test that a cursor cannot be replayed against a different query."""
+        first = manager.search(SearchQuery(query="the", limit=1))
+
+        with pytest.raises(ValueError):
+            manager.search(SearchQuery(query="novel", cursor=first.next_cursor))
+
+    def test_malformed_cursor_rejected(self, manager, sample_books):
+        """Test that garbage cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            manager.search(SearchQuery(query="the", cursor="not-a-cursor"))
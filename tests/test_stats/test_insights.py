@@ -355,6 +355,22 @@ class TestInsightGenerator:
         keep_streak = [i for i in rec_insights if "streak" in i.message.lower()]
         # May or may not have this depending on streak calculation
 
+    def test_streak_skips_no_days(self, db):
+        """A gap ends the streak, as it does for the streak engine."""
+        today = date.today()
+        book = db.create_book(BookCreate(title="Test Book", author="Author"))
+        for days_ago in (0, 2, 4, 5, 6, 7):
+            with db.get_session() as session:
+                db.create_reading_log(ReadingLogCreate(
+                    book_id=book.id,
+                    date=(today - timedelta(days=days_ago)).isoformat(),
+                    pages_read=30,
+                ), session)
+
+        insights = InsightGenerator(db).generate_all_insights()
+
+        assert not [i for i in insights if i.insight_type == InsightType.STREAK]
+
     def test_pace_trend_insight(self, db):
         """Test pace trend detection."""
         today = date.today()
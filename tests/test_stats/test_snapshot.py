@@ -0,0 +1,164 @@
+"""Tests for the in-memory library snapshot."""
+
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+
+from vibecoding.booktracker.db.cache import clear_result_cache
+from vibecoding.booktracker.db.models import Book
+from vibecoding.booktracker.db.schemas import BookCreate, BookStatus, ReadingLogCreate
+from vibecoding.booktracker.db.sqlite import Database
+from vibecoding.booktracker.locations.manager import LocationManager
+from vibecoding.booktracker.locations.schemas import (
+    LocationCreate,
+    LocationSessionCreate,
+    LocationType,
+)
+from vibecoding.booktracker.reports.manager import ReportManager
+from vibecoding.booktracker.stats.snapshot import LibrarySnapshot
+from vibecoding.booktracker.streaks.manager import StreakManager
+
+
+@pytest.fixture
+def db():
+    """Create an in-memory database for testing."""
+    database = Database(":memory:")
+    database.create_tables()
+    return database
+
+
+@pytest.fixture
+def library(db):
+    """Books, logs, daily readings and location sessions across two years."""
+    year = date.today().year
+    books = [
+        ("Dune", "Herbert", f"{year}-01-10", 5, 600, ["sf", "classic"]),
+        ("Emma", "Austen", f"{year}-02-03", 4, 450, ["classic"]),
+        ("Persuasion", "Austen", f"{year}-02-20", None, 250, ["classic", "romance"]),
+        ("Kindred", "Butler", f"{year}-03-15", 5, None, None),
+        ("Dawn", "Butler", f"{year - 1}-12-30", 3, 260, ["sf"]),
+        ("Untitled", "", f"{year}-04-01", 2, 90, []),
+    ]
+    for title, author, finished, rating, pages, genres in books:
+        book = db.create_book(
+            BookCreate(
+                title=title,
+                author=author or "Unknown",
+                status=BookStatus.COMPLETED,
+                date_finished=finished,
+                rating=rating,
+                page_count=pages,
+            )
+        )
+        with db.get_session() as session:
+            session.execute(
+                update(Book)
+                .where(Book.id == book.id)
+                .values(author=author, genres=json.dumps(genres) if genres is not None else None)
+            )
+    reading = db.create_book(
+        BookCreate(title="Lilith's Brood", author="Butler", status=BookStatus.READING)
+    )
+
+    with db.get_session() as session:
+        for i, (pages, minutes) in enumerate([(30, 40), (12, None), (None, 25), (50, 60)]):
+            day = (date.today() - timedelta(days=i // 2)).isoformat()
+            db.create_reading_log(
+                ReadingLogCreate(
+                    book_id=reading.id, date=day, pages_read=pages, duration_minutes=minutes
+                ),
+                session,
+            )
+
+    streaks = StreakManager(db)
+    for i in range(20):
+        streaks.log_reading(
+            reading_date=date.today() - timedelta(days=i * 2 % 19),
+            minutes=10 + i * 7 % 45,
+            pages=i * 3 % 20,
+            primary_hour=None if i % 5 == 0 else 6 + i % 15,
+        )
+
+    locations = LocationManager(db)
+    home = locations.create_location(LocationCreate(name="Home", location_type=LocationType.HOME))
+    cafe = locations.create_location(
+        LocationCreate(name="Cafe", location_type=LocationType.CAFE, icon="☕", is_favorite=True)
+    )
+    locations.create_location(LocationCreate(name="Train", location_type=LocationType.COMMUTE))
+    for i, (location, minutes) in enumerate([(home, 30), (cafe, 45), (home, 20), (cafe, 5)]):
+        locations.log_session(
+            LocationSessionCreate(
+                location_id=location.id,
+                minutes_read=minutes,
+                pages_read=i * 4,
+                session_date=datetime(2024, 5, 1, 7 + i * 5, 30),
+            )
+        )
+    return db
+
+
+class TestLibrarySnapshot:
+    """Reports from a snapshot match the same reports from SQL."""
+
+    def test_yearly_recap(self, library: Database):
+        """Every recap figure comes out the same."""
+        snapshot = LibrarySnapshot.load(library)
+        year = date.today().year
+
+        from_sql = ReportManager(library).get_yearly_recap(year)
+        from_snapshot = ReportManager(library, snapshot=snapshot).get_yearly_recap(year)
+
+        assert from_snapshot == from_sql
+        assert from_snapshot.books_completed == 5
+        assert [a.author for a in from_snapshot.top_authors] == ["Austen", "Butler", "Herbert"]
+        assert from_snapshot.top_genres[0].genre == "classic"
+
+    def test_dashboard_and_charts(self, library: Database):
+        """The dashboard, heatmap and charts come out the same."""
+        snapshot = LibrarySnapshot.load(library)
+        year = date.today().year
+        sql = ReportManager(library)
+        frames = ReportManager(library, snapshot=snapshot)
+
+        dashboard = frames.get_dashboard(year)
+        with library.get_session() as session:
+            clear_result_cache(session)
+        assert dashboard == sql.get_dashboard(year)
+        assert dashboard.currently_reading == 1
+
+        assert frames.get_year_heatmap(year) == sql.get_year_heatmap(year)
+        assert frames.get_rating_chart() == sql.get_rating_chart()
+        assert frames.get_pages_over_time_chart(year) == sql.get_pages_over_time_chart(year)
+
+    def test_reading_habits(self, library: Database):
+        """Habits computed from the snapshot match the database."""
+        snapshot = LibrarySnapshot.load(library)
+
+        habits = StreakManager(library, snapshot=snapshot).get_reading_habits()
+
+        assert habits == StreakManager(library).get_reading_habits()
+        assert habits.reading_days_this_month == 19
+
+    def test_location_stats(self, library: Database):
+        """Location stats computed from the snapshot match the database."""
+        snapshot = LibrarySnapshot.load(library)
+
+        stats = LocationManager(library, snapshot=snapshot).get_stats()
+
+        assert stats == LocationManager(library).get_stats()
+        assert stats.most_used_location == "Home"
+        assert stats.favorite_location == "Cafe"
+        assert stats.reading_by_hour[12] == 45
+
+    def test_empty_library(self, db: Database):
+        """An empty database loads and reports nothing."""
+        snapshot = LibrarySnapshot.load(db)
+        year = date.today().year
+
+        recap = ReportManager(db, snapshot=snapshot).get_yearly_recap(year)
+
+        assert recap == ReportManager(db).get_yearly_recap(year)
+        assert LocationManager(db, snapshot=snapshot).get_stats().total_sessions == 0
+        assert StreakManager(db, snapshot=snapshot).get_reading_habits().consistency_score == 0
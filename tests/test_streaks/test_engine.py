@@ -0,0 +1,94 @@
+"""Tests for the streak engine."""
+
+from datetime import date, timedelta
+
+from vibecoding.booktracker.streaks.engine import Run, StreakEngine
+
+
+def d(day: int) -> date:
+    """A day in January 2024."""
+    return date(2024, 1, day)
+
+
+class TestStreakEngine:
+    """Tests for StreakEngine."""
+
+    def test_empty(self):
+        """No days, no streaks."""
+        engine = StreakEngine()
+
+        assert len(engine) == 0
+        assert engine.longest() is None
+        assert engine.current(d(1)) is None
+        assert engine.top(3) == []
+
+    def test_appending_extends_and_starts_runs(self):
+        """Days in order extend the latest run or start a new one."""
+        engine = StreakEngine()
+        for day in (1, 2, 3, 5, 6):
+            engine.add(d(day))
+
+        assert engine.runs() == [Run(d(1), d(3)), Run(d(5), d(6))]
+        assert engine.total_days == 5
+
+    def test_unordered_strings(self):
+        """Days may be ISO strings, in any order, with duplicates."""
+        engine = StreakEngine(["2024-01-03", "2024-01-01", "2024-01-02", "2024-01-02"])
+
+        assert engine.runs() == [Run(d(1), d(3))]
+
+    def test_backfill_merges_runs(self):
+        """A day filling a one-day gap joins the runs either side."""
+        engine = StreakEngine([d(1), d(2), d(4), d(5)])
+
+        run, replaced = engine.add(d(3))
+
+        assert run == Run(d(1), d(5))
+        assert replaced == [Run(d(1), d(2)), Run(d(4), d(5))]
+        assert engine.runs() == [run]
+        assert engine.longest() == run
+
+    def test_backfill_into_gap(self):
+        """Backfilled days extend a neighbour or start a run of their own."""
+        engine = StreakEngine([d(1), d(10)])
+
+        assert engine.add(d(9)) == (Run(d(9), d(10)), [Run(d(10), d(10))])
+        assert engine.add(d(2)) == (Run(d(1), d(2)), [Run(d(1), d(1))])
+        assert engine.add(d(5)) == (Run(d(5), d(5)), [])
+        assert engine.add(d(5)) == (Run(d(5), d(5)), [])
+        assert engine.runs() == [Run(d(1), d(2)), Run(d(5), d(5)), Run(d(9), d(10))]
+
+    def test_discard_splits_run(self):
+        """Removing a day splits its run; the longest shrinks with it."""
+        engine = StreakEngine(d(day) for day in range(1, 8))
+
+        left, old = engine.discard(d(4))
+
+        assert old == Run(d(1), d(7))
+        assert left == [Run(d(1), d(3)), Run(d(5), d(7))]
+        assert engine.longest() == Run(d(1), d(3))
+        assert engine.discard(d(4)) == ([], None)
+        assert engine.total_days == 6
+
+    def test_current(self):
+        """The current streak reaches the day or the day before."""
+        engine = StreakEngine([d(1), d(2), d(3), d(6)])
+
+        assert engine.current(d(3)) == Run(d(1), d(3))
+        assert engine.current(d(4)) == Run(d(1), d(3))
+        assert engine.current(d(5)) is None
+        assert engine.current(d(2)) == Run(d(1), d(2))  # Later days aren't counted
+
+    def test_current_defaults_to_today(self):
+        """Without a day, the streak is taken as of today."""
+        today = date.today()
+        engine = StreakEngine([today - timedelta(days=2), today - timedelta(days=1)])
+
+        assert engine.current().length == 2
+
+    def test_top(self):
+        """Longest first; equally long runs oldest first."""
+        engine = StreakEngine([d(1), d(2), d(4), d(6), d(7), d(8), d(10), d(11)])
+
+        assert [run.length for run in engine.top(10)] == [3, 2, 2, 1]
+        assert engine.top(2) == [Run(d(6), d(8)), Run(d(1), d(2))]
@@ -490,3 +490,52 @@ class TestModelProperties:
         ended_streak = next(s for s in streaks if not s.is_current)
 
         assert ended_streak.is_active is False
+
+
+class TestBackfilledStreaks:
+    """Tests for reading logged for past days."""
+
+    def test_backfill_merges_streaks(self, manager):
+        """Filling the gap between two streaks joins them, with their totals."""
+        today = date.today()
+        for days_ago in (4, 3, 1, 0):
+            manager.log_reading(reading_date=today - timedelta(days=days_ago), minutes=10)
+
+        assert len(manager.get_all_streaks()) == 2
+
+        manager.log_reading(reading_date=today - timedelta(days=2), minutes=10)
+
+        streaks = manager.get_all_streaks()
+        assert len(streaks) == 1
+        assert streaks[0].length == 5
+        assert streaks[0].total_minutes == 50
+        assert manager.get_current_streak().length == 5
+
+    def test_backfill_before_streak_extends_it(self, manager):
+        """A day just before the current streak becomes its new start."""
+        today = date.today()
+        manager.log_reading(reading_date=today, minutes=10)
+        manager.log_reading(reading_date=today - timedelta(days=1), minutes=10)
+
+        current = manager.get_current_streak()
+        assert current.length == 2
+        assert current.start_date == (today - timedelta(days=1)).isoformat()
+
+    def test_old_reading_is_not_current(self, manager):
+        """Reading that stopped days ago is an ended streak."""
+        manager.log_reading(reading_date=date.today() - timedelta(days=5), minutes=10)
+
+        assert manager.get_current_streak() is None
+        assert manager.get_longest_streak().is_current is False
+        assert manager.get_streak_status() == StreakStatus.ENDED
+
+    def test_new_manager_sees_same_streaks(self, db, manager):
+        """Streaks are loaded from the stored reading days."""
+        today = date.today()
+        for days_ago in (6, 5, 1, 0):
+            manager.log_reading(reading_date=today - timedelta(days=days_ago), minutes=10)
+
+        other = StreakManager(db)
+
+        assert [s.length for s in other.get_all_streaks()] == [2, 2]
+        assert other.get_current_streak().start_date == (today - timedelta(days=1)).isoformat()
@@ -1,5 +1,6 @@
 """Tests for Notion API client."""
 
+import time
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
@@ -10,6 +11,7 @@ from src.vibecoding.booktracker.sync.notion import (
     NotionClient,
     NotionConfigError,
     NotionPage,
+    RateLimiter,
     STATUS_TO_NOTION,
     NOTION_TO_STATUS,
 )
@@ -220,3 +222,26 @@ class TestNotionPageToBook:
         assert book.date_added.isoformat() == "2025-01-01"
         assert book.date_started.isoformat() == "2025-01-05"
         assert book.date_finished.isoformat() == "2025-01-20"
+
+
+class TestRateLimiter:
+    """Tests for the shared token-bucket rate limiter."""
+
+    def test_burst_then_refill_rate(self):
+        """A full bucket allows a burst, then requests are paced at the rate."""
+        limiter = RateLimiter(rate=50.0, burst=2)
+        start = time.monotonic()
+        for _ in range(6):
+            limiter.acquire()
+        elapsed = time.monotonic() - start
+
+        # Two from the bucket, four more at 50/s
+        assert 0.07 <= elapsed < 0.5
+
+    def test_defer_blocks_all_callers(self):
+        """Deferring holds back the next request."""
+        limiter = RateLimiter(rate=1000.0, burst=5)
+        limiter.defer(0.1)
+        start = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - start >= 0.09
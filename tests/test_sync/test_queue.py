@@ -0,0 +1,236 @@
+"""Tests for the sync queue processor."""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.vibecoding.booktracker.db.models import Book
+from src.vibecoding.booktracker.db.schemas import BookCreate, BookUpdate
+from src.vibecoding.booktracker.db.sqlite import Database
+from src.vibecoding.booktracker.sync.notion import NotionError, NotionPage
+from src.vibecoding.booktracker.sync.queue import (
+    NOTION_BOOKS_STREAM,
+    PULL_OVERLAP,
+    SyncProcessor,
+)
+
+
+def _slow_notion(delay: float = 0.05) -> tuple[MagicMock, dict]:
+    """Mock Notion client whose requests take ``delay`` seconds."""
+    stats = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def create_book(book_data: BookCreate) -> str:
+        with lock:
+            stats["active"] += 1
+            stats["peak"] = max(stats["peak"], stats["active"])
+        time.sleep(delay)
+        with lock:
+            stats["active"] -= 1
+        if book_data.title == "Broken":
+            raise NotionError("validation failed")
+        return f"page-{book_data.title}"
+
+    notion = MagicMock()
+    notion.create_book.side_effect = create_book
+    return notion, stats
+
+
+class TestPushPending:
+    """Tests for the concurrent push pipeline."""
+
+    def test_creates_pushed_concurrently(self, db: Database):
+        """Create requests overlap and every book gets its page ID."""
+        for i in range(8):
+            db.create_book(BookCreate(title=f"Book {i}", author="Author"))
+        notion, stats = _slow_notion()
+
+        processor = SyncProcessor(db=db, notion_client=notion)
+        result = processor.push_pending(interactive=False, show_progress=False, workers=4)
+
+        assert result.pushed == 8
+        assert result.success
+        assert stats["peak"] > 1
+        assert db.count_pending_sync_items() == 0
+        assert all(b.notion_page_id == f"page-{b.title}" for b in db.get_all_books())
+
+    def test_failed_request_marks_item_failed(self, db: Database):
+        """A Notion error fails its item without stopping the others."""
+        db.create_book(BookCreate(title="Good", author="Author"))
+        db.create_book(BookCreate(title="Broken", author="Author"))
+        notion, _ = _slow_notion(0)
+
+        processor = SyncProcessor(db=db, notion_client=notion, max_retries=1)
+        result = processor.push_pending(interactive=False, show_progress=False, workers=2)
+
+        assert result.pushed == 1
+        assert result.errors == [("Broken", "validation failed")]
+        pages = {b.title: b.notion_page_id for b in db.get_all_books()}
+        assert pages == {"Good": "page-Good", "Broken": None}
+
+    def test_unfinished_items_return_to_queue(self, db: Database):
+        """Claimed items that weren't completed or failed are pending again."""
+        db.create_book(BookCreate(title="Book", author="Author"))
+        notion = MagicMock()
+        notion.create_book.side_effect = RuntimeError("bug")
+
+        processor = SyncProcessor(db=db, notion_client=notion)
+        result = processor.push_pending(interactive=False, show_progress=False)
+
+        assert not result.success
+        assert db.count_pending_sync_items() == 1
+
+    def test_update_fetches_then_pushes(self, db: Database):
+        """Updates check the Notion page before sending the change."""
+        book = db.create_book(BookCreate(title="Synced", author="Author"))
+        with db.get_session() as session:
+            stored = session.get(Book, book.id)
+            stored.notion_page_id = "page-1"
+            stored.notion_modified_at = datetime.now(timezone.utc).isoformat()
+        for item in db.get_pending_sync_items():
+            db.mark_sync_item_completed(item.id)
+        db.update_book(book.id, BookUpdate(rating=4))
+
+        notion = MagicMock()
+        notion.get_page.return_value = NotionPage(
+            page_id="page-1",
+            title="Synced",
+            author="Author",
+            properties={},
+            last_edited_time=datetime(2020, 1, 1, tzinfo=timezone.utc),
+            created_time=datetime(2020, 1, 1, tzinfo=timezone.utc),
+        )
+
+        processor = SyncProcessor(db=db, notion_client=notion)
+        result = processor.push_pending(interactive=False, show_progress=False)
+
+        assert result.pushed == 1
+        notion.get_page.assert_called_once_with("page-1")
+        page_id, update = notion.update_book.call_args.args
+        assert page_id == "page-1"
+        assert update.rating == 4
+
+
+def _page(page_id: str, title: str, minutes: int = 0) -> NotionPage:
+    """Notion page last edited ``minutes`` after a fixed time."""
+    edited = datetime(2026, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=minutes)
+    return NotionPage(
+        page_id=page_id,
+        title=title,
+        author="Author",
+        properties={},
+        last_edited_time=edited,
+        created_time=edited,
+    )
+
+
+class TestPullChanges:
+    """Tests for pulling Notion pages into the local database."""
+
+    def test_pages_matched_by_page_id_and_isbn(self, db: Database):
+        """Pages match local books by page ID or ISBN, else create new ones."""
+        linked = db.create_book(BookCreate(title="Linked", author="Author"))
+        with db.get_session() as session:
+            session.get(Book, linked.id).notion_page_id = "page-linked"
+        by_isbn = db.create_book(
+            BookCreate(title="By ISBN", author="Author", isbn13="9780000000002")
+        )
+
+        converted = {
+            "page-linked": BookCreate(title="Linked (renamed)", author="Author"),
+            "page-isbn": BookCreate(title="By ISBN", author="Author", isbn13="9780000000002"),
+            "page-new": BookCreate(title="New", author="Author"),
+        }
+        notion = MagicMock()
+        notion.query_books_page.return_value = (
+            [
+                _page("page-linked", "Linked (renamed)"),
+                _page("page-isbn", "By ISBN"),
+                _page("page-new", "New"),
+            ],
+            None,
+        )
+        notion.notion_page_to_book.side_effect = lambda page: converted[page.page_id]
+
+        processor = SyncProcessor(db=db, notion_client=notion)
+        result = processor.pull_changes(interactive=False, show_progress=False)
+
+        assert result.pulled == 3
+        assert result.success
+        # One conversion per page
+        assert notion.notion_page_to_book.call_count == 3
+
+        books = {b.notion_page_id: b for b in db.get_all_books()}
+        assert len(books) == 3
+        assert books["page-linked"].id == linked.id
+        assert books["page-linked"].title == "Linked (renamed)"
+        assert books["page-isbn"].id == by_isbn.id
+        assert books["page-new"].title == "New"
+
+    def test_repeated_page_matches_book_created_earlier(self, db: Database):
+        """A book created during the pull is found again by its page ID."""
+        notion = MagicMock()
+        notion.query_books_page.return_value = (
+            [_page("page-1", "Once"), _page("page-1", "Once", minutes=1)],
+            None,
+        )
+        notion.notion_page_to_book.return_value = BookCreate(title="Once", author="Author")
+
+        processor = SyncProcessor(db=db, notion_client=notion)
+        processor.pull_changes(interactive=False, show_progress=False)
+
+        assert len(db.get_all_books()) == 1
+
+    def test_incremental_pull_uses_checkpoint(self, db: Database):
+        """After a complete pull, the next one only asks for newer edits."""
+        notion = MagicMock()
+        notion.query_books_page.return_value = ([_page("page-1", "Book")], None)
+        notion.notion_page_to_book.return_value = BookCreate(title="Book", author="Author")
+        processor = SyncProcessor(db=db, notion_client=notion)
+
+        processor.pull_changes(interactive=False, show_progress=False)
+        assert notion.query_books_page.call_args.kwargs["since"] is None
+        state = db.get_sync_state(NOTION_BOOKS_STREAM)
+        assert state.last_pulled_at is not None
+        assert not state.in_progress
+
+        # The same page again (overlap window) is skipped by its version
+        result = processor.pull_changes(interactive=False, show_progress=False)
+        since = notion.query_books_page.call_args.kwargs["since"]
+        assert since == datetime.fromisoformat(state.last_pulled_at) - PULL_OVERLAP
+        assert result.pulled == 0
+        assert notion.notion_page_to_book.call_count == 1
+
+        # A full pull re-applies everything
+        result = processor.pull_changes(interactive=False, show_progress=False, full=True)
+        assert notion.query_books_page.call_args.kwargs["since"] is None
+        assert result.pulled == 1
+
+    def test_interrupted_pull_resumes_from_cursor(self, db: Database):
+        """A pull that stops mid-way continues from its saved cursor."""
+        notion = MagicMock()
+        notion.query_books_page.side_effect = [
+            ([_page("page-1", "First")], "cursor-2"),
+            KeyboardInterrupt(),
+        ]
+        notion.notion_page_to_book.side_effect = lambda page: BookCreate(
+            title=page.title, author="Author"
+        )
+        processor = SyncProcessor(db=db, notion_client=notion)
+
+        with pytest.raises(KeyboardInterrupt):
+            processor.pull_changes(interactive=False, show_progress=False)
+        state = db.get_sync_state(NOTION_BOOKS_STREAM)
+        assert state.in_progress
+        assert state.cursor == "cursor-2"
+
+        notion.query_books_page.side_effect = [([_page("page-2", "Second")], None)]
+        result = processor.pull_changes(interactive=False, show_progress=False)
+
+        assert notion.query_books_page.call_args.kwargs["start_cursor"] == "cursor-2"
+        assert result.pulled == 1
+        assert sorted(b.title for b in db.get_all_books()) == ["First", "Second"]
+        assert not db.get_sync_state(NOTION_BOOKS_STREAM).in_progress